@@ -12,6 +12,8 @@ import type {
   InjectIntentRequest,
   InjectIntentResponse,
   EventBusStatsResponse,
+  MessageTraceInfo,
+  TraceListResponse,
   ConfigSchemaResponse,
   ConfigUpdateRequest,
   ConfigUpdateResponse,
@@ -62,6 +64,8 @@ export const debugApi = {
   injectIntent: (request: InjectIntentRequest) =>
     api.post<InjectIntentResponse>('/debug/inject-intent', request),
   getEventBusStats: () => api.get<EventBusStatsResponse>('/debug/event-bus/stats'),
+  getTraces: (limit = 50) => api.get<TraceListResponse>('/debug/traces', { params: { limit } }),
+  getTrace: (traceId: string) => api.get<MessageTraceInfo>(`/debug/traces/${traceId}`),
 };
 
 // MaiBot API
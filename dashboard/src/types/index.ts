@@ -86,10 +86,92 @@ export interface InjectMessageResponse {
   error?: string;
 }
 
+export interface EventQueueStats {
+  handler_name: string;
+  policy: string;
+  max_pending: number;
+  depth: number;
+  high_watermark: number;
+  delivered_count: number;
+  dropped_count: number;
+  blocked_count: number;
+  coalesced_count: number;
+}
+
+export interface LatencySummary {
+  count: number;
+  avg_ms: number;
+  p50_ms: number;
+  p95_ms: number;
+  p99_ms: number;
+  max_ms: number;
+}
+
+export interface EventLatencyStats {
+  emit_count: number;
+  listener_count: number;
+  error_count: number;
+  handler_latency: LatencySummary;
+  emit_latency: LatencySummary;
+}
+
+export interface EventHandlerStats {
+  event_name: string;
+  handler_name: string;
+  call_count: number;
+  error_count: number;
+  last_error?: string | null;
+  latency: LatencySummary;
+  delivery_latency: LatencySummary;
+}
+
+export interface StuckHandlerInfo {
+  handler_name: string;
+  running_seconds: number;
+}
+
+export interface EventExecutorStats {
+  name: string;
+  max_workers: number;
+  pending: number;
+  active: number;
+  queued: number;
+  high_watermark: number;
+  completed_count: number;
+  timeout_count: number;
+  stuck: StuckHandlerInfo[];
+}
+
 export interface EventBusStatsResponse {
   total_events: number;
   total_subscribers: number;
   events_by_name: Record<string, number>;
+  queues: Record<string, EventQueueStats[]>;
+  events: Record<string, EventLatencyStats>;
+  handlers: Record<string, EventHandlerStats[]>;
+  executors: EventExecutorStats[];
+}
+
+export interface TraceSpanInfo {
+  name: string;
+  start_ms: number;
+  end_ms?: number | null;
+  duration_ms?: number | null;
+  is_mark: boolean;
+}
+
+export interface MessageTraceInfo {
+  trace_id: string;
+  source: string;
+  text: string;
+  created_at_ms: number;
+  total_ms?: number | null;
+  breakdown: Record<string, number>;
+  spans: TraceSpanInfo[];
+}
+
+export interface TraceListResponse {
+  traces: MessageTraceInfo[];
 }
 
 export interface InjectIntentRequest {
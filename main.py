@@ -13,11 +13,13 @@ from loguru import logger as loguru_logger
 from src.modules.dashboard.server import DashboardServer
 from src.modules.events import (
     EventBus,
+    EventJournal,
     list_registered_events,
     register_core_events,
 )
 from src.modules.logging import get_logger
 from src.modules.config.service import ConfigService
+from src.modules.lifecycle import LifecycleGraph, get_lifecycle_profiler
 from src.modules.llm.manager import LLMManager
 from src.modules.context import ContextService, ContextServiceConfig
 from src.modules.prompts import PromptManager, get_prompt_manager
@@ -31,6 +33,13 @@ from src.stages.output import OutputHandlerManager
 logger = get_logger("Main")
 _BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# 启动时每个步骤的最长等待秒数，超时视为启动失败（Decider / Handler 的初始化另有更短的单独超时）
+STARTUP_STEP_TIMEOUT = 120.0
+# 可选服务（MCP、Dashboard）启动的最长等待秒数，超时后禁用该服务，继续启动
+OPTIONAL_SERVICE_STARTUP_TIMEOUT = 15.0
+# 关闭时每个步骤（如清理某个阶段管理器）的最长等待秒数，超时后继续执行后续步骤
+SHUTDOWN_STEP_TIMEOUT = 15.0
+
 
 # ---------------------------------------------------------------------------
 # 命令行与日志
@@ -52,6 +61,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="启用 WebUI 开发模式：自动启动 Vite 开发服务器（HMR 热更新），浏览器将打开 http://localhost:60315",
     )
+    parser.add_argument(
+        "--record-events",
+        metavar="PATH",
+        help="把 EventBus 的所有事件录制到事件日志文件（.gz 结尾时压缩），可用 scripts/replay_journal.py 离线重放",
+    )
     return parser.parse_args()
 
 
@@ -224,6 +238,7 @@ async def create_app_components(
     input_pipeline_manager: Optional[PipelineManager],
     config_service: ConfigService,
     dev_webui: bool = False,
+    event_journal: Optional[EventJournal] = None,
 ) -> Tuple[
     ContextService,
     EventBus,
@@ -236,16 +251,15 @@ async def create_app_components(
 ]:
     """创建并连接核心组件。
 
-    创建顺序：
-    1. AudioStreamChannel
-    2. LLMManager
-    3. ContextService（新增，在 EventBus 之前）
-    4. EventBus
-    5. InputCollectorManager
-    6. DeciderManager
-    7. OutputHandlerManager
-    8. DashboardServer
-    9. MCPServerService
+    启动步骤按依赖关系并发执行（LifecycleGraph），每个步骤的耗时记录在 "startup.<步骤>" 下：
+    - log_streamer、audio_stream_channel、llm、context、mcp、input.setup：互不依赖，立即开始
+    - output：依赖 audio_stream_channel、llm
+    - decision：依赖 llm、context、output（OutputHandlerManager 作为 CapabilitiesProvider 注入）
+    - input.start：依赖 input.setup、decision、output（下游就绪后才开始采集）
+    - dashboard：依赖 log_streamer、input.start、decision、output
+
+    每个步骤最多等待 STARTUP_STEP_TIMEOUT 秒；MCP、Dashboard 超过 OPTIONAL_SERVICE_STARTUP_TIMEOUT 秒
+    未就绪时禁用并继续启动，单个 Decider / Handler 的初始化超时由各自的管理器处理。
 
     返回顺序（8个）：
     1. ContextService
@@ -266,35 +280,58 @@ async def create_app_components(
     else:
         logger.info("未检测到输出Handler配置，输出协调器功能将被禁用")
 
-    # 创建 AudioStreamChannel
+    # ========================================
+    # 创建组件实例（构造很快，耗时的初始化放在下面的启动步骤中）
+    # ========================================
+    from src.modules.logging.log_streamer import LogStreamer
     from src.modules.streaming.audio_stream_channel import AudioStreamChannel
 
-    logger.info("初始化 AudioStreamChannel...")
     audio_stream_channel = AudioStreamChannel("tts")
-    await audio_stream_channel.start()
-    logger.info("AudioStreamChannel 已创建并启动")
-
-    # LLM 服务
-    logger.info("初始化 LLM 服务...")
     llm_service = LLMManager()
-    await llm_service.setup(config)
-    logger.info("已创建 LLM 服务实例")
-
-    # 上下文服务（在 EventBus 之前创建）
-    logger.info("初始化上下文服务...")
-    context_config = config.get("context", {})
-    context_service_config = ContextServiceConfig(**context_config)
-    context_service = ContextService(config=context_service_config)
-    await context_service.initialize()
-    logger.info("已创建上下文服务实例")
-
-    # 事件总线
+    context_service = ContextService(config=ContextServiceConfig(**config.get("context", {})))
+
     logger.info("初始化事件总线和数据流协调器...")
     event_bus = EventBus()
+    if event_journal:
+        event_journal.attach(event_bus)
+
+    # 初始化 prompt_manager（供 decision 和 output 阶段使用）
+    prompt_manager = get_prompt_manager()
+
+    # 提前创建 LogStreamer，以便捕获应用启动过程中的日志
+    log_streamer = LogStreamer(min_level="DEBUG")
 
-    # 输入Collector管理器 (Input 阶段)
     input_manager: Optional[InputCollectorManager] = None
-    if input_config:
+    output_manager: Optional[OutputHandlerManager] = None
+    decision_manager: Optional[DeciderManager] = None
+    dashboard_server: Optional["DashboardServer"] = None
+    mcp_service: Optional["MCPServerService"] = None
+
+    # ========================================
+    # 启动步骤
+    # ========================================
+
+    async def start_audio_stream_channel() -> None:
+        logger.info("初始化 AudioStreamChannel...")
+        await audio_stream_channel.start()
+        logger.info("AudioStreamChannel 已创建并启动")
+
+    async def setup_llm() -> None:
+        logger.info("初始化 LLM 服务...")
+        await llm_service.setup(config)
+        logger.info("已创建 LLM 服务实例")
+
+    async def setup_context() -> None:
+        logger.info("初始化上下文服务...")
+        await context_service.initialize()
+        logger.info("已创建上下文服务实例")
+
+    async def setup_input() -> None:
+        # 输入Collector管理器 (Input 阶段)：只创建 Collector，等下游就绪后再开始采集
+        nonlocal input_manager
+        if not input_config:
+            logger.info("未检测到输入配置，输入Collector功能将被禁用")
+            return
         logger.info("初始化输入Collector管理器（Input 阶段）...")
         try:
             input_manager = InputCollectorManager(
@@ -305,48 +342,46 @@ async def create_app_components(
                 logger.info("已注入 InputPipelineManager 到 InputCollectorManager")
 
             await input_manager.setup(input_config, config_service=config_service)
-            await input_manager.start()
         except Exception as e:
             logger.error(f"设置输入Collector管理器失败: {e}", exc_info=True)
             logger.warning("输入Collector功能不可用，继续启动其他服务")
             input_manager = None
-    else:
-        logger.info("未检测到输入配置，输入Collector功能将被禁用")
-
-    # InputCollectorManager 直接订阅事件，无需协调器
-    # input_coordinator 已被移除
 
-    # 初始化 prompt_manager（供 decision 和 output 阶段使用）
-    prompt_manager = get_prompt_manager()
+    async def start_input() -> None:
+        nonlocal input_manager
+        if input_manager is None:
+            return
+        try:
+            await input_manager.start()
+        except Exception as e:
+            logger.opt(exception=e).error(f"启动输入Collector管理器失败: {e}")
+            logger.warning("输入Collector功能不可用，继续启动其他服务")
+            input_manager = None
 
-    # 输出Handler管理器 (Output 阶段)
-    # 先于 Decision 阶段创建并启动，以便作为 CapabilitiesProvider 注入 DeciderManager，
-    # 供 Decider 查询 Output 能力做动作选择（只读 Protocol，不违反单向数据流）。
-    logger.info("初始化输出Handler管理器...")
-    output_pipeline_manager = await create_pipeline_manager(
-        stage="output",
-        config=config,
-        services_by_type={
+    async def setup_output() -> None:
+        # 输出Handler管理器 (Output 阶段)
+        # 先于 Decision 阶段创建并启动，以便作为 CapabilitiesProvider 注入 DeciderManager，
+        # 供 Decider 查询 Output 能力做动作选择（只读 Protocol，不违反单向数据流）。
+        nonlocal output_manager
+        logger.info("初始化输出Handler管理器...")
+        output_services = {
             LLMManager: llm_service,
             PromptManager: prompt_manager,
-        },
-    )
-    output_manager: Optional[OutputHandlerManager] = None
-    if output_config:
+        }
+        output_pipeline_manager = await create_pipeline_manager(
+            stage="output",
+            config=config,
+            services_by_type=output_services,
+        )
+        if not output_config:
+            return
         if output_pipeline_manager is None:
-            output_pipeline_manager = PipelineManager(
-                stage="output",
-                services_by_type={
-                    LLMManager: llm_service,
-                    PromptManager: prompt_manager,
-                },
-            )
+            output_pipeline_manager = PipelineManager(stage="output", services_by_type=output_services)
         output_manager = OutputHandlerManager(
             event_bus,
             pipeline_manager=output_pipeline_manager,
             prompt_manager=prompt_manager,
         )
-    if output_manager:
         try:
             await output_manager.setup(
                 output_config,
@@ -361,9 +396,12 @@ async def create_app_components(
             logger.warning("输出Handler管理器功能不可用，继续启动其他服务")
             output_manager = None
 
-    # 决策阶段 (Decision 阶段)
-    decision_manager: Optional[DeciderManager] = None
-    if decision_config:
+    async def setup_decision() -> None:
+        # 决策阶段 (Decision 阶段)
+        nonlocal decision_manager
+        if not decision_config:
+            logger.info("未检测到决策配置，决策域功能将被禁用")
+            return
         logger.info("初始化决策阶段组件（Decision 阶段）...")
         try:
             decision_manager = DeciderManager(
@@ -383,22 +421,12 @@ async def create_app_components(
             logger.error(f"设置决策域组件失败: {e}", exc_info=True)
             logger.warning("决策域功能不可用，继续启动其他服务")
             decision_manager = None
-    else:
-        logger.info("未检测到决策配置，决策域功能将被禁用")
-
-    # ========================================
-    # 初始化 Dashboard Server
-    # ========================================
-    dashboard_server: Optional["DashboardServer"] = None
-    dashboard_config = config.get("dashboard", {})
-
-    # 提前创建 LogStreamer，以便捕获应用启动过程中的日志
-    from src.modules.logging.log_streamer import LogStreamer
-
-    log_streamer = LogStreamer(min_level="DEBUG")
-    await log_streamer.start()  # 立即启动捕获日志
 
-    if dashboard_config.get("enabled", True):
+    async def start_dashboard() -> None:
+        nonlocal dashboard_server
+        dashboard_config = config.get("dashboard", {})
+        if not dashboard_config.get("enabled", True):
+            return
         try:
             from src.modules.dashboard.config import DashboardConfig
             from src.modules.dashboard.server import DashboardServer
@@ -415,7 +443,7 @@ async def create_app_components(
                 dashboard_config=typed_dashboard_config,
                 log_streamer=log_streamer,
             )
-            await dashboard_server.start()
+            await asyncio.wait_for(dashboard_server.start(), timeout=OPTIONAL_SERVICE_STARTUP_TIMEOUT)
             logger.info(f"Dashboard 已启动: http://{typed_dashboard_config.host}:{typed_dashboard_config.port}")
 
             # 自动打开浏览器
@@ -429,26 +457,50 @@ async def create_app_components(
         except ImportError as e:
             logger.warning(f"Dashboard 模块导入失败（可能缺少依赖）: {e}")
             logger.warning("Dashboard 功能将被禁用。请运行: uv add fastapi 'uvicorn[standard]'")
+            dashboard_server = None
+        except asyncio.TimeoutError:
+            logger.error(f"Dashboard 启动超时（{OPTIONAL_SERVICE_STARTUP_TIMEOUT}s），功能将被禁用")
+            with contextlib.suppress(Exception):
+                await dashboard_server.stop()
+            dashboard_server = None
         except Exception as e:
             logger.error(f"Dashboard 启动失败: {e}")
             logger.warning("Dashboard 功能将被禁用")
+            dashboard_server = None
 
-    # ========================================
-    # 初始化 MCP 服务
-    # ========================================
-    mcp_service: Optional["MCPServerService"] = None
-    mcp_config = config.get("mcp", {})
-    if mcp_config.get("enabled", False):
+    async def setup_mcp() -> None:
+        nonlocal mcp_service
+        mcp_config = config.get("mcp", {})
+        if not mcp_config.get("enabled", False):
+            logger.info("MCP 服务未启用")
+            return
         try:
             mcp_service = MCPServerService(MCPServerConfig(**mcp_config))
-            await mcp_service.setup(mcp_config)
+            await asyncio.wait_for(mcp_service.setup(mcp_config), timeout=OPTIONAL_SERVICE_STARTUP_TIMEOUT)
             logger.info("已创建 MCP 服务实例")
+        except asyncio.TimeoutError:
+            logger.error(f"MCP 服务初始化超时（{OPTIONAL_SERVICE_STARTUP_TIMEOUT}s），功能将被禁用")
+            with contextlib.suppress(Exception):
+                await mcp_service.cleanup()
+            mcp_service = None
         except Exception as e:
             logger.error(f"MCP 服务初始化失败: {e}")
             logger.warning("MCP 服务功能将被禁用")
             mcp_service = None
-    else:
-        logger.info("MCP 服务未启用")
+
+    # 互不依赖的步骤并发执行；Collector 在 Decision / Output 就绪后才开始采集，避免启动期间的消息无人处理
+    startup = LifecycleGraph("startup", default_timeout=STARTUP_STEP_TIMEOUT)
+    startup.add("log_streamer", log_streamer.start)
+    startup.add("audio_stream_channel", start_audio_stream_channel)
+    startup.add("llm", setup_llm)
+    startup.add("context", setup_context)
+    startup.add("mcp", setup_mcp)
+    startup.add("input.setup", setup_input)
+    startup.add("output", setup_output, depends_on=["audio_stream_channel", "llm"])
+    startup.add("decision", setup_decision, depends_on=["llm", "context", "output"])
+    startup.add("input.start", start_input, depends_on=["input.setup", "decision", "output"])
+    startup.add("dashboard", start_dashboard, depends_on=["log_streamer", "input.start", "decision", "output"])
+    await startup.run()
 
     return (
         context_service,
@@ -515,96 +567,86 @@ async def run_shutdown(
     dashboard_server: Optional["DashboardServer"] = None,
     mcp_service: Optional["MCPServerService"] = None,
 ) -> None:
-    """按顺序执行关闭与清理。
+    """按依赖关系执行关闭与清理（互不依赖的步骤并发执行）。
 
     关闭顺序（关键）：
     1. 先停止数据生产者（InputCollectorManager）
-    2. 组件取消订阅（InputCollectorManager、DeciderManager、OutputHandlerManager）- 在 EventBus.cleanup 之前
-       2.1 清理输入域协调器（取消订阅 data.raw）
-       2.2 清理 DeciderManager（取消订阅 data.message 和 decision.intent）
-       2.3 清理 OutputHandlerManager（取消订阅 decision.intent）
-       2.4 清理 OutputHandler（必须在 EventBus.cleanup 之前，因为会调用 event_bus.off()）
-    3. 清理 MCP 服务
-    4. 清理 Dashboard（停止 WebSocket 连接和服务器）
-    5. 等待待处理事件完成（EventBus.cleanup）- 清除所有监听器
-    6. 清理基础设施（LLM等）
+    2. 组件取消订阅（DeciderManager → OutputHandlerManager）- 在 EventBus.cleanup 之前
+       2.1 清理 DeciderManager（取消订阅 data.message 和 decision.intent）
+       2.2 清理 OutputHandlerManager 与 OutputHandler（必须在 EventBus.cleanup 之前，因为会调用 event_bus.off()）
+    3. 清理 MCP 服务、Dashboard（不依赖其他组件，与 1、2 并发）
+    4. 等待待处理事件完成（EventBus.cleanup）- 清除所有监听器
+    5. 清理基础设施（LLM、上下文服务，两者并发）
 
     关键原则：
     - 所有订阅者的 cleanup() 必须在 EventBus.cleanup() 之前执行
     - 否则 cleanup() 中的 event_bus.off() 会因为监听器已被清除而失败
-    - OutputHandler 的 cleanup() 也会调用 event_bus.off()，因此必须在步骤 2.4 中清理
+    - OutputHandler 的 cleanup() 也会调用 event_bus.off()，因此必须在步骤 2.2 中清理
+
+    每个步骤最多等待 SHUTDOWN_STEP_TIMEOUT 秒，失败或超时只记录日志，不影响后续步骤；
+    耗时记录在 "shutdown.<步骤>" 下。
     """
-    if input_manager:
-        logger.info("正在停止输入Collector（数据生产者）...")
-        try:
+
+    async def cleanup_input() -> None:
+        if input_manager:
+            logger.info("正在停止输入Collector（数据生产者）...")
             await input_manager.cleanup()
             logger.info("输入Collector已停止并清理")
-        except Exception as e:
-            logger.error(f"停止输入Collector时出错: {e}")
 
-    if decision_manager:
-        logger.info("正在清理 DeciderManager（取消订阅）...")
-        try:
+    async def cleanup_decision() -> None:
+        if decision_manager:
+            logger.info("正在清理 DeciderManager（取消订阅）...")
             await decision_manager.cleanup()
             logger.info("DeciderManager 清理完成")
-        except Exception as e:
-            logger.error(f"清理 DeciderManager 时出错: {e}")
 
-    if output_manager:
-        logger.info("正在清理 OutputHandler（必须在 EventBus.cleanup 之前）...")
-        try:
+    async def cleanup_output() -> None:
+        if output_manager:
+            logger.info("正在清理 OutputHandler（必须在 EventBus.cleanup 之前）...")
             await output_manager.stop()
             await output_manager.cleanup()
             logger.info("OutputHandler 已清理")
-        except Exception as e:
-            logger.error(f"清理 OutputHandler 失败: {e}")
 
-    # 3. 清理 MCP 服务
-    if mcp_service:
-        logger.info("正在清理 MCP 服务...")
-        try:
+    async def cleanup_mcp() -> None:
+        if mcp_service:
+            logger.info("正在清理 MCP 服务...")
             await mcp_service.cleanup()
             logger.info("MCP 服务已清理")
-        except Exception as e:
-            logger.error(f"MCP 服务清理失败: {e}")
 
-    # 4. 清理 Dashboard（停止 WebSocket 连接和服务器）
-    if dashboard_server:
-        logger.info("正在停止 Dashboard...")
-        try:
+    async def stop_dashboard() -> None:
+        # 停止 WebSocket 连接和服务器
+        if dashboard_server:
+            logger.info("正在停止 Dashboard...")
             await dashboard_server.stop()
             await dashboard_server.cleanup()
             logger.info("Dashboard 已停止")
-        except Exception as e:
-            logger.error(f"停止 Dashboard 失败: {e}")
 
-    # 4. 等待待处理事件完成并清除所有监听器（EventBus 清理）
-    logger.info("等待待处理事件完成...")
-    if event_bus:
-        try:
+    async def cleanup_event_bus() -> None:
+        # 等待待处理事件完成并清除所有监听器
+        if event_bus:
+            logger.info("等待待处理事件完成...")
             await event_bus.cleanup()
             logger.info("EventBus 清理完成")
-        except Exception as e:
-            logger.error(f"EventBus 清理失败: {e}")
 
-    # 5. 清理基础设施（LLM等）
-    logger.info("正在清理核心服务...")
-    try:
+    async def cleanup_llm() -> None:
         if llm_service:
             await llm_service.cleanup()
             logger.info("LLM 服务已清理")
-        logger.info("核心服务关闭完成")
-    except Exception as e:
-        logger.error(f"核心服务关闭时出错: {e}")
 
-    # 6. 清理上下文服务
-    logger.info("正在清理上下文服务...")
-    try:
+    async def cleanup_context() -> None:
         if context_service:
             await context_service.cleanup()
             logger.info("上下文服务已清理")
-    except Exception as e:
-        logger.error(f"清理上下文服务失败: {e}")
+
+    shutdown = LifecycleGraph("shutdown", fail_fast=False, default_timeout=SHUTDOWN_STEP_TIMEOUT)
+    shutdown.add("input", cleanup_input)
+    shutdown.add("decision", cleanup_decision, depends_on=["input"])
+    shutdown.add("output", cleanup_output, depends_on=["decision"])
+    shutdown.add("mcp", cleanup_mcp)
+    shutdown.add("dashboard", stop_dashboard)
+    shutdown.add("event_bus", cleanup_event_bus, depends_on=["input", "decision", "output", "mcp", "dashboard"])
+    shutdown.add("llm", cleanup_llm, depends_on=["event_bus"])
+    shutdown.add("context", cleanup_context, depends_on=["event_bus"])
+    await shutdown.run()
 
     logger.info("Amaidesu 应用程序已关闭。")
 
@@ -623,8 +665,13 @@ async def main() -> None:
     #    这必须在导入阶段参与者之前完成，避免过早的DEBUG日志输出
     setup_logging_early(args)
 
+    # 启动/关闭各阶段的耗时记录（配置加载、组件导入、DI 实例化、各组件 setup/start/cleanup 等）
+    profiler = get_lifecycle_profiler()
+    profiler.reset()
+
     # 3. 加载配置文件
-    config_service, config, was_created = load_config()
+    with profiler.phase("config.load"):
+        config_service, config, was_created = load_config()
 
     # 4. 获取完整的日志配置并重新配置日志（应用完整配置）
     logging_config = config_service.get_section("logging", default={})
@@ -633,20 +680,18 @@ async def main() -> None:
     validate_config(config)
     exit_if_config_created(was_created)
 
-    # 触发阶段参与者装饰器注册（必须在 create_pipeline_manager() 之前执行，否则 *_REGISTRY 为空）
-    import src.stages.input.collectors  # noqa: F401
-    import src.stages.input.pipelines  # noqa: F401
-    import src.stages.decision.deciders  # noqa: F401
-    import src.stages.output.handlers  # noqa: F401
-    import src.stages.output.pipelines  # noqa: F401
-
-    input_pipeline_manager = await create_pipeline_manager(stage="input", config=config)
+    # 阶段参与者（Collector/Decider/Handler/Pipeline）由各管理器按 component_manifest 清单
+    # 只导入配置中启用的部分，不再在启动时导入全部实现
+    with profiler.phase("pipelines.input"):
+        input_pipeline_manager = await create_pipeline_manager(stage="input", config=config)
 
     # 注册所有核心事件（通过 @register_event 装饰器触发 Payload 模块导入）
     # 必须在 create_app_components() 之前调用，否则 EventBus 校验时找不到 Payload 类型
     register_core_events()
     logger.info(f"核心事件注册完成，共 {len(list_registered_events())} 个事件")
 
+    event_journal = EventJournal(args.record_events) if args.record_events else None
+
     (
         context_service,
         event_bus,
@@ -656,7 +701,11 @@ async def main() -> None:
         decision_manager,
         dashboard_server,
         mcp_service,
-    ) = await create_app_components(config, input_pipeline_manager, config_service, dev_webui=args.dev_webui)
+    ) = await create_app_components(
+        config, input_pipeline_manager, config_service, dev_webui=args.dev_webui, event_journal=event_journal
+    )
+
+    logger.info(profiler.report(title="启动耗时"))
 
     stop_event = asyncio.Event()
     orig_sigint, orig_sigterm = setup_signal_handlers(stop_event)
@@ -670,6 +719,7 @@ async def main() -> None:
         logger.info("检测到 KeyboardInterrupt，开始清理...")
 
     restore_signal_handlers(orig_sigint, orig_sigterm)
+    profiler.reset()
     await run_shutdown(
         context_service,
         output_manager,
@@ -680,6 +730,9 @@ async def main() -> None:
         dashboard_server,
         mcp_service,
     )
+    logger.info(profiler.report(title="关闭耗时"))
+    if event_journal:
+        await event_journal.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,229 @@
+"""
+Bilibili 官方弹幕 WebSocket 帧解码基准
+
+用帧语料（默认合成；也可以用 --corpus 读取录制的真实帧）对比：
+- legacy: 旧实现，每帧只按单个未压缩包解码，包长超过 2048 字节直接丢弃
+- decoder: FrameDecoder，切分首尾相连的包并展开 zlib / brotli 压缩包
+
+输出两者解出的消息数、解码吞吐，以及把解码放在事件循环内 / 工作线程中时事件循环的最大停顿。
+
+语料文件格式：每帧为 4 字节大端长度 + 帧原始字节（即 websocket.recv() 的返回值），可用 --save 导出合成语料。
+
+使用方法：
+
+```bash
+python scripts/bench_bili_frames.py
+python scripts/bench_bili_frames.py --frames 5000 --batch 40 --save /tmp/bili_frames.bin
+python scripts/bench_bili_frames.py --corpus /tmp/bili_frames.bin
+```
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import struct
+import sys
+import time
+import zlib
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.stages.input.collectors.bili_danmaku_official.client import frame_decoder  # noqa: E402
+from src.stages.input.collectors.bili_danmaku_official.client.frame_decoder import (  # noqa: E402
+    OP_HEARTBEAT_REPLY,
+    PROTO_VER_BROTLI,
+    PROTO_VER_INT,
+    PROTO_VER_ZLIB,
+    FrameDecoder,
+    encode_packet,
+)
+from src.stages.input.collectors.bili_danmaku_official.client.websocket_client import (  # noqa: E402
+    _OFFLOAD_FRAME_BYTES,
+)
+
+_CHARS = "的一是在不了有和人这中大为上个国我以要他时来用们生到作地于出就分对成会可主播好哈今天气真来了晚上吗啊呢吧"
+
+
+def _notification(rng: random.Random, seq: int) -> bytes:
+    roll = rng.random()
+    if roll < 0.85:
+        data = {
+            "cmd": "LIVE_OPEN_PLATFORM_DM",
+            "data": {
+                "uname": f"观众{rng.randrange(5000)}",
+                "open_id": f"open-{rng.randrange(5000)}",
+                "msg": "".join(rng.choice(_CHARS) for _ in range(rng.randint(2, 30))),
+                "timestamp": 1700000000 + seq,
+                "fans_medal_level": rng.randrange(30),
+                "msg_id": f"msg-{seq}",
+            },
+        }
+    elif roll < 0.97:
+        data = {
+            "cmd": "LIVE_OPEN_PLATFORM_SEND_GIFT",
+            "data": {
+                "uname": f"观众{rng.randrange(5000)}",
+                "gift_name": rng.choice(["辣条", "小心心", "牛哇牛哇", "打call"]),
+                "gift_num": rng.randint(1, 99),
+                "price": rng.choice([100, 1000, 5000]),
+                "combo_info": {"combo_id": f"combo-{seq}", "combo_count": rng.randint(1, 50)},
+                "msg_id": f"msg-{seq}",
+            },
+        }
+    else:
+        # 醒目留言：消息体明显更大，旧实现的 2048 字节限制会丢掉其中一部分
+        data = {
+            "cmd": "LIVE_OPEN_PLATFORM_SUPER_CHAT",
+            "data": {
+                "uname": f"观众{rng.randrange(5000)}",
+                "message": "".join(rng.choice(_CHARS) for _ in range(rng.randint(50, 400))),
+                "rmb": rng.choice([30, 50, 100]),
+                "uface": "https://i0.hdslb.com/bfs/face/" + "a" * 64 + ".jpg",
+                "msg_id": f"msg-{seq}",
+            },
+        }
+    return encode_packet(json.dumps(data, ensure_ascii=False).encode("utf-8"), seq=seq)
+
+
+def build_corpus(frames: int, batch: int, seed: int) -> List[bytes]:
+    """构造合成帧语料：单条未压缩通知、多条拼接、zlib / brotli 压缩批次和心跳回复混合"""
+    rng = random.Random(seed)
+    corpus = []
+    seq = 0
+    for _ in range(frames):
+        roll = rng.random()
+        if roll < 0.05:
+            corpus.append(encode_packet(struct.pack(">I", rng.randrange(100000)), OP_HEARTBEAT_REPLY, PROTO_VER_INT))
+            continue
+        count = 1 if roll < 0.3 else rng.randint(2, batch)
+        packets = []
+        for _ in range(count):
+            packets.append(_notification(rng, seq))
+            seq += 1
+        payload = b"".join(packets)
+        if count > 1 and roll < 0.5:
+            corpus.append(payload)
+        elif count > 1 and frame_decoder.brotli is not None and roll > 0.85:
+            corpus.append(encode_packet(frame_decoder.brotli.compress(payload), ver=PROTO_VER_BROTLI))
+        elif count > 1:
+            corpus.append(encode_packet(zlib.compress(payload), ver=PROTO_VER_ZLIB))
+        else:
+            corpus.append(payload)
+    return corpus
+
+
+def save_corpus(path: str, corpus: List[bytes]) -> None:
+    with open(path, "wb") as f:
+        for frame in corpus:
+            f.write(struct.pack(">I", len(frame)))
+            f.write(frame)
+
+
+def load_corpus(path: str) -> List[bytes]:
+    corpus = []
+    with open(path, "rb") as f:
+        data = f.read()
+    offset = 0
+    while offset < len(data):
+        (length,) = struct.unpack_from(">I", data, offset)
+        corpus.append(data[offset + 4 : offset + 4 + length])
+        offset += 4 + length
+    return corpus
+
+
+def legacy_decode(frame: bytes) -> int:
+    """旧 Proto.unpack + json.loads 的行为，返回解出的通知数（0 或 1）"""
+    if len(frame) < 16:
+        return 0
+    packet_len, header_len, _ver, op = struct.unpack_from(">ihhi", frame)
+    if packet_len < 0 or packet_len > 2048 or header_len != 16 or op != 5:
+        return 0
+    try:
+        json.loads(frame[16:packet_len].decode("utf-8"))
+    except ValueError:
+        return 0
+    return 1
+
+
+def bench_throughput(corpus: List[bytes], rounds: int) -> None:
+    total_bytes = sum(len(frame) for frame in corpus)
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        legacy_messages = sum(legacy_decode(frame) for frame in corpus)
+    legacy_elapsed = time.perf_counter() - started
+
+    decoder = FrameDecoder()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        messages = 0
+        for frame in corpus:
+            decoded, _others = decoder.decode(frame)
+            messages += len(decoded)
+    elapsed = time.perf_counter() - started
+
+    print(f"语料: {len(corpus)} 帧, {total_bytes / 1024:.1f} KiB")
+    print(f"legacy : 解出 {legacy_messages:>7} 条消息, {legacy_elapsed / rounds * 1000:8.2f} ms/轮")
+    print(
+        f"decoder: 解出 {messages:>7} 条消息, {elapsed / rounds * 1000:8.2f} ms/轮, "
+        f"{messages * rounds / elapsed:,.0f} 条/秒, {total_bytes * rounds / elapsed / 1024 / 1024:.1f} MiB/秒"
+    )
+
+
+async def bench_loop_stall(corpus: List[bytes], offload_bytes: int) -> float:
+    """按 websocket 客户端的方式解码整个语料，返回期间事件循环的最大停顿（毫秒）"""
+    decoder = FrameDecoder()
+    max_stall = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal max_stall
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            max_stall = max(max_stall, now - last - 0.001)
+            last = now
+
+    tick_task = asyncio.create_task(ticker())
+    # 帧之间让出事件循环，模拟逐帧到达
+    for frame in corpus:
+        if len(frame) >= offload_bytes:
+            await asyncio.to_thread(decoder.decode, frame)
+        else:
+            decoder.decode(frame)
+        await asyncio.sleep(0)
+    done = True
+    await tick_task
+    return max_stall * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bilibili WebSocket 帧解码基准")
+    parser.add_argument("--frames", type=int, default=2000, help="合成语料的帧数")
+    parser.add_argument("--batch", type=int, default=30, help="合成语料单帧最多包含的通知数")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--rounds", type=int, default=5, help="吞吐测试重复次数")
+    parser.add_argument("--corpus", help="读取录制的帧语料文件")
+    parser.add_argument("--save", help="把语料写入文件")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else build_corpus(args.frames, args.batch, args.seed)
+    if args.save:
+        save_corpus(args.save, corpus)
+        print(f"语料已保存到 {args.save}")
+    if frame_decoder.brotli is None:
+        print("未安装 brotli，合成语料中不包含 brotli 压缩帧")
+
+    bench_throughput(corpus, args.rounds)
+
+    inline_stall = asyncio.run(bench_loop_stall(corpus, offload_bytes=sys.maxsize))
+    offload_stall = asyncio.run(bench_loop_stall(corpus, offload_bytes=_OFFLOAD_FRAME_BYTES))
+    print(f"事件循环最大停顿: 全部在循环内解码 {inline_stall:.2f} ms, 大帧放到工作线程 {offload_stall:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+"""
+容量压测：Input → Decision → Output
+
+MockDanmakuCollector 按到达过程产生合成负载（或回放录制的会话），消息经过 InputCollectorManager
+（调度队列 + Input Pipeline）、DeciderManager、OutputHandlerManager（Output Pipeline）到达 MockOutputHandler：
+- LLM 替换为替身客户端：固定延迟（可加抖动）后返回合法的结构化 JSON，不发网络请求
+- TTS 由 MockOutputHandler 的 synthesis_delay 模拟（与真实 TTS 一样串行合成）
+- Decider、Input/Output Pipeline 按 config/ 中的配置加载，--decider 可指定只启用某个 Decider
+
+运行期间按固定间隔采样各处的队列深度，结束后输出持续吞吐、队列深度和各阶段延迟分位数。
+相同的 --seed 产生相同的消息序列，可以对比不同版本或不同配置的容量。
+
+使用方法：
+
+```bash
+# 每秒 20 条的泊松到达，持续 30 秒
+python scripts/bench_capacity.py --mode steady --rate 20 --duration 30
+
+# 平时每秒 5 条，每 30 秒有 5 秒每秒 200 条的刷屏；LLM 800ms、TTS 300ms
+python scripts/bench_capacity.py --mode burst --rate 5 --peak-rate 200 --duration 60 --llm-latency 0.8 --tts-latency 0.3
+
+# 礼物潮 / 突袭，观众数和重复弹幕比例
+python scripts/bench_capacity.py --mode gift_storm --users 2000 --duplicate-ratio 0.5
+python scripts/bench_capacity.py --mode raid --decider amaidesu
+
+# 回放录制的会话（main.py --record-events 的输出或带 timestamp_ms 的 JSONL），4 倍速
+python scripts/bench_capacity.py --mode replay --replay logs/events.jsonl.gz --speed 4 --duration 60
+```
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+_BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, _BASE_DIR)
+
+from src.modules.config.service import ConfigService  # noqa: E402
+from src.modules.context import ContextService, ContextServiceConfig  # noqa: E402
+from src.modules.events import EventBus, register_core_events  # noqa: E402
+from src.modules.events.names import CoreEvents  # noqa: E402
+from src.modules.events.payloads.input import MessageReadyPayload  # noqa: E402
+from src.modules.events.stats import LatencyHistogram  # noqa: E402
+from src.modules.llm.manager import ClientType, LLMManager, LLMResponse  # noqa: E402
+from src.modules.logging.logger import configure_from_config  # noqa: E402
+from src.modules.pipeline import PipelineManager  # noqa: E402
+from src.modules.prompts import PromptManager, get_prompt_manager  # noqa: E402
+from src.modules.tracing import get_tracer  # noqa: E402
+from src.stages.input.manager import InputCollectorManager  # noqa: E402
+
+# 同时满足 LLMDecider 和 AmaidesuDecider 的结构化回复格式
+_STUB_REPLY = json.dumps(
+    {"should_reply": True, "text": "收到啦，谢谢大家～", "emotion": "happy", "action": ""}, ensure_ascii=False
+)
+
+
+class StubLLMClient:
+    """替身 LLM 客户端：延迟 latency ± jitter 秒后返回固定回复，记录并发请求数"""
+
+    def __init__(self, latency: float, jitter: float, seed: Optional[int] = None):
+        self.latency = latency
+        self.jitter = jitter
+        self._rng = random.Random(seed)
+        self.call_count = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def chat(self, messages: List[Dict[str, Any]], **kwargs) -> LLMResponse:
+        self.call_count += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(max(0.0, self.latency + self._rng.uniform(-self.jitter, self.jitter)))
+        finally:
+            self.in_flight -= 1
+        prompt_tokens = sum(len(str(m.get("content", ""))) for m in messages)
+        return LLMResponse(
+            success=True,
+            content=_STUB_REPLY,
+            model="stub",
+            usage={"prompt_tokens": prompt_tokens, "completion_tokens": 16, "total_tokens": prompt_tokens + 16},
+        )
+
+    async def cleanup(self) -> None:
+        pass
+
+
+class DepthSampler:
+    """按固定间隔采样队列深度，记录每项的平均值和最大值"""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = {}
+
+    def record(self, name: str, value: float) -> None:
+        self.samples.setdefault(name, []).append(value)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        return {
+            name: {"mean": sum(values) / len(values), "max": max(values)}
+            for name, values in self.samples.items()
+            if values
+        }
+
+
+async def sample_depths(
+    sampler: DepthSampler,
+    interval: float,
+    event_bus: EventBus,
+    input_manager: InputCollectorManager,
+    llm_client: StubLLMClient,
+    tts_handler: Any,
+) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        scheduler_stats = input_manager.get_scheduler_stats()
+        sampler.record("input_queue", sum(s["depth"] for s in scheduler_stats.values()))
+        mailbox_depth = sum(s.depth for stats in event_bus.get_queue_stats().values() for s in stats)
+        sampler.record("eventbus_mailboxes", mailbox_depth)
+        sampler.record("llm_in_flight", llm_client.in_flight)
+        if tts_handler is not None:
+            sampler.record("tts_pending", tts_handler.pending_count)
+        sampler.record("asyncio_tasks", len(asyncio.all_tasks()))
+
+
+def print_report(
+    elapsed: float,
+    collector: Any,
+    input_manager: InputCollectorManager,
+    llm_client: StubLLMClient,
+    tts_handler: Any,
+    trace_ids: List[str],
+    sampler: DepthSampler,
+) -> None:
+    scheduler_stats = input_manager.get_scheduler_stats()
+    dispatched = sum(s["dispatched_count"] for s in scheduler_stats.values())
+    dropped = sum(s["dropped_count"] for s in scheduler_stats.values())
+    intents = len(tts_handler.get_received_intents()) if tts_handler is not None else 0
+
+    print(f"运行 {elapsed:.1f}s")
+    print(
+        f"  产生消息 {collector.sent_count} 条（{collector.sent_count / elapsed:.1f} 条/秒，"
+        f"最大发送延迟 {collector.max_schedule_lag_ms:.0f}ms）"
+    )
+    print(f"  输入调度 {dispatched} 条（{dispatched / elapsed:.1f} 条/秒），队列溢出丢弃 {dropped} 条")
+    print(f"  发布到 Decision {len(trace_ids)} 条（{len(trace_ids) / elapsed:.1f} 条/秒）")
+    llm_rate = llm_client.call_count / elapsed
+    print(f"  LLM 请求 {llm_client.call_count} 次（{llm_rate:.1f} 次/秒，最大并发 {llm_client.max_in_flight}）")
+    print(f"  到达输出 Handler 的 Intent {intents} 条（{intents / elapsed:.1f} 条/秒）")
+
+    print("队列深度（采样）:")
+    for name, summary in sampler.summary().items():
+        print(f"  {name:<20} mean={summary['mean']:8.1f} max={summary['max']:8.0f}")
+
+    tracer = get_tracer()
+    stages: Dict[str, LatencyHistogram] = {}
+    total = LatencyHistogram()
+    for trace_id in trace_ids:
+        trace = tracer.get_trace(trace_id)
+        if trace is None:
+            continue
+        if trace.total_ms is not None:
+            total.record(trace.total_ms)
+        for stage, duration_ms in trace.breakdown().items():
+            stages.setdefault(stage, LatencyHistogram()).record(duration_ms)
+    stages["end_to_end"] = total
+
+    print("延迟分位数（消息追踪）:")
+    for stage, histogram in stages.items():
+        summary = histogram.summary()
+        if not summary["count"]:
+            continue
+        print(
+            f"  {stage:<18} n={summary['count']:<7} p50={summary['p50_ms']:8.1f}ms "
+            f"p95={summary['p95_ms']:8.1f}ms p99={summary['p99_ms']:8.1f}ms max={summary['max_ms']:8.1f}ms"
+        )
+
+
+async def main(args: argparse.Namespace) -> None:
+    configure_from_config({"enabled": False, "console_level": args.log_level})
+    config_service = ConfigService(base_dir=_BASE_DIR)
+    config, _ = config_service.initialize()
+
+    # 阶段参与者由各管理器按 component_manifest 清单按需导入（与 main.py 一致）
+    from src.stages.decision import DeciderManager
+    from src.stages.input.collectors.mock_danmaku import MockDanmakuCollector
+    from src.stages.output import OutputHandlerManager
+
+    register_core_events()
+    tracer = get_tracer()
+    tracer.max_traces = max(tracer.max_traces, 1_000_000)
+    event_bus = EventBus()
+
+    llm_client = StubLLMClient(args.llm_latency, args.llm_jitter, args.seed)
+    # 不记录请求历史，避免写入源码树中的 src/modules/llm/history/
+    llm_service = LLMManager(record_history=False)
+    for client_type in ClientType.ALL:
+        llm_service._clients[client_type] = llm_client
+    context_service = ContextService(config=ContextServiceConfig(**config.get("context", {})))
+    await context_service.initialize()
+    prompt_manager = get_prompt_manager()
+
+    # 输出阶段：保留 Output Pipeline，Handler 全部替换为 MockOutputHandler（TTS 替身）
+    services = {LLMManager: llm_service, PromptManager: prompt_manager}
+    output_pipeline_manager = PipelineManager(stage="output", services_by_type=services)
+    output_pipeline_config = config.get("pipelines", {}).get("output", {})
+    if output_pipeline_config:
+        await output_pipeline_manager.load_from_config(output_pipeline_config)
+    output_manager = OutputHandlerManager(event_bus, pipeline_manager=output_pipeline_manager)
+    await output_manager.setup({"enabled": ["mock"]}, config_service=config_service, prompt_manager=prompt_manager)
+    tts_handler = output_manager.get_handler_by_name("mock")
+    if tts_handler is not None:
+        tts_handler.synthesis_delay = args.tts_latency
+    await output_manager.start()
+
+    decision_config = dict(config.get("deciders", {}))
+    if args.decider:
+        decision_config["enabled"] = [args.decider]
+    decision_manager = DeciderManager(
+        event_bus,
+        llm_service,
+        config_service,
+        context_service,
+        prompt_manager,
+        capabilities_provider=output_manager,
+    )
+    await decision_manager.setup(decision_config=decision_config)
+    await decision_manager.start()
+
+    # 输入阶段：保留 Input Pipeline 和调度配置，Collector 只有负载生成器
+    input_pipeline_manager = None
+    input_pipeline_config = config.get("pipelines", {}).get("input", {})
+    if input_pipeline_config and not args.no_input_pipelines:
+        input_pipeline_manager = PipelineManager(stage="input")
+        await input_pipeline_manager.load_from_config(input_pipeline_config)
+    input_manager = InputCollectorManager(event_bus, pipeline_manager=input_pipeline_manager)
+    await input_manager.setup({"enabled": [], "scheduling": config.get("collectors", {}).get("scheduling", {})})
+
+    collector_config: Dict[str, Any] = {
+        "mode": args.mode,
+        "duration": args.duration,
+        "rate": args.rate,
+        "peak_rate": args.peak_rate,
+        "peak_interval": args.peak_interval,
+        "peak_duration": args.peak_duration,
+        "users": args.users,
+        "duplicate_ratio": args.duplicate_ratio,
+        "gift_ratio": args.gift_ratio,
+        "raid_users": args.raid_users,
+        "seed": args.seed,
+        "speed": args.speed,
+        "loop_playback": False,
+    }
+    if args.replay:
+        collector_config["log_file_path"] = os.path.abspath(args.replay)
+    collector = MockDanmakuCollector(collector_config, event_bus)
+
+    trace_ids: List[str] = []
+
+    async def on_message(event_name: str, payload: MessageReadyPayload, source: str) -> None:
+        if payload.trace_id:
+            trace_ids.append(payload.trace_id)
+
+    event_bus.on(CoreEvents.INPUT_MESSAGE_RECEIVED, on_message, MessageReadyPayload)
+
+    sampler = DepthSampler()
+    sampler_task = asyncio.create_task(
+        sample_depths(sampler, args.sample_interval, event_bus, input_manager, llm_client, tts_handler)
+    )
+    started = time.perf_counter()
+    try:
+        await input_manager.start_all_collectors([collector])
+        # 合成负载按 duration 结束；回放在文件末尾结束，超过 duration 时提前停止
+        deadline = started + args.duration if args.duration > 0 else None
+        while True:
+            await asyncio.sleep(0.1)
+            if not collector.is_started or (deadline is not None and time.perf_counter() >= deadline):
+                break
+        elapsed = time.perf_counter() - started
+        await input_manager.stop_all_collectors()
+        # 等待最后一批消息走完 Decider 和 Output
+        await asyncio.sleep(args.drain)
+        sampler_task.cancel()
+        print_report(elapsed, collector, input_manager, llm_client, tts_handler, trace_ids, sampler)
+    finally:
+        sampler_task.cancel()
+        await input_manager.cleanup()
+        await decision_manager.cleanup()
+        await output_manager.stop()
+        await output_manager.cleanup()
+        await event_bus.cleanup()
+        await context_service.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="容量压测：Input → Decision → Output")
+    parser.add_argument(
+        "--mode", default="steady", choices=["steady", "burst", "gift_storm", "raid", "replay"], help="到达过程"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=30.0, help="负载持续秒数（回放时为最长秒数，0 表示回放到结束）"
+    )
+    parser.add_argument("--rate", type=float, default=10.0, help="平时的平均到达率（条/秒）")
+    parser.add_argument("--peak-rate", type=float, default=100.0, help="峰值窗口内的平均到达率（条/秒）")
+    parser.add_argument("--peak-interval", type=float, default=30.0, help="峰值窗口周期（秒）")
+    parser.add_argument("--peak-duration", type=float, default=5.0, help="峰值窗口时长（秒）")
+    parser.add_argument("--users", type=int, default=200, help="观众数量（用户基数）")
+    parser.add_argument("--duplicate-ratio", type=float, default=0.3, help="重复弹幕比例")
+    parser.add_argument("--gift-ratio", type=float, default=0.02, help="平时礼物消息比例")
+    parser.add_argument("--raid-users", type=int, default=100, help="每次突袭的新观众数量")
+    parser.add_argument("--seed", type=int, default=42, help="随机种子")
+    parser.add_argument("--replay", help="回放的会话文件（JSONL 或事件日志），配合 --mode replay")
+    parser.add_argument("--speed", type=float, default=1.0, help="回放倍速，0 表示最大速度")
+    parser.add_argument("--decider", help="只启用指定的 Decider（如 llm、amaidesu），默认按配置")
+    parser.add_argument("--llm-latency", type=float, default=0.5, help="替身 LLM 的响应延迟（秒）")
+    parser.add_argument("--llm-jitter", type=float, default=0.1, help="替身 LLM 延迟的抖动（秒）")
+    parser.add_argument("--tts-latency", type=float, default=0.2, help="替身 TTS 的合成耗时（秒）")
+    parser.add_argument("--no-input-pipelines", action="store_true", help="不加载 Input Pipeline")
+    parser.add_argument("--sample-interval", type=float, default=0.5, help="队列深度采样间隔（秒）")
+    parser.add_argument("--drain", type=float, default=5.0, help="负载结束后等待处理完成的秒数")
+    parser.add_argument("--log-level", default="ERROR", help="控制台日志级别")
+    args = parser.parse_args()
+    if args.mode == "replay" and not args.replay:
+        parser.error("--mode replay 需要 --replay 指定会话文件")
+    asyncio.run(main(args))
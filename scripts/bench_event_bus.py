@@ -0,0 +1,78 @@
+"""
+EventBus emit 性能基准
+
+测量不同订阅者数量下单次 emit（wait=True）的平均耗时，用于验证零拷贝分发：
+类型匹配的订阅者共享同一个 Payload 实例，emit 成本不应随订阅者数量线性增长。
+
+使用方法：
+
+```bash
+python scripts/bench_event_bus.py
+python scripts/bench_event_bus.py --emits 20000 --subscribers 1 5 20
+```
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.modules.events.event_bus import EventBus  # noqa: E402
+from src.modules.events.names import CoreEvents  # noqa: E402
+from src.modules.events.payloads import IntentPayload  # noqa: E402
+
+
+def build_payload() -> IntentPayload:
+    """构造一个接近真实大小的 IntentPayload"""
+    return IntentPayload(
+        intent_data={
+            "speech": "你好！今天的直播也要开开心心的哦~" * 4,
+            "emotion": {"name": "happy", "intensity": 0.8},
+            "action": {"name": "warudo.wave", "parameters": {"duration_ms": 1500}},
+            "metadata": {"source_id": "bench", "decision_time_ms": 0},
+        },
+        name="bench",
+    )
+
+
+async def run_case(subscribers: int, emits: int) -> float:
+    """返回单次 emit 的平均耗时（微秒）"""
+    event_bus = EventBus(enable_stats=False)
+
+    async def handler(event_name: str, data: IntentPayload, source: str) -> None:
+        _ = data.intent_data["speech"]
+
+    for _ in range(subscribers):
+        event_bus.on(CoreEvents.DECISION_INTENT_GENERATED, handler, IntentPayload)
+
+    payload = build_payload()
+    # 预热
+    for _ in range(min(emits, 200)):
+        await event_bus.emit(CoreEvents.DECISION_INTENT_GENERATED, payload, source="bench", wait=True)
+
+    start = time.perf_counter()
+    for _ in range(emits):
+        await event_bus.emit(CoreEvents.DECISION_INTENT_GENERATED, payload, source="bench", wait=True)
+    elapsed = time.perf_counter() - start
+
+    await event_bus.cleanup()
+    return elapsed / emits * 1_000_000
+
+
+async def main(subscriber_counts: List[int], emits: int) -> None:
+    print(f"EventBus emit 基准: emits={emits}")
+    results = [(count, await run_case(count, emits)) for count in subscriber_counts]
+    for count, per_emit_us in results:
+        print(f"订阅者={count:>3}  每次 emit={per_emit_us:8.1f} µs  每个订阅者={per_emit_us / count:6.1f} µs")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="EventBus emit 性能基准")
+    parser.add_argument("--emits", type=int, default=5000, help="每组 emit 次数")
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[1, 5, 20], help="订阅者数量列表")
+    args = parser.parse_args()
+    asyncio.run(main(args.subscribers, args.emits))
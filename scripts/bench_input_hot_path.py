@@ -0,0 +1,161 @@
+"""
+Input → Decision 热路径性能基准
+
+模拟 B 站官方弹幕从 InputCollectorManager 发布到 DecisionManager 取得 NormalizedMessage 的过程，对比：
+- dict: 旧实现，NormalizedMessage.model_dump() 成字典（连同原始 DanmakuMessage），
+  MessageReadyPayload 验证字典，订阅者再 model_validate 回 NormalizedMessage
+- record: 当前实现，MessageReadyPayload.from_normalized_message() 包装为 MessageRecord，
+  订阅者 to_normalized() 直接取回原消息
+
+输出每条消息的平均耗时（微秒）和单条消息处理期间的内存分配峰值（字节，tracemalloc）。
+
+使用方法：
+
+```bash
+python scripts/bench_input_hot_path.py
+python scripts/bench_input_hot_path.py --messages 50000 --subscribers 3
+```
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.modules.events.event_bus import EventBus  # noqa: E402
+from src.modules.events.names import CoreEvents  # noqa: E402
+from src.modules.events.payloads.input import MessageReadyPayload  # noqa: E402
+from src.modules.logging.logger import configure_from_config  # noqa: E402
+from src.modules.types.base.message_record import MessageRecord  # noqa: E402
+from src.modules.types.base.normalized_message import NormalizedMessage  # noqa: E402
+from src.stages.input.shared.bili_messages import DanmakuMessage  # noqa: E402
+
+
+def build_messages(count: int) -> List[NormalizedMessage]:
+    """构造接近真实的官方弹幕消息（raw 为 DanmakuMessage）"""
+    messages = []
+    for i in range(count):
+        raw = DanmakuMessage.from_dict(
+            {
+                "cmd": "LIVE_OPEN_PLATFORM_DM",
+                "data": {
+                    "uname": f"观众{i % 500}",
+                    "open_id": f"open-{i % 500}",
+                    "uface": "https://i0.hdslb.com/bfs/face/" + "a" * 40 + ".jpg",
+                    "msg": f"主播晚上好呀今天播什么 {i}",
+                    "room_id": 123456,
+                    "timestamp": 1700000000 + i,
+                    "fans_medal_level": i % 30,
+                    "fans_medal_name": "粉丝牌",
+                    "fans_medal_wearing_status": True,
+                    "msg_id": f"msg-{i}",
+                },
+            }
+        )
+        messages.append(
+            NormalizedMessage(
+                text=raw.msg,
+                source="bili_danmaku_official",
+                timestamp_ms=raw.timestamp * 1000,
+                raw=raw,
+                user_id=raw.open_id,
+                user_nickname=raw.uname,
+                platform="bilibili",
+                room_id="123456",
+            )
+        )
+    return messages
+
+
+def build_dict_payload(message: NormalizedMessage) -> MessageReadyPayload:
+    """旧实现：model_dump 后由 Payload 验证字典"""
+    metadata = {"user_id": message.user_id, "username": message.user_nickname}
+    return MessageReadyPayload(
+        message=message.model_dump(mode="python"),
+        source=message.source,
+        timestamp_ms=message.timestamp_ms,
+        metadata=metadata,
+    )
+
+
+def receive_dict(payload: MessageReadyPayload) -> NormalizedMessage:
+    return NormalizedMessage.model_validate(payload.message)
+
+
+def receive_record(payload: MessageReadyPayload) -> NormalizedMessage:
+    message = payload.message
+    if isinstance(message, MessageRecord):
+        return message.to_normalized()
+    return NormalizedMessage.model_validate(message)
+
+
+async def run_case(
+    messages: List[NormalizedMessage],
+    subscribers: int,
+    build: Callable[[NormalizedMessage], MessageReadyPayload],
+    receive: Callable[[MessageReadyPayload], NormalizedMessage],
+) -> tuple:
+    """返回 (每条消息耗时 μs, 单条消息分配峰值字节)"""
+    event_bus = EventBus(enable_stats=False)
+
+    async def handler(event_name: str, payload: MessageReadyPayload, source: str) -> None:
+        _ = receive(payload).text
+
+    for _ in range(subscribers):
+        event_bus.on(CoreEvents.INPUT_MESSAGE_RECEIVED, handler, MessageReadyPayload)
+
+    async def publish(message: NormalizedMessage) -> None:
+        await event_bus.emit(CoreEvents.INPUT_MESSAGE_RECEIVED, build(message), source="bench", wait=True)
+
+    for message in messages[:200]:
+        await publish(message)
+
+    started = time.perf_counter()
+    for message in messages:
+        await publish(message)
+    elapsed = time.perf_counter() - started
+
+    sample = messages[: min(len(messages), 500)]
+    tracemalloc.start()
+    peaks = []
+    for message in sample:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        await publish(message)
+        peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    tracemalloc.stop()
+
+    return elapsed / len(messages) * 1e6, sum(peaks) / len(peaks)
+
+
+async def main(count: int, subscribers: int) -> None:
+    # 与默认控制台级别一致，不输出 emit 的 DEBUG 日志，也不写日志文件
+    configure_from_config({"enabled": False, "console_level": "INFO"})
+    messages = build_messages(count)
+    print(f"{count} 条消息, {subscribers} 个订阅者")
+    results = {}
+    for name, build, receive in (
+        ("dict", build_dict_payload, receive_dict),
+        ("record", MessageReadyPayload.from_normalized_message, receive_record),
+    ):
+        results[name] = await run_case(messages, subscribers, build, receive)
+        micros, peak = results[name]
+        print(f"{name:>6}: {micros:8.2f} μs/条, 分配峰值 {peak:8.0f} 字节/条")
+
+    (old_us, old_peak), (new_us, new_peak) = results["dict"], results["record"]
+    print(f"耗时降低 {(1 - new_us / old_us) * 100:.0f}%，分配峰值降低 {(1 - new_peak / old_peak) * 100:.0f}%")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Input → Decision 热路径性能基准")
+    parser.add_argument("--messages", type=int, default=20000, help="发布的消息数")
+    parser.add_argument(
+        "--subscribers", type=int, default=1, help="订阅者数量（DecisionManager 之外还可能有 Dashboard）"
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.messages, args.subscribers))
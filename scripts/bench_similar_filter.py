@@ -0,0 +1,144 @@
+"""
+SimilarFilterInputPipeline 性能基准
+
+用合成弹幕流（少量热门短语的刷屏变体 + 大量普通弹幕）对比：
+- linear: 旧实现，逐一与时间窗口内所有缓存文本计算 difflib 相似度
+- indexed: 当前实现（重复字符归一化 + 精确哈希 + MinHash LSH 候选）
+
+输出两者的吞吐（消息/秒）以及判定一致率（以 linear 为参照，分别统计漏判和多判）。
+
+使用方法：
+
+```bash
+python scripts/bench_similar_filter.py
+python scripts/bench_similar_filter.py --messages 20000 --spam-ratio 0.7
+```
+"""
+
+import argparse
+import asyncio
+import difflib
+import os
+import random
+import sys
+import time
+from collections import deque
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.modules.types.base.normalized_message import NormalizedMessage  # noqa: E402
+from src.stages.input.pipelines.similar_filter.pipeline import SimilarFilterInputPipeline  # noqa: E402
+
+_CHARS = "的一是在不了有和人这中大为上个国我以要他时来用们生到作地于出就分对成会可主播好哈今天气真来了晚上吗啊呢吧"
+_SPAM_PHRASES = ["主播晚上好", "哈哈哈哈哈", "666666", "前方高能", "awsl", "？？？", "下次一定", "好耶好耶", "来了来了"]
+_SUFFIXES = ["", "!", "！！", "~", "哈", "6", "。", "??"]
+
+
+def _random_text(rng: random.Random) -> str:
+    return "".join(rng.choice(_CHARS) for _ in range(rng.randint(4, 20)))
+
+
+def _spam_variant(rng: random.Random, phrase: str) -> str:
+    text = phrase
+    roll = rng.random()
+    if roll < 0.3:
+        # 重复字符变长/变短
+        text = text + text[-1] * rng.randint(0, 6)
+    elif roll < 0.6:
+        text = text + rng.choice(_SUFFIXES)
+    elif roll < 0.8 and len(text) > 3:
+        # 替换一个字符
+        i = rng.randrange(len(text))
+        text = text[:i] + rng.choice(_CHARS) + text[i + 1 :]
+    return text
+
+
+def build_corpus(count: int, spam_ratio: float, users: int, seed: int) -> List[NormalizedMessage]:
+    """构造合成弹幕流"""
+    rng = random.Random(seed)
+    messages = []
+    for _ in range(count):
+        if rng.random() < spam_ratio:
+            text = _spam_variant(rng, rng.choice(_SPAM_PHRASES))
+        else:
+            text = _random_text(rng)
+        messages.append(NormalizedMessage(text=text, source="bench", user_id=f"u{rng.randrange(users)}"))
+    return messages
+
+
+class LinearSimilarFilter:
+    """旧实现的参照版本：与时间窗口内所有缓存文本逐一比较"""
+
+    def __init__(self, threshold: float, min_text_length: int):
+        self.threshold = threshold
+        self.min_text_length = min_text_length
+        self.cache: deque = deque()
+
+    def process(self, message: NormalizedMessage) -> bool:
+        text = message.text
+        if len(text) < self.min_text_length:
+            return True
+        for cached in self.cache:
+            similarity = difflib.SequenceMatcher(None, text, cached).ratio()
+            if text in cached or cached in text:
+                longer, shorter = max(len(text), len(cached)), min(len(text), len(cached))
+                if shorter >= longer * 0.5:
+                    similarity = max(similarity, shorter / longer)
+            if similarity >= self.threshold:
+                return False
+        self.cache.append(text)
+        return True
+
+
+async def run_indexed(messages: List[NormalizedMessage], threshold: float, max_repeat: int) -> List[bool]:
+    config = {"similarity_threshold": threshold, "time_window": 3600.0, "max_repeat": max_repeat}
+    pipeline = SimilarFilterInputPipeline(config)
+    return [result is not None for result in await pipeline._process_batch(messages)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SimilarFilterInputPipeline 性能基准")
+    parser.add_argument("--messages", type=int, default=5000, help="消息数量（均在同一时间窗口内）")
+    parser.add_argument("--spam-ratio", type=float, default=0.6, help="刷屏变体所占比例")
+    parser.add_argument("--users", type=int, default=500, help="用户数量")
+    parser.add_argument("--threshold", type=float, default=0.85, help="相似度阈值")
+    parser.add_argument("--seed", type=int, default=42, help="随机种子")
+    parser.add_argument(
+        "--max-repeat", type=int, default=3, help="重复字符归一化长度，0 表示关闭（用于单独衡量 LSH 的召回）"
+    )
+    parser.add_argument("--skip-linear", action="store_true", help="跳过旧实现（消息数很大时）")
+    args = parser.parse_args()
+
+    from loguru import logger
+
+    logger.remove()
+
+    messages = build_corpus(args.messages, args.spam_ratio, args.users, args.seed)
+
+    start = time.perf_counter()
+    indexed = asyncio.run(run_indexed(messages, args.threshold, args.max_repeat))
+    indexed_s = time.perf_counter() - start
+    print(
+        f"indexed: {len(messages)} 条, {indexed_s:.2f}s, {len(messages) / indexed_s:,.0f} 条/秒, 通过 {sum(indexed)} 条"
+    )
+
+    if args.skip_linear:
+        return
+
+    linear_filter = LinearSimilarFilter(args.threshold, min_text_length=3)
+    start = time.perf_counter()
+    linear = [linear_filter.process(m) for m in messages]
+    linear_s = time.perf_counter() - start
+    print(f"linear:  {len(messages)} 条, {linear_s:.2f}s, {len(messages) / linear_s:,.0f} 条/秒, 通过 {sum(linear)} 条")
+
+    # 两种实现的缓存内容会随判定分歧而不同，一致率只是近似的召回指标
+    missed = sum(1 for a, b in zip(linear, indexed, strict=True) if not a and b)
+    extra = sum(1 for a, b in zip(linear, indexed, strict=True) if a and not b)
+    agreement = 1 - (missed + extra) / len(messages)
+    print(f"一致率 {agreement:.2%}（linear 过滤而 indexed 放行 {missed} 条，indexed 额外过滤 {extra} 条）")
+    print(f"加速比 {linear_s / indexed_s:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
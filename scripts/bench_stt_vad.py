@@ -0,0 +1,216 @@
+"""
+STT 语音活动检测对事件循环的阻塞
+
+用 WAV 文件（或合成的"说话 + 静音"交替音频）模拟麦克风：采集线程按实时节奏每 32ms 产出一帧，
+同时事件循环上的探针每 1ms 醒来一次，记录实际醒来的延迟（事件循环被阻塞的时间），
+并累计超过 1ms 的停顿。对比：
+- inline: 旧实现，事件循环逐帧调用 VAD 模型
+- worker: VAD 工作线程逐帧调用模型
+- worker+gate: VAD 工作线程 + 能量门限，静音帧不调用模型
+
+--model synthetic（默认）用与 torch 一样在计算时释放 GIL 的 numpy 矩阵乘法模拟推理耗时；
+--model silero 加载真实的 Silero VAD（需要 torch 和网络）。
+只有一个 CPU 核心时工作线程仍与事件循环分时占用同一核心，worker 的剩余停顿来自操作系统调度，
+多核机器上 worker 的停顿接近探针自身的定时器抖动。
+
+使用方法：
+
+```bash
+python scripts/bench_stt_vad.py
+python scripts/bench_stt_vad.py --wav recordings/mic.wav --infer-ms 3
+python scripts/bench_stt_vad.py --model silero --seconds 20
+```
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+import wave
+from typing import Callable, Dict, List
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.modules.events.stats import LatencyHistogram  # noqa: E402
+from src.modules.logging.logger import configure_from_config  # noqa: E402
+from src.stages.input.collectors.stt.vad_worker import EnergyGate, VadWorker  # noqa: E402
+
+SAMPLE_RATE = 16000
+FRAME_SAMPLES = 512
+
+
+def synthesize_speech_wav(path: str, seconds: float, seed: int = 0) -> None:
+    """合成"说话 1.5 秒 + 静音 1 秒"交替的 16kHz 单声道 WAV：浊音用谐波叠加加音节包络，静音为底噪"""
+    rng = np.random.default_rng(seed)
+    total = int(seconds * SAMPLE_RATE)
+    t = np.arange(total) / SAMPLE_RATE
+    audio = rng.normal(0, 10 ** (-70 / 20), total)
+
+    cycle = 2.5
+    talking = (t % cycle) < 1.5
+    f0 = 150 + 50 * np.sin(2 * np.pi * 0.7 * t)
+    phase = 2 * np.pi * np.cumsum(f0) / SAMPLE_RATE
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 8))
+    envelope = 0.5 * (1 - np.cos(2 * np.pi * 4 * t))
+    audio += np.where(talking, 0.15 * voiced * envelope, 0.0)
+
+    pcm = (np.clip(audio, -1, 1) * 32767).astype(np.int16)
+    with wave.open(path, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes(pcm.tobytes())
+
+
+def read_frames(path: str) -> List[bytes]:
+    """读取 16kHz int16 WAV 并切成 512 采样点的帧（多声道取第一声道）"""
+    with wave.open(path, "rb") as f:
+        if f.getframerate() != SAMPLE_RATE or f.getsampwidth() != 2:
+            raise ValueError("只支持 16kHz 16bit WAV")
+        pcm = np.frombuffer(f.readframes(f.getnframes()), dtype=np.int16)
+        if f.getnchannels() > 1:
+            pcm = pcm.reshape(-1, f.getnchannels())[:, 0]
+    count = len(pcm) // FRAME_SAMPLES
+    return [pcm[i * FRAME_SAMPLES : (i + 1) * FRAME_SAMPLES].tobytes() for i in range(count)]
+
+
+def synthetic_model(infer_ms: float) -> Callable[[np.ndarray], float]:
+    """一次耗时约 infer_ms 的 numpy 矩阵乘法（整个计算期间释放 GIL，与一次 torch 推理相同）"""
+    rng = np.random.default_rng(0)
+    size = 256
+    for _ in range(3):
+        a = rng.random((size, size), dtype=np.float32)
+        started = time.perf_counter()
+        for _ in range(5):
+            a @ a
+        elapsed_ms = (time.perf_counter() - started) * 1000 / 5
+        size = max(16, int(size * (infer_ms / elapsed_ms) ** (1 / 3)))
+    a = rng.random((size, size), dtype=np.float32)
+
+    def infer(samples: np.ndarray) -> float:
+        a @ a
+        return 0.9 if float(np.sqrt(np.mean(samples**2))) > 0.01 else 0.1
+
+    return infer
+
+
+def silero_model() -> Callable[[np.ndarray], float]:
+    import torch
+
+    model, _ = torch.hub.load("snakers4/silero-vad", "silero_vad", trust_repo=True, skip_validation=True)
+
+    def infer(samples: np.ndarray) -> float:
+        with torch.no_grad():
+            return model(torch.from_numpy(samples), SAMPLE_RATE).item()
+
+    return infer
+
+
+async def run_case(name: str, frames: List[bytes], infer: Callable, speed: float) -> Dict[str, float]:
+    loop = asyncio.get_running_loop()
+    results: asyncio.Queue = asyncio.Queue()
+    inline = name == "inline"
+    worker = None
+    if not inline:
+        gate = EnergyGate() if name == "worker+gate" else None
+        worker = VadWorker(infer, lambda batch: loop.call_soon_threadsafe(results.put_nowait, batch), gate=gate)
+        worker.start()
+
+    captured = threading.Event()
+
+    def capture() -> None:
+        """采集线程：按实时节奏产出帧（与 sounddevice 回调相同，不在事件循环中）"""
+        interval = FRAME_SAMPLES / SAMPLE_RATE / speed
+        next_at = time.perf_counter()
+        for frame in frames:
+            next_at += interval
+            time.sleep(max(0.0, next_at - time.perf_counter()))
+            if inline:
+                loop.call_soon_threadsafe(results.put_nowait, [frame])
+            else:
+                worker.submit(frame)
+        captured.set()
+
+    lag = LatencyHistogram()
+    stalled_ms = 0.0
+    running = True
+
+    async def probe() -> None:
+        nonlocal stalled_ms
+        while running:
+            started = time.perf_counter()
+            await asyncio.sleep(0.001)
+            late_ms = max(0.0, (time.perf_counter() - started) * 1000 - 1.0)
+            lag.record(late_ms)
+            # 定时器本身有亚毫秒级抖动，只累计超过 1ms 的停顿
+            if late_ms > 1.0:
+                stalled_ms += late_ms
+
+    probe_task = asyncio.create_task(probe())
+    threading.Thread(target=capture, daemon=True).start()
+    processed = 0
+    inferred = 0
+    while True:
+        dropped = worker.ring.stats.overrun_count if worker is not None else 0
+        if captured.is_set() and processed + dropped >= len(frames):
+            break
+        try:
+            batch = await asyncio.wait_for(results.get(), timeout=0.1)
+        except asyncio.TimeoutError:
+            continue
+        for item in batch:
+            if inline:
+                infer(np.frombuffer(item, dtype=np.int16).astype(np.float32) / 32768.0)
+                inferred += 1
+            processed += 1
+    if worker is not None:
+        await asyncio.to_thread(worker.stop)
+        inferred = worker.stats.inferred_count
+
+    running = False
+    await probe_task
+    summary = lag.summary()
+    return {
+        "frames": len(frames),
+        "inferred": inferred,
+        "p50_ms": summary["p50_ms"],
+        "p99_ms": summary["p99_ms"],
+        "max_ms": summary["max_ms"],
+        "stalled_ms": stalled_ms,
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    configure_from_config({"enabled": False, "console_level": "WARNING"})
+    wav_path = args.wav
+    if wav_path is None:
+        wav_path = os.path.join(tempfile.mkdtemp(), "speech.wav")
+        synthesize_speech_wav(wav_path, args.seconds)
+    frames = read_frames(wav_path)
+    infer = silero_model() if args.model == "silero" else synthetic_model(args.infer_ms)
+    print(
+        f"{len(frames)} 帧（{len(frames) * FRAME_SAMPLES / SAMPLE_RATE:.1f}s 音频），{args.speed} 倍速，"
+        f"{os.cpu_count()} 个 CPU 核心"
+    )
+
+    for name in ("inline", "worker", "worker+gate"):
+        r = await run_case(name, frames, infer, args.speed)
+        print(
+            f"{name:>12}: 推理 {r['inferred']:5d}/{r['frames']} 帧, 事件循环延迟 p50={r['p50_ms']:6.2f}ms "
+            f"p99={r['p99_ms']:6.2f}ms max={r['max_ms']:6.2f}ms, 超过 1ms 的停顿累计 {r['stalled_ms']:7.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="STT 语音活动检测对事件循环的阻塞")
+    parser.add_argument("--wav", help="16kHz 16bit WAV 文件，默认合成说话/静音交替的音频")
+    parser.add_argument("--seconds", type=float, default=10.0, help="合成音频的时长（秒）")
+    parser.add_argument("--model", choices=["synthetic", "silero"], default="synthetic", help="VAD 模型")
+    parser.add_argument("--infer-ms", type=float, default=5.0, help="synthetic 模型每帧推理耗时（毫秒）")
+    parser.add_argument("--speed", type=float, default=1.0, help="采集倍速（1 为实时）")
+    asyncio.run(main(parser.parse_args()))
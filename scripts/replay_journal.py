@@ -0,0 +1,149 @@
+"""
+事件日志重放
+
+把 `main.py --record-events` 录制的事件日志重放到一个全新的进程中：
+- Decider、Output Pipeline 按 config/ 中的配置正常加载；Input Pipeline 可选
+  （录制的 input.message.received 已经过一次 Input Pipeline，--input-pipelines 会让消息再经过一次，
+  用于测量 Pipeline 本身的耗时）
+- 所有输出 Handler 替换为 MockOutputHandler（收到 Intent 即视为开始播放，不产生 TTS/虚拟形象调用）
+- 重放结束后输出发布速率、调度延迟和各阶段延迟分位数（来自消息追踪）
+
+使用方法：
+
+```bash
+# 录制
+uv run python main.py --record-events logs/events.jsonl.gz
+
+# 按原始节奏重放
+python scripts/replay_journal.py logs/events.jsonl.gz
+
+# 4 倍速 / 最大速度重放
+python scripts/replay_journal.py logs/events.jsonl.gz --speed 4
+python scripts/replay_journal.py logs/events.jsonl.gz --speed 0
+```
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from typing import Dict, List
+
+_BASE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, _BASE_DIR)
+
+from src.modules.config.service import ConfigService  # noqa: E402
+from src.modules.context import ContextService, ContextServiceConfig  # noqa: E402
+from src.modules.events import EventBus, read_journal, register_core_events  # noqa: E402
+from src.modules.events.replay import JournalReplayer, ReplayReport  # noqa: E402
+from src.modules.events.stats import LatencyHistogram  # noqa: E402
+from src.modules.llm.manager import LLMManager  # noqa: E402
+from src.modules.pipeline import PipelineManager  # noqa: E402
+from src.modules.prompts import PromptManager, get_prompt_manager  # noqa: E402
+from src.modules.tracing import get_tracer  # noqa: E402
+
+
+def print_report(report: ReplayReport) -> None:
+    """输出重放结果和各阶段延迟分位数"""
+    lag = report.lag.summary()
+    print(
+        f"发布 {report.emitted_count} 个事件（跳过 {report.skipped_count}，过滤 {report.filtered_count}），"
+        f"录制跨度 {report.journal_span_ms / 1000:.1f}s，实际耗时 {report.wall_time_ms / 1000:.1f}s，"
+        f"{report.events_per_second:.1f} 事件/秒"
+    )
+    print(f"调度延迟: p50={lag['p50_ms']:.1f}ms p99={lag['p99_ms']:.1f}ms max={lag['max_ms']:.1f}ms")
+
+    tracer = get_tracer()
+    stages: Dict[str, LatencyHistogram] = {}
+    completed = 0
+    for trace_id in report.trace_ids:
+        trace = tracer.get_trace(trace_id)
+        if trace is None:
+            continue
+        if trace.total_ms is not None:
+            completed += 1
+        for stage, duration_ms in trace.breakdown().items():
+            stages.setdefault(stage, LatencyHistogram()).record(duration_ms)
+
+    print(f"消息 {len(report.trace_ids)} 条，到达输出 Handler {completed} 条")
+    for stage, histogram in stages.items():
+        summary = histogram.summary()
+        print(
+            f"  {stage:<18} n={summary['count']:<6} p50={summary['p50_ms']:8.1f}ms "
+            f"p95={summary['p95_ms']:8.1f}ms p99={summary['p99_ms']:8.1f}ms max={summary['max_ms']:8.1f}ms"
+        )
+
+
+async def main(journal_path: str, speed: float, include: List[str], drain: float, input_pipelines: bool) -> None:
+    config_service = ConfigService(base_dir=_BASE_DIR)
+    config, _ = config_service.initialize()
+
+    # 阶段参与者由各管理器按 component_manifest 清单按需导入（与 main.py 一致）
+    from src.stages.decision import DeciderManager
+    from src.stages.output import OutputHandlerManager
+
+    register_core_events()
+    tracer = get_tracer()
+    tracer.max_traces = max(tracer.max_traces, 100_000)
+
+    input_pipeline_manager = None
+    input_pipeline_config = config.get("pipelines", {}).get("input", {})
+    if input_pipeline_config and input_pipelines:
+        input_pipeline_manager = PipelineManager(stage="input")
+        await input_pipeline_manager.load_from_config(input_pipeline_config)
+
+    # 不记录请求历史，避免写入源码树中的 src/modules/llm/history/
+    llm_service = LLMManager(record_history=False)
+    await llm_service.setup(config)
+    context_service = ContextService(config=ContextServiceConfig(**config.get("context", {})))
+    await context_service.initialize()
+    prompt_manager = get_prompt_manager()
+    event_bus = EventBus()
+
+    # 输出阶段：保留 Output Pipeline，Handler 全部替换为 MockOutputHandler
+    services = {LLMManager: llm_service, PromptManager: prompt_manager}
+    output_pipeline_manager = PipelineManager(stage="output", services_by_type=services)
+    output_pipeline_config = config.get("pipelines", {}).get("output", {})
+    if output_pipeline_config:
+        await output_pipeline_manager.load_from_config(output_pipeline_config)
+    output_manager = OutputHandlerManager(event_bus, pipeline_manager=output_pipeline_manager)
+    await output_manager.setup({"enabled": ["mock"]}, config_service=config_service, prompt_manager=prompt_manager)
+    await output_manager.start()
+
+    decision_manager = DeciderManager(
+        event_bus,
+        llm_service,
+        config_service,
+        context_service,
+        prompt_manager,
+        capabilities_provider=output_manager,
+    )
+    await decision_manager.setup(decision_config=config.get("deciders", {}))
+    await decision_manager.start()
+
+    try:
+        replayer = JournalReplayer(
+            event_bus, speed=speed, include=include, input_pipeline_manager=input_pipeline_manager
+        )
+        report = await replayer.replay(read_journal(journal_path))
+        # 等待最后一批消息走完 Decider 和 Output Pipeline
+        await asyncio.sleep(drain)
+        print_report(report)
+    finally:
+        await decision_manager.cleanup()
+        await output_manager.stop()
+        await output_manager.cleanup()
+        await event_bus.cleanup()
+        await llm_service.cleanup()
+        await context_service.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="事件日志重放")
+    parser.add_argument("journal", help="事件日志文件路径（main.py --record-events 的输出）")
+    parser.add_argument("--speed", type=float, default=1.0, help="重放倍速，0 表示最大速度（默认 1.0）")
+    parser.add_argument("--events", nargs="+", default=["input."], help="重放的事件前缀（默认只重放 input.*）")
+    parser.add_argument("--drain", type=float, default=5.0, help="重放结束后等待处理完成的秒数（默认 5）")
+    parser.add_argument("--input-pipelines", action="store_true", help="让重放的消息再经过一次 Input Pipeline")
+    args = parser.parse_args()
+    asyncio.run(main(args.journal, args.speed, args.events, args.drain, args.input_pipelines))
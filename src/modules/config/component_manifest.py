@@ -0,0 +1,127 @@
+"""组件清单
+
+静态记录每个 Collector / Decider / Handler / Pipeline 的名称与实现模块，
+用于在不导入实现的情况下列举可用组件，并在真正用到时按需导入。
+
+组件模块在导入时通过 @collector/@decider/@handler/@pipeline 装饰器注册自身类（以及嵌套的
+ConfigSchema），因此只有配置中启用的组件才会被导入：仅启用 console_input + edge_tts 时
+不会加载 torch、pygame、pyvts 等重量级依赖。
+
+新增组件时需要在这里登记模块路径（tests/modules/config/test_component_manifest.py 会校验清单与装饰器注册一致）。
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Dict, List, Optional
+
+from src.modules.lifecycle import get_lifecycle_profiler
+from src.modules.logging import get_logger
+
+logger = get_logger("ComponentManifest")
+
+# 阶段 → {组件名称: 实现模块}
+COMPONENT_MANIFEST: Dict[str, Dict[str, str]] = {
+    "input": {
+        "bili_danmaku": "src.stages.input.collectors.bili_danmaku.bili_danmaku_collector",
+        "bili_danmaku_official": "src.stages.input.collectors.bili_danmaku_official.bili_danmaku_official_collector",
+        "console_input": "src.stages.input.collectors.console_input.console_input_collector",
+        "mainosaba": "src.stages.input.collectors.mainosaba.mainosaba_collector",
+        "mock_danmaku": "src.stages.input.collectors.mock_danmaku.mock_danmaku_collector",
+        "read_pingmu": "src.stages.input.collectors.read_pingmu.read_pingmu_collector",
+        "stt": "src.stages.input.collectors.stt.stt_collector",
+    },
+    "decision": {
+        "amaidesu": "src.stages.decision.deciders.amaidesu.amaidesu_decider",
+        "command": "src.stages.decision.deciders.command.command_decider",
+        "llm": "src.stages.decision.deciders.llm.llm_decider",
+        "maibot": "src.stages.decision.deciders.maibot.maibot_decider",
+        "replay": "src.stages.decision.deciders.replay.replay_decider",
+    },
+    "output": {
+        "debug_console": "src.stages.output.handlers.debug_console.debug_console_handler",
+        "edge_tts": "src.stages.output.handlers.edge_tts.edge_tts_handler",
+        "gptsovits": "src.stages.output.handlers.gptsovits.gptsovits_handler",
+        "mock": "src.stages.output.handlers.mock",
+        "obs_control": "src.stages.output.handlers.obs_control.obs_control_handler",
+        "omni_tts": "src.stages.output.handlers.omni_tts.omni_tts_handler",
+        "remote_stream": "src.stages.output.handlers.remote_stream.remote_stream_handler",
+        "sticker": "src.stages.output.handlers.sticker.sticker_handler",
+        "subtitle": "src.stages.output.handlers.subtitle.subtitle_handler",
+        "vrchat": "src.stages.output.handlers.avatar.vrchat.vrchat_handler",
+        "vts": "src.stages.output.handlers.avatar.vts.vts_handler",
+        "warudo": "src.stages.output.handlers.avatar.warudo.warudo_handler",
+    },
+}
+
+# Pipeline 阶段 → {Pipeline 名称: 实现模块}
+PIPELINE_MANIFEST: Dict[str, Dict[str, str]] = {
+    "input": {
+        "load_shed": "src.stages.input.pipelines.load_shed.pipeline",
+        "rate_limit": "src.stages.input.pipelines.rate_limit.pipeline",
+        "similar_filter": "src.stages.input.pipelines.similar_filter.pipeline",
+    },
+    "output": {
+        "profanity_filter": "src.stages.output.pipelines.profanity_filter.pipeline",
+    },
+}
+
+
+def list_components(phase: str) -> List[str]:
+    """列出某阶段清单中的所有组件名称（不导入实现）"""
+    return list(COMPONENT_MANIFEST.get(phase, {}))
+
+
+def get_component_module(phase: str, name: str) -> Optional[str]:
+    """组件的实现模块路径，不在清单中时返回 None"""
+    return COMPONENT_MANIFEST.get(phase, {}).get(name)
+
+
+def import_component(phase: str, name: str) -> bool:
+    """
+    导入组件的实现模块（触发装饰器注册）
+
+    Returns:
+        组件在清单中时返回 True，否则返回 False
+
+    Raises:
+        ImportError: 实现模块或其依赖导入失败
+    """
+    return _import(get_component_module(phase, name), f"{phase} 组件 '{name}'", f"import.{phase}.{name}")
+
+
+def import_pipeline(stage: str, name: str) -> bool:
+    """
+    导入 Pipeline 的实现模块（触发 @pipeline 注册）
+
+    Returns:
+        Pipeline 在清单中时返回 True，否则返回 False
+
+    Raises:
+        ImportError: 实现模块或其依赖导入失败
+    """
+    module_path = PIPELINE_MANIFEST.get(stage, {}).get(name)
+    return _import(module_path, f"{stage} Pipeline '{name}'", f"import.pipeline.{stage}.{name}")
+
+
+def _import(module_path: Optional[str], label: str, phase_name: str) -> bool:
+    if module_path is None:
+        return False
+    # 只有首次导入会真正执行模块（及其依赖），之后直接命中 sys.modules；耗时分析只记录首次导入
+    if module_path in sys.modules:
+        return True
+    logger.debug(f"按需导入 {label}: {module_path}")
+    with get_lifecycle_profiler().phase(phase_name):
+        importlib.import_module(module_path)
+    return True
+
+
+__all__ = [
+    "COMPONENT_MANIFEST",
+    "PIPELINE_MANIFEST",
+    "get_component_module",
+    "import_component",
+    "import_pipeline",
+    "list_components",
+]
@@ -127,6 +127,15 @@ class CoreConfig(BaseConfig):
     pipelines: dict[str, Any] = Field(
         default_factory=lambda: {
             "input": {
+                "load_shed": {
+                    "priority": 50,
+                    "enabled": True,
+                    "max_in_flight": 8,
+                    "max_lag_ms": 10000,
+                    "max_age_seconds": 60.0,
+                    # 主播自己的语音和控制台输入不参与降级
+                    "always_admit_sources": ["stt", "console", "console_input"],
+                },
                 "rate_limit": {
                     "priority": 100,
                     "enabled": True,
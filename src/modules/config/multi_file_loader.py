@@ -21,6 +21,7 @@ from typing import Any, Literal, Union, cast, get_args, get_origin
 
 import tomlkit
 
+from src.modules.config.component_manifest import import_component, list_components
 from src.modules.config.schemas.base import BaseConfig, DriftReport, _set_toml_value
 from src.modules.config.core_schemas import CoreConfig
 from src.modules.config.model_schemas import ModelConfig
@@ -34,11 +35,6 @@ _PHASE_TO_SECTION: dict[str, str] = {
     "decision": "deciders",
     "output": "handlers",
 }
-_PHASE_TO_COMPONENTS_PKG: dict[str, str] = {
-    "input": "src.stages.input.collectors",
-    "decision": "src.stages.decision.deciders",
-    "output": "src.stages.output.handlers",
-}
 _PHASE_TO_REGISTRY: dict[tuple[str, str], str] = {
     ("input", "_COLLECTORS"): "src.stages.input.registry",
     ("decision", "_DECIDERS"): "src.stages.decision.registry",
@@ -324,32 +320,18 @@ def _schema_to_toml_table(schema_cls: type[BaseModel]) -> Any:
 
 
 def _discover_components(phase: str) -> dict[str, type]:
-    """发现某阶段所有已注册组件的 ConfigSchema 类。
+    """发现某阶段所有组件的 ConfigSchema 类（仅用于生成默认配置文件）。
 
-    主动 import 阶段包，触发 @collector/@decider/@handler 装饰器注册，
-    然后枚举对应 registry 中的组件，提取其 ConfigSchema 嵌套类。
+    按 component_manifest 清单逐个 import 组件模块，触发 @collector/@decider/@handler 装饰器注册，
+    然后从对应 registry 中提取其 ConfigSchema 嵌套类。
 
-    容错策略：组件包 import 失败（如 STT 缺少 torch 依赖）时，
-    仅记录 warning 并返回空 dict，调用方降级到不追加组件模板的行为。
+    容错策略：单个组件 import 失败（如 STT 缺少 torch 依赖）时，仅记录 warning 并跳过该组件，
+    其余组件的配置模板照常生成。
     """
-    components_pkg = _PHASE_TO_COMPONENTS_PKG.get(phase)
-    section_key = _PHASE_TO_SECTION.get(phase)
     registry_attr = {"input": "_COLLECTORS", "decision": "_DECIDERS", "output": "_HANDLERS"}.get(phase)
-    if components_pkg is None or section_key is None or registry_attr is None:
-        logger.warning(f"未知阶段: {phase}")
-        return {}
-
-    try:
-        importlib.import_module(components_pkg)
-    except ImportError as e:
-        logger.warning(f"无法 import 阶段 {phase} 的组件包 {components_pkg}: {e}；跳过组件配置模板生成")
-        return {}
-    except Exception as e:
-        logger.warning(f"加载阶段 {phase} 组件时出错: {e}；跳过组件配置模板生成")
-        return {}
-
-    registry_path = _PHASE_TO_REGISTRY.get((phase, registry_attr))
+    registry_path = _PHASE_TO_REGISTRY.get((phase, registry_attr)) if registry_attr else None
     if registry_path is None:
+        logger.warning(f"未知阶段: {phase}")
         return {}
 
     try:
@@ -360,8 +342,14 @@ def _discover_components(phase: str) -> dict[str, type]:
         return {}
 
     discovered: dict[str, type] = {}
-    for name, cls in registry.items():
-        config_schema = getattr(cls, "ConfigSchema", None)
+    for name in list_components(phase):
+        try:
+            import_component(phase, name)
+        except Exception as e:
+            logger.warning(f"无法 import {phase} 组件 {name}: {e}；跳过该组件的配置模板生成")
+            continue
+
+        config_schema = getattr(registry.get(name), "ConfigSchema", None)
         if config_schema is not None and isinstance(config_schema, type):
             discovered[name] = config_schema
 
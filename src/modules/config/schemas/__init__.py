@@ -18,8 +18,8 @@ from .output_schemas import (
 
 # 组件 Schema Registry - 内存存储
 #
-# Input/Decision 阶段组件尚未注册 Schema，调用 get_config_schema 时会抛 KeyError。
-# Output 阶段组件通过 OUTPUT_CONFIG_MAP 查找；该 map 由 output_schemas 模块维护。
+# 组件的 ConfigSchema 在组件模块导入时由 @collector/@decider/@handler 装饰器注册；
+# get_config_schema 会按 component_manifest 清单按需导入尚未导入的组件。
 CONFIG_SCHEMA_REGISTRY: Dict[str, Type[BaseModel]] = {}
 
 
@@ -36,11 +36,11 @@ def register_config_schema(type: str, schema_class: Type[BaseModel]) -> None:
 
 def get_config_schema(type: str, phase: Optional[str] = None) -> Type[BaseModel]:
     """
-    获取组件的 Schema 类
+    获取组件的 Schema 类（组件尚未导入时按 component_manifest 清单导入）
 
     Args:
         type: Collector/Decider/Handler 类型标识
-        phase: 组件所处阶段（可选，仅用于错误信息）
+        phase: 组件所处阶段（可选，未指定时在所有阶段的清单中查找）
 
     Returns:
         对应的 Schema 类
@@ -52,6 +52,19 @@ def get_config_schema(type: str, phase: Optional[str] = None) -> Type[BaseModel]
     if schema is not None:
         return schema
 
+    # Schema 嵌套在组件类中，随组件模块导入时注册：按清单导入该组件后再查找
+    from src.modules.config.component_manifest import COMPONENT_MANIFEST, import_component
+
+    for component_phase in [phase] if phase else list(COMPONENT_MANIFEST):
+        try:
+            if import_component(component_phase, type):
+                break
+        except ImportError:
+            break
+    schema = CONFIG_SCHEMA_REGISTRY.get(type)
+    if schema is not None:
+        return schema
+
     raise KeyError(f"未注册的 Collector/Decider/Handler 类型: {type} (phase: {phase})")
 
 
@@ -5,24 +5,35 @@
 """
 
 import uuid
+from dataclasses import asdict
 from typing import TYPE_CHECKING, Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from src.modules.context.models import MessageRole
 from src.modules.dashboard.dependencies import get_dashboard_server
 from src.modules.dashboard.schemas.debug import (
     EventBusStatsResponse,
+    EventExecutorStats,
+    EventHandlerStats,
+    EventLatencyStats,
+    EventQueueStats,
     InjectIntentRequest,
     InjectIntentResponse,
     InjectMessageRequest,
     InjectMessageResponse,
+    LatencySummary,
+    MessageTraceInfo,
+    StuckHandlerInfo,
+    TraceListResponse,
+    TraceSpanInfo,
 )
 from src.modules.events.names import CoreEvents
 from src.modules.events.payloads.decision import IntentPayload
 from src.modules.events.payloads.input import MessageReadyPayload
 from src.modules.logging import get_logger
 from src.modules.time_utils import now_ms
+from src.modules.tracing import MessageTrace, get_tracer
 from src.modules.types.base.normalized_message import NormalizedMessage
 from src.modules.types.intent import Intent, IntentAction, IntentEmotion, IntentMetadata
 
@@ -169,17 +180,108 @@ async def get_event_bus_stats(
         total_events = 0
         total_subscribers = 0
         events_by_name: dict[str, int] = {}
+        events: dict[str, EventLatencyStats] = {}
 
         for event_name, stats in all_stats.items():
             total_events += stats.emit_count
             total_subscribers += stats.listener_count
             events_by_name[event_name] = stats.emit_count
+            events[event_name] = EventLatencyStats(
+                emit_count=stats.emit_count,
+                listener_count=stats.listener_count,
+                error_count=stats.error_count,
+                handler_latency=LatencySummary(**stats.handler_latency.summary()),
+                emit_latency=LatencySummary(**stats.emit_latency.summary()),
+            )
+
+        # 处理器级调用次数和延迟分位数（定位慢处理器）
+        handler_stats = event_bus.get_handler_stats() if hasattr(event_bus, "get_handler_stats") else {}
+        handlers = {
+            event_name: [
+                EventHandlerStats(
+                    event_name=item.event_name,
+                    handler_name=item.handler_name,
+                    call_count=item.call_count,
+                    error_count=item.error_count,
+                    last_error=item.last_error,
+                    latency=LatencySummary(**item.latency.summary()),
+                    delivery_latency=LatencySummary(**item.delivery_latency.summary()),
+                )
+                for item in items
+            ]
+            for event_name, items in handler_stats.items()
+        }
+
+        # 有界订阅者队列深度和丢弃计数
+        queue_stats = event_bus.get_queue_stats() if hasattr(event_bus, "get_queue_stats") else {}
+        queues = {
+            event_name: [EventQueueStats(**asdict(item)) for item in items] for event_name, items in queue_stats.items()
+        }
+
+        # 同步处理器执行器的排队深度、超时和卡住的处理器
+        executor_stats = event_bus.get_executor_stats() if hasattr(event_bus, "get_executor_stats") else []
+        executors = [
+            EventExecutorStats(
+                name=item.name,
+                max_workers=item.max_workers,
+                pending=item.pending,
+                active=item.active,
+                queued=item.queued,
+                high_watermark=item.high_watermark,
+                completed_count=item.completed_count,
+                timeout_count=item.timeout_count,
+                stuck=[StuckHandlerInfo(handler_name=name, running_seconds=seconds) for name, seconds in item.stuck],
+            )
+            for item in executor_stats
+        ]
 
         return EventBusStatsResponse(
             total_events=total_events,
             total_subscribers=total_subscribers,
             events_by_name=events_by_name,
+            queues=queues,
+            events=events,
+            handlers=handlers,
+            executors=executors,
         )
     except Exception as e:
         logger.error(f"获取 EventBus 统计失败: {e}")
         return EventBusStatsResponse()
+
+
+def _trace_to_info(trace: MessageTrace) -> MessageTraceInfo:
+    return MessageTraceInfo(
+        trace_id=trace.trace_id,
+        source=trace.source,
+        text=trace.text,
+        created_at_ms=trace.created_at_ms,
+        total_ms=trace.total_ms,
+        breakdown=trace.breakdown(),
+        spans=[
+            TraceSpanInfo(
+                name=span.name,
+                start_ms=span.start_ms,
+                end_ms=span.end_ms,
+                duration_ms=span.duration_ms,
+                is_mark=span.is_mark,
+            )
+            for span in trace.spans
+        ],
+    )
+
+
+@router.get("/traces", response_model=TraceListResponse)
+async def list_traces(
+    limit: Annotated[int, Query(ge=1, le=500, description="返回数量")] = 50,
+) -> TraceListResponse:
+    """获取最近消息的端到端延迟分解（新的在前）"""
+    return TraceListResponse(traces=[_trace_to_info(trace) for trace in get_tracer().get_recent(limit)])
+
+
+@router.get("/traces/{trace_id}", response_model=MessageTraceInfo)
+async def get_trace(trace_id: str) -> MessageTraceInfo:
+    """获取单条消息的端到端追踪"""
+    trace = get_tracer().get_trace(trace_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail=f"Trace not found: {trace_id}")
+    return _trace_to_info(trace)
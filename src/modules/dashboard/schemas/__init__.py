@@ -20,10 +20,19 @@ from src.modules.dashboard.schemas.config_schema import (
 )
 from src.modules.dashboard.schemas.debug import (
     EventBusStatsResponse,
+    EventExecutorStats,
+    EventHandlerStats,
+    EventLatencyStats,
+    EventQueueStats,
     InjectIntentRequest,
     InjectIntentResponse,
     InjectMessageRequest,
     InjectMessageResponse,
+    LatencySummary,
+    MessageTraceInfo,
+    StuckHandlerInfo,
+    TraceListResponse,
+    TraceSpanInfo,
 )
 from src.modules.dashboard.schemas.event import (
     ClientInfo,
@@ -101,6 +110,15 @@ __all__ = [
     "InjectIntentRequest",
     "InjectIntentResponse",
     "EventBusStatsResponse",
+    "EventExecutorStats",
+    "EventQueueStats",
+    "EventLatencyStats",
+    "EventHandlerStats",
+    "LatencySummary",
+    "MessageTraceInfo",
+    "StuckHandlerInfo",
+    "TraceListResponse",
+    "TraceSpanInfo",
     # Event
     "WebSocketMessage",
     "SubscribeRequest",
@@ -26,12 +26,112 @@ class InjectMessageResponse(BaseModel):
     error: Optional[str] = None
 
 
+class EventQueueStats(BaseModel):
+    """有界/合并订阅者队列统计"""
+
+    handler_name: str
+    policy: str
+    max_pending: int
+    depth: int = 0
+    high_watermark: int = 0
+    delivered_count: int = 0
+    dropped_count: int = 0
+    blocked_count: int = 0
+    coalesced_count: int = 0
+
+
+class LatencySummary(BaseModel):
+    """延迟直方图摘要（毫秒）"""
+
+    count: int = 0
+    avg_ms: float = 0.0
+    p50_ms: float = 0.0
+    p95_ms: float = 0.0
+    p99_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+class EventLatencyStats(BaseModel):
+    """单个事件的计数与延迟统计"""
+
+    emit_count: int = 0
+    listener_count: int = 0
+    error_count: int = 0
+    handler_latency: LatencySummary = Field(default_factory=LatencySummary)
+    emit_latency: LatencySummary = Field(default_factory=LatencySummary)
+
+
+class EventHandlerStats(BaseModel):
+    """单个处理器的计数与延迟统计"""
+
+    event_name: str
+    handler_name: str
+    call_count: int = 0
+    error_count: int = 0
+    last_error: Optional[str] = None
+    latency: LatencySummary = Field(default_factory=LatencySummary)
+    delivery_latency: LatencySummary = Field(default_factory=LatencySummary)
+
+
+class StuckHandlerInfo(BaseModel):
+    """超时后仍在运行的同步处理器"""
+
+    handler_name: str
+    running_seconds: float
+
+
+class EventExecutorStats(BaseModel):
+    """同步处理器执行器统计"""
+
+    name: str
+    max_workers: int
+    pending: int = 0
+    active: int = 0
+    queued: int = 0
+    high_watermark: int = 0
+    completed_count: int = 0
+    timeout_count: int = 0
+    stuck: List[StuckHandlerInfo] = []
+
+
 class EventBusStatsResponse(BaseModel):
     """EventBus 统计响应"""
 
     total_events: int = 0
     total_subscribers: int = 0
     events_by_name: Dict[str, int] = {}
+    queues: Dict[str, List[EventQueueStats]] = {}
+    events: Dict[str, EventLatencyStats] = {}
+    handlers: Dict[str, List[EventHandlerStats]] = {}
+    executors: List[EventExecutorStats] = []
+
+
+class TraceSpanInfo(BaseModel):
+    """消息追踪中的单个阶段"""
+
+    name: str
+    start_ms: float
+    end_ms: Optional[float] = None
+    duration_ms: Optional[float] = None
+    is_mark: bool = False
+
+
+class MessageTraceInfo(BaseModel):
+    """单条消息的端到端追踪"""
+
+    trace_id: str
+    source: str
+    text: str = ""
+    created_at_ms: int
+    total_ms: Optional[float] = None  # 到第一帧音频播放的耗时
+    breakdown: Dict[str, float] = {}  # 阶段名 -> 耗时（毫秒）
+    spans: List[TraceSpanInfo] = []
+
+
+class TraceListResponse(BaseModel):
+    """最近的消息追踪列表"""
+
+    traces: List[MessageTraceInfo] = []
 
 
 class InjectIntentRequest(BaseModel):
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set
 
 from pydantic import BaseModel
 
+from src.modules.events.mailbox import OverflowPolicy
 from src.modules.events.names import CoreEvents
 from src.modules.events.payloads import (
     IntentPayload,
@@ -42,6 +43,12 @@ class EventBroadcaster:
         CoreEvents.DECISION_DISCONNECTED: "decider.disconnected",
     }
 
+    # 每个订阅的最大积压事件数：WebSocket 客户端慢时丢弃最旧的事件，避免突发流量下内存无限增长
+    MAX_PENDING_EVENTS = 256
+
+    # 组件状态事件的合并窗口（毫秒）：重连抖动时每个组件每个窗口只广播最新状态
+    COMPONENT_COALESCE_MS = 200
+
     def __init__(
         self,
         event_bus: "EventBus",
@@ -155,7 +162,13 @@ class EventBroadcaster:
 
         for event_name, payload_class in component_event_map.items():
             handler = self._create_component_handler(event_name)
-            self._subscribe_event(event_name, handler, model_class=payload_class)
+            self._subscribe_event(
+                event_name,
+                handler,
+                model_class=payload_class,
+                coalesce_ms=self.COMPONENT_COALESCE_MS,
+                coalesce_key=lambda payload: payload.name,
+            )
 
     def _create_component_handler(self, target_event_name: str) -> Callable:
         """创建组件事件处理器（闭包捕获事件名）"""
@@ -170,10 +183,30 @@ class EventBroadcaster:
 
         return handler
 
-    def _subscribe_event(self, event_name: str, handler: Callable, model_class: type[BaseModel]) -> None:
-        """订阅单个事件"""
+    def _subscribe_event(
+        self,
+        event_name: str,
+        handler: Callable,
+        model_class: type[BaseModel],
+        coalesce_ms: Optional[int] = None,
+        coalesce_key: Optional[Callable[[Any], Any]] = None,
+    ) -> None:
+        """
+        订阅单个事件
+
+        消息/意图事件逐条广播（Dashboard 会话记录需要每一条），积压时丢弃最旧的；
+        指定 coalesce_ms 时改为合并订阅，只广播每个 key 的最新状态。
+        """
         try:
-            self.event_bus.on(event_name, handler, model_class=model_class)
+            self.event_bus.on(
+                event_name,
+                handler,
+                model_class=model_class,
+                max_pending=self.MAX_PENDING_EVENTS,
+                overflow=OverflowPolicy.DROP_OLDEST,
+                coalesce_ms=coalesce_ms,
+                coalesce_key=coalesce_key,
+            )
             self._subscribed_events.add(event_name)
             logger.debug(f"已订阅事件: {event_name}")
         except Exception as e:
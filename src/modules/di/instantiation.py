@@ -30,6 +30,7 @@ handler = instantiate_with_di(
 - **kwargs 处理**：检测到 `**kwargs` 时自动把所有剩余服务传入
 - **config 特殊处理**：`config` 参数从 `config=` 关键字直接获取
 - **默认值**：有默认值的无注解参数会被跳过
+- **签名缓存**：每个类的 `__init__` 签名和解析后的类型注解只计算一次
 
 ## 与参数名匹配的比较
 
@@ -48,10 +49,15 @@ from __future__ import annotations
 
 import inspect
 import logging
-from typing import Any, Dict, Type, Union, get_args, get_origin, get_type_hints
+from typing import Any, Dict, Tuple, Type, Union, get_args, get_origin, get_type_hints
+
+from src.modules.lifecycle.profiler import get_lifecycle_profiler
 
 logger = logging.getLogger(__name__)
 
+# 类 -> (__init__ 签名, 解析后的类型注解)
+_INIT_SPEC_CACHE: Dict[Type[Any], Tuple[inspect.Signature, Dict[str, Any]]] = {}
+
 
 class DependencyInjectionError(Exception):
     """依赖注入失败（缺失必填服务或参数无类型注解）。"""
@@ -124,18 +130,45 @@ def instantiate_with_di(
     Raises:
         DependencyInjectionError: 缺失必填服务、参数无注解且无默认值
     """
+    with get_lifecycle_profiler().phase(f"di.{cls.__name__}"):
+        return _instantiate(cls, config, services_by_type)
+
+
+def _get_init_spec(cls: Type[Any]) -> Tuple[inspect.Signature, Dict[str, Any]]:
+    """
+    获取 `cls.__init__` 的签名和解析后的类型注解（按类缓存）。
+
+    inspect.signature() 和 get_type_hints() 每次调用都要重新解析注解，
+    同一个类（如重启时重新创建的 Handler）没有必要重复计算。
+    """
+    cached = _INIT_SPEC_CACHE.get(cls)
+    if cached is not None:
+        return cached
+
     sig = inspect.signature(cls.__init__)
-    kwargs: Dict[str, Any] = {}
-    remaining_services: Dict[Type[Any], Any] = dict(services_by_type)
 
     # 解析 PEP 563 字符串注解（from __future__ import annotations）；
     # inspect.signature() 默认不解析字符串，会导致 DI 类型匹配失败
     try:
         resolved_hints = get_type_hints(cls.__init__)
     except Exception as e:
-        # 引用类型不在模块 globals 时回退到原始 annotation
+        # 引用类型不在模块 globals 时回退到原始 annotation；
+        # 不缓存失败结果，引用的类型之后可能变得可解析
         logger.debug(f"get_type_hints 解析失败，回退到原始 annotation: {e}")
-        resolved_hints = {}
+        return sig, {}
+
+    _INIT_SPEC_CACHE[cls] = (sig, resolved_hints)
+    return sig, resolved_hints
+
+
+def _instantiate(
+    cls: Type[Any],
+    config: Any,
+    services_by_type: Dict[Type[Any], Any],
+) -> Any:
+    sig, resolved_hints = _get_init_spec(cls)
+    kwargs: Dict[str, Any] = {}
+    remaining_services: Dict[Type[Any], Any] = dict(services_by_type)
 
     for name, param in sig.parameters.items():
         # 跳过 self
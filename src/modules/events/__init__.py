@@ -6,6 +6,9 @@ Amaidesu 事件系统模块
 
 # 导出核心组件
 from .event_bus import EventBus
+from .executor import ExecutorStats
+from .journal import EventJournal, JournalRecord, read_journal
+from .mailbox import MailboxStats, OverflowPolicy
 from .registry import (
     EVENT_REGISTRY,
     EventRegistry,
@@ -14,9 +17,19 @@ from .registry import (
     register_core_events,
     register_event,
 )
+from .stats import EventStats, HandlerStats, LatencyHistogram
 
 __all__ = [
     "EventBus",
+    "OverflowPolicy",
+    "MailboxStats",
+    "ExecutorStats",
+    "EventJournal",
+    "JournalRecord",
+    "read_journal",
+    "EventStats",
+    "HandlerStats",
+    "LatencyHistogram",
     "EventRegistry",
     "EVENT_REGISTRY",
     "register_event",
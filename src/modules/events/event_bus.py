@@ -7,6 +7,13 @@
 - 统计功能(emit/on调用计数、错误率、执行时间)
 - 生命周期管理(cleanup方法)
 - 类型化订阅支持(通过 model_class 参数自动反序列化)
+- 零拷贝分发(每次 emit 只验证一次，类型匹配的订阅者共享同一个 Payload 实例)
+- 预编译分发表(按事件缓存已排序的处理器元组，仅在 on/off 时失效；单处理器走快速路径)
+- 有界订阅(慢订阅者可设置 max_pending 和溢出策略，见 src.modules.events.mailbox)
+- 合并订阅(只关心最新状态的订阅者可设置 coalesce_ms/coalesce_key，按 key 合并并限制交付频率)
+- 无锁统计(事件级/处理器级计数与延迟直方图，见 src.modules.events.stats)
+- 专用同步执行器(同步处理器运行在有界线程池中，不占用默认线程池，见 src.modules.events.executor)
+- 事件监听(tap: 同步观察所有 emit，用于事件日志录制，见 src.modules.events.journal)
 
 类型化订阅使用示例:
     from src.modules.events.payloads import CommandRouterData
@@ -17,43 +24,38 @@
         logger.debug(f"Received: {command}")
 
     event_bus.on("command_router.received", handle_command_typed, model_class=CommandRouterData)
+
+零拷贝分发约定:
+    emit 传入的 Payload 实例会被原样交给所有 model_class 匹配（isinstance）的订阅者，
+    多个订阅者共享同一个对象，处理器必须将其视为只读（BasePayload 为 frozen，字段赋值会抛出
+    ValidationError）。只有类型不匹配的订阅者才会触发
+    一次 model_dump + model_validate（同一次 emit 内按类型缓存），dict 仅为
+    model_class=None 的旧式无类型处理器生成。
 """
 
 import asyncio
 import copy
 import time
 from collections import defaultdict
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Type, TypeVar
 
 from pydantic import BaseModel, ValidationError
 
+from src.modules.events.executor import ExecutorStats, SyncHandlerExecutor
+from src.modules.events.mailbox import CoalescingMailbox, MailboxStats, OverflowPolicy, SubscriberMailbox
 from src.modules.events.registry import EventRegistry
+from src.modules.events.stats import EventStats, HandlerStats, LatencyHistogram
 from src.modules.logging import get_logger
 
 T = TypeVar("T", bound=BaseModel)
 
+# 合并订阅未指定 max_pending 时最多保留的不同 key 数量
+DEFAULT_COALESCE_MAX_KEYS = 256
 
-@dataclass
-class EventStats:
-    """
-    事件统计信息
-
-    Attributes:
-        emit_count: 发布次数
-        listener_count: 监听器数量
-        error_count: 错误次数
-        last_emit_time: 最后发布时间(Unix时间戳,秒)
-        last_error_time: 最后错误时间(Unix时间戳,秒)
-        total_execution_time_ms: 总执行时间(毫秒)
-    """
-
-    emit_count: int = 0
-    listener_count: int = 0
-    error_count: int = 0
-    last_emit_time: float = 0
-    last_error_time: float = 0
-    total_execution_time_ms: float = 0
+# 共享同步处理器执行器的默认线程数与单次调用超时（秒）
+DEFAULT_SYNC_WORKERS = 4
+DEFAULT_SYNC_HANDLER_TIMEOUT = 30.0
 
 
 @dataclass
@@ -67,6 +69,10 @@ class HandlerWrapper:
     - error_count: 错误次数
     - last_error: 最后错误信息
     - original_handler: 原始处理器函数（用于取消订阅）
+    - model_class: 期望的 Payload 类型
+    - mailbox: 有界订阅的事件队列（None 表示每次 emit 直接分发）
+    - call_count / latency / delivery_latency: 处理器级调用计数与延迟直方图
+    - executor: 隔离的同步处理器执行器（None 表示使用共享执行器）
     """
 
     handler: Callable
@@ -74,6 +80,72 @@ class HandlerWrapper:
     error_count: int = 0
     last_error: Optional[str] = None
     original_handler: Optional[Callable] = None  # 存储用户提供的原始处理器
+    model_class: Optional[Type[BaseModel]] = None  # 期望的 Payload 类型，None 表示旧式无类型处理器（接收 dict）
+    mailbox: Optional[SubscriberMailbox] = None
+    call_count: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    delivery_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    executor: Optional[SyncHandlerExecutor] = None
+
+
+@dataclass(frozen=True)
+class _DispatchTable:
+    """
+    预编译的事件分发表
+
+    - direct: 每次 emit 直接分发的处理器（按优先级排序）
+    - queued: 通过有界邮箱分发的处理器（按优先级排序）
+    """
+
+    direct: Tuple[HandlerWrapper, ...]
+    queued: Tuple[HandlerWrapper, ...]
+
+    def __len__(self) -> int:
+        return len(self.direct) + len(self.queued)
+
+
+class _DispatchPayload:
+    """
+    单次 emit 内共享的 Payload 视图
+
+    按订阅者声明的类型惰性地提供数据：
+    - 类型匹配（isinstance）：直接返回原实例，不做任何拷贝
+    - 类型不匹配：model_dump 一次后按目标类型验证，并在本次 emit 内缓存
+    - model_class 为 None：返回缓存的 dict（仅旧式无类型处理器需要）
+
+    emitted_at 记录 emit 开始的单调时钟时间，用于计算投递延迟。
+    """
+
+    __slots__ = ("model", "emitted_at", "_dict", "_converted")
+
+    def __init__(self, model: BaseModel):
+        self.model = model
+        self.emitted_at = time.perf_counter()
+        self._dict: Optional[Dict[str, Any]] = None
+        self._converted: Dict[Type[BaseModel], BaseModel] = {}
+
+    def as_dict(self) -> Dict[str, Any]:
+        """返回序列化后的 dict（整个 emit 只序列化一次）"""
+        if self._dict is None:
+            self._dict = self.model.model_dump()
+        return self._dict
+
+    def as_type(self, model_class: Optional[Type[BaseModel]]) -> Any:
+        """
+        返回订阅者期望类型的数据
+
+        Raises:
+            ValidationError: 数据无法转换为 model_class
+        """
+        if model_class is None:
+            return self.as_dict()
+        if isinstance(self.model, model_class):
+            return self.model
+        converted = self._converted.get(model_class)
+        if converted is None:
+            converted = model_class.model_validate(self.as_dict())
+            self._converted[model_class] = converted
+        return converted
 
 
 class EventBus:
@@ -88,21 +160,34 @@ class EventBus:
     - 生命周期管理(cleanup方法)
     """
 
-    def __init__(self, enable_stats: bool = True):
+    def __init__(
+        self,
+        enable_stats: bool = True,
+        sync_workers: int = DEFAULT_SYNC_WORKERS,
+        sync_handler_timeout: Optional[float] = DEFAULT_SYNC_HANDLER_TIMEOUT,
+    ):
         """
         初始化事件总线
 
         Args:
             enable_stats: 是否启用统计功能
+            sync_workers: 共享同步处理器执行器的线程数
+            sync_handler_timeout: 同步处理器单次调用的超时时间（秒），None 表示不限制。
+                                  超时后停止等待并报告卡住的处理器（线程无法被强制终止）
         """
         self._handlers: Dict[str, List[HandlerWrapper]] = defaultdict(list)
+        # 预编译分发表：事件名 -> 按优先级排好序的处理器元组，on/off/clear 时失效
+        self._dispatch_tables: Dict[str, _DispatchTable] = {}
         self._stats: Dict[str, EventStats] = defaultdict(lambda: EventStats())
         self.enable_stats = enable_stats
         self.enable_validation = True  # 固定开启验证
         self._is_cleanup = False
         self._active_emits: Dict[str, asyncio.Event] = {}  # 跟踪活跃的 emit 操作
         self._background_tasks: set = set()  # 跟踪后台任务
-        self._stats_lock = asyncio.Lock()  # 保护统计数据的并发访问
+        self.sync_workers = sync_workers
+        self.sync_handler_timeout = sync_handler_timeout
+        self._sync_executor: Optional[SyncHandlerExecutor] = None  # 首个同步处理器调用时创建
+        self._taps: Tuple[Callable[[str, BaseModel, str], None], ...] = ()  # 观察所有 emit 的同步回调
         self.logger = get_logger("EventBus")
         self.logger.debug(f"EventBus 初始化完成 (stats={enable_stats}, validation=enabled)")
 
@@ -128,14 +213,17 @@ class EventBus:
 
         Args:
             event_name: 事件名称
-            data: Pydantic Model 实例（自动序列化为 dict）
+            data: Pydantic Model 实例（类型匹配的订阅者直接共享该实例，不做序列化）
             source: 事件源（通常是发布者的类名）
             error_isolate: 错误隔离策略
                 - True: 错误被隔离并记录，单个 handler 异常不会影响其他 handler 的执行
                 - False: 第一个异常会传播到调用者，中断所有 handler 的执行
             wait: 是否等待所有监听器执行完成
                 - False: 在后台任务中执行，不等待完成（默认）
-                - True: 等待所有监听器执行完成后再返回
+                - True: 等待所有监听器执行完成后再返回（有界订阅者的事件被丢弃时视为完成）
+
+        注意：有界订阅者（max_pending）使用 OverflowPolicy.BLOCK 时，即使 wait=False，
+        emit 也会等待其队列出现空位后才返回。
 
         Raises:
             TypeError: 如果 data 不是 BaseModel 实例
@@ -153,176 +241,311 @@ class EventBus:
                 f"请使用对应的事件 Payload 类（如 src.core.events.payloads 中定义的类）"
             )
 
-        # 将 Pydantic Model 序列化为 dict
-        dict_data = data.model_dump()
+        payload = _DispatchPayload(data)
 
-        # === 数据验证 ===
+        # === 数据验证（每次 emit 最多一次）===
         if self.enable_validation:
-            self._validate_event_data(event_name, dict_data)
+            self._validate_event_data(event_name, payload)
 
-        handlers = self._handlers.get(event_name, [])
-        if not handlers:
+        for tap in self._taps:
+            try:
+                tap(event_name, data, source)
+            except Exception as e:
+                self.logger.error(f"事件监听回调执行错误 ({event_name}): {e}")
+
+        table = self._get_dispatch_table(event_name)
+        if table is None:
             self.logger.debug(f"事件 {event_name} 没有监听器")
             return
 
-        # 按优先级排序（数字越小越优先）
-        handlers = sorted(handlers, key=lambda h: h.priority)
-
         # 打印事件信息（INFO 级别）
         log_message = self._format_event_log(event_name, data, source)
         self.logger.debug(log_message)
 
-        # 更新统计（使用锁保护）
+        # 更新统计（仅在事件循环线程中同步更新，无需加锁）
         if self.enable_stats:
-            async with self._stats_lock:
-                self._stats[event_name].emit_count += 1
-                self._stats[event_name].last_emit_time = time.time()
-                self._stats[event_name].listener_count = len(handlers)
+            stats = self._stats[event_name]
+            stats.emit_count += 1
+            stats.last_emit_time = time.time()
+            stats.listener_count = len(table)
+
+        # 有界订阅者：在发布者调用栈中入队（BLOCK 策略会在此等待空位）
+        waiters = []
+        for wrapper in table.queued:
+            waiter = await wrapper.mailbox.put(event_name, payload, source, track=wait)
+            if waiter is not None:
+                waiters.append(waiter)
+
+        # 根据 wait 参数决定执行方式
+        if table.direct:
+            if wait:
+                # 等待完成
+                await self._dispatch(event_name, table.direct, payload, source, error_isolate)
+            else:
+                # 在后台任务中执行并跟踪
+                task = asyncio.create_task(self._dispatch(event_name, table.direct, payload, source, error_isolate))
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+
+        if waiters:
+            await asyncio.gather(*waiters)
+
+    def _get_dispatch_table(self, event_name: str) -> Optional[_DispatchTable]:
+        """
+        获取事件的预编译分发表
+
+        分发表中的处理器按优先级排序（同优先级保持注册顺序），
+        首次 emit 时编译并缓存，直到 on/off/clear 使其失效。
 
-        start_time = time.time()
+        Args:
+            event_name: 事件名称
+
+        Returns:
+            分发表，没有监听器时为 None
+        """
+        table = self._dispatch_tables.get(event_name)
+        if table is None:
+            handlers = self._handlers.get(event_name)
+            if not handlers:
+                return None
+            # sorted 是稳定排序，同优先级保持注册顺序
+            ordered = sorted(handlers, key=lambda h: h.priority)
+            table = _DispatchTable(
+                direct=tuple(h for h in ordered if h.mailbox is None),
+                queued=tuple(h for h in ordered if h.mailbox is not None),
+            )
+            self._dispatch_tables[event_name] = table
+        return table
+
+    async def _dispatch(
+        self,
+        event_name: str,
+        handlers: Tuple[HandlerWrapper, ...],
+        payload: _DispatchPayload,
+        source: str,
+        error_isolate: bool,
+    ) -> None:
+        """
+        执行一次 emit 的处理器分发并跟踪完成状态
 
+        单处理器直接 await，不创建额外的 task 和 gather；多处理器按优先级顺序创建 task 并发执行。
+        """
         # 创建跟踪事件
         complete_event = asyncio.Event()
         emit_id = f"{event_name}_{id(complete_event)}"
         self._active_emits[emit_id] = complete_event
 
-        # 定义带跟踪的 emit 逻辑
-        async def emit_with_tracking():
-            try:
+        try:
+            if len(handlers) == 1:
+                # 快速路径：单处理器
+                await self._call_handler(handlers[0], event_name, payload, source, error_isolate)
+            else:
                 # 并发执行所有处理器
-                tasks = []
-                for wrapper in handlers:
-                    task = asyncio.create_task(
-                        self._call_handler(wrapper, event_name, dict_data, source, error_isolate)
-                    )
-                    tasks.append(task)
-
-                if tasks:
-                    if error_isolate:
-                        # 错误隔离模式：捕获所有异常，但不重新抛出
-                        results = await asyncio.gather(*tasks, return_exceptions=True)
-                        # 检查是否有异常（仅用于统计）
-                        for result in results:
-                            if isinstance(result, Exception):
-                                # 异常已在 _call_handler 中处理，这里不需要额外操作
-                                pass
-                    else:
-                        # 非隔离模式：让第一个异常传播到调用者
-                        results = await asyncio.gather(*tasks, return_exceptions=False)
-                        # 如果有异常，gather 会自动抛出，不需要额外处理
-
-                # 更新统计（使用锁保护）
-                if self.enable_stats:
-                    execution_time = (time.time() - start_time) * 1000
-                    async with self._stats_lock:
-                        self._stats[event_name].total_execution_time_ms += execution_time
-            finally:
-                # 标记完成并从活跃列表中移除
-                complete_event.set()
-                self._active_emits.pop(emit_id, None)
-
-        # 根据 wait 参数决定执行方式
-        if wait:
-            # 等待完成
-            await emit_with_tracking()
-        else:
-            # 在后台任务中执行并跟踪
-            task = asyncio.create_task(emit_with_tracking())
-            self._background_tasks.add(task)
-            task.add_done_callback(lambda t: self._background_tasks.discard(t))
+                tasks = [
+                    asyncio.create_task(self._call_handler(wrapper, event_name, payload, source, error_isolate))
+                    for wrapper in handlers
+                ]
+                # 错误隔离模式捕获所有异常（已在 _call_handler 中处理）；非隔离模式让第一个异常传播到调用者
+                await asyncio.gather(*tasks, return_exceptions=error_isolate)
+
+            if self.enable_stats:
+                execution_time = (time.perf_counter() - payload.emitted_at) * 1000
+                stats = self._stats[event_name]
+                stats.total_execution_time_ms += execution_time
+                stats.emit_latency.record(execution_time)
+        finally:
+            # 标记完成并从活跃列表中移除
+            complete_event.set()
+            self._active_emits.pop(emit_id, None)
 
     async def _call_handler(
-        self, wrapper: HandlerWrapper, event_name: str, data: Any, source: str, error_isolate: bool
+        self, wrapper: HandlerWrapper, event_name: str, payload: _DispatchPayload, source: str, error_isolate: bool
     ):
         """
         调用事件处理器
 
+        类型化处理器的异常总是被隔离并记录到 wrapper（与旧版 typed_wrapper 行为一致），
+        error_isolate 仅影响未被包装的异常传播。
+
         Args:
             wrapper: 处理器包装器
             event_name: 事件名称
-            data: 事件数据
+            payload: 本次 emit 共享的 Payload 视图
             source: 事件源
             error_isolate: 是否隔离错误
         """
+        try:
+            data = payload.as_type(wrapper.model_class)
+        except ValidationError as e:
+            # 验证错误：数据格式不匹配
+            # 不需要完整堆栈，ValidationError 已包含详细信息
+            # 注意：消息中含有任意异常文本，不能向 loguru 传递额外 kwargs（会触发 str.format）
+            self.logger.error(f"类型化事件数据验证失败 ({event_name}, 期望类型: {wrapper.model_class.__name__}): {e}")
+            return
+
+        start_time = time.perf_counter()
         try:
             if asyncio.iscoroutinefunction(wrapper.handler):
                 await wrapper.handler(event_name, data, source)
             else:
-                # 同步处理器在线程池中执行
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(None, wrapper.handler, event_name, data, source)
+                # 同步处理器在专用的有界线程池中执行（隔离处理器使用自己的单线程执行器）
+                executor = wrapper.executor or self._get_sync_executor()
+                handler_name = getattr(wrapper.handler, "__name__", repr(wrapper.handler))
+                await executor.run(handler_name, wrapper.handler, event_name, data, source)
         except Exception as e:
             # 更新处理器级别的错误统计（不需要锁，因为每个 handler 独立）
             wrapper.error_count += 1
             wrapper.last_error = str(e)
-
-            if error_isolate:
-                self.logger.error(f"事件处理器执行错误 (事件: {event_name}, 来源: {source}): {e}", exc_info=True)
-                # 更新统计（使用锁保护）
-                if self.enable_stats:
-                    async with self._stats_lock:
-                        self._stats[event_name].error_count += 1
-                        self._stats[event_name].last_error_time = time.time()
-            else:
-                raise
-
-    def on(self, event_name: str, handler: Callable, model_class: Type[T], priority: int = 100) -> None:
+            handler_name = getattr(wrapper.handler, "__name__", repr(wrapper.handler))
+            self.logger.exception(
+                f"类型化事件处理器执行错误 ({event_name}, 处理器: {handler_name}, 来源: {source}): {e}"
+            )
+            if self.enable_stats:
+                stats = self._stats[event_name]
+                stats.error_count += 1
+                stats.last_error_time = time.time()
+            # 注意：这里不重新抛出异常，保持与 error_isolate=True 一致的行为
+        finally:
+            if self.enable_stats:
+                end_time = time.perf_counter()
+                elapsed_ms = (end_time - start_time) * 1000
+                wrapper.call_count += 1
+                wrapper.latency.record(elapsed_ms)
+                wrapper.delivery_latency.record((end_time - payload.emitted_at) * 1000)
+                self._stats[event_name].handler_latency.record(elapsed_ms)
+
+    def on(
+        self,
+        event_name: str,
+        handler: Callable,
+        model_class: Optional[Type[T]],
+        priority: int = 100,
+        max_pending: Optional[int] = None,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        coalesce_ms: Optional[int] = None,
+        coalesce_key: Optional[Callable[[Any], Hashable]] = None,
+        isolated: bool = False,
+    ) -> None:
         """
         订阅类型化事件
 
-        EventBus 强制要求类型化订阅，所有订阅必须指定 model_class。
+        EventBus 要求类型化订阅，所有订阅都应指定 model_class。
 
         Args:
             event_name: 要监听的事件名称
             handler: 事件处理器函数
-            model_class: 期望的数据模型类型（必须是 BaseModel 子类）
-                         EventBus 会自动将字典数据反序列化为该类型
+            model_class: 期望的数据模型类型（BaseModel 子类）
+                         emit 的 Payload 若是该类型的实例则直接传入（零拷贝），
+                         否则自动转换为该类型。传入 None 表示旧式无类型处理器，接收 dict。
             priority: 优先级(数字越小越优先,默认100)
+            max_pending: 有界订阅的最大待处理事件数。None（默认）表示每次 emit 直接分发；
+                         设置后该处理器的事件进入独立队列，由单个工作协程按顺序处理
+            overflow: 队列满时的溢出策略（仅 max_pending 不为 None 且未启用合并时生效）
+            coalesce_ms: 合并订阅的交付窗口（毫秒）。设置后（或设置了 coalesce_key）启用合并订阅：
+                         同 key 的待处理事件只保留最新一条，且每个窗口最多交付一批。
+                         适合只关心最新状态的订阅者（Dashboard、字幕、虚拟形象）
+            coalesce_key: 从 Payload（已转换为 model_class）计算合并 key 的函数。
+                          None 表示所有事件共用一个 key（只保留最新一条）；
+                          启用合并时 max_pending 表示最多保留的不同 key 数量（默认 256）
+            isolated: 同步处理器独占一个单线程执行器（适合可能长时间阻塞的处理器），
+                      阻塞时不影响共享执行器中的其他同步处理器
+
+        Raises:
+            ValueError: max_pending 小于 1、coalesce_ms 小于 0，或对异步处理器设置 isolated
 
         Example:
             ```python
             # 类型化订阅（接收 Pydantic Model 对象）
             event_bus.on("event.name", handler, model_class=MessageReadyPayload)
+
+            # 慢订阅者：最多积压 64 个事件，溢出时丢弃最旧的
+            event_bus.on(
+                "event.name", handler, MessageReadyPayload, max_pending=64, overflow=OverflowPolicy.DROP_OLDEST
+            )
+
+            # 状态订阅者：每 100ms 最多交付一次，每个组件只保留最新状态
+            event_bus.on("event.name", handler, ComponentPayload, coalesce_ms=100, coalesce_key=lambda p: p.name)
             ```
         """
-        # 注册事件类型到 EventRegistry
-        try:
-            EventRegistry.register_core_event(event_name, model_class)
-        except ValueError:
-            self.logger.debug(f"事件 '{event_name}' 不符合核心事件命名规范")
-
-        # 创建包装器，自动反序列化
-        async def typed_wrapper(event_name: str, dict_data: Dict[str, Any], source: str):
+        if model_class is not None:
+            # 注册事件类型到 EventRegistry
             try:
-                typed_data = model_class.model_validate(dict_data)
-                if asyncio.iscoroutinefunction(handler):
-                    await handler(event_name, typed_data, source)
-                else:
-                    handler(event_name, typed_data, source)
-            except ValidationError as e:
-                # 验证错误：数据格式不匹配
-                self.logger.error(
-                    f"类型化事件数据验证失败 ({event_name}, 期望类型: {model_class.__name__}): {e}",
-                    exc_info=False,  # 不需要完整堆栈，ValidationError 已包含详细信息
-                )
-            except Exception as e:
-                # 处理器执行错误：记录但不传播（保持与其他处理器一致）
-                self.logger.error(
-                    f"类型化事件处理器执行错误 ({event_name}, 处理器: {handler.__name__}): {e}", exc_info=True
+                EventRegistry.register_core_event(event_name, model_class)
+            except ValueError:
+                self.logger.debug(f"事件 '{event_name}' 不符合核心事件命名规范")
+
+        handler_name = getattr(handler, "__name__", repr(handler))
+        if isolated and asyncio.iscoroutinefunction(handler):
+            raise ValueError(f"isolated 只适用于同步处理器: {handler_name}")
+
+        wrapper = HandlerWrapper(handler=handler, priority=priority, original_handler=handler, model_class=model_class)
+        if isolated:
+            wrapper.executor = SyncHandlerExecutor(f"EventBus-{handler_name}", 1, self.sync_handler_timeout)
+        coalesce = coalesce_ms is not None or coalesce_key is not None
+        if max_pending is not None or coalesce:
+
+            async def consume(name: str, payload: _DispatchPayload, source: str) -> None:
+                await self._call_handler(wrapper, name, payload, source, True)
+
+            if coalesce:
+                key_fn = self._make_coalesce_key(model_class, coalesce_key) if coalesce_key is not None else None
+                wrapper.mailbox = CoalescingMailbox(
+                    handler_name,
+                    max_pending if max_pending is not None else DEFAULT_COALESCE_MAX_KEYS,
+                    consume,
+                    window_ms=coalesce_ms or 0,
+                    key_fn=key_fn,
                 )
-                # 更新错误计数
-                wrapper.error_count += 1
-                wrapper.last_error = str(e)
-                # 注意：这里不重新抛出异常，保持与 error_isolate=True 一致的行为
-                # 如果需要传播异常，应该通过 error_isolate 参数控制
+            else:
+                wrapper.mailbox = SubscriberMailbox(handler_name, max_pending, overflow, consume)
 
-        wrapper = HandlerWrapper(handler=typed_wrapper, priority=priority, original_handler=handler)
         self._handlers[event_name].append(wrapper)
+        self._dispatch_tables.pop(event_name, None)
+        type_name = model_class.__name__ if model_class is not None else "dict"
+        if coalesce:
+            queue_info = f", 合并: {coalesce_ms or 0}ms"
+        elif max_pending is not None:
+            queue_info = f", 队列: {max_pending}/{OverflowPolicy(overflow).value}"
+        else:
+            queue_info = ""
+        if isolated:
+            queue_info += ", 隔离执行器"
         self.logger.debug(
-            f"注册类型化事件监听器: {event_name} -> {handler.__name__} "
-            f"(类型: {model_class.__name__}, 优先级: {priority})"
+            f"注册类型化事件监听器: {event_name} -> {handler_name} (类型: {type_name}, 优先级: {priority}{queue_info})"
         )
 
+    def add_tap(self, tap: Callable[[str, BaseModel, str], None]) -> None:
+        """
+        添加事件监听回调（tap）
+
+        tap 在每次 emit 时（验证之后、分发之前，无论是否有订阅者）以 (event_name, data, source)
+        同步调用，不参与分发也不影响统计。tap 必须足够轻量（例如只把事件追加到缓冲区），
+        且与订阅者一样须将 data 视为只读。
+
+        Args:
+            tap: 同步回调函数
+        """
+        self._taps = (*self._taps, tap)
+
+    def remove_tap(self, tap: Callable[[str, BaseModel, str], None]) -> None:
+        """移除事件监听回调（未添加时忽略）"""
+        self._taps = tuple(t for t in self._taps if t != tap)
+
+    @staticmethod
+    def _make_coalesce_key(
+        model_class: Optional[Type[BaseModel]], coalesce_key: Callable[[Any], Hashable]
+    ) -> Callable[[_DispatchPayload], Hashable]:
+        """把作用于订阅类型的 coalesce_key 包装为作用于 _DispatchPayload 的 key 函数"""
+
+        def key_fn(payload: _DispatchPayload) -> Hashable:
+            try:
+                return coalesce_key(payload.as_type(model_class))
+            except ValidationError:
+                # 无法转换的事件归入同一个 key，交付时由 _call_handler 记录验证错误
+                return None
+
+        return key_fn
+
     def off(self, event_name: str, handler: Callable) -> None:
         """
         取消订阅
@@ -336,18 +559,30 @@ class EventBus:
             # 检查是否匹配（支持 on_typed 的原始处理器）
             if wrapper.handler == handler or wrapper.original_handler == handler:
                 handlers.pop(i)
+                if wrapper.mailbox is not None:
+                    wrapper.mailbox.close()
+                if wrapper.executor is not None:
+                    wrapper.executor.shutdown()
+                self._dispatch_tables.pop(event_name, None)
                 self.logger.debug(f"移除事件监听器: {event_name} -> {handler.__name__}")
                 break
 
         # 如果该事件没有监听器了，删除该条目
         if not handlers:
-            del self._handlers[event_name]
+            self._handlers.pop(event_name, None)
 
     def clear(self) -> None:
         """
         清除所有事件监听器和统计信息
         """
+        for handlers in self._handlers.values():
+            for wrapper in handlers:
+                if wrapper.mailbox is not None:
+                    wrapper.mailbox.close()
+                if wrapper.executor is not None:
+                    wrapper.executor.shutdown()
         self._handlers.clear()
+        self._dispatch_tables.clear()
         self._stats.clear()
         self.logger.info("已清除所有事件监听器和统计信息")
 
@@ -397,7 +632,20 @@ class EventBus:
             except asyncio.TimeoutError:
                 self.logger.warning("等待后台任务超时")
 
+        # 有界订阅者队列处理
+        busy = [w.mailbox for hs in self._handlers.values() for w in hs if w.mailbox and not w.mailbox.is_idle]
+        if busy:
+            pending = sum(mailbox.depth for mailbox in busy)
+            self.logger.info(f"等待 {len(busy)} 个有界订阅者处理剩余的 {pending} 个排队事件...")
+            try:
+                await asyncio.wait_for(asyncio.gather(*(m.join() for m in busy)), timeout=2.0)
+            except asyncio.TimeoutError:
+                self.logger.warning("等待有界订阅者队列超时，剩余事件将被丢弃")
+
         self.clear()
+        if self._sync_executor is not None:
+            self._sync_executor.shutdown()
+            self._sync_executor = None
         self.logger.info("EventBus已清理")
 
     def get_listeners_count(self, event_name: str) -> int:
@@ -448,25 +696,91 @@ class EventBus:
         # 返回深拷贝以避免外部修改影响内部数据
         return {k: copy.deepcopy(v) for k, v in self._stats.items()}
 
+    def get_queue_stats(self) -> Dict[str, List[MailboxStats]]:
+        """
+        获取有界订阅者的队列统计（队列深度、丢弃计数等）
+
+        Returns:
+            事件名到该事件所有有界订阅者队列统计（副本）的映射，只包含存在有界订阅者的事件
+        """
+        result: Dict[str, List[MailboxStats]] = {}
+        for event_name, handlers in self._handlers.items():
+            queue_stats = [copy.copy(w.mailbox.stats) for w in handlers if w.mailbox is not None]
+            if queue_stats:
+                result[event_name] = queue_stats
+        return result
+
+    def get_executor_stats(self) -> List[ExecutorStats]:
+        """
+        获取同步处理器执行器统计（共享执行器 + 所有隔离执行器）
+
+        Returns:
+            执行器统计快照列表（排队/运行中调用数、超时次数、卡住的处理器）
+        """
+        result: List[ExecutorStats] = []
+        if self._sync_executor is not None:
+            result.append(self._sync_executor.stats)
+        for handlers in self._handlers.values():
+            result.extend(w.executor.stats for w in handlers if w.executor is not None)
+        return result
+
+    def _get_sync_executor(self) -> SyncHandlerExecutor:
+        if self._sync_executor is None:
+            self._sync_executor = SyncHandlerExecutor("EventBus-sync", self.sync_workers, self.sync_handler_timeout)
+        return self._sync_executor
+
+    def get_handler_stats(self) -> Dict[str, List[HandlerStats]]:
+        """
+        获取处理器级统计（调用次数、错误、执行延迟和投递延迟直方图）
+
+        Returns:
+            事件名到该事件所有处理器统计（副本）的映射
+        """
+        if not self.enable_stats:
+            return {}
+        result: Dict[str, List[HandlerStats]] = {}
+        for event_name, handlers in self._handlers.items():
+            result[event_name] = [
+                HandlerStats(
+                    event_name=event_name,
+                    handler_name=getattr(w.handler, "__name__", repr(w.handler)),
+                    call_count=w.call_count,
+                    error_count=w.error_count,
+                    last_error=w.last_error,
+                    latency=copy.deepcopy(w.latency),
+                    delivery_latency=copy.deepcopy(w.delivery_latency),
+                )
+                for w in handlers
+            ]
+        return result
+
     def reset_stats(self, event_name: Optional[str] = None):
         """
-        重置统计信息
+        重置统计信息（包括处理器级延迟直方图）
 
         Args:
             event_name: 事件名称，如果为None则重置所有
         """
         if event_name:
             self._stats[event_name] = EventStats()
+            wrappers = self._handlers.get(event_name, [])
         else:
             self._stats.clear()
+            wrappers = [w for handlers in self._handlers.values() for w in handlers]
+        for wrapper in wrappers:
+            wrapper.call_count = 0
+            wrapper.latency = LatencyHistogram()
+            wrapper.delivery_latency = LatencyHistogram()
 
-    def _validate_event_data(self, event_name: str, data: Any) -> None:
+    def _validate_event_data(self, event_name: str, payload: _DispatchPayload) -> None:
         """
         验证事件数据
 
         策略：
-        - 已注册事件：验证数据格式
-        - 未注册事件：仅警告，不阻断
+        - 未注册事件：跳过
+        - Payload 已是注册类型的实例：视为已验证，不再序列化
+        - 其他类型：序列化后按注册类型验证一次，结果缓存到 payload 供同类型订阅者复用；
+          验证失败仅警告，不阻断
         """
         model = EventRegistry.get(event_name)
 
@@ -476,16 +790,8 @@ class EventBus:
                 self.logger.debug(f"未注册的非插件事件: {event_name}")
             return
 
-        # 已注册事件：验证数据
         try:
-            if isinstance(data, BaseModel):
-                # 已经是 Pydantic Model，跳过验证
-                return
-            elif isinstance(data, dict):
-                # 字典数据，尝试验证
-                model.model_validate(data)
-            else:
-                self.logger.warning(f"事件 {event_name} 数据类型不支持验证: {type(data).__name__}")
+            payload.as_type(model)
         except ValidationError as e:
             self.logger.warning(f"事件数据验证失败 ({event_name}): {e.error_count()} 个错误")
             for error in e.errors():
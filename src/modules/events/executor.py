@@ -0,0 +1,177 @@
+"""
+同步事件处理器执行器
+
+EventBus 的同步处理器不再使用事件循环的默认线程池（该线程池与 Edge TTS 文件保存、
+VLM 图片编码、OBS 调用等所有 run_in_executor/to_thread 共享），而是运行在专用的
+有界线程池中：
+- 共享执行器：所有同步处理器默认共用，线程数固定
+- 隔离执行器：on(isolated=True) 的处理器独占一个单线程执行器，阻塞时只影响自己
+
+超时的处理器无法被强制终止（线程会继续运行到结束），执行器会停止等待、记录超时，
+并在 stuck 列表中报告仍在运行的处理器及其已运行时长，直到它最终返回。
+"""
+
+import asyncio
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.modules.logging import get_logger
+
+logger = get_logger("EventBus")
+
+
+@dataclass
+class ExecutorStats:
+    """
+    同步处理器执行器统计
+
+    Attributes:
+        name: 执行器名称
+        max_workers: 最大线程数
+        pending: 已提交但尚未完成的调用数（排队 + 运行中）
+        active: 正在线程中运行的调用数
+        high_watermark: pending 的历史峰值
+        completed_count: 已完成的调用数（包括抛出异常的调用，不包括超时的调用）
+        timeout_count: 超时的调用数
+        stuck: 超时后仍在运行的处理器 (处理器名称, 已运行秒数)
+    """
+
+    name: str
+    max_workers: int
+    pending: int = 0
+    active: int = 0
+    high_watermark: int = 0
+    completed_count: int = 0
+    timeout_count: int = 0
+    stuck: List[Tuple[str, float]] = field(default_factory=list)
+
+    @property
+    def queued(self) -> int:
+        """等待空闲线程的调用数"""
+        return max(self.pending - self.active, 0)
+
+
+class SyncHandlerExecutor:
+    """
+    有界同步处理器执行器
+
+    计数只在事件循环线程中更新；工作线程只写入 _running 字典（单次字典赋值/删除在 GIL 下是原子的），
+    用于区分排队和运行中的调用并报告卡住的处理器。
+    """
+
+    def __init__(self, name: str, max_workers: int, timeout: Optional[float] = None):
+        """
+        初始化执行器
+
+        Args:
+            name: 执行器名称（同时作为线程名前缀）
+            max_workers: 最大线程数
+            timeout: 单次调用的超时时间（秒），None 表示不限制
+
+        Raises:
+            ValueError: max_workers 小于 1 或 timeout 不为正数
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers 必须 >= 1，收到: {max_workers}")
+        if timeout is not None and timeout <= 0:
+            raise ValueError(f"timeout 必须 > 0，收到: {timeout}")
+
+        self.name = name
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._stats = ExecutorStats(name=name, max_workers=max_workers)
+        self._ids = itertools.count()
+        # 调用 ID -> (处理器名称, 开始运行时间)，由工作线程维护
+        self._running: Dict[int, Tuple[str, float]] = {}
+        # 已超时但仍在运行的调用 ID
+        self._timed_out: Dict[int, str] = {}
+
+    @property
+    def stats(self) -> ExecutorStats:
+        """统计快照"""
+        snapshot = ExecutorStats(
+            name=self.name,
+            max_workers=self.max_workers,
+            pending=self._stats.pending,
+            active=len(self._running),
+            high_watermark=self._stats.high_watermark,
+            completed_count=self._stats.completed_count,
+            timeout_count=self._stats.timeout_count,
+        )
+        now = time.monotonic()
+        for call_id in list(self._timed_out):
+            running = self._running.get(call_id)
+            if running is None:
+                # 超时记录与线程结束存在竞争，已结束的调用在这里清理
+                self._timed_out.pop(call_id, None)
+            else:
+                snapshot.stuck.append((running[0], now - running[1]))
+        return snapshot
+
+    async def run(self, handler_name: str, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        在线程池中执行同步函数
+
+        Args:
+            handler_name: 处理器名称（用于超时报告）
+            func: 同步函数
+            *args: 函数参数
+
+        Returns:
+            函数返回值
+
+        Raises:
+            asyncio.TimeoutError: 超过 timeout 仍未完成（函数会在线程中继续运行）
+        """
+        call_id = next(self._ids)
+        running = self._running
+        timed_out = self._timed_out
+
+        def call() -> Any:
+            running[call_id] = (handler_name, time.monotonic())
+            try:
+                return func(*args)
+            finally:
+                del running[call_id]
+                timed_out.pop(call_id, None)
+
+        stats = self._stats
+        stats.pending += 1
+        if stats.pending > stats.high_watermark:
+            stats.high_watermark = stats.pending
+
+        concurrent_future = self._pool.submit(call)
+        future = asyncio.wrap_future(concurrent_future)
+        try:
+            if self.timeout is None:
+                result = await future
+            else:
+                result = await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except asyncio.TimeoutError:
+            stats.timeout_count += 1
+            if call_id in running:
+                timed_out[call_id] = handler_name
+                logger.warning(
+                    f"同步处理器执行超时 ({self.timeout}s)，线程仍在运行: {handler_name} "
+                    f"(执行器: {self.name}, 排队: {stats.pending - len(running)})"
+                )
+            else:
+                # 仍在排队：直接取消线程池中的任务（同步生效），之后不会再运行
+                concurrent_future.cancel()
+                logger.warning(f"同步处理器排队超时 ({self.timeout}s)，已取消: {handler_name} (执行器: {self.name})")
+            raise
+        except Exception:
+            stats.completed_count += 1
+            raise
+        finally:
+            stats.pending -= 1
+        stats.completed_count += 1
+        return result
+
+    def shutdown(self) -> None:
+        """关闭执行器：取消排队中的调用，不等待运行中的线程"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,231 @@
+"""
+事件日志（Event Journal）
+
+把 EventBus 的所有流量（事件名、Payload、时间偏移、来源）录制到只追加的 JSON Lines 文件，
+供 src.modules.events.replay 在离线进程中按原始节奏（或加速）重放，用于复现礼物刷屏、
+突袭等真实突发流量并测量 Decider / Pipeline 的吞吐与延迟。
+
+文件格式（每行一个 JSON 对象，路径以 .gz 结尾时使用 gzip 压缩）：
+
+    {"journal": 1, "started_at_ms": 1729612345678}
+    {"t": 12.345, "e": "input.message.received", "s": "bili_danmaku", "p": {...}}
+
+- t: 相对录制开始的偏移（毫秒，单调时钟）
+- e / s: 事件名 / 事件源
+- p: Payload（按别名序列化的 JSON，重放时按 EventRegistry 中的类型反序列化）
+
+录制开销：tap 只把 (偏移, 事件名, 来源, Payload 引用) 追加到缓冲区；序列化和写文件在
+后台刷新任务中批量进行（写文件在线程中执行，不阻塞事件循环）。Payload 按零拷贝约定是只读的，
+因此延迟序列化是安全的。
+"""
+
+import asyncio
+import gzip
+import json
+import time
+from dataclasses import dataclass
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel
+
+from src.modules.logging import get_logger
+from src.modules.time_utils import now_ms
+
+if TYPE_CHECKING:
+    from src.modules.events.event_bus import EventBus
+
+JOURNAL_FORMAT_VERSION = 1
+
+logger = get_logger("EventJournal")
+
+
+@dataclass
+class JournalRecord:
+    """
+    事件日志中的一条记录
+
+    Attributes:
+        offset_ms: 相对录制开始的偏移（毫秒）
+        event_name: 事件名称
+        source: 事件源
+        payload: Payload 字典（JSON 兼容格式）
+    """
+
+    offset_ms: float
+    event_name: str
+    source: str
+    payload: Dict[str, Any]
+
+
+def _open_journal(path: str, mode: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class EventJournal:
+    """
+    EventBus 流量录制器
+
+    使用方式::
+
+        journal = EventJournal("logs/events.jsonl.gz")
+        journal.attach(event_bus)
+        ...
+        await journal.close()
+    """
+
+    def __init__(
+        self,
+        path: str,
+        include: Optional[Sequence[str]] = None,
+        flush_interval: float = 0.5,
+        max_buffer: int = 1000,
+    ):
+        """
+        初始化录制器
+
+        Args:
+            path: 日志文件路径（以 .gz 结尾时使用 gzip 压缩；已存在时追加）
+            include: 只录制以这些前缀开头的事件，None 表示录制所有事件
+            flush_interval: 后台刷新间隔（秒）
+            max_buffer: 缓冲区达到该数量时立即触发刷新
+        """
+        self.path = path
+        self.include = tuple(include) if include else None
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+
+        self.recorded_count = 0
+        self.failed_count = 0
+
+        self._origin = time.perf_counter()
+        self._buffer: List[Tuple[float, str, str, BaseModel]] = []
+        self._file: Optional[IO[str]] = None
+        self._event_bus: Optional["EventBus"] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_requested = asyncio.Event()
+        self._write_lock = asyncio.Lock()
+        self._closed = False
+
+    def attach(self, event_bus: "EventBus") -> None:
+        """开始录制指定 EventBus 的流量"""
+        self._event_bus = event_bus
+        event_bus.add_tap(self._tap)
+        logger.info(f"事件日志录制已开始: {self.path}")
+
+    def detach(self) -> None:
+        """停止录制（已缓冲的记录在 close() 时写入）"""
+        if self._event_bus is not None:
+            self._event_bus.remove_tap(self._tap)
+            self._event_bus = None
+
+    async def close(self) -> None:
+        """停止录制，写入剩余记录并关闭文件"""
+        self.detach()
+        self._closed = True
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+        if self._file is not None:
+            await asyncio.to_thread(self._file.close)
+            self._file = None
+        logger.info(f"事件日志录制已结束: {self.path} (记录 {self.recorded_count} 条，失败 {self.failed_count} 条)")
+
+    async def flush(self) -> None:
+        """把缓冲区中的记录序列化并写入文件"""
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        lines = []
+        for offset_ms, event_name, source, data in batch:
+            try:
+                payload = data.model_dump_json(by_alias=True, fallback=str)
+            except Exception as e:
+                self.failed_count += 1
+                logger.warning(f"事件序列化失败，跳过 ({event_name}): {e}")
+                continue
+            lines.append(
+                f'{{"t":{offset_ms:.3f},"e":{json.dumps(event_name)},"s":{json.dumps(source, ensure_ascii=False)},'
+                f'"p":{payload}}}\n'
+            )
+        if not lines:
+            return
+        async with self._write_lock:
+            await asyncio.to_thread(self._write, "".join(lines))
+        self.recorded_count += len(lines)
+
+    def _tap(self, event_name: str, data: BaseModel, source: str) -> None:
+        if self._closed or (self.include is not None and not event_name.startswith(self.include)):
+            return
+        self._buffer.append(((time.perf_counter() - self._origin) * 1000, event_name, source, data))
+        if len(self._buffer) >= self.max_buffer:
+            self._flush_requested.set()
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop(), name="EventJournal.flush")
+
+    async def _flush_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"写入事件日志失败: {e}")
+
+    def _write(self, text: str) -> None:
+        if self._file is None:
+            self._file = _open_journal(self.path, "a")
+            header = {"journal": JOURNAL_FORMAT_VERSION, "started_at_ms": now_ms()}
+            self._file.write(json.dumps(header) + "\n")
+        self._file.write(text)
+        self._file.flush()
+
+
+def read_journal(path: str) -> Iterator[JournalRecord]:
+    """
+    读取事件日志
+
+    同一文件中多次录制（追加）的片段会按顺序读出，每个片段的偏移从该片段开始重新计算，
+    读取时把后续片段的偏移接在前一片段之后，保证偏移单调不减。
+
+    Args:
+        path: 日志文件路径
+
+    Yields:
+        按录制顺序排列的 JournalRecord
+
+    Raises:
+        ValueError: 文件格式版本不受支持
+    """
+    base_ms = 0.0
+    last_ms = 0.0
+    with _open_journal(path, "r") as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError:
+                # 进程被强制结束时最后一行可能不完整
+                logger.warning(f"事件日志第 {line_no} 行不是有效的 JSON，已跳过")
+                continue
+            if "journal" in item:
+                if item["journal"] != JOURNAL_FORMAT_VERSION:
+                    raise ValueError(f"不支持的事件日志版本: {item['journal']}")
+                base_ms = last_ms
+                continue
+            last_ms = base_ms + item["t"]
+            yield JournalRecord(offset_ms=last_ms, event_name=item["e"], source=item["s"], payload=item["p"])
+
+
+__all__ = ["EventJournal", "JournalRecord", "read_journal", "JOURNAL_FORMAT_VERSION"]
@@ -0,0 +1,338 @@
+"""
+订阅者邮箱（有界事件队列）
+
+为慢订阅者（TTS、Dashboard 广播等）提供有界的待处理队列和溢出策略，
+避免 emit(wait=False) 在突发流量下无限制地堆积后台任务。
+
+每个邮箱有一个工作协程按顺序消费队列，队列满时根据 OverflowPolicy 处理：
+- BLOCK: 阻塞发布者，直到队列有空位
+- DROP_OLDEST: 丢弃队列中最旧的事件（滑动窗口）
+- DROP_NEWEST: 丢弃新到达的事件（保护已排队的事件）
+- LATEST: 只保留最新的一条，新事件总是替换所有待处理事件
+
+CoalescingMailbox 用于只关心最新状态的订阅者（Dashboard、字幕、虚拟形象）：
+同一 key 的待处理事件被新事件替换，并且每个时间窗口最多向订阅者交付一次。
+"""
+
+import asyncio
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Awaitable, Callable, Deque, Hashable, List, Optional, Tuple
+
+
+class OverflowPolicy(str, Enum):
+    """订阅者队列溢出策略"""
+
+    BLOCK = "block"  # 阻塞发布者（等待订阅者）
+    DROP_OLDEST = "drop_oldest"  # 丢弃最旧事件（滑动窗口）
+    DROP_NEWEST = "drop_newest"  # 丢弃新事件（保护旧事件）
+    LATEST = "latest"  # 合并为最新事件（只保留一条待处理）
+
+
+@dataclass
+class MailboxStats:
+    """
+    订阅者邮箱统计信息
+
+    Attributes:
+        handler_name: 处理器名称
+        policy: 溢出策略
+        max_pending: 最大待处理事件数
+        depth: 当前队列深度
+        high_watermark: 历史最大队列深度
+        delivered_count: 已交付给处理器的事件数
+        dropped_count: 因溢出策略丢弃的事件数
+        blocked_count: 发布者因队列满被阻塞的次数
+        coalesced_count: 被同 key 新事件合并（替换）的事件数
+    """
+
+    handler_name: str
+    policy: str
+    max_pending: int
+    depth: int = 0
+    high_watermark: int = 0
+    delivered_count: int = 0
+    dropped_count: int = 0
+    blocked_count: int = 0
+    coalesced_count: int = 0
+
+
+# (event_name, payload, source, waiter)
+_MailboxItem = Tuple[str, Any, str, Optional[asyncio.Future]]
+
+
+class SubscriberMailbox:
+    """
+    单个订阅者的有界事件队列
+
+    put() 在发布者的调用栈中执行（BLOCK 策略下会让 emit 等待），
+    工作协程在首次 put 时惰性启动，按顺序调用 consumer。
+    """
+
+    def __init__(
+        self,
+        handler_name: str,
+        max_pending: int,
+        policy: OverflowPolicy,
+        consumer: Callable[[str, Any, str], Awaitable[None]],
+    ):
+        """
+        初始化邮箱
+
+        Args:
+            handler_name: 处理器名称（用于统计和日志）
+            max_pending: 最大待处理事件数（不含正在处理的事件）
+            policy: 溢出策略
+            consumer: 事件消费函数 (event_name, payload, source)
+
+        Raises:
+            ValueError: max_pending 小于 1
+        """
+        if max_pending < 1:
+            raise ValueError(f"max_pending 必须 >= 1，收到: {max_pending}")
+
+        self.policy = OverflowPolicy(policy)
+        self.max_pending = max_pending
+        self.stats = MailboxStats(handler_name=handler_name, policy=self.policy.value, max_pending=max_pending)
+
+        self._consumer = consumer
+        self._queue: Deque[_MailboxItem] = deque()
+        self._has_items = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._worker: Optional[asyncio.Task] = None
+        self._closed = False
+
+    @property
+    def depth(self) -> int:
+        """当前队列深度"""
+        return len(self._queue)
+
+    @property
+    def is_idle(self) -> bool:
+        """队列为空且没有正在处理的事件"""
+        return self._idle.is_set()
+
+    async def put(self, event_name: str, payload: Any, source: str, track: bool = False) -> Optional[asyncio.Future]:
+        """
+        投递事件
+
+        Args:
+            event_name: 事件名称
+            payload: 事件数据
+            source: 事件源
+            track: 是否返回完成 Future（emit(wait=True) 使用）
+
+        Returns:
+            track=True 时返回 Future：事件被处理后结果为 True，被丢弃时为 False；否则返回 None
+        """
+        waiter = asyncio.get_running_loop().create_future() if track else None
+        if self._closed:
+            self._drop((event_name, payload, source, waiter))
+            return waiter
+
+        if self.policy == OverflowPolicy.LATEST:
+            while self._queue:
+                self._drop(self._queue.popleft())
+        elif len(self._queue) >= self.max_pending:
+            if self.policy == OverflowPolicy.DROP_NEWEST:
+                self._drop((event_name, payload, source, waiter))
+                return waiter
+            if self.policy == OverflowPolicy.DROP_OLDEST:
+                self._drop(self._queue.popleft())
+            else:
+                self.stats.blocked_count += 1
+                while len(self._queue) >= self.max_pending and not self._closed:
+                    self._space.clear()
+                    await self._space.wait()
+                if self._closed:
+                    self._drop((event_name, payload, source, waiter))
+                    return waiter
+
+        self._queue.append((event_name, payload, source, waiter))
+        depth = len(self._queue)
+        self.stats.depth = depth
+        if depth > self.stats.high_watermark:
+            self.stats.high_watermark = depth
+        self._idle.clear()
+        self._has_items.set()
+        self._ensure_worker()
+        return waiter
+
+    async def join(self) -> None:
+        """等待队列清空且当前事件处理完成"""
+        await self._idle.wait()
+
+    def close(self) -> None:
+        """关闭邮箱：停止工作协程，丢弃所有待处理事件并唤醒被阻塞的发布者"""
+        self._closed = True
+        while self._queue:
+            self._drop(self._queue.popleft())
+        self.stats.depth = 0
+        self._space.set()
+        self._idle.set()
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+        self._worker = None
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run(), name=f"EventMailbox[{self.stats.handler_name}]")
+
+    def _drop(self, item: _MailboxItem) -> None:
+        self.stats.dropped_count += 1
+        waiter = item[3]
+        if waiter is not None and not waiter.done():
+            waiter.set_result(False)
+
+    async def _run(self) -> None:
+        while not self._closed:
+            if not self._queue:
+                self._idle.set()
+                self._has_items.clear()
+                await self._has_items.wait()
+                continue
+
+            event_name, payload, source, waiter = self._queue.popleft()
+            self.stats.depth = len(self._queue)
+            self._space.set()
+            try:
+                await self._consumer(event_name, payload, source)
+            finally:
+                self.stats.delivered_count += 1
+                if waiter is not None and not waiter.done():
+                    waiter.set_result(True)
+
+
+class CoalescingMailbox(SubscriberMailbox):
+    """
+    合并（去抖）订阅的事件队列
+
+    - 待处理事件按 key 存放，同 key 的新事件替换旧事件（计入 coalesced_count）
+    - 空闲后的第一个事件立即交付；之后每 window_ms 最多交付一批（每个 key 最新的一条）
+    - 不同 key 的数量超过 max_pending 时丢弃最旧的 key
+    - emit(wait=True) 的等待者在合并后的事件交付时一起完成
+    """
+
+    def __init__(
+        self,
+        handler_name: str,
+        max_pending: int,
+        consumer: Callable[[str, Any, str], Awaitable[None]],
+        window_ms: int = 0,
+        key_fn: Optional[Callable[[Any], Hashable]] = None,
+    ):
+        """
+        初始化合并邮箱
+
+        Args:
+            handler_name: 处理器名称
+            max_pending: 最多保留的不同 key 数量
+            consumer: 事件消费函数 (event_name, payload, source)
+            window_ms: 两次交付之间的最小间隔（毫秒），0 表示只合并不限速
+            key_fn: 从 payload 计算合并 key 的函数，None 表示所有事件共用一个 key（只保留最新）
+
+        Raises:
+            ValueError: max_pending 小于 1 或 window_ms 小于 0
+        """
+        if window_ms < 0:
+            raise ValueError(f"window_ms 必须 >= 0，收到: {window_ms}")
+        super().__init__(handler_name, max_pending, OverflowPolicy.DROP_OLDEST, consumer)
+        self.stats.policy = "coalesce"
+        self.window = window_ms / 1000
+        self._key_fn = key_fn
+        # key -> [event_name, payload, source, waiters]
+        self._pending: "OrderedDict[Hashable, list]" = OrderedDict()
+        self._next_delivery = 0.0
+
+    @property
+    def depth(self) -> int:
+        """当前待处理的不同 key 数量"""
+        return len(self._pending)
+
+    async def put(self, event_name: str, payload: Any, source: str, track: bool = False) -> Optional[asyncio.Future]:
+        """
+        投递事件（从不阻塞发布者）
+
+        Returns:
+            track=True 时返回 Future：合并后的事件被处理后结果为 True，被丢弃时为 False；否则返回 None
+        """
+        waiter = asyncio.get_running_loop().create_future() if track else None
+        if self._closed:
+            self._drop_entry([event_name, payload, source, [waiter] if waiter else []])
+            return waiter
+
+        key = self._key_fn(payload) if self._key_fn is not None else None
+        entry = self._pending.get(key)
+        if entry is not None:
+            # 同 key 合并：替换为最新事件，保留原有的排队位置和等待者
+            entry[0], entry[1], entry[2] = event_name, payload, source
+            if waiter is not None:
+                entry[3].append(waiter)
+            self.stats.coalesced_count += 1
+            return waiter
+
+        if len(self._pending) >= self.max_pending:
+            _, oldest = self._pending.popitem(last=False)
+            self._drop_entry(oldest)
+
+        self._pending[key] = [event_name, payload, source, [waiter] if waiter else []]
+        depth = len(self._pending)
+        self.stats.depth = depth
+        if depth > self.stats.high_watermark:
+            self.stats.high_watermark = depth
+        self._idle.clear()
+        self._has_items.set()
+        self._ensure_worker()
+        return waiter
+
+    def close(self) -> None:
+        """关闭邮箱：停止工作协程并丢弃所有待处理事件"""
+        self._closed = True
+        while self._pending:
+            _, entry = self._pending.popitem(last=False)
+            self._drop_entry(entry)
+        self.stats.depth = 0
+        self._idle.set()
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+        self._worker = None
+
+    def _drop_entry(self, entry: list) -> None:
+        self.stats.dropped_count += 1
+        self._resolve(entry[3], False)
+
+    @staticmethod
+    def _resolve(waiters: List[asyncio.Future], result: bool) -> None:
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(result)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while not self._closed:
+            if not self._pending:
+                self._idle.set()
+                self._has_items.clear()
+                await self._has_items.wait()
+                continue
+
+            delay = self._next_delivery - loop.time()
+            if delay > 0:
+                # 等待窗口结束，期间到达的事件继续合并
+                await asyncio.sleep(delay)
+                continue
+
+            batch = list(self._pending.values())
+            self._pending.clear()
+            self.stats.depth = 0
+            self._next_delivery = loop.time() + self.window
+            for event_name, payload, source, waiters in batch:
+                try:
+                    await self._consumer(event_name, payload, source)
+                finally:
+                    self.stats.delivered_count += 1
+                    self._resolve(waiters, True)
@@ -32,6 +32,10 @@ class CoreEvents:
     # 标准化消息接收事件（由 Input 阶段发布，Decision 阶段订阅）
     INPUT_MESSAGE_RECEIVED = "input.message.received"
 
+    # 语音识别结果事件（STT Collector 发布：说话过程中的部分结果 + 每次话语的最终结果，
+    # 订阅者可据此在说话结束前开始准备回复；最终文本仍以 INPUT_MESSAGE_RECEIVED 为准）
+    INPUT_SPEECH_RECOGNIZED = "input.speech.recognized"
+
     # 组件 连接状态事件（去 collector 前缀：阶段名已隐含组件类型）
     INPUT_CONNECTED = "input.connected"
     INPUT_DISCONNECTED = "input.disconnected"
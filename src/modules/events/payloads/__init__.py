@@ -37,6 +37,7 @@ from .decision import (
 from .input import (
     MessageReadyPayload,
     RawDataPayload,
+    SpeechRecognizedPayload,
 )
 from .output import (
     OBSCommandPayload,
@@ -51,6 +52,7 @@ __all__ = [
     # Input 阶段
     "RawDataPayload",
     "MessageReadyPayload",
+    "SpeechRecognizedPayload",
     # Decision 阶段
     "IntentPayload",
     "IntentActionPayload",
@@ -6,7 +6,7 @@
 
 from typing import Any, Optional, Tuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class BasePayload(BaseModel):
@@ -17,8 +17,14 @@ class BasePayload(BaseModel):
     子类可以覆盖 __str__() 方法以自定义格式化输出。
 
     所有事件 Payload 都应继承此类而非直接继承 BaseModel。
+
+    Payload 是不可变的（frozen）：EventBus 零拷贝分发时，同一个实例会被所有类型匹配的订阅者
+    和 tap（事件日志录制）共享，任何字段赋值都会抛出 ValidationError。需要修改时使用
+    model_copy(update={...}) 生成新实例。
     """
 
+    model_config = ConfigDict(frozen=True)
+
     def _format_field_value(self, value: Any, indent: int = 0) -> str:
         """
         格式化字段值用于显示（单行模式）。
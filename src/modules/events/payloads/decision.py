@@ -15,6 +15,7 @@ from pydantic import ConfigDict, Field
 from src.modules.events.payloads.base import BasePayload
 from src.modules.events.registry import register_event
 from src.modules.time_utils import now_ms
+from src.modules.tracing import get_current_trace_id
 
 if TYPE_CHECKING:
     from src.modules.types import Intent
@@ -71,6 +72,7 @@ class IntentPayload(BasePayload):
 
     intent_data: Dict[str, Any] = Field(..., description="Intent 序列化数据")
     name: str = Field(..., description="决策Decider名称")
+    trace_id: Optional[str] = Field(default=None, description="消息追踪 ID（见 src.modules.tracing）")
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -100,7 +102,7 @@ class IntentPayload(BasePayload):
         return f"IntentPayload({', '.join(parts)})"
 
     @classmethod
-    def from_intent(cls, intent: "Intent", name: str) -> "IntentPayload":
+    def from_intent(cls, intent: "Intent", name: str, trace_id: Optional[str] = None) -> "IntentPayload":
         """
         从 Intent 对象创建 Payload（纯工厂，无副作用）
 
@@ -110,14 +112,20 @@ class IntentPayload(BasePayload):
         `OutputHandlerManager._on_decision_intent` 统一打印（每个被发布的意图
         仅经过该处一次），本工厂不承担日志职责，避免被 Output 转发等场景重复打印。
 
+        trace_id 未指定时取当前调用链上的 trace_id（DeciderManager 在调用 decide() 时设置），
+        因此在 decide() 调用链内直接发布 Intent 的 Decider 无需任何改动即可接入追踪。
+
         Args:
             intent: Intent 对象
             name: 决策Decider名称
+            trace_id: 消息追踪 ID
 
         Returns:
             IntentPayload 实例
         """
-        return cls(intent_data=intent.model_dump(mode="json"), name=name)
+        if trace_id is None:
+            trace_id = get_current_trace_id()
+        return cls(intent_data=intent.model_dump(mode="json"), name=name, trace_id=trace_id)
 
     def to_intent(self) -> "Intent":
         """
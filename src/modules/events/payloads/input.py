@@ -4,15 +4,18 @@ Input 阶段 事件 Payload 定义
 定义 Input 阶段 相关的事件 Payload 类型。
 - RawDataPayload: 原始数据事件
 - MessageReadyPayload: 标准化消息就绪事件
+- SpeechRecognizedPayload: 语音识别结果事件（部分结果 / 最终结果）
 """
 
-from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
 
 from pydantic import ConfigDict, Field
 
 from src.modules.events.payloads.base import BasePayload
 from src.modules.events.registry import register_event
 from src.modules.time_utils import now_ms
+from src.modules.types.base.message_record import MessageRecord
 
 if TYPE_CHECKING:
     from src.modules.types.base.normalized_message import NormalizedMessage
@@ -125,12 +128,15 @@ class MessageReadyPayload(BasePayload):
 
     表示 InputDomain 完成了数据标准化处理，生成了 NormalizedMessage。
 
-    注意：message 字段使用 Dict[str, Any] 而不是 NormalizedMessage 对象，
-    因为 NormalizedMessage.content 包含不可序列化的 StructuredContent 对象。
+    message 字段：
+    - MessageRecord：Input 阶段内部发布（from_normalized_message），不验证、不序列化，原始消息只保存引用
+    - Dict[str, Any]：来自外部的数据（事件日志重放、旧代码），订阅者需要自行验证为 NormalizedMessage
+    两者都可以按字典读取（message["text"]、message.get(...)），序列化时统一为字典。
     """
 
-    # 使用 Dict 格式，因为 NormalizedMessage.content 包含不可序列化的对象
-    message: Dict[str, Any] = Field(..., description="标准化消息（NormalizedMessage 序列化后的字典）")
+    message: Union[MessageRecord, Dict[str, Any]] = Field(
+        ..., description="标准化消息（MessageRecord，或 NormalizedMessage 序列化后的字典）"
+    )
     source: str = Field(..., min_length=1, description="数据源")
     timestamp_ms: int = Field(
         default_factory=lambda: now_ms(),
@@ -138,6 +144,7 @@ class MessageReadyPayload(BasePayload):
         description="事件时间戳（Unix 毫秒）",
     )
     metadata: Dict[str, Any] = Field(default_factory=dict, description="额外元数据")
+    trace_id: Optional[str] = Field(default=None, description="消息追踪 ID（见 src.modules.tracing）")
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -161,7 +168,7 @@ class MessageReadyPayload(BasePayload):
 
     def get_log_format(self) -> Optional[Tuple[str, str, Optional[str]]]:
         """返回日志格式化信息"""
-        if isinstance(self.message, dict):
+        if isinstance(self.message, Mapping):
             text = self.message.get("text", "")
             metadata = self.message.get("metadata", {})
             user_name = metadata.get("user_name", "")
@@ -180,7 +187,7 @@ class MessageReadyPayload(BasePayload):
     def __str__(self) -> str:
         """简化格式：直接显示消息内容"""
         # 提取 text 和 user_name
-        if isinstance(self.message, dict):
+        if isinstance(self.message, Mapping):
             text = self.message.get("text", "")
             user_name = self.message.get("user_name", "")
         elif isinstance(self.message, str):
@@ -221,21 +228,21 @@ class MessageReadyPayload(BasePayload):
 
     @classmethod
     def from_normalized_message(
-        cls, normalized_message: "NormalizedMessage", **extra_metadata
+        cls, normalized_message: "NormalizedMessage", trace_id: Optional[str] = None, **extra_metadata
     ) -> "MessageReadyPayload":
         """
         从 NormalizedMessage 对象创建 Payload
 
+        消息包装为 MessageRecord，不做 model_dump，订阅者收到的仍是同一条已验证的消息。
+
         Args:
             normalized_message: NormalizedMessage 对象
+            trace_id: 消息追踪 ID
             **extra_metadata: 额外的元数据
 
         Returns:
             MessageReadyPayload 实例
         """
-        # 使用 model_dump() 序列化 NormalizedMessage (Python 模式)
-        # mode='python' 保留 Python 对象，mode='json' 转换为 JSON 兼容格式
-
         # 构建 metadata：从 NormalizedMessage 中提取用户信息
         metadata = {}
         if normalized_message.user_id:
@@ -245,8 +252,50 @@ class MessageReadyPayload(BasePayload):
         metadata.update(extra_metadata)
 
         return cls(
-            message=normalized_message.model_dump(mode="python"),
+            message=MessageRecord.from_normalized(normalized_message),
             source=normalized_message.source,
             timestamp_ms=normalized_message.timestamp_ms,
             metadata=metadata,
+            trace_id=trace_id,
         )
+
+
+@register_event("input.speech.recognized")
+class SpeechRecognizedPayload(BasePayload):
+    """
+    语音识别结果事件 Payload
+
+    事件名：CoreEvents.INPUT_SPEECH_RECOGNIZED
+    发布者：STTCollector
+    订阅者：DeciderManager（转发给实现了 prepare() 的 Decider）
+
+    说话过程中每次识别文本变化发布一条部分结果（is_final=False），话语结束时发布一条最终结果。
+    部分结果可能被后续结果修正；最终结果为空表示本次话语识别失败或被放弃，
+    非空的最终结果同时会作为 NormalizedMessage 走正常的 input.message.received 流程。
+    """
+
+    text: str = Field(..., description="识别文本（部分结果为截至目前的完整文本，不是增量）")
+    is_final: bool = Field(default=False, description="是否为话语的最终结果")
+    utterance_id: int = Field(..., description="话语序号（同一 Collector 内递增）")
+    source: str = Field(default="stt", min_length=1, description="数据源（与最终 NormalizedMessage.source 相同）")
+    engine: str = Field(default="", description="识别引擎名称")
+    elapsed_ms: float = Field(default=0.0, description="距话语开始的时间（毫秒）")
+    timestamp_ms: int = Field(
+        default_factory=lambda: now_ms(),
+        alias="timestamp",
+        description="Unix 时间戳（毫秒）",
+    )
+    user_id: Optional[str] = Field(default=None, description="用户 ID")
+    user_nickname: Optional[str] = Field(default=None, description="用户昵称")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    def get_log_format(self) -> Optional[Tuple[str, str, Optional[str]]]:
+        """返回日志格式化信息"""
+        text = self.text if len(self.text) <= 50 else self.text[:47] + "..."
+        return text, self.user_nickname or "", "final" if self.is_final else "partial"
+
+    def __str__(self) -> str:
+        """简化格式：[partial#3] 识别文本"""
+        kind = "final" if self.is_final else "partial"
+        return f'[{kind}#{self.utterance_id}] "{self.text}"'
@@ -0,0 +1,193 @@
+"""
+事件日志重放
+
+把 EventJournal 录制的事件按原始时间间隔重新发布到 EventBus，支持 1x、Nx 和最大速度，
+用于离线复现直播中的真实突发流量（礼物刷屏、突袭等），测量 Decider 和 Pipeline 的吞吐与延迟。
+
+- 默认只重放外部输入事件（input.*）：decision.* / output.* 等派生事件由被测进程中的
+  Decider 和 OutputHandlerManager 重新产生，重放它们会导致重复
+- 重放顺序与录制顺序一致；事件发布时刻只取决于录制偏移和速度，与处理耗时无关
+  （调度落后时记录 lag，不会跳过或重排事件）
+- input.message.received 会分配新的 trace_id（见 src.modules.tracing），可选地重新经过
+  InputPipeline，因此 MessageTracer 能给出重放流量的逐阶段延迟分解
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable, Optional, Sequence
+
+from pydantic import BaseModel, ValidationError
+
+from src.modules.events.journal import JournalRecord
+from src.modules.events.names import CoreEvents
+from src.modules.events.registry import EventRegistry, get_registered_event
+from src.modules.events.stats import LatencyHistogram
+from src.modules.logging import get_logger
+from src.modules.tracing import TraceStage, get_tracer
+from src.modules.types.base.normalized_message import NormalizedMessage
+
+if TYPE_CHECKING:
+    from src.modules.events.event_bus import EventBus
+    from src.modules.pipeline.manager import PipelineManager
+
+logger = get_logger("JournalReplayer")
+
+# 默认重放的事件前缀：只重放外部输入
+DEFAULT_REPLAY_EVENTS = ("input.",)
+
+
+@dataclass
+class ReplayReport:
+    """
+    重放结果
+
+    Attributes:
+        emitted_count: 已发布的事件数
+        skipped_count: 未注册类型或 Payload 验证失败而跳过的事件数
+        filtered_count: 被 InputPipeline 过滤的消息数
+        journal_span_ms: 被重放事件在录制中的时间跨度（毫秒）
+        wall_time_ms: 重放实际耗时（毫秒）
+        lag: 实际发布时刻相对计划时刻的延迟直方图（毫秒）
+        trace_ids: 重放的 input.message.received 对应的 trace_id
+    """
+
+    emitted_count: int = 0
+    skipped_count: int = 0
+    filtered_count: int = 0
+    journal_span_ms: float = 0.0
+    wall_time_ms: float = 0.0
+    lag: LatencyHistogram = field(default_factory=LatencyHistogram)
+    trace_ids: list = field(default_factory=list)
+
+    @property
+    def events_per_second(self) -> float:
+        """实际发布速率"""
+        return self.emitted_count / (self.wall_time_ms / 1000) if self.wall_time_ms > 0 else 0.0
+
+
+class JournalReplayer:
+    """事件日志重放驱动"""
+
+    def __init__(
+        self,
+        event_bus: "EventBus",
+        speed: Optional[float] = 1.0,
+        include: Sequence[str] = DEFAULT_REPLAY_EVENTS,
+        input_pipeline_manager: Optional["PipelineManager"] = None,
+        wait: bool = False,
+    ):
+        """
+        初始化重放驱动
+
+        Args:
+            event_bus: 目标 EventBus（通常在全新的进程中创建）
+            speed: 重放倍速（1.0 为原始节奏），None 或 0 表示以最大速度连续发布
+            include: 只重放以这些前缀开头的事件
+            input_pipeline_manager: 提供时 input.message.received 的消息重新经过 InputPipeline
+            wait: 是否等待每个事件的处理器完成后再发布下一个（最大速度下可用于测量串行吞吐）
+
+        Raises:
+            ValueError: speed 为负数
+        """
+        if speed is not None and speed < 0:
+            raise ValueError(f"speed 必须 >= 0，收到: {speed}")
+        self.event_bus = event_bus
+        self.speed = speed or None
+        self.include = tuple(include)
+        self.input_pipeline_manager = input_pipeline_manager
+        self.wait = wait
+        self._tracer = get_tracer()
+
+    async def replay(self, records: Iterable[JournalRecord]) -> ReplayReport:
+        """
+        重放事件
+
+        Args:
+            records: 事件记录（如 read_journal(path) 的结果）
+
+        Returns:
+            重放结果
+        """
+        report = ReplayReport()
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        wall_start = time.perf_counter()
+        first_offset: Optional[float] = None
+
+        for record in records:
+            if not record.event_name.startswith(self.include):
+                continue
+            if first_offset is None:
+                first_offset = record.offset_ms
+            relative_ms = record.offset_ms - first_offset
+            report.journal_span_ms = relative_ms
+
+            if self.speed is not None:
+                due = start + relative_ms / 1000 / self.speed
+                delay = due - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                report.lag.record(max(loop.time() - due, 0.0) * 1000)
+
+            data = self._decode(record)
+            if data is None:
+                report.skipped_count += 1
+                continue
+
+            if record.event_name == CoreEvents.INPUT_MESSAGE_RECEIVED:
+                data = await self._prepare_message(data, record.source, report)
+                if data is None:
+                    continue
+
+            await self.event_bus.emit(record.event_name, data, source=record.source, wait=self.wait)
+            report.emitted_count += 1
+
+        report.wall_time_ms = (time.perf_counter() - wall_start) * 1000
+        logger.info(
+            f"重放完成: 发布 {report.emitted_count} 个事件，跳过 {report.skipped_count}，"
+            f"过滤 {report.filtered_count}，录制跨度 {report.journal_span_ms:.0f}ms，"
+            f"实际耗时 {report.wall_time_ms:.0f}ms ({report.events_per_second:.1f} 事件/秒)"
+        )
+        return report
+
+    def _decode(self, record: JournalRecord) -> Optional[BaseModel]:
+        model_class = get_registered_event(record.event_name) or EventRegistry.get(record.event_name)
+        if model_class is None:
+            logger.debug(f"事件 {record.event_name} 未注册 Payload 类型，跳过")
+            return None
+        try:
+            return model_class.model_validate(record.payload)
+        except ValidationError as e:
+            logger.warning(f"事件 {record.event_name} 的 Payload 验证失败，跳过: {e.error_count()} 个错误")
+            return None
+
+    async def _prepare_message(self, data: BaseModel, source: str, report: ReplayReport) -> Optional[BaseModel]:
+        """为重放的消息分配新 trace_id，并按需重新经过 InputPipeline（与 InputCollectorManager 一致）"""
+        message = dict(data.message)
+        trace_id = self._tracer.start_trace(source, message.get("text", ""))
+        if self.input_pipeline_manager is not None:
+            try:
+                normalized = NormalizedMessage.model_validate({k: v for k, v in message.items() if k != "raw"})
+            except ValidationError as e:
+                self._tracer.discard(trace_id)
+                logger.warning(f"重放消息无法还原为 NormalizedMessage，跳过: {e.error_count()} 个错误")
+                report.skipped_count += 1
+                return None
+            with self._tracer.span(trace_id, TraceStage.INPUT_PIPELINES):
+                processed = await self.input_pipeline_manager.process(normalized)
+            if processed is None:
+                self._tracer.discard(trace_id)
+                report.filtered_count += 1
+                return None
+            data = type(data).from_normalized_message(processed, trace_id=trace_id, **data.metadata)
+        else:
+            data = data.model_copy(update={"trace_id": trace_id})
+
+        if trace_id is not None:
+            report.trace_ids.append(trace_id)
+        self._tracer.start_span(trace_id, TraceStage.DECIDER_QUEUE)
+        return data
+
+
+__all__ = ["DEFAULT_REPLAY_EVENTS", "JournalReplayer", "ReplayReport"]
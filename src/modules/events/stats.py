@@ -0,0 +1,148 @@
+"""
+EventBus 统计数据结构
+
+- EventStats: 事件级统计（计数 + 延迟直方图）
+- HandlerStats: 处理器级统计快照
+- LatencyHistogram: 固定桶延迟直方图，O(log 桶数) 记录，可估算 p50/p95/p99
+
+所有统计只在事件循环线程中更新，且更新过程中没有 await，
+因此不需要锁（单线程内的读-改-写不会被其他协程打断）。
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+# 桶上界（毫秒），最后一个桶为溢出桶（> 10s）
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+    10000.0,
+)
+
+
+class LatencyHistogram:
+    """
+    固定桶延迟直方图
+
+    记录成本与样本数无关，内存固定。分位数在命中的桶内做线性插值，
+    并以实际观测到的最大值为上限，精度取决于桶宽度。
+    """
+
+    __slots__ = ("counts", "count", "sum_ms", "max_ms")
+
+    def __init__(self):
+        self.counts: List[int] = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, value_ms: float) -> None:
+        """记录一个样本（毫秒）"""
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, value_ms)] += 1
+        self.count += 1
+        self.sum_ms += value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+
+    def percentile(self, q: float) -> float:
+        """
+        估算分位数
+
+        Args:
+            q: 分位（0~1，如 0.99）
+
+        Returns:
+            分位数估计值（毫秒），没有样本时为 0
+        """
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count == 0:
+                continue
+            if cumulative + bucket_count >= rank:
+                if index >= len(LATENCY_BUCKETS_MS):
+                    return self.max_ms
+                lower = LATENCY_BUCKETS_MS[index - 1] if index > 0 else 0.0
+                upper = LATENCY_BUCKETS_MS[index]
+                fraction = (rank - cumulative) / bucket_count
+                return min(lower + (upper - lower) * fraction, self.max_ms)
+            cumulative += bucket_count
+        return self.max_ms
+
+    def summary(self) -> Dict[str, float]:
+        """返回 count/avg/p50/p95/p99/max 摘要（毫秒）"""
+        return {
+            "count": self.count,
+            "avg_ms": self.sum_ms / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": self.max_ms,
+        }
+
+
+@dataclass
+class EventStats:
+    """
+    事件统计信息
+
+    Attributes:
+        emit_count: 发布次数
+        listener_count: 监听器数量
+        error_count: 错误次数
+        last_emit_time: 最后发布时间(Unix时间戳,秒)
+        last_error_time: 最后错误时间(Unix时间戳,秒)
+        total_execution_time_ms: 总执行时间(毫秒)
+        handler_latency: 该事件所有处理器单次执行耗时的直方图
+        emit_latency: emit 开始到所有直接分发的处理器完成的耗时直方图
+    """
+
+    emit_count: int = 0
+    listener_count: int = 0
+    error_count: int = 0
+    last_emit_time: float = 0
+    last_error_time: float = 0
+    total_execution_time_ms: float = 0
+    handler_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    emit_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+@dataclass
+class HandlerStats:
+    """
+    处理器统计快照
+
+    Attributes:
+        event_name: 事件名称
+        handler_name: 处理器名称
+        call_count: 调用次数
+        error_count: 错误次数
+        last_error: 最后错误信息
+        latency: 处理器执行耗时直方图
+        delivery_latency: emit 开始到该处理器完成的耗时直方图（包含排队和调度等待）
+    """
+
+    event_name: str
+    handler_name: str
+    call_count: int
+    error_count: int
+    last_error: Optional[str]
+    latency: LatencyHistogram
+    delivery_latency: LatencyHistogram
@@ -0,0 +1,17 @@
+"""
+Amaidesu 生命周期模块
+
+提供启动/关闭各阶段的耗时分析，以及按依赖图并发执行启动/关闭步骤。
+"""
+
+from .graph import LifecycleGraph, LifecycleStep, run_phases
+from .profiler import LifecycleProfiler, PhaseRecord, get_lifecycle_profiler
+
+__all__ = [
+    "LifecycleGraph",
+    "LifecycleProfiler",
+    "LifecycleStep",
+    "PhaseRecord",
+    "get_lifecycle_profiler",
+    "run_phases",
+]
@@ -0,0 +1,221 @@
+"""
+按依赖关系并发执行启动/关闭步骤
+
+每个步骤声明自己依赖的步骤，LifecycleGraph 在依赖全部结束后立即开始执行该步骤：
+互不依赖的步骤（LLM 初始化、上下文服务、MCP ...）并发执行，总耗时从"所有步骤耗时之和"
+缩短为"依赖链上最长路径的耗时"。
+
+每个步骤可以单独设置超时，耗时记录到 LifecycleProfiler（阶段名称为 "<图名称>.<步骤名称>"）。
+
+两种失败处理方式：
+- fail_fast=True（启动）：任一步骤失败时取消其余步骤并抛出该异常，依赖它的步骤不会执行
+- fail_fast=False（关闭）：失败/超时只记录日志，依赖只约束顺序，后续步骤照常执行
+"""
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.modules.logging import get_logger
+
+from .profiler import LifecycleProfiler, get_lifecycle_profiler
+
+logger = get_logger("LifecycleGraph")
+
+StepAction = Callable[[], Awaitable[Any]]
+
+
+@dataclass
+class LifecycleStep:
+    """
+    一个生命周期步骤
+
+    Attributes:
+        name: 步骤名称（图内唯一）
+        action: 无参数的异步函数
+        depends_on: 必须在本步骤之前结束的步骤名称
+        timeout: 超时秒数，None 表示使用图的默认超时
+    """
+
+    name: str
+    action: StepAction
+    depends_on: Tuple[str, ...] = ()
+    timeout: Optional[float] = None
+
+
+class LifecycleGraph:
+    """启动/关闭步骤的依赖图"""
+
+    def __init__(
+        self,
+        name: str,
+        fail_fast: bool = True,
+        default_timeout: Optional[float] = None,
+        profiler: Optional[LifecycleProfiler] = None,
+    ):
+        """
+        Args:
+            name: 图名称（如 "startup" / "shutdown"），作为耗时记录的前缀
+            fail_fast: 步骤失败时是否中止整个图并抛出异常
+            default_timeout: 未单独设置超时的步骤使用的超时秒数，None 表示不限时
+            profiler: 耗时分析器，默认使用全局实例
+        """
+        self.name = name
+        self.fail_fast = fail_fast
+        self.default_timeout = default_timeout
+        self._profiler = profiler or get_lifecycle_profiler()
+        self._steps: Dict[str, LifecycleStep] = {}
+
+    def add(
+        self,
+        name: str,
+        action: StepAction,
+        depends_on: Iterable[str] = (),
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        添加步骤（依赖的步骤可以之后再添加，run() 时统一校验）
+
+        Raises:
+            ValueError: 步骤名称重复
+        """
+        if name in self._steps:
+            raise ValueError(f"步骤 '{name}' 已存在")
+        self._steps[name] = LifecycleStep(name=name, action=action, depends_on=tuple(depends_on), timeout=timeout)
+
+    async def run(self) -> Dict[str, Optional[Exception]]:
+        """
+        执行所有步骤
+
+        Returns:
+            步骤名称 -> 异常（正常结束为 None；fail_fast 下被取消的步骤不在结果中）
+
+        Raises:
+            ValueError: 依赖了不存在的步骤，或存在循环依赖
+            Exception: fail_fast 下第一个失败步骤的异常
+        """
+        results: Dict[str, Optional[Exception]] = {}
+        tasks: Dict[str, asyncio.Task] = {}
+        for step in self._ordered_steps():
+            dependencies = [tasks[name] for name in step.depends_on]
+            tasks[step.name] = asyncio.create_task(
+                self._run_step(step, dependencies, results), name=f"{self.name}.{step.name}"
+            )
+        if not tasks:
+            return results
+
+        try:
+            if not self.fail_fast:
+                await asyncio.gather(*tasks.values())
+                return results
+
+            done, pending = await asyncio.wait(tasks.values(), return_when=asyncio.FIRST_EXCEPTION)
+            failed = next((t for t in tasks.values() if t in done and not t.cancelled() and t.exception()), None)
+            if failed is not None:
+                await self._cancel(pending)
+                raise failed.exception()
+            return results
+        except asyncio.CancelledError:
+            await self._cancel(tasks.values())
+            raise
+
+    async def _run_step(
+        self, step: LifecycleStep, dependencies: List[asyncio.Task], results: Dict[str, Optional[Exception]]
+    ) -> None:
+        if dependencies:
+            # asyncio.wait 不会在本步骤被取消时连带取消依赖的步骤
+            await asyncio.wait(dependencies)
+
+        timeout = step.timeout if step.timeout is not None else self.default_timeout
+        label = f"{self.name}.{step.name}"
+        try:
+            with self._profiler.phase(label):
+                if timeout is None:
+                    await step.action()
+                else:
+                    await asyncio.wait_for(step.action(), timeout=timeout)
+        except Exception as e:
+            results[step.name] = e
+            if self.fail_fast:
+                raise
+            if isinstance(e, TimeoutError):
+                logger.error(f"步骤 {label} 超时（{timeout}s），继续执行后续步骤")
+            else:
+                logger.opt(exception=e).error(f"步骤 {label} 失败: {e}")
+        else:
+            results[step.name] = None
+
+    def _ordered_steps(self) -> List[LifecycleStep]:
+        """拓扑排序（Kahn 算法），同时校验依赖"""
+        dependents: Dict[str, List[str]] = {name: [] for name in self._steps}
+        remaining: Dict[str, int] = {}
+        for step in self._steps.values():
+            for dependency in step.depends_on:
+                if dependency not in self._steps:
+                    raise ValueError(f"步骤 '{step.name}' 依赖了不存在的步骤 '{dependency}'")
+                dependents[dependency].append(step.name)
+            remaining[step.name] = len(step.depends_on)
+
+        ready = deque(name for name, count in remaining.items() if count == 0)
+        ordered = []
+        while ready:
+            name = ready.popleft()
+            ordered.append(self._steps[name])
+            for dependent in dependents[name]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(ordered) != len(self._steps):
+            cyclic = sorted(name for name, count in remaining.items() if count > 0)
+            raise ValueError(f"步骤之间存在循环依赖: {cyclic}")
+        return ordered
+
+    @staticmethod
+    async def _cancel(tasks: Iterable[asyncio.Task]) -> None:
+        tasks = list(tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def run_phases(
+    phases: Sequence[Tuple[str, StepAction]],
+    timeout: Optional[float] = None,
+    concurrent: bool = True,
+    profiler: Optional[LifecycleProfiler] = None,
+) -> List[Optional[Exception]]:
+    """
+    执行一组互不依赖的操作（如所有 Handler 的 init()），每个操作单独计时和超时
+
+    异常不会向外传播，由调用方根据返回值记录日志、更新状态。
+
+    Args:
+        phases: (阶段名称, 无参数的异步函数) 列表
+        timeout: 每个操作的超时秒数，None 表示不限时
+        concurrent: 是否并发执行（False 时按顺序执行）
+        profiler: 耗时分析器，默认使用全局实例
+
+    Returns:
+        与 phases 一一对应的异常（正常结束为 None，超时为 TimeoutError）
+    """
+    profiler = profiler or get_lifecycle_profiler()
+
+    async def run_one(name: str, action: StepAction) -> Optional[Exception]:
+        try:
+            with profiler.phase(name):
+                if timeout is None:
+                    await action()
+                else:
+                    await asyncio.wait_for(action(), timeout=timeout)
+        except Exception as e:
+            return e
+        return None
+
+    if concurrent:
+        return list(await asyncio.gather(*(run_one(name, action) for name, action in phases)))
+    return [await run_one(name, action) for name, action in phases]
+
+
+__all__ = ["LifecycleGraph", "LifecycleStep", "run_phases"]
@@ -0,0 +1,130 @@
+"""
+启动/关闭耗时分析
+
+记录应用生命周期中每个阶段的墙钟耗时：配置加载、组件导入、DI 实例化、各 Collector / Decider / Handler
+的 setup / start / cleanup、Dashboard 启动等。main.py 在启动完成和关闭完成后输出报告，
+用于定位"修改配置后重启很慢"的瓶颈。
+
+阶段名称用 "." 分隔层级，如 "import.input.stt"、"decision.llm.setup"、"startup.dashboard"。
+并发执行的阶段各自记录，报告按开始时间排序，重叠的阶段可以从开始时间和耗时看出来。
+
+与 MessageTracer 一样，只在事件循环线程中使用，不需要锁。
+"""
+
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+
+@dataclass
+class PhaseRecord:
+    """
+    一个阶段的耗时记录
+
+    Attributes:
+        name: 阶段名称
+        start_ms: 开始时刻（相对于 profiler 起点）
+        duration_ms: 墙钟耗时
+        ok: 是否正常结束
+        error: 异常结束时的异常描述
+    """
+
+    name: str
+    start_ms: float
+    duration_ms: float
+    ok: bool = True
+    error: Optional[str] = None
+
+    @property
+    def end_ms(self) -> float:
+        return self.start_ms + self.duration_ms
+
+
+class LifecycleProfiler:
+    """生命周期耗时分析器"""
+
+    def __init__(self, max_records: int = 1000):
+        """
+        Args:
+            max_records: 最多保留的记录数（超出后丢弃最早的记录）
+        """
+        self._records: Deque[PhaseRecord] = deque(maxlen=max_records)
+        self._origin = time.perf_counter()
+
+    def reset(self) -> None:
+        """清空记录，并把当前时刻作为新的起点"""
+        self._records.clear()
+        self._origin = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        记录 with 块的耗时（同步、异步代码均可使用）
+
+        块内抛出的异常照常向外传播，记录标记为失败。
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        except BaseException as e:
+            self._add(name, started, error=f"{type(e).__name__}: {e}" if str(e) else type(e).__name__)
+            raise
+        else:
+            self._add(name, started)
+
+    def records(self, prefix: Optional[str] = None) -> List[PhaseRecord]:
+        """按开始时间排序的记录，prefix 不为空时只返回名称以 prefix 开头的阶段"""
+        selected = [r for r in self._records if prefix is None or r.name.startswith(prefix)]
+        return sorted(selected, key=lambda r: r.start_ms)
+
+    def snapshot(self, prefix: Optional[str] = None) -> List[Dict[str, Any]]:
+        """记录的字典形式（用于 Dashboard / 日志）"""
+        return [
+            {**asdict(r), "start_ms": round(r.start_ms, 1), "duration_ms": round(r.duration_ms, 1)}
+            for r in self.records(prefix)
+        ]
+
+    def report(self, prefix: Optional[str] = None, title: str = "生命周期耗时") -> str:
+        """
+        生成文本报告
+
+        每行依次为：开始时刻、耗时、阶段名称（失败的阶段附带异常描述）；
+        标题行的总耗时为选中阶段中最早开始到最晚结束的墙钟时间。
+        """
+        records = self.records(prefix)
+        if not records:
+            return f"{title}: 无记录"
+
+        total_ms = max(r.end_ms for r in records) - records[0].start_ms
+        lines = [f"{title}: 共 {len(records)} 个阶段，总耗时 {total_ms:.1f}ms", "    开始(ms)    耗时(ms)  阶段"]
+        for r in records:
+            line = f"{r.start_ms:>12.1f}{r.duration_ms:>12.1f}  {r.name}"
+            if not r.ok:
+                line += f"  [失败: {r.error}]"
+            lines.append(line)
+        return "\n".join(lines)
+
+    def _add(self, name: str, started: float, error: Optional[str] = None) -> None:
+        now = time.perf_counter()
+        self._records.append(
+            PhaseRecord(
+                name=name,
+                start_ms=(started - self._origin) * 1000,
+                duration_ms=(now - started) * 1000,
+                ok=error is None,
+                error=error,
+            )
+        )
+
+
+_profiler = LifecycleProfiler()
+
+
+def get_lifecycle_profiler() -> LifecycleProfiler:
+    """获取全局生命周期耗时分析器"""
+    return _profiler
+
+
+__all__ = ["LifecycleProfiler", "PhaseRecord", "get_lifecycle_profiler"]
@@ -15,6 +15,7 @@ from typing import Any, AsyncIterator, Dict, List, Optional
 from pydantic import BaseModel, Field
 
 from src.modules.logging import get_logger
+from src.modules.tracing import TraceStage, get_current_trace_id, get_tracer
 
 # === 数据类定义 ===
 
@@ -116,13 +117,18 @@ class LLMManager:
         ClientType.LLM_LOCAL: "openai",  # 本地模型使用 OpenAI 兼容 API
     }
 
-    def __init__(self):
+    def __init__(self, record_history: bool = True):
+        """
+        Args:
+            record_history: 是否记录请求历史（写入 src/modules/llm/history/），压测和重放脚本应关闭
+        """
         self.logger = get_logger("LLMManager")
         self._clients: Dict[str, Any] = {}  # client_type -> client_instance
         self._client_configs: Dict[str, Dict[str, Any]] = {}  # client_type -> config
         self._config: Dict[str, Any] = {}
         self._token_manager = None
         self._retry_config = RetryConfig()
+        self._record_history = record_history
 
     async def setup(self, config: Dict[str, Any]) -> None:
         """
@@ -630,7 +636,9 @@ class LLMManager:
         for attempt in range(max_retries):
             try:
                 method_func = getattr(llm_client, method)
-                result = await method_func(**kwargs)
+                # 关联到当前正在处理的消息（由 DeciderManager 通过 use_trace 设置）
+                with get_tracer().span(get_current_trace_id(), TraceStage.LLM):
+                    result = await method_func(**kwargs)
 
                 # 记录 token 使用量
                 if result.success and result.usage and self._token_manager:
@@ -692,6 +700,9 @@ class LLMManager:
             kwargs: 请求参数
             start_time: 请求开始时间
         """
+        if not self._record_history:
+            return
+
         try:
             from src.modules.llm.request_history_manager import (
                 RequestRecord,
@@ -7,11 +7,11 @@ from __future__ import annotations
 
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, Optional, TypeVar
+from typing import Any, Dict, Generic, Hashable, List, Optional, TypeVar
 
 from src.modules.logging import get_logger
 from src.modules.types.base.pipeline_stats import PipelineStats
-from src.modules.types.base.pipeline_types import PipelineErrorHandling
+from src.modules.types.base.pipeline_types import PipelineConcurrency, PipelineErrorHandling
 
 T = TypeVar("T")  # exported
 
@@ -19,14 +19,20 @@ T = TypeVar("T")  # exported
 class Pipeline(ABC, Generic[T]):
     """Pipeline 泛型基类。
 
-    子类实现 `_process()` 方法定义具体处理逻辑。
+    子类实现 `_process()` 方法定义具体处理逻辑；需要批量优化（一次加锁、一次清理、
+    向量化匹配）的子类可以额外覆盖 `_process_batch()`。
     基类负责统计、超时、错误处理的包装。
+
+    并发：PipelineManager 不再对整条链路加全局锁，而是按 `concurrency` 对单个 Pipeline 加锁。
+    默认 SERIAL（与旧行为等价的保守选择）；纯函数 Pipeline 应声明 CONCURRENT，
+    状态按用户/来源划分的 Pipeline 应声明 KEYED 并覆盖 `lock_key()`。
     """
 
     priority: int = 500
     enabled: bool = True
     error_handling: PipelineErrorHandling = PipelineErrorHandling.CONTINUE
     timeout_seconds: float = 5.0
+    concurrency: PipelineConcurrency = PipelineConcurrency.SERIAL
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """初始化 Pipeline。
@@ -71,6 +77,31 @@ class Pipeline(ABC, Generic[T]):
             self._stats.error_count += 1
             raise
 
+    async def process_batch(self, items: List[T]) -> List[Optional[T]]:
+        """批量处理 items（包装 _process_batch 并记录统计）。
+
+        Args:
+            items: 待处理对象列表
+
+        Returns:
+            与 items 一一对应的结果列表，None 表示该 item 被丢弃
+
+        Raises:
+            ValueError: _process_batch 返回的结果数量与输入不一致
+        """
+        start_time = time.time()
+        try:
+            results = await self._process_batch(items)
+        except Exception:
+            self._stats.error_count += 1
+            raise
+        if len(results) != len(items):
+            self._stats.error_count += 1
+            raise ValueError(f"_process_batch 返回了 {len(results)} 个结果，输入为 {len(items)} 个")
+        self._stats.processed_count += len(items)
+        self._stats.total_duration_ms += (time.time() - start_time) * 1000
+        return results
+
     @abstractmethod
     async def _process(self, item: T) -> Optional[T]:
         """实际处理 item（子类实现）。
@@ -85,6 +116,28 @@ class Pipeline(ABC, Generic[T]):
         """
         raise NotImplementedError
 
+    async def _process_batch(self, items: List[T]) -> List[Optional[T]]:
+        """批量处理 items（默认逐个调用 _process，子类可覆盖为批量实现）。
+
+        批量实现必须与逐个处理的语义一致：items 按顺序处理，前面的 item
+        对状态的影响（如限流计数、去重缓存）对后面的 item 可见。
+
+        Args:
+            items: 待处理对象列表（顺序即到达顺序）
+
+        Returns:
+            与 items 一一对应的结果列表，None 表示丢弃
+        """
+        return [await self._process(item) for item in items]
+
+    def lock_key(self, item: T) -> Hashable:
+        """返回 item 的锁 key（仅 concurrency 为 KEYED 时使用）。
+
+        相同 key 的 item 串行处理，不同 key 的 item 可同时处理。
+        默认所有 item 共用一个 key（等价于 SERIAL）。
+        """
+        return None
+
     def get_info(self) -> Dict[str, Any]:
         """获取 Pipeline 信息。"""
         return {
@@ -93,6 +146,7 @@ class Pipeline(ABC, Generic[T]):
             "enabled": self.enabled,
             "error_handling": self.error_handling.value,
             "timeout_seconds": self.timeout_seconds,
+            "concurrency": self.concurrency.value,
         }
 
     def get_stats(self) -> PipelineStats:
@@ -0,0 +1,45 @@
+"""Pipeline 细粒度锁。
+
+KeyedLock 为每个 key（如 user_id、source）提供独立的 asyncio.Lock，
+供 PipelineConcurrency.KEYED 的 Pipeline 使用。
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Hashable, List
+
+
+class KeyedLock:
+    """按 key 划分的锁。
+
+    同一 key 的持有者互斥，不同 key 互不影响。锁对象按引用计数管理，
+    没有持有者和等待者时立即删除，因此 key 的数量（如用户数）不会让内存无限增长。
+    """
+
+    def __init__(self) -> None:
+        # key -> [锁, 持有者 + 等待者数量]
+        self._entries: Dict[Hashable, List] = {}
+
+    @asynccontextmanager
+    async def acquire(self, key: Hashable) -> AsyncIterator[None]:
+        """获取 key 对应的锁（async with 使用）。"""
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        """当前有持有者或等待者的 key 数量。"""
+        return len(self._entries)
+
+
+__all__ = ["KeyedLock"]
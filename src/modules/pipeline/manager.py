@@ -1,19 +1,29 @@
 """PipelineManager[T] 泛型管理器。
 
 负责 Pipeline 的注册、排序、执行、统计。
+
+并发模型：process() 不持有全局锁，多个采集器的消息可以同时流经链路；
+每个 Pipeline 按自身声明的 concurrency 加锁（CONCURRENT 不加锁，SERIAL 使用 Pipeline 级锁，
+KEYED 按 lock_key(item) 使用 KeyedLock），因此只有真正共享状态的 Pipeline 会让消息排队。
+
+批量处理：process_batch() 让一批 item 以整批的形式流经链路，每个 Pipeline 每批只调用一次
+process_batch()（一次加锁、一次超时包装），适用于突发到达的消息（如 WebSocket 一次推送的多条弹幕）。
 """
 
 from __future__ import annotations
 
 import asyncio
 import time
-from typing import Any, Dict, Generic, List, Optional, Type
+from contextlib import AbstractAsyncContextManager, nullcontext
+from typing import Any, Dict, Generic, Hashable, List, Optional, Type, Union
 
+from src.modules.config.component_manifest import import_pipeline
 from src.modules.di import instantiate_with_di
 from src.modules.logging import get_logger
-from src.modules.types.base.pipeline_types import PipelineErrorHandling, PipelineException
+from src.modules.types.base.pipeline_types import PipelineConcurrency, PipelineErrorHandling, PipelineException
 
 from src.modules.pipeline.base import T, Pipeline
+from src.modules.pipeline.locks import KeyedLock
 from src.modules.pipeline.registry import PIPELINE_REGISTRY
 
 
@@ -34,22 +44,31 @@ class PipelineManager(Generic[T]):
             raise ValueError(f"stage 必须是 'input' 或 'output'，得到: {stage}")
         self.stage = stage
         self.services_by_type = services_by_type or {}
+        # 注册和排序时整体替换列表（写时复制），process() 迭代的快照不会被并发修改
         self._pipelines: List[Pipeline] = []
         self._pipelines_sorted: bool = True
-        self._pipeline_lock = asyncio.Lock()
+        # Pipeline 级锁：key = id(pipeline)，只为 SERIAL / KEYED 的 Pipeline 创建
+        self._locks: Dict[int, Union[asyncio.Lock, KeyedLock]] = {}
         self.logger = get_logger("PipelineManager")
 
     def register_pipeline(self, pipeline_instance: Pipeline) -> None:
         """注册一个 Pipeline。"""
-        self._pipelines.append(pipeline_instance)
+        self._pipelines = [*self._pipelines, pipeline_instance]
         self._pipelines_sorted = False
+        if pipeline_instance.concurrency == PipelineConcurrency.SERIAL:
+            self._locks[id(pipeline_instance)] = asyncio.Lock()
+        elif pipeline_instance.concurrency == PipelineConcurrency.KEYED:
+            self._locks[id(pipeline_instance)] = KeyedLock()
         info = pipeline_instance.get_info()
-        self.logger.info(f"Pipeline 已注册: {info['name']} (priority={info['priority']}, enabled={info['enabled']})")
+        self.logger.info(
+            f"Pipeline 已注册: {info['name']} "
+            f"(priority={info['priority']}, enabled={info['enabled']}, concurrency={info['concurrency']})"
+        )
 
     def _ensure_pipelines_sorted(self) -> None:
         """确保 Pipeline 列表按优先级排序（数字小优先）。"""
         if not self._pipelines_sorted:
-            self._pipelines.sort(key=lambda p: p.priority)
+            self._pipelines = sorted(self._pipelines, key=lambda p: p.priority)
             self._pipelines_sorted = True
             pipe_info = ", ".join([f"{p.get_info()['name']}({p.priority})" for p in self._pipelines])
             self.logger.debug(f"Pipeline 已排序: {pipe_info}")
@@ -69,64 +88,177 @@ class PipelineManager(Generic[T]):
         if not self._pipelines:
             return item
 
-        async with self._pipeline_lock:
-            self._ensure_pipelines_sorted()
+        self._ensure_pipelines_sorted()
 
-            current_item = item
-            for pipeline_instance in self._pipelines:
-                if not pipeline_instance.enabled:
-                    continue
+        current_item = item
+        for pipeline_instance in self._pipelines:
+            if not pipeline_instance.enabled:
+                continue
 
-                info = pipeline_instance.get_info()
-                pipeline_name = info["name"]
+            info = pipeline_instance.get_info()
+            pipeline_name = info["name"]
 
-                try:
-                    start_time = time.time()
-                    assert current_item is not None
+            try:
+                start_time = time.time()
+                assert current_item is not None
+                # 等锁时间不计入 Pipeline 超时
+                async with self._guard(pipeline_instance, current_item):
                     result = await asyncio.wait_for(
                         pipeline_instance.process(current_item),
                         timeout=pipeline_instance.timeout_seconds,
                     )
-                    current_item = result
+                current_item = result
 
-                    duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.time() - start_time) * 1000
 
-                    if current_item is None:
-                        self.logger.debug(f"Pipeline {pipeline_name} 丢弃了 item (耗时 {duration_ms:.2f}ms)")
-                        stats = pipeline_instance.get_stats()
-                        stats.dropped_count += 1
-                        return None
+                if current_item is None:
+                    self.logger.debug(f"Pipeline {pipeline_name} 丢弃了 item (耗时 {duration_ms:.2f}ms)")
+                    stats = pipeline_instance.get_stats()
+                    stats.dropped_count += 1
+                    return None
 
-                    self.logger.debug(f"Pipeline {pipeline_name} 处理完成 (耗时 {duration_ms:.2f}ms)")
+                self.logger.debug(f"Pipeline {pipeline_name} 处理完成 (耗时 {duration_ms:.2f}ms)")
 
-                except asyncio.TimeoutError as timeout_error:
-                    error = PipelineException(pipeline_name, f"处理超时 ({pipeline_instance.timeout_seconds}s)")
-                    self.logger.error(f"Pipeline 超时: {error}")
-                    stats = pipeline_instance.get_stats()
-                    stats.error_count += 1
-                    if pipeline_instance.error_handling == PipelineErrorHandling.STOP:
-                        raise error from timeout_error
-                    elif pipeline_instance.error_handling == PipelineErrorHandling.DROP:
-                        stats.dropped_count += 1
-                        return None
-                    # CONTINUE: 继续下一个
-
-                except PipelineException:
-                    raise
-
-                except Exception as e:
-                    error = PipelineException(pipeline_name, f"处理失败: {e}", original_error=e)
-                    self.logger.error(f"Pipeline 错误: {error}", exc_info=True)
-                    stats = pipeline_instance.get_stats()
-                    stats.error_count += 1
-                    if pipeline_instance.error_handling == PipelineErrorHandling.STOP:
-                        raise error from e
-                    elif pipeline_instance.error_handling == PipelineErrorHandling.DROP:
-                        stats.dropped_count += 1
-                        return None
-                    # CONTINUE: 继续下一个
+            except PipelineException:
+                raise
+
+            except Exception as e:
+                if self._handle_error(pipeline_instance, pipeline_name, e):
+                    return None
+                # CONTINUE: 继续下一个
+
+        return current_item
+
+    async def process_batch(self, items: List[T]) -> List[Optional[T]]:
+        """按优先级顺序通过所有启用的 Pipeline 批量处理 items。
+
+        与逐个调用 process() 的结果一致，但每个 Pipeline 每批只调用一次 process_batch()。
+        已被丢弃的 item 不会进入后续 Pipeline。超时（timeout_seconds）和错误处理策略作用于整批：
+        CONTINUE 时该 Pipeline 对整批透传，DROP 时丢弃整批。
+
+        Args:
+            items: 待处理对象列表
+
+        Returns:
+            与 items 一一对应的结果列表，None 表示该 item 被丢弃
+
+        Raises:
+            PipelineException: 当某个 Pipeline 错误处理策略为 STOP 时抛出
+        """
+        results: List[Optional[T]] = list(items)
+        if not self._pipelines or not items:
+            return results
+
+        self._ensure_pipelines_sorted()
+
+        alive = list(range(len(items)))
+        for pipeline_instance in self._pipelines:
+            if not alive:
+                break
+            if not pipeline_instance.enabled:
+                continue
 
-            return current_item
+            pipeline_name = pipeline_instance.get_info()["name"]
+            batch = [results[i] for i in alive]
+
+            try:
+                start_time = time.time()
+                processed = await self._run_batch(pipeline_instance, batch)
+                duration_ms = (time.time() - start_time) * 1000
+            except PipelineException:
+                raise
+            except Exception as e:
+                if self._handle_error(pipeline_instance, pipeline_name, e, item_count=len(alive)):
+                    for i in alive:
+                        results[i] = None
+                    alive = []
+                # CONTINUE: 整批透传给下一个
+                continue
+
+            survivors = []
+            for i, result in zip(alive, processed, strict=True):
+                results[i] = result
+                if result is not None:
+                    survivors.append(i)
+            dropped = len(alive) - len(survivors)
+            if dropped:
+                pipeline_instance.get_stats().dropped_count += dropped
+            self.logger.debug(
+                f"Pipeline {pipeline_name} 批量处理完成: {len(alive)} 个 item，丢弃 {dropped} 个 (耗时 {duration_ms:.2f}ms)"
+            )
+            alive = survivors
+
+        return results
+
+    async def _run_batch(self, pipeline_instance: Pipeline, batch: List[T]) -> List[Optional[T]]:
+        """在 Pipeline 的锁内调用 process_batch()；KEYED Pipeline 按 key 分组，各组并发处理。"""
+        timeout = pipeline_instance.timeout_seconds
+        lock = self._locks.get(id(pipeline_instance))
+        if not isinstance(lock, KeyedLock):
+            async with lock or nullcontext():
+                return await asyncio.wait_for(pipeline_instance.process_batch(batch), timeout=timeout)
+
+        groups: Dict[Hashable, List[int]] = {}
+        for index, item in enumerate(batch):
+            groups.setdefault(pipeline_instance.lock_key(item), []).append(index)
+
+        results: List[Optional[T]] = [None] * len(batch)
+
+        async def run_group(key: Hashable, indices: List[int]) -> None:
+            async with lock.acquire(key):
+                group_results = await asyncio.wait_for(
+                    pipeline_instance.process_batch([batch[i] for i in indices]), timeout=timeout
+                )
+            for i, result in zip(indices, group_results, strict=True):
+                results[i] = result
+
+        await asyncio.gather(*(run_group(key, indices) for key, indices in groups.items()))
+        return results
+
+    def _handle_error(
+        self,
+        pipeline_instance: Pipeline,
+        pipeline_name: str,
+        error: Exception,
+        item_count: int = 1,
+    ) -> bool:
+        """按 Pipeline 的错误处理策略处理超时或异常。
+
+        Args:
+            pipeline_instance: 出错的 Pipeline
+            pipeline_name: Pipeline 名称
+            error: 捕获的异常（asyncio.TimeoutError 表示超时）
+            item_count: 受影响的 item 数量（DROP 时计入 dropped_count）
+
+        Returns:
+            True 表示应丢弃 item（DROP），False 表示继续执行下一个 Pipeline（CONTINUE）
+
+        Raises:
+            PipelineException: 错误处理策略为 STOP
+        """
+        if isinstance(error, asyncio.TimeoutError):
+            exception = PipelineException(pipeline_name, f"处理超时 ({pipeline_instance.timeout_seconds}s)")
+            self.logger.error(f"Pipeline 超时: {exception}")
+        else:
+            exception = PipelineException(pipeline_name, f"处理失败: {error}", original_error=error)
+            self.logger.error(f"Pipeline 错误: {exception}", exc_info=True)
+        stats = pipeline_instance.get_stats()
+        stats.error_count += 1
+        if pipeline_instance.error_handling == PipelineErrorHandling.STOP:
+            raise exception from error
+        if pipeline_instance.error_handling == PipelineErrorHandling.DROP:
+            stats.dropped_count += item_count
+            return True
+        return False
+
+    def _guard(self, pipeline_instance: Pipeline, item: T) -> AbstractAsyncContextManager:
+        """按 Pipeline 的并发模式返回处理 item 时需要持有的锁。"""
+        lock = self._locks.get(id(pipeline_instance))
+        if lock is None:
+            return nullcontext()
+        if isinstance(lock, KeyedLock):
+            return lock.acquire(pipeline_instance.lock_key(item))
+        return lock
 
     def get_pipeline_stats(self) -> Dict[str, Dict[str, Any]]:
         """获取所有 Pipeline 的统计信息。"""
@@ -141,6 +273,7 @@ class PipelineManager(Generic[T]):
                 "avg_duration_ms": stats.avg_duration_ms,
                 "enabled": info["enabled"],
                 "priority": info["priority"],
+                "concurrency": info["concurrency"],
             }
         return result
 
@@ -196,14 +329,20 @@ class PipelineManager(Generic[T]):
                 self.logger.warning(f"Pipeline '{name}' 缺少 priority 字段或类型错误，跳过加载")
                 continue
 
-            # 查注册表
+            # 查注册表（未注册时按 component_manifest 清单按需导入）
             key = (self.stage, name)
+            if key not in PIPELINE_REGISTRY:
+                try:
+                    import_pipeline(self.stage, name)
+                except ImportError as e:
+                    raise PipelineConfigError(f"导入 Pipeline '{name}' 失败: {e}") from e
             pipeline_cls = PIPELINE_REGISTRY.get(key)
             if pipeline_cls is None:
                 raise PipelineConfigError(
                     f"Pipeline '{name}' 在配置 [pipelines.{self.stage}.{name}] 中启用，"
                     f"但未在 PIPELINE_REGISTRY 中注册。"
-                    f"请确认：(1) 模块是否被 import？(2) 是否加了 @pipeline('{name}') 装饰器？"
+                    f"请确认：(1) 是否已在 component_manifest.PIPELINE_MANIFEST 中登记模块？"
+                    f"(2) 是否加了 @pipeline('{name}') 装饰器？"
                 )
 
             # 构造 Pipeline（反射注入服务）
@@ -1,6 +1,7 @@
 """Audio data chunk and metadata classes for streaming."""
 
 import time
+from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -14,6 +15,7 @@ class AudioMetadata(BaseModel):
     sample_rate: int = Field(description="采样率（Hz）")
     channels: int = Field(default=1, description="声道数")
     timestamp: float = Field(default_factory=time.time, description="时间戳")
+    trace_id: Optional[str] = Field(default=None, description="消息追踪 ID")
 
 
 class AudioChunk(BaseModel):
@@ -24,6 +26,7 @@ class AudioChunk(BaseModel):
     channels: int = Field(default=1, description="声道数")
     sequence: int = Field(description="序列号（用于排序）")
     timestamp: float = Field(default_factory=time.time, description="时间戳")
+    trace_id: Optional[str] = Field(default=None, description="消息追踪 ID")
 
     def size(self) -> int:
         """返回数据大小（字节）"""
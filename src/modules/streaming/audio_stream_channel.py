@@ -8,6 +8,7 @@ import asyncio
 from typing import Any, Awaitable, Callable, Dict, Optional
 
 from src.modules.logging import get_logger
+from src.modules.tracing import TraceStage, get_tracer
 
 from .audio_chunk import AudioChunk, AudioMetadata
 from .backpressure import BackpressureStrategy, PublishResult, SubscriberConfig
@@ -164,6 +165,7 @@ class AudioStreamChannel:
             return results
 
         self._publish_count += 1
+        get_tracer().mark(chunk.trace_id, TraceStage.FIRST_AUDIO_CHUNK)
 
         async with self._lock:
             for sub_id, sub_data in self._subscribers.items():
@@ -0,0 +1,29 @@
+"""
+Amaidesu 消息追踪模块
+
+提供端到端消息链路追踪（trace_id + 阶段 span）和决策阶段负载监视。
+"""
+
+from .load import DecisionLoadMonitor, DecisionTicket, get_load_monitor
+from .tracer import (
+    MessageTrace,
+    MessageTracer,
+    Span,
+    TraceStage,
+    get_current_trace_id,
+    get_tracer,
+    use_trace,
+)
+
+__all__ = [
+    "DecisionLoadMonitor",
+    "DecisionTicket",
+    "MessageTrace",
+    "MessageTracer",
+    "Span",
+    "TraceStage",
+    "get_current_trace_id",
+    "get_load_monitor",
+    "get_tracer",
+    "use_trace",
+]
@@ -0,0 +1,100 @@
+"""
+决策阶段负载监视
+
+DeciderManager 在每条消息开始/结束决策时调用 begin() / end()，Input 阶段的准入管道
+（load_shed）读取 in_flight 与 lag_ms 判断下游是否过载。两者只通过这个 Core 层对象交换数值，
+Input 阶段不依赖 Decision 阶段。
+
+与 MessageTracer 一样，所有操作都只在事件循环线程中同步执行，不需要锁。
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from src.modules.time_utils import now_ms
+
+
+@dataclass
+class DecisionTicket:
+    """一条正在决策的消息（begin() 的返回值，传回给 end()）"""
+
+    started_at_ms: int
+
+
+class DecisionLoadMonitor:
+    """
+    决策阶段负载监视器
+
+    Attributes:
+        in_flight: 已进入 DeciderManager 但尚未完成决策的消息数
+        lag_ms: 排队延迟的指数滑动平均（消息产生 → 开始决策），空闲时为 0
+        decision_ms: 决策耗时的指数滑动平均
+    """
+
+    def __init__(self, alpha: float = 0.2):
+        """
+        Args:
+            alpha: 指数滑动平均的平滑系数（越大越偏向最近的样本）
+        """
+        self.alpha = alpha
+        self.in_flight = 0
+        self.completed = 0
+        self.decision_ms = 0.0
+        self._lag_ms = 0.0
+
+    @property
+    def lag_ms(self) -> float:
+        # 没有消息在决策时新消息不需要排队：返回 0，避免旧的延迟样本在负载消失后继续触发降载
+        return self._lag_ms if self.in_flight > 0 else 0.0
+
+    def begin(self, created_at_ms: int = 0) -> DecisionTicket:
+        """
+        记录一条消息开始决策
+
+        Args:
+            created_at_ms: 消息产生时刻（NormalizedMessage.timestamp_ms），为 0 时不计入排队延迟
+        """
+        now = now_ms()
+        if created_at_ms > 0:
+            self._lag_ms = self._ewma(self._lag_ms, max(now - created_at_ms, 0))
+        self.in_flight += 1
+        return DecisionTicket(started_at_ms=now)
+
+    def end(self, ticket: Optional[DecisionTicket]) -> None:
+        """记录一条消息完成决策（成功或失败）"""
+        if ticket is None:
+            return
+        self.in_flight = max(self.in_flight - 1, 0)
+        self.completed += 1
+        self.decision_ms = self._ewma(self.decision_ms, now_ms() - ticket.started_at_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """当前负载（用于 get_info / Dashboard）"""
+        return {
+            "in_flight": self.in_flight,
+            "lag_ms": round(self.lag_ms, 1),
+            "decision_ms": round(self.decision_ms, 1),
+            "completed": self.completed,
+        }
+
+    def reset(self) -> None:
+        self.in_flight = 0
+        self.completed = 0
+        self.decision_ms = 0.0
+        self._lag_ms = 0.0
+
+    def _ewma(self, current: float, sample: float) -> float:
+        if current == 0.0:
+            return float(sample)
+        return current + self.alpha * (sample - current)
+
+
+_load_monitor = DecisionLoadMonitor()
+
+
+def get_load_monitor() -> DecisionLoadMonitor:
+    """获取全局决策负载监视器"""
+    return _load_monitor
+
+
+__all__ = ["DecisionLoadMonitor", "DecisionTicket", "get_load_monitor"]
@@ -0,0 +1,265 @@
+"""
+消息链路追踪
+
+为每条进入系统的消息分配 trace_id，并记录各阶段的时间跨度（span），
+用于回答"从弹幕到第一帧音频，时间都花在哪里"。
+
+trace_id 的传递方式：
+- 跨事件边界：显式放在 Payload 字段中（MessageReadyPayload.trace_id、IntentPayload.trace_id、
+  AudioMetadata.trace_id / AudioChunk.trace_id）
+- 阶段内部调用链：通过 contextvars（use_trace / get_current_trace_id），
+  例如 Decider → LLMManager、TTS Handler → AudioDeviceManager.play_audio
+
+所有记录操作都只在事件循环线程中同步执行，不需要锁；trace_id 为 None 或未知时静默忽略，
+因此未接入追踪的调用方（如 Dashboard 注入的 Intent）不受影响。
+"""
+
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional
+
+from src.modules.time_utils import now_ms
+
+
+class TraceStage:
+    """标准阶段名称（span 名称），避免魔法字符串"""
+
+    INPUT_QUEUE = "input_queue"  # Collector 产出到被 InputScheduler 调度（Collector 调度队列）
+    INPUT_PIPELINES = "input_pipelines"  # InputPipeline 处理
+    DECIDER_QUEUE = "decider_queue"  # input.message.received 发布到 DeciderManager 收到
+    DECISION = "decision"  # Decider.decide() 调用（包含 LLM）
+    LLM = "llm"  # LLMManager 请求（含重试）
+    OUTPUT_PIPELINES = "output_pipelines"  # OutputPipeline 处理
+    TTS_QUEUE = "tts_queue"  # 等待 TTS 锁（前一句仍在合成/播放）
+    TTS_SYNTHESIS = "tts_synthesis"  # TTS 请求发出到第一块音频就绪
+    FIRST_AUDIO_CHUNK = "first_audio_chunk"  # 第一块音频发布到 AudioStreamChannel（标记点）
+    PLAYBACK_START = "playback_start"  # 第一帧 PCM 交给音频设备（标记点）
+
+
+@dataclass
+class Span:
+    """
+    阶段时间跨度
+
+    Attributes:
+        name: 阶段名称（见 TraceStage）
+        start_ms: 相对 trace 开始的起始偏移（毫秒）
+        end_ms: 相对 trace 开始的结束偏移（毫秒），未结束时为 None
+        is_mark: 是否为时刻标记（时长为 0）
+    """
+
+    name: str
+    start_ms: float
+    end_ms: Optional[float] = None
+    is_mark: bool = False
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        """持续时间（毫秒），未结束时为 None"""
+        return None if self.end_ms is None else self.end_ms - self.start_ms
+
+
+@dataclass
+class MessageTrace:
+    """
+    单条消息的追踪记录
+
+    Attributes:
+        trace_id: 追踪 ID
+        source: 消息来源（Collector 名称）
+        text: 消息文本（截断）
+        created_at_ms: 创建时刻（Unix 毫秒）
+        spans: 按开始顺序排列的 span 列表
+    """
+
+    trace_id: str
+    source: str
+    text: str
+    created_at_ms: int
+    spans: List[Span] = field(default_factory=list)
+    _origin: float = field(default_factory=time.perf_counter, repr=False)
+    _open: Dict[str, Span] = field(default_factory=dict, repr=False)
+
+    def offset_ms(self) -> float:
+        """当前时刻相对 trace 开始的偏移（毫秒）"""
+        return (time.perf_counter() - self._origin) * 1000
+
+    def breakdown(self) -> Dict[str, float]:
+        """
+        各阶段耗时
+
+        同名 span 出现多次时（如 LLM 重试、多个 Decider 各产生一个 Intent）累加其耗时；
+        标记点（如 playback_start）取第一次出现时相对 trace 开始的偏移，即端到端延迟。
+        未结束的 span 不计入。
+        """
+        result: Dict[str, float] = {}
+        for span in self.spans:
+            if span.end_ms is None:
+                continue
+            if span.is_mark:
+                result.setdefault(span.name, span.start_ms)
+            else:
+                result[span.name] = result.get(span.name, 0.0) + span.end_ms - span.start_ms
+        return result
+
+    @property
+    def total_ms(self) -> Optional[float]:
+        """到第一帧音频播放的端到端耗时；尚未播放时为 None"""
+        for span in self.spans:
+            if span.name == TraceStage.PLAYBACK_START:
+                return span.start_ms
+        return None
+
+
+_current_trace_id: ContextVar[Optional[str]] = ContextVar("amaidesu_trace_id", default=None)
+
+
+def get_current_trace_id() -> Optional[str]:
+    """获取当前调用链上的 trace_id"""
+    return _current_trace_id.get()
+
+
+@contextmanager
+def use_trace(trace_id: Optional[str]) -> Iterator[None]:
+    """在 with 块内把 trace_id 设置为当前调用链的 trace_id（trace_id 为 None 时不改变）"""
+    if trace_id is None:
+        yield
+        return
+    token = _current_trace_id.set(trace_id)
+    try:
+        yield
+    finally:
+        _current_trace_id.reset(token)
+
+
+class MessageTracer:
+    """
+    消息追踪器
+
+    只在内存中保留最近创建的 max_traces 条记录（最旧的先淘汰），供 Dashboard 查询。
+    """
+
+    def __init__(self, max_traces: int = 500, enabled: bool = True):
+        """
+        初始化追踪器
+
+        Args:
+            max_traces: 最多保留的 trace 数量
+            enabled: 是否启用（禁用时 start_trace 返回 None，其余操作全部为空操作）
+        """
+        self.max_traces = max_traces
+        self.enabled = enabled
+        self._traces: "OrderedDict[str, MessageTrace]" = OrderedDict()
+
+    def start_trace(self, source: str, text: str = "") -> Optional[str]:
+        """
+        开始一条新的 trace
+
+        Args:
+            source: 消息来源
+            text: 消息文本（只保留前 50 个字符）
+
+        Returns:
+            trace_id，追踪器禁用时为 None
+        """
+        if not self.enabled:
+            return None
+        trace_id = uuid.uuid4().hex[:16]
+        self._traces[trace_id] = MessageTrace(trace_id=trace_id, source=source, text=text[:50], created_at_ms=now_ms())
+        while len(self._traces) > self.max_traces:
+            self._traces.popitem(last=False)
+        return trace_id
+
+    def discard(self, trace_id: Optional[str]) -> None:
+        """丢弃 trace（如消息被 Pipeline 过滤）"""
+        if trace_id is not None:
+            self._traces.pop(trace_id, None)
+
+    def start_span(self, trace_id: Optional[str], name: str) -> None:
+        """开始一个阶段；同名阶段已在进行中时忽略"""
+        trace = self._get(trace_id)
+        if trace is None or name in trace._open:
+            return
+        span = Span(name=name, start_ms=trace.offset_ms())
+        trace.spans.append(span)
+        trace._open[name] = span
+
+    def end_span(self, trace_id: Optional[str], name: str) -> None:
+        """结束一个阶段；阶段未开始时忽略"""
+        trace = self._get(trace_id)
+        if trace is None:
+            return
+        span = trace._open.pop(name, None)
+        if span is not None:
+            span.end_ms = trace.offset_ms()
+
+    @contextmanager
+    def span(self, trace_id: Optional[str], name: str) -> Iterator[None]:
+        """在 with 块内记录一个阶段（异常时同样结束）"""
+        self.start_span(trace_id, name)
+        try:
+            yield
+        finally:
+            self.end_span(trace_id, name)
+
+    def mark(self, trace_id: Optional[str], name: str, once: bool = True) -> None:
+        """
+        记录一个时刻标记（时长为 0 的 span）
+
+        Args:
+            trace_id: 追踪 ID
+            name: 标记名称
+            once: 为 True 时同名标记只记录第一次（如第一帧音频）
+        """
+        trace = self._get(trace_id)
+        if trace is None:
+            return
+        if once and any(span.name == name for span in trace.spans):
+            return
+        offset = trace.offset_ms()
+        trace.spans.append(Span(name=name, start_ms=offset, end_ms=offset, is_mark=True))
+
+    def get_trace(self, trace_id: str) -> Optional[MessageTrace]:
+        """获取指定 trace"""
+        return self._traces.get(trace_id)
+
+    def get_recent(self, limit: int = 50) -> List[MessageTrace]:
+        """获取最近的 trace（新的在前）"""
+        result = []
+        for trace in reversed(self._traces.values()):
+            if len(result) >= limit:
+                break
+            result.append(trace)
+        return result
+
+    def clear(self) -> None:
+        """清空所有 trace"""
+        self._traces.clear()
+
+    def _get(self, trace_id: Optional[str]) -> Optional[MessageTrace]:
+        if trace_id is None:
+            return None
+        return self._traces.get(trace_id)
+
+
+_tracer = MessageTracer()
+
+
+def get_tracer() -> MessageTracer:
+    """获取全局消息追踪器"""
+    return _tracer
+
+
+__all__ = [
+    "MessageTrace",
+    "MessageTracer",
+    "Span",
+    "TraceStage",
+    "get_current_trace_id",
+    "get_tracer",
+    "use_trace",
+]
@@ -13,6 +13,7 @@ from typing import Any, Dict, List, Optional
 import numpy as np
 
 from src.modules.logging import get_logger
+from src.modules.tracing import TraceStage, get_current_trace_id, get_tracer
 
 # 检查依赖
 DEPENDENCIES_OK = False
@@ -176,6 +177,8 @@ class AudioDeviceManager:
             # 播放音频
             sd.play(audio_array, samplerate=samplerate, device=device_index)
             self.is_playing = True
+            # 调用方（TTS Handler）通过 use_trace 设置当前消息的 trace_id
+            get_tracer().mark(get_current_trace_id(), TraceStage.PLAYBACK_START)
 
             # 计算播放时长并等待
             duration = len(audio_array) / samplerate
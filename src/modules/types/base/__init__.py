@@ -5,10 +5,13 @@
 """
 
 from .base import NormalizedMessage
-from .pipeline_types import PipelineErrorHandling, PipelineException
+from .message_record import MessageRecord
+from .pipeline_types import PipelineConcurrency, PipelineErrorHandling, PipelineException
 
 __all__ = [
+    "MessageRecord",
     "NormalizedMessage",
+    "PipelineConcurrency",
     "PipelineErrorHandling",
     "PipelineException",
 ]
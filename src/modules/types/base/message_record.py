@@ -0,0 +1,172 @@
+"""
+阶段间传递的轻量消息记录
+
+NormalizedMessage 是 Pydantic 模型，适合在信任边界（Collector 产出、Dashboard 注入、外部桥接）做验证；
+Input → Decision 的热路径上消息已经验证过，原来每条消息还要 model_dump 成字典（连同整个原始平台消息）、
+由 MessageReadyPayload 验证字典，再在 DecisionManager 中 model_validate 回 NormalizedMessage。
+
+MessageRecord 用 __slots__ 保存同样的字段，发布时不做任何验证和序列化：
+- raw 只保存原始消息对象的引用，只有订阅者读取 record["raw"] 或序列化时才 model_dump 一次（并缓存）
+- 实现 Mapping 接口，按字典读取 payload.message 的订阅者（Dashboard、事件日志、重放）不需要改动
+- to_normalized() 返回原 NormalizedMessage（直接构造的记录才创建一次，不重复验证）
+"""
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional
+
+from pydantic_core import core_schema
+
+from src.modules.types.base.normalized_message import NormalizedMessage
+
+_UNSET = object()
+
+
+class MessageRecord(Mapping):
+    """
+    轻量消息记录（只读）
+
+    字段与 NormalizedMessage 相同；按 Mapping 读取时的键与 NormalizedMessage.model_dump() 一致，
+    其中 "raw" 为原始消息 model_dump() 后的字典。
+    """
+
+    FIELDS = (
+        "text",
+        "source",
+        "data_type",
+        "importance",
+        "timestamp_ms",
+        "raw",
+        "user_id",
+        "user_nickname",
+        "platform",
+        "room_id",
+    )
+
+    __slots__ = (
+        "text",
+        "source",
+        "data_type",
+        "importance",
+        "timestamp_ms",
+        "user_id",
+        "user_nickname",
+        "platform",
+        "room_id",
+        "_raw",
+        "_raw_dict",
+        "_normalized",
+    )
+
+    def __init__(
+        self,
+        text: str,
+        source: str,
+        data_type: str = "text",
+        importance: float = 0.5,
+        timestamp_ms: int = 0,
+        raw: Any = None,
+        user_id: Optional[str] = None,
+        user_nickname: Optional[str] = None,
+        platform: Optional[str] = None,
+        room_id: Optional[str] = None,
+    ):
+        self.text = text
+        self.source = source
+        self.data_type = data_type
+        self.importance = importance
+        self.timestamp_ms = timestamp_ms
+        self.user_id = user_id
+        self.user_nickname = user_nickname
+        self.platform = platform
+        self.room_id = room_id
+        self._raw = raw
+        self._raw_dict: Any = _UNSET
+        self._normalized: Optional[NormalizedMessage] = None
+
+    @classmethod
+    def from_normalized(cls, message: NormalizedMessage) -> "MessageRecord":
+        """从已验证的 NormalizedMessage 创建（不验证、不拷贝原始消息）"""
+        record = cls(
+            text=message.text,
+            source=message.source,
+            data_type=message.data_type,
+            importance=message.importance,
+            timestamp_ms=message.timestamp_ms,
+            raw=message.raw,
+            user_id=message.user_id,
+            user_nickname=message.user_nickname,
+            platform=message.platform,
+            room_id=message.room_id,
+        )
+        record._normalized = message
+        return record
+
+    @property
+    def raw(self) -> Any:
+        """原始消息对象（未序列化的引用）"""
+        return self._raw
+
+    @property
+    def raw_dict(self) -> Optional[Dict[str, Any]]:
+        """原始消息序列化后的字典（第一次访问时生成）"""
+        if self._raw_dict is _UNSET:
+            raw = self._raw
+            self._raw_dict = raw.model_dump() if hasattr(raw, "model_dump") else raw
+        return self._raw_dict
+
+    def to_normalized(self) -> NormalizedMessage:
+        """
+        转换为 NormalizedMessage
+
+        从 NormalizedMessage 创建的记录直接返回原对象（Input 阶段发布后不再修改消息）；
+        否则用 model_construct 构造一次并缓存，字段在创建记录时已是可信数据，不再验证。
+        """
+        if self._normalized is None:
+            self._normalized = NormalizedMessage.model_construct(
+                text=self.text,
+                source=self.source,
+                data_type=self.data_type,
+                importance=self.importance,
+                timestamp_ms=self.timestamp_ms,
+                raw=self._raw,
+                user_id=self.user_id,
+                user_nickname=self.user_nickname,
+                platform=self.platform,
+                room_id=self.room_id,
+            )
+        return self._normalized
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典（与原来的 NormalizedMessage.model_dump() 结构相同）"""
+        return {key: self[key] for key in self.FIELDS}
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "raw":
+            return self.raw_dict
+        if key in self.FIELDS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        # Mapping 默认实现会调用 __getitem__，对 "raw" 会触发序列化
+        return key in self.FIELDS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def __repr__(self) -> str:
+        return f"MessageRecord(text={self.text!r}, source={self.source!r}, data_type={self.data_type!r})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: Any) -> core_schema.CoreSchema:
+        # 作为 Payload 字段时只接受 MessageRecord 实例（不验证内容），序列化时转为字典
+        return core_schema.is_instance_schema(
+            cls,
+            serialization=core_schema.plain_serializer_function_ser_schema(lambda record: record.to_dict()),
+        )
+
+
+__all__ = ["MessageRecord"]
@@ -1,7 +1,7 @@
 """
 Pipeline 共享类型定义
 
-供 InputPipeline 和 OutputPipeline 共同使用的错误处理策略和异常类。
+供 InputPipeline 和 OutputPipeline 共同使用的错误处理策略、并发模式和异常类。
 """
 
 from enum import Enum
@@ -16,6 +16,14 @@ class PipelineErrorHandling(str, Enum):
     DROP = "drop"  # 丢弃消息，不执行后续 Pipeline
 
 
+class PipelineConcurrency(str, Enum):
+    """Pipeline 并发模式（PipelineManager 据此决定是否对该 Pipeline 加锁）"""
+
+    CONCURRENT = "concurrent"  # 无状态（纯函数）或自行保证并发安全，多个 item 可同时处理
+    SERIAL = "serial"  # 同一时刻只处理一个 item（Pipeline 级锁）
+    KEYED = "keyed"  # 按 lock_key(item) 串行，不同 key 的 item 可同时处理
+
+
 class PipelineException(Exception):
     """Pipeline 处理异常"""
 
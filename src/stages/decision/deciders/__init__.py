@@ -7,13 +7,29 @@ Decision Deciders - 决策Decider实现
 - AmaidesuDecider: 直播专用决策（双阶段轻量版）
 - CommandDecider: 通用命令意图路由器
 - ReplayDecider: 输入重放（调试用）
+
+导入此包不会导入任何 Decider：DeciderManager 通过 get_decider() 按 component_manifest 清单
+只导入启用的 Decider；下列类名在首次访问时才导入对应子模块。
 """
 
-from .llm import LLMDecider
-from .maibot import MaiBotDecider
-from .amaidesu import AmaidesuDecider
-from .command import CommandDecider
-from .replay import ReplayDecider
+import importlib
+from typing import Any
+
+_EXPORTS = {
+    "AmaidesuDecider": ".amaidesu",
+    "CommandDecider": ".command",
+    "LLMDecider": ".llm",
+    "MaiBotDecider": ".maibot",
+    "ReplayDecider": ".replay",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
+
 
 __all__ = [
     "MaiBotDecider",
@@ -5,10 +5,14 @@ LLMDecider - LLM决策提供者
 - 使用 LLM Service 进行决策
 - 支持自定义 prompt 模板
 - 错误处理和降级机制
+- 语音输入的推测请求（可选）：说话过程中识别文本稳定后提前发起 LLM 请求，
+  最终识别文本与之相同时直接使用该请求的结果
 """
 
-from typing import Any, Dict, Literal, Optional
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Literal, Optional
 
+import asyncio
 import json
 import re
 
@@ -28,6 +32,24 @@ from src.modules.types import Intent, IntentAction, IntentEmotion, IntentMetadat
 from src.modules.types.base.normalized_message import NormalizedMessage
 from src.modules.time_utils import now_ms
 
+if TYPE_CHECKING:
+    from src.modules.events.payloads.input import SpeechRecognizedPayload
+
+
+def _speculation_key(text: str) -> str:
+    """比较识别文本时忽略空白和标点（最终结果常常只比部分结果多了标点）"""
+    return re.sub(r"[\W_]+", "", text)
+
+
+@dataclass
+class _Speculation:
+    """一次推测请求：key 为识别文本的比较键，started 表示已经发出 LLM 请求（不再处于防抖等待）"""
+
+    source: str
+    key: str
+    task: Optional["asyncio.Task"] = None
+    started: bool = False
+
 
 @decider("llm")
 class LLMDecider:
@@ -41,6 +63,8 @@ class LLMDecider:
         [llm]
         client = "llm"  # 使用的 LLM 客户端（llm, llm_fast, vlm）
         fallback_mode = "simple"
+        speculate_on_partial = true  # 语音输入时提前发起推测请求
+        speculate_after_ms = 300
         ```
 
     属性:
@@ -62,6 +86,13 @@ class LLMDecider:
         type: Literal["llm"] = "llm"
         client: Literal["llm", "llm_fast", "vlm"] = Field(default="llm", description="使用的LLM客户端名称")
         fallback_mode: Literal["simple", "echo", "error"] = Field(default="simple", description="降级模式")
+        speculate_on_partial: bool = Field(
+            default=False,
+            description="语音识别部分结果稳定后提前发起 LLM 请求（最终文本不同时请求作废，会多消耗 token）",
+        )
+        speculate_after_ms: int = Field(
+            default=300, ge=0, description="部分结果保持不变多久后发起推测请求（毫秒），应小于 STT 静音阈值"
+        )
 
     def __init__(
         self,
@@ -100,10 +131,17 @@ class LLMDecider:
         # 降级模式配置
         self.fallback_mode = self.typed_config.fallback_mode
 
+        # 推测请求（语音输入）
+        self.speculate_on_partial = self.typed_config.speculate_on_partial
+        self.speculate_after_ms = self.typed_config.speculate_after_ms
+        self._speculation: Optional[_Speculation] = None
+
         # 统计信息
         self._total_requests = 0
         self._successful_requests = 0
         self._failed_requests = 0
+        self._speculation_hits = 0
+        self._speculation_misses = 0
 
     async def setup(self) -> None:
         """
@@ -169,52 +207,22 @@ class LLMDecider:
             except Exception as e:
                 self.logger.warning(f"保存用户消息到上下文失败: {e}")
 
-        # 读取 persona 配置（带默认值）
-        persona_config = self._get_persona_config()
-
-        # 获取历史上下文用于构建 prompt
-        history_context = []
-        if self._context_service:
-            try:
-                # 获取最近10条历史消息
-                history = await self._context_service.get_history(session_id, limit=10)
-                # 转换为字符串格式（排除刚保存的当前用户消息，避免重复）
-                history_items = []
-                for msg in history[:-1]:  # 排除刚刚添加的用户消息
-                    role_name = "用户" if msg.role.value == "user" else "助手"
-                    history_items.append(f"{role_name}: {msg.content}")
-                history_context = history_items
-                self.logger.debug(f"历史上下文: {len(history_context)} 条消息")
-            except Exception as e:
-                self.logger.warning(f"获取历史上下文失败: {e}")
-
-        # 构建历史文本（用于 prompt 模板）
-        history_text = "\n".join(history_context) if history_context else ""
-
-        # 获取 prompt_service（依赖注入）
-        if not self._prompt_service:
-            raise ValueError("prompt_service 未注入，请检查 组件初始化配置")
-        prompt_manager = self._prompt_service
-
-        # 构建 prompt（使用 PromptManager 渲染结构化模板）
-        prompt = prompt_manager.render_safe(
-            "decision/llm_structured",
-            text=normalized_message.text,
-            bot_name=persona_config.get("bot_name", "爱德丝"),
-            personality=persona_config.get("personality", "活泼开朗，有些调皮，喜欢和观众互动"),
-            style_constraints=persona_config.get(
-                "style_constraints", "口语化，使用网络流行语，避免机械式回复，适当使用emoji"
-            ),
-            history=history_text,
-        )
+        # 说话过程中已按相同文本发出的推测请求：直接使用其结果
+        speculation = self._take_speculation(normalized_message)
+        if speculation is None:
+            prompt = await self._build_prompt(session_id, normalized_message.text, exclude_latest=True)
 
         try:
-            # 使用 LLM Service 进行调用（不使用 response_format，因为该参数不存在）
-            self.logger.info(f"LLMDecider 使用 LLM 解析意图: {normalized_message.text[:50]}...")
-            response = await self._llm_service.chat(
-                prompt=prompt,
-                client_type=self.client_type,
-            )
+            if speculation is not None:
+                self.logger.info(f"LLMDecider 使用推测请求的结果: {normalized_message.text[:50]}...")
+                response = await speculation
+            else:
+                # 使用 LLM Service 进行调用（不使用 response_format，因为该参数不存在）
+                self.logger.info(f"LLMDecider 使用 LLM 解析意图: {normalized_message.text[:50]}...")
+                response = await self._llm_service.chat(
+                    prompt=prompt,
+                    client_type=self.client_type,
+                )
 
             if not response.success:
                 self._failed_requests += 1
@@ -266,6 +274,114 @@ class LLMDecider:
             await self._handle_fallback(normalized_message)
             return
 
+    async def _build_prompt(self, session_id: str, text: str, exclude_latest: bool) -> str:
+        """
+        渲染结构化 prompt（persona + 最近的对话历史）
+
+        Args:
+            session_id: 上下文会话 ID
+            text: 用户输入
+            exclude_latest: 上下文最后一条是否为刚保存的当前用户消息（需要从历史中排除，避免重复）
+        """
+        # 读取 persona 配置（带默认值）
+        persona_config = self._get_persona_config()
+
+        # 获取历史上下文用于构建 prompt（不含当前用户消息的最近 9 条）
+        history_context = []
+        if self._context_service:
+            try:
+                history = await self._context_service.get_history(session_id, limit=10 if exclude_latest else 9)
+                if exclude_latest:
+                    history = history[:-1]
+                for msg in history:
+                    role_name = "用户" if msg.role.value == "user" else "助手"
+                    history_context.append(f"{role_name}: {msg.content}")
+                self.logger.debug(f"历史上下文: {len(history_context)} 条消息")
+            except Exception as e:
+                self.logger.warning(f"获取历史上下文失败: {e}")
+
+        # 构建历史文本（用于 prompt 模板）
+        history_text = "\n".join(history_context) if history_context else ""
+
+        # 获取 prompt_service（依赖注入）
+        if not self._prompt_service:
+            raise ValueError("prompt_service 未注入，请检查 组件初始化配置")
+
+        # 构建 prompt（使用 PromptManager 渲染结构化模板）
+        return self._prompt_service.render_safe(
+            "decision/llm_structured",
+            text=text,
+            bot_name=persona_config.get("bot_name", "爱德丝"),
+            personality=persona_config.get("personality", "活泼开朗，有些调皮，喜欢和观众互动"),
+            style_constraints=persona_config.get(
+                "style_constraints", "口语化，使用网络流行语，避免机械式回复，适当使用emoji"
+            ),
+            history=history_text,
+        )
+
+    async def prepare(self, hypothesis: "SpeechRecognizedPayload") -> None:
+        """
+        处理说话过程中的语音识别结果（由 DeciderManager 转发）
+
+        开启 speculate_on_partial 时，部分结果保持 speculate_after_ms 不变（说话人停顿）就提前发起 LLM 请求，
+        文本再变化时作废旧请求；decide() 收到相同的最终文本时直接使用推测请求的结果，
+        省下说话结束到 LLM 返回之间的等待。
+
+        Args:
+            hypothesis: 语音识别结果事件 Payload
+        """
+        if not self.speculate_on_partial:
+            return
+
+        if hypothesis.is_final:
+            # 非空的最终结果随后由 decide() 认领；空结果说明话语识别失败或被放弃
+            if not hypothesis.text:
+                self._cancel_speculation()
+            return
+
+        key = _speculation_key(hypothesis.text)
+        current = self._speculation
+        if current is not None and current.source == hypothesis.source and current.key == key:
+            return
+
+        self._cancel_speculation()
+        speculation = _Speculation(source=hypothesis.source, key=key)
+        speculation.task = asyncio.create_task(self._speculate(speculation, hypothesis.text))
+        # 作废的请求不会被 await，这里取走异常避免 "exception was never retrieved"
+        speculation.task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._speculation = speculation
+
+    async def _speculate(self, speculation: _Speculation, text: str) -> Any:
+        """防抖等待后发起推测请求，返回 LLM 响应"""
+        await asyncio.sleep(self.speculate_after_ms / 1000)
+        prompt = await self._build_prompt(speculation.source, text, exclude_latest=False)
+        speculation.started = True
+        self.logger.debug(f"发起推测请求: {text[:50]}")
+        return await self._llm_service.chat(prompt=prompt, client_type=self.client_type)
+
+    def _take_speculation(self, normalized_message: "NormalizedMessage") -> Optional["asyncio.Task"]:
+        """认领与最终文本相同且已发出的推测请求；同一来源的其他推测请求作废"""
+        speculation = self._speculation
+        if speculation is None or speculation.source != normalized_message.source:
+            return None
+
+        if speculation.started and speculation.key == _speculation_key(normalized_message.text):
+            self._speculation = None
+            self._speculation_hits += 1
+            return speculation.task
+
+        self._cancel_speculation()
+        return None
+
+    def _cancel_speculation(self) -> None:
+        speculation = self._speculation
+        if speculation is None:
+            return
+        self._speculation = None
+        if speculation.started:
+            self._speculation_misses += 1
+        speculation.task.cancel()
+
     def _clean_llm_json(self, raw_output: str) -> str:
         """
         清理 LLM 返回的 JSON 字符串（与 MaiBot 一致）
@@ -401,6 +517,7 @@ class LLMDecider:
         输出统计信息。
         """
         self.logger.info("清理LLMDecider...")
+        self._cancel_speculation()
 
         # 输出统计信息
         success_rate = self._successful_requests / self._total_requests * 100 if self._total_requests > 0 else 0
@@ -427,6 +544,8 @@ class LLMDecider:
             "success_rate": round(success_rate, 1),
             "client_type": self.client_type,
             "fallback_mode": self.fallback_mode,
+            "speculation_hits": self._speculation_hits,
+            "speculation_misses": self._speculation_misses,
         }
 
     def get_info(self) -> Dict[str, Any]:
@@ -3,10 +3,11 @@ DeciderManager - 决策Decider管理器
 
 职责:
 - 管理多个DecisionDecider生命周期（支持多Decider并行）
-- 使用 _DECIDERS 字典直接创建Decider
+- 通过 get_decider() 按需导入并创建Decider
 - 支持从配置加载多个启用的Decider
 - 提供decide()方法进行决策（每个Decider独立决策）
 - 订阅 Input 阶段 的 input.message.ready 事件
+- 订阅 input.speech.recognized 事件，转发给实现了 prepare() 的 Decider（提前准备回复）
 - 发布 decision.intent.generated 事件到 Output 阶段
 - 异常处理和优雅降级
 - Speech冲突警告机制
@@ -29,13 +30,16 @@ from src.modules.events.event_bus import EventBus
 from src.modules.events.names import CoreEvents
 from src.modules.events.payloads import DisconnectedPayload
 from src.modules.events.payloads.decision import ConnectedPayload
-from src.modules.events.payloads.input import MessageReadyPayload
+from src.modules.events.payloads.input import MessageReadyPayload, SpeechRecognizedPayload
+from src.modules.lifecycle import run_phases
 from src.modules.llm.manager import LLMManager
 from src.modules.logging import get_logger
 from src.modules.prompts.manager import PromptManager
+from src.modules.tracing import TraceStage, get_load_monitor, get_tracer, use_trace
+from src.modules.types.base.message_record import MessageRecord
 from src.modules.types.base.normalized_message import NormalizedMessage
 from src.modules.types.capabilities import CapabilitiesProvider
-from src.stages.decision.registry import _DECIDERS
+from src.stages.decision.registry import get_decider, list_deciders
 
 
 # 产生语音输出的Decider列表（可能产生音频交叠）
@@ -48,10 +52,11 @@ class DeciderManager:
 
     职责:
     - 管理多个DecisionDecider生命周期（支持多Decider并行）
-    - 使用 _DECIDERS 字典直接创建Decider
+    - 通过 get_decider() 按需导入并创建Decider
     - 支持从配置加载多个启用的Decider
     - 提供decide()方法进行决策（每个Decider独立决策）
     - 订阅 input.message.ready 事件（来自 Input 阶段）
+    - 订阅 input.speech.recognized 事件，转发给实现了可选方法 prepare() 的 Decider
     - 发布 decision.intent.generated 事件（到 Output 阶段）
     - 异常处理和优雅降级
     - Speech冲突警告机制
@@ -63,6 +68,11 @@ class DeciderManager:
     - 不订阅其他 Decision 阶段 事件
     """
 
+    # 单个 Decider setup() 的超时秒数（连接外部服务卡住时不拖住整个启动）
+    DECIDER_SETUP_TIMEOUT = 30.0
+    # 单个 Decider cleanup() 的超时秒数
+    DECIDER_CLEANUP_TIMEOUT = 10.0
+
     def __init__(
         self,
         event_bus: EventBus,
@@ -209,12 +219,12 @@ class DeciderManager:
         Raises:
             ValueError: 如果Decider未注册
         """
-        if decider_name not in _DECIDERS:
-            available = list(_DECIDERS.keys())
+        try:
+            decider_cls = get_decider(decider_name)
+        except KeyError:
+            available = list_deciders()
             self.logger.error(f"Decider '{decider_name}' 未找到。可用: {available}")
-            raise ValueError(f"Decider '{decider_name}' 未找到。可用: {available}")
-
-        decider_cls = _DECIDERS[decider_name]
+            raise ValueError(f"Decider '{decider_name}' 未找到。可用: {available}") from None
 
         # 获取Decider特定配置
         decider_config = decision_config.get(decider_name, {})
@@ -253,14 +263,19 @@ class DeciderManager:
             self.logger.warning("没有已创建的 Decider，跳过启动")
             return
 
-        # 启动所有Decider
-        for name, decider in self._deciders.items():
-            try:
-                await decider.setup()
+        # 并发启动所有Decider，一个失败不影响其他Decider
+        deciders = list(self._deciders.items())
+        errors = await run_phases(
+            [(f"decision.{name}.setup", decider.setup) for name, decider in deciders],
+            timeout=self.DECIDER_SETUP_TIMEOUT,
+        )
+        for (name, _), error in zip(deciders, errors, strict=True):
+            if error is None:
                 self.logger.info(f"Decider '{name}' 已启动")
-            except Exception as e:
-                self.logger.error(f"Decider '{name}' 启动失败: {e}", exc_info=True)
-                # 继续启动其他Decider，不因为一个失败而全部停止
+            elif isinstance(error, TimeoutError):
+                self.logger.error(f"Decider '{name}' 启动超时（{self.DECIDER_SETUP_TIMEOUT}s）")
+            else:
+                self.logger.opt(exception=error).error(f"Decider '{name}' 启动失败: {error}")
 
         # 发布连接事件（向后兼容，只发布第一个Decider的事件）
         if self._current_decider and self._decider_name:
@@ -277,13 +292,14 @@ class DeciderManager:
         """停止所有Decider（不删除实例）"""
         self._unsubscribe_data_message_event()
 
-        # 停止所有Decider
-        for name, decider in self._deciders.items():
-            try:
-                await decider.cleanup()
+        # 并发停止所有Decider
+        deciders = list(self._deciders.items())
+        errors = await self._cleanup_deciders(deciders)
+        for (name, _), error in zip(deciders, errors, strict=True):
+            if error is None:
                 self.logger.info(f"Decider '{name}' 已停止")
-            except Exception as e:
-                self.logger.error(f"停止 Decider '{name}' 失败: {e}", exc_info=True)
+            else:
+                self.logger.opt(exception=error).error(f"停止 Decider '{name}' 失败: {error!r}")
 
         # 发布断开事件（向后兼容，只发布第一个Decider的事件）
         if self._decider_name:
@@ -293,6 +309,13 @@ class DeciderManager:
             self._decider_ready[name] = False
         self.logger.info("所有 Decider 已停止")
 
+    async def _cleanup_deciders(self, deciders: List[tuple]) -> List[Optional[Exception]]:
+        """并发调用 Decider 的 cleanup()（单个 Decider 超时不会拖住其他 Decider），返回对应的异常"""
+        return await run_phases(
+            [(f"decision.{name}.cleanup", decider.cleanup) for name, decider in deciders],
+            timeout=self.DECIDER_CLEANUP_TIMEOUT,
+        )
+
     async def _emit_decider_connected_event(self) -> None:
         """发布 Decider 连接事件"""
         if not self._current_decider or not self._decider_name:
@@ -440,13 +463,13 @@ class DeciderManager:
         self._unsubscribe_data_message_event()
 
         async with self._switch_lock:
-            # 清理所有Decider
-            for name, decider in self._deciders.items():
-                self.logger.info(f"清理Decider: {name}")
-                try:
-                    await decider.cleanup()
-                except Exception as e:
-                    self.logger.error(f"清理Decider '{name}' 失败: {e}", exc_info=True)
+            # 并发清理所有Decider
+            deciders = list(self._deciders.items())
+            self.logger.info(f"清理Decider: {[name for name, _ in deciders]}")
+            errors = await self._cleanup_deciders(deciders)
+            for (name, _), error in zip(deciders, errors, strict=True):
+                if error is not None:
+                    self.logger.opt(exception=error).error(f"清理Decider '{name}' 失败: {error!r}")
 
                 await self._emit_decider_disconnected_event(name, reason="cleanup", will_retry=False)
 
@@ -475,8 +498,8 @@ class DeciderManager:
         return self._decider_names.copy()
 
     def get_available_deciders(self) -> list[str]:
-        """获取所有可用的Decider名称"""
-        return list(_DECIDERS.keys())
+        """获取所有可用的Decider名称（不导入实现）"""
+        return list_deciders()
 
     def get_decider_status(self) -> list[dict[str, Any]]:
         """
@@ -525,6 +548,11 @@ class DeciderManager:
                 self._on_data_message,
                 model_class=MessageReadyPayload,
             )
+            self.event_bus.on(
+                CoreEvents.INPUT_SPEECH_RECOGNIZED,
+                self._on_speech_recognized,
+                model_class=SpeechRecognizedPayload,
+            )
             self._event_subscribed = True
             self.logger.info(f"DeciderManager 已订阅 '{CoreEvents.INPUT_MESSAGE_RECEIVED}' 事件（类型化）")
         else:
@@ -534,17 +562,45 @@ class DeciderManager:
         """取消订阅 input.message.ready 事件"""
         if self._event_subscribed:
             self.event_bus.off(CoreEvents.INPUT_MESSAGE_RECEIVED, self._on_data_message)
+            self.event_bus.off(CoreEvents.INPUT_SPEECH_RECOGNIZED, self._on_speech_recognized)
             self._event_subscribed = False
             self.logger.debug("DeciderManager 已取消事件订阅")
 
+    async def _on_speech_recognized(self, event_name: str, payload: SpeechRecognizedPayload, source: str) -> None:
+        """处理 input.speech.recognized 事件：转发给实现了 prepare() 的 Decider
+
+        prepare() 是 Decider 的可选方法，用说话过程中的识别结果提前准备回复
+        （如 LLMDecider 的推测请求）。最终文本仍通过 input.message.received 触发 decide()。
+        """
+        tasks = []
+        for name, decider in self._deciders.items():
+            prepare = getattr(decider, "prepare", None)
+            if callable(prepare):
+                tasks.append(self._safe_prepare(prepare, name, payload))
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    async def _safe_prepare(self, prepare: Any, name: str, payload: SpeechRecognizedPayload) -> None:
+        try:
+            await prepare(payload)
+        except Exception as e:
+            self.logger.opt(exception=e).error(f"Decider '{name}' 处理语音识别结果失败: {e}")
+
     async def _on_data_message(self, event_name: str, payload: "MessageReadyPayload", source: str) -> None:
         """处理 input.message.ready 事件（类型化）"""
+        tracer = get_tracer()
+        tracer.end_span(payload.trace_id, TraceStage.DECIDER_QUEUE)
+
         message_data = payload.message
         if not message_data:
             self.logger.warning("收到空的 NormalizedMessage 事件")
             return
 
-        if isinstance(message_data, dict):
+        if isinstance(message_data, MessageRecord):
+            # Input 阶段发布的消息已在 Collector 处验证过
+            normalized = message_data.to_normalized()
+        elif isinstance(message_data, dict):
+            # 外部来源（事件日志重放等）的字典：在这里验证
             normalized_dict = message_data
 
             try:
@@ -555,12 +611,19 @@ class DeciderManager:
                     self.logger.debug(f"  - {error['loc']}: {error['msg']}")
                 return
         else:
-            self.logger.warning(f"不支持的消息数据类型: {type(message_data)}，期望 Dict[str, Any]")
+            self.logger.warning(f"不支持的消息数据类型: {type(message_data)}，期望 MessageRecord 或 Dict[str, Any]")
             return
 
+        # 负载监视：Input 阶段的 load_shed 管道据此判断下游是否过载
+        load_monitor = get_load_monitor()
+        ticket = load_monitor.begin(normalized.timestamp_ms)
         try:
             self.logger.debug(f'触发决策: "{normalized.text[:50]}..." (来源: {normalized.source})')
 
-            await self.decide(normalized)
+            # 在 decide() 调用链内设置 trace_id：Decider 发布的 IntentPayload 和 LLM 请求会自动关联到该消息
+            with use_trace(payload.trace_id), tracer.span(payload.trace_id, TraceStage.DECISION):
+                await self.decide(normalized)
         except Exception as e:
             self.logger.error(f"触发决策时出错: {e}", exc_info=True)
+        finally:
+            load_monitor.end(ticket)
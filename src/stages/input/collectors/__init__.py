@@ -14,16 +14,30 @@ Input Collectors - 输入 Collector 实现
 作为 RemoteStreamHandler，因为它是一个输出Handler。
 
 收集器通过 @collector 装饰器自动注册到 registry.py 中的 _COLLECTORS 字典。
-导入此包会触发所有收集器的注册。
+导入此包不会导入任何收集器：InputCollectorManager 通过 get_collector() 按
+component_manifest 清单只导入启用的收集器；下列类名在首次访问时才导入对应子模块。
 """
 
-from .bili_danmaku import BiliDanmakuCollector
-from .bili_danmaku_official import BiliDanmakuOfficialCollector
-from .console_input import ConsoleInputCollector
-from .mainosaba import MainosabaCollector
-from .mock_danmaku import MockDanmakuCollector
-from .read_pingmu import ReadPingmuCollector
-from .stt import STTCollector
+import importlib
+from typing import Any
+
+_EXPORTS = {
+    "BiliDanmakuCollector": ".bili_danmaku",
+    "BiliDanmakuOfficialCollector": ".bili_danmaku_official",
+    "ConsoleInputCollector": ".console_input",
+    "MainosabaCollector": ".mainosaba",
+    "MockDanmakuCollector": ".mock_danmaku",
+    "ReadPingmuCollector": ".read_pingmu",
+    "STTCollector": ".stt",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
+
 
 __all__ = [
     "ConsoleInputCollector",
@@ -2,13 +2,15 @@
 BiliDanmakuCollector - Bilibili 弹幕 Collector
 
 从 Bilibili 直播间采集弹幕数据。
+
+轮询间隔随弹幕速度自适应（见 polling.py），弹幕按 (uid, 文本, 时间戳) 去重。
 """
 
 from __future__ import annotations
 
 import asyncio
 import time
-from typing import Any, AsyncIterator, Dict, Literal, Optional
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional
 
 try:
     import aiohttp
@@ -23,6 +25,11 @@ from src.modules.events.event_bus import EventBus
 from src.modules.logging import get_logger
 from src.modules.types.base.normalized_message import NormalizedMessage
 
+from .polling import AdaptivePollScheduler, DanmakuDedup
+
+# gethistory 接口每次返回的最大弹幕数；整页都是新弹幕说明两次轮询之间的弹幕可能超过一页
+_HISTORY_PAGE_SIZE = 10
+
 
 @collector("bili_danmaku")
 class BiliDanmakuCollector:
@@ -30,6 +37,9 @@ class BiliDanmakuCollector:
     Bilibili 直播弹幕 Collector
 
     通过轮询 Bilibili API 获取直播间的弹幕信息。
+
+    poll_interval 是平均请求间隔（请求预算）：启用 adaptive_polling 时，弹幕多时最快每
+    min_poll_interval 秒轮询一次，安静时逐渐放慢到 max_poll_interval，长期请求数不超过固定间隔轮询。
     """
 
     class ConfigSchema(BaseConfig):
@@ -37,7 +47,12 @@ class BiliDanmakuCollector:
 
         type: Literal["bili_danmaku"] = "bili_danmaku"
         room_id: int = Field(..., description="直播间ID", gt=0)
-        poll_interval: int = Field(default=3, description="轮询间隔（秒）", ge=1)
+        poll_interval: int = Field(default=3, description="平均轮询间隔（秒），自适应轮询的请求预算", ge=1)
+        adaptive_polling: bool = Field(default=True, description="是否根据弹幕速度自适应调整轮询间隔")
+        min_poll_interval: float = Field(default=1.0, description="自适应轮询的最小间隔（秒）", gt=0)
+        max_poll_interval: float = Field(default=10.0, description="自适应轮询的最大间隔（秒）", gt=0)
+        dedup_size: int = Field(default=512, description="去重记录的最近弹幕数", ge=1)
+        api_base_url: str = Field(default="https://api.live.bilibili.com", description="Bilibili 直播 API 地址")
         message_config: dict = Field(default_factory=dict, description="消息配置")
 
     def __init__(self, config: Dict[str, Any], event_bus: EventBus):
@@ -62,10 +77,23 @@ class BiliDanmakuCollector:
         self.room_id = self.typed_config.room_id
         self.poll_interval = self.typed_config.poll_interval
         self.message_config = self.typed_config.message_config
-        self.api_url = f"https://api.live.bilibili.com/xlive/web-room/v1/dM/gethistory?roomid={self.room_id}"
+        base_url = self.typed_config.api_base_url.rstrip("/")
+        self.api_url = f"{base_url}/xlive/web-room/v1/dM/gethistory?roomid={self.room_id}"
+
+        if self.typed_config.adaptive_polling:
+            min_interval = self.typed_config.min_poll_interval
+            max_interval = max(self.typed_config.max_poll_interval, min_interval)
+        else:
+            min_interval = max_interval = float(self.poll_interval)
+        self._poller = AdaptivePollScheduler(
+            base_interval=self.poll_interval,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        )
+        self._dedup = DanmakuDedup(self.typed_config.dedup_size)
 
         # 状态变量
-        self._latest_timestamp: float = time.time()
+        self._start_timestamp: float = time.time()
         self._session: Optional[aiohttp.ClientSession] = None
         self.is_started: bool = False
 
@@ -130,7 +158,7 @@ class BiliDanmakuCollector:
 
                     # 等待下次轮询
                     try:
-                        await asyncio.wait_for(asyncio.sleep(self.poll_interval), timeout=None)
+                        await asyncio.sleep(self._poller.next_delay())
                     except asyncio.CancelledError:
                         break
 
@@ -148,61 +176,73 @@ class BiliDanmakuCollector:
 
         从 Bilibili API 获取弹幕，过滤新弹幕并转换为 NormalizedMessage。
         """
+        for item in await self._poll():
+            normalized_msg = await self._create_danmaku_message(item)
+            if normalized_msg:
+                yield normalized_msg
+
+    async def _poll(self) -> List[Dict[str, Any]]:
+        """请求一次弹幕历史，返回按时间排序的新弹幕，并把结果反馈给轮询调度"""
         if not self._session or self._session.closed:
             self.logger.warning("aiohttp session 未初始化或已关闭，跳过本次轮询。")
-            return
-
-        new_max_timestamp = self._latest_timestamp
+            return []
 
         try:
             self.logger.debug(f"轮询 Bilibili API: {self.api_url}")
             async with self._session.get(self.api_url, timeout=10) as response:
                 if response.status != 200:
                     self.logger.warning(f"Bilibili API 请求失败，状态码: {response.status}")
-                    await asyncio.sleep(self.poll_interval * 2)
-                    return
+                    self._poller.record_error()
+                    return []
 
                 data = await response.json()
                 self.logger.debug(f"收到 API 响应: code={data.get('code')}")
-
-                if data.get("code") == 0:
-                    room_data = data.get("data", {}).get("room", [])
-                    if not room_data:
-                        self.logger.debug("API 返回的弹幕列表为空")
-                        return
-
-                    new_danmakus = []
-                    for item in room_data:
-                        timestamp = item.get("check_info", {}).get("ts")
-                        item.get("uid")
-
-                        if timestamp and timestamp > self._latest_timestamp:
-                            new_danmakus.append(item)
-                            new_max_timestamp = max(new_max_timestamp, timestamp)
-
-                    if new_danmakus:
-                        new_danmakus.sort(key=lambda x: x.get("check_info", {}).get("ts", 0))
-                        self.logger.debug(f"收到 {len(new_danmakus)} 条新弹幕")
-
-                        for item in new_danmakus:
-                            normalized_msg = await self._create_danmaku_message(item)
-                            if normalized_msg:
-                                yield normalized_msg
-                    else:
-                        self.logger.debug("没有新的弹幕")
-
-                    self._latest_timestamp = new_max_timestamp
-                else:
-                    self.logger.warning(
-                        f"Bilibili API 返回错误: code={data.get('code')}, message={data.get('message')}"
-                    )
-
         except aiohttp.ClientError as e:
             self.logger.warning(f"轮询 Bilibili API 时发生网络错误: {e}")
+            self._poller.record_error()
+            return []
         except asyncio.TimeoutError:
             self.logger.warning("轮询 Bilibili API 超时")
+            self._poller.record_error()
+            return []
         except Exception as e:
             self.logger.exception(f"处理 Bilibili 弹幕时发生未知错误: {e}")
+            self._poller.record_error()
+            return []
+
+        if data.get("code") != 0:
+            self.logger.warning(f"Bilibili API 返回错误: code={data.get('code')}, message={data.get('message')}")
+            self._poller.record_error()
+            return []
+
+        room_data = (data.get("data") or {}).get("room") or []
+        new_danmakus = self._select_new(room_data)
+        self._poller.record(
+            len(new_danmakus), page_full=len(room_data) >= _HISTORY_PAGE_SIZE and len(new_danmakus) == len(room_data)
+        )
+
+        if new_danmakus:
+            self.logger.debug(f"收到 {len(new_danmakus)} 条新弹幕，下次轮询间隔 {self._poller.interval:.1f}s")
+        else:
+            self.logger.debug("没有新的弹幕")
+        return new_danmakus
+
+    def _select_new(self, room_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        挑出未见过的弹幕（按时间排序）
+
+        按 (uid, 文本, 时间戳) 去重：同一秒内的不同弹幕都会保留；启动前发送的历史弹幕被忽略。
+        """
+        new_danmakus = []
+        for item in room_data:
+            timestamp = item.get("check_info", {}).get("ts")
+            if not timestamp or timestamp < int(self._start_timestamp):
+                continue
+            if self._dedup.add((item.get("uid"), item.get("text"), timestamp)):
+                new_danmakus.append(item)
+
+        new_danmakus.sort(key=lambda x: x.get("check_info", {}).get("ts", 0))
+        return new_danmakus
 
     async def _create_danmaku_message(self, item: Dict[str, Any]) -> Optional[NormalizedMessage]:
         """
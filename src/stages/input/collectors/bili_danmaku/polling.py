@@ -0,0 +1,153 @@
+"""
+弹幕轮询的自适应调度与去重
+
+gethistory 接口每次只返回直播间最近的若干条弹幕（约 10 条），固定间隔轮询有两个问题：
+安静的直播间大部分请求都是空的，热闹的直播间每条弹幕平均要多等半个间隔、弹幕过多时还会漏掉。
+
+AdaptivePollScheduler 在不增加总请求数的前提下，把请求集中到弹幕多的时候：
+- 期望每次轮询拿到约 target_per_poll 条新弹幕：间隔 = target_per_poll / 弹幕速度，限制在 [min, max] 内
+- 没有新弹幕时间隔按 backoff 倍数增大；整页都是新弹幕（可能漏掉了）时立即降到最小间隔
+- 请求预算：令牌桶按 base_interval 的速率补充令牌，长期平均请求数不超过固定间隔轮询；
+  安静时省下的请求（最多 burst 个）留给弹幕突增时使用，桶满后按 base_interval 轮询
+
+DanmakuDedup 按 (uid, 文本, 时间戳) 记录最近见过的弹幕，取代"时间戳大于上次最大值"的判断：
+后者会丢掉与上一批最后一条同一秒发送的不同弹幕。
+"""
+
+import time
+from collections import deque
+from typing import Callable, Deque, Hashable, Set
+
+
+class AdaptivePollScheduler:
+    """根据弹幕速度调整轮询间隔，并限制长期请求速率"""
+
+    def __init__(
+        self,
+        base_interval: float,
+        min_interval: float,
+        max_interval: float,
+        target_per_poll: float = 1.0,
+        backoff: float = 1.5,
+        burst: float = 20.0,
+        alpha: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            base_interval: 请求预算对应的平均间隔（秒），即原来的固定轮询间隔
+            min_interval: 最小间隔（秒）
+            max_interval: 最大间隔（秒）
+            target_per_poll: 期望每次轮询拿到的新弹幕数
+            backoff: 没有新弹幕时间隔的增长倍数
+            burst: 令牌桶容量（最多可连续使用的"省下来"的请求数）
+            alpha: 弹幕速度指数滑动平均的平滑系数
+            clock: 时钟（测试时可替换）
+        """
+        if not 0 < min_interval <= max_interval:
+            raise ValueError(f"需要 0 < min_interval <= max_interval，收到: {min_interval}, {max_interval}")
+        if base_interval <= 0:
+            raise ValueError(f"base_interval 必须 > 0，收到: {base_interval}")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target_per_poll = target_per_poll
+        self.backoff = backoff
+        self.burst = max(burst, 1.0)
+        self.alpha = alpha
+        self._clock = clock
+        self._rate = 1.0 / base_interval
+
+        self.interval = min(max(base_interval, min_interval), max_interval)
+        self.velocity = 0.0
+        self.request_count = 0
+        self._tokens = 1.0
+        self._tokens_at = clock()
+        self._last_poll_at: float | None = None
+
+    def record(self, new_count: int, page_full: bool = False) -> None:
+        """
+        记录一次轮询的结果，更新弹幕速度和下次间隔
+
+        Args:
+            new_count: 本次轮询拿到的新弹幕数
+            page_full: 返回的整页都是新弹幕（两次轮询之间的弹幕可能超过一页）
+        """
+        now = self._clock()
+        self.request_count += 1
+        if self._last_poll_at is not None:
+            elapsed = max(now - self._last_poll_at, 1e-3)
+            sample = new_count / elapsed
+            self.velocity += self.alpha * (sample - self.velocity)
+        self._last_poll_at = now
+
+        if page_full:
+            self.interval = self.min_interval
+        elif new_count == 0:
+            self.interval = min(self.interval * self.backoff, self.max_interval)
+        elif self.velocity > 0:
+            self.interval = self._clamp(self.target_per_poll / self.velocity)
+
+    def record_error(self) -> None:
+        """请求失败（非 200、网络错误）：间隔加倍，避免在接口异常时频繁重试"""
+        self.request_count += 1
+        self._last_poll_at = self._clock()
+        self.interval = min(self.interval * 2, self.max_interval)
+
+    def next_delay(self) -> float:
+        """
+        距离下次轮询应等待的秒数（调用即视为预定了下次请求，会消耗一个令牌）
+
+        期望间隔内补充的令牌不足一个时，延长等待直到令牌足够；令牌桶会在期望间隔内装满时提前轮询，
+        因此安静的直播间也按 base_interval 轮询，延迟不会比固定间隔轮询更差。
+        """
+        now = self._clock()
+        tokens = self._refill(now)
+        delay = self.interval
+        tokens_then = tokens + delay * self._rate
+        if tokens_then < 1.0:
+            delay += (1.0 - tokens_then) / self._rate
+            tokens_then = 1.0
+        elif tokens_then > self.burst:
+            # 令牌桶会在等待期间装满：再等下去省下的请求也存不住，不如在装满时就轮询
+            delay = max((self.burst - tokens) / self._rate, self.min_interval)
+            tokens_then = min(tokens + delay * self._rate, self.burst)
+        self._tokens = tokens_then - 1.0
+        self._tokens_at = now + delay
+        return delay
+
+    def _refill(self, now: float) -> float:
+        elapsed = max(now - self._tokens_at, 0.0)
+        return min(self._tokens + elapsed * self._rate, self.burst)
+
+    def _clamp(self, interval: float) -> float:
+        return min(max(interval, self.min_interval), self.max_interval)
+
+
+class DanmakuDedup:
+    """最近见过的弹幕键（有界，超出容量时淘汰最早的键）"""
+
+    def __init__(self, capacity: int = 512):
+        if capacity < 1:
+            raise ValueError(f"capacity 必须 >= 1，收到: {capacity}")
+        self.capacity = capacity
+        self._order: Deque[Hashable] = deque()
+        self._keys: Set[Hashable] = set()
+
+    def add(self, key: Hashable) -> bool:
+        """记录键，返回是否为第一次见到"""
+        if key in self._keys:
+            return False
+        if len(self._order) >= self.capacity:
+            self._keys.discard(self._order.popleft())
+        self._order.append(key)
+        self._keys.add(key)
+        return True
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._keys
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+
+__all__ = ["AdaptivePollScheduler", "DanmakuDedup"]
@@ -7,7 +7,7 @@ BiliDanmakuOfficialCollector - Bilibili 官方弹幕 Collector
 from __future__ import annotations
 
 import asyncio
-from typing import Any, AsyncIterator, Dict, Literal, Optional
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional
 
 from pydantic import Field
 
@@ -39,6 +39,9 @@ class BiliDanmakuOfficialCollector:
     使用官方WebSocket API获取实时弹幕。
     """
 
+    # collect_batches() 单批最多取出的消息数
+    MAX_BATCH_SIZE = 50
+
     class ConfigSchema(BaseConfig):
         """Bilibili官方弹幕输入Collector配置"""
 
@@ -48,7 +51,7 @@ class BiliDanmakuOfficialCollector:
         access_key: str = Field(..., description="访问密钥")
         access_key_secret: str = Field(..., description="访问密钥Secret")
         api_host: str = Field(default="https://live-open.biliapi.com", description="API主机地址")
-        message_cache_size: int = Field(default=1000, description="消息缓存大小", ge=1)
+        message_cache_size: int = Field(default=1000, description="消息缓存大小（队列满时丢弃最旧的消息）", ge=1)
         context_tags: Optional[list] = Field(default=None, description="Prompt上下文标签")
         enable_template_info: bool = Field(default=False, description="启用模板信息")
         template_items: dict = Field(default_factory=dict, description="模板项")
@@ -71,6 +74,8 @@ class BiliDanmakuOfficialCollector:
         self.access_key = self.typed_config.access_key
         self.access_key_secret = self.typed_config.access_key_secret
         self.api_host = self.typed_config.api_host
+        self.message_cache_size = self.typed_config.message_cache_size
+        self.dropped_message_count = 0
 
         self.message_type_config = BiliMessageTypeConfig(config)
 
@@ -134,9 +139,21 @@ class BiliDanmakuOfficialCollector:
 
     async def collect(self) -> AsyncIterator[NormalizedMessage]:
         """采集弹幕数据"""
+        async for batch in self.collect_batches():
+            for message in batch:
+                yield message
+
+    async def collect_batches(self) -> AsyncIterator[List[NormalizedMessage]]:
+        """
+        批量采集弹幕数据
+
+        WebSocket 一次推送的多条消息（以及处理上一批期间到达的消息）会被合并为一批，
+        由 InputCollectorManager 整批通过 InputPipeline。
+        """
         self.is_started = True
 
-        message_queue = asyncio.Queue()
+        # 有界队列：下游处理不过来时丢弃最旧的消息，WebSocket 读取协程永远不会因此阻塞
+        message_queue: asyncio.Queue = asyncio.Queue(maxsize=self.message_cache_size)
 
         self.websocket_client = BiliWebSocketClient(
             id_code=self.id_code,
@@ -154,10 +171,17 @@ class BiliDanmakuOfficialCollector:
             while self.is_started:
                 try:
                     normalized_msg = await asyncio.wait_for(message_queue.get(), timeout=1.0)
+                    batch = []
+                    while normalized_msg is not None:
+                        batch.append(normalized_msg)
+                        if len(batch) >= self.MAX_BATCH_SIZE or message_queue.empty():
+                            break
+                        normalized_msg = message_queue.get_nowait()
+                    if batch:
+                        yield batch
                     if normalized_msg is None:
                         self.logger.info("收到结束信号，停止数据采集")
                         break
-                    yield normalized_msg
                 except asyncio.TimeoutError:
                     continue
                 except Exception as e:
@@ -184,7 +208,7 @@ class BiliDanmakuOfficialCollector:
         except Exception as e:
             self.logger.error(f"WebSocket运行出错: {e}", exc_info=True)
         finally:
-            await message_queue.put(None)
+            self._put_dropping_oldest(message_queue, None)
 
     async def _handle_message_from_bili(self, message_data: Dict[str, Any], message_queue: asyncio.Queue) -> None:
         """处理从 Bilibili 接收到的消息"""
@@ -202,12 +226,24 @@ class BiliDanmakuOfficialCollector:
             normalized_msg = self._create_normalized_message(bili_message)
 
             self.logger.debug(f"消息已处理: {normalized_msg.text[:50]}...")
-            await message_queue.put(normalized_msg)
+            self._put_dropping_oldest(message_queue, normalized_msg)
 
         except Exception as e:
             self.logger.error(f"处理消息时出错: {e}", exc_info=True)
             self.logger.debug(f"失败消息数据: cmd={message_data.get('cmd')}")
 
+    def _put_dropping_oldest(self, message_queue: asyncio.Queue, item: Optional[NormalizedMessage]) -> None:
+        """放入队列，队列满时先丢弃最旧的消息"""
+        while message_queue.full():
+            message_queue.get_nowait()
+            self.dropped_message_count += 1
+            if self.dropped_message_count % 100 == 1:
+                self.logger.warning(
+                    f"消息队列已满（{self.message_cache_size}），丢弃最旧的消息，"
+                    f"累计丢弃 {self.dropped_message_count} 条"
+                )
+        message_queue.put_nowait(item)
+
     def _create_message_from_dict(self, data: Dict[str, Any]) -> Optional[BiliBaseMessage]:
         """从字典创建对应的消息对象"""
         cmd = data.get("cmd", "")
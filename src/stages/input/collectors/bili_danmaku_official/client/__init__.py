@@ -1,6 +1,7 @@
 # src/stages/input/collectors/bili_danmaku_official/client/__init__.py
 
+from .frame_decoder import FrameDecodeError, FrameDecoder, Packet
 from .proto import Proto
 from .websocket_client import BiliWebSocketClient
 
-__all__ = ["BiliWebSocketClient", "Proto"]
+__all__ = ["BiliWebSocketClient", "FrameDecodeError", "FrameDecoder", "Packet", "Proto"]
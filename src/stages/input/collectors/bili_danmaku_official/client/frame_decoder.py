@@ -0,0 +1,212 @@
+# src/stages/input/collectors/bili_danmaku_official/client/frame_decoder.py
+
+"""
+Bilibili 直播 WebSocket 帧解码
+
+一个 WebSocket 帧里可以有多个首尾相连的包，每个包以 16 字节包头（大端）开始：
+packet_len(4) header_len(2) ver(2) op(4) seq(4)
+
+ver 表示包体格式：
+- 0: 原始 JSON
+- 1: 心跳回复（包体是 4 字节人气值）
+- 2: zlib 压缩，解压后仍是若干首尾相连的包
+- 3: brotli 压缩，同上（需要安装 brotli>=1.1）
+
+直播间热闹时服务器会把几十条通知压缩进一个帧，单个包也可能远超 2KB（醒目留言、礼物连击等），
+因此解码按包头逐个切分并展开压缩包，而不是把整个帧当作一个未压缩的包。
+"""
+
+import json
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+from src.modules.logging import get_logger
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# brotli>=1.1 的 Decompressor.process() 支持 output_buffer_limit，才能边解压边限制长度
+_BROTLI_BOUNDED = brotli is not None and hasattr(brotli.Decompressor, "can_accept_more_data")
+
+HEADER = struct.Struct(">IHHII")
+HEADER_LEN = HEADER.size
+
+# 单个包（及压缩包解压后）的长度上限，只用于拦截损坏的包头和解压炸弹
+MAX_PACKET_LEN = 16 * 1024 * 1024
+
+PROTO_VER_RAW = 0
+PROTO_VER_INT = 1
+PROTO_VER_ZLIB = 2
+PROTO_VER_BROTLI = 3
+
+OP_HEARTBEAT = 2
+OP_HEARTBEAT_REPLY = 3
+OP_NOTIFICATION = 5
+OP_AUTH = 7
+OP_AUTH_REPLY = 8
+
+
+class FrameDecodeError(Exception):
+    """帧数据无法解码（包头损坏、解压失败等）"""
+
+
+@dataclass(frozen=True)
+class Packet:
+    """一个已展开的包"""
+
+    ver: int
+    op: int
+    seq: int
+    body: bytes
+
+
+class FrameDecoder:
+    """
+    流式帧解码器
+
+    feed() 接收任意切分的字节流，返回其中所有完整的包（压缩包已展开），不完整的尾部留到下次 feed()。
+    解码器有内部缓冲，同一连接的数据必须按顺序交给同一个实例，且不能并发调用。
+    """
+
+    def __init__(self, max_packet_len: int = MAX_PACKET_LEN):
+        self.max_packet_len = max_packet_len
+        self.logger = get_logger("BiliFrameDecoder")
+        self._buffer = bytearray()
+        self.packet_count = 0
+        self.invalid_json_count = 0
+
+    @property
+    def pending_bytes(self) -> int:
+        """缓冲中尚未凑成完整包的字节数"""
+        return len(self._buffer)
+
+    def reset(self) -> None:
+        """丢弃缓冲中不完整的数据"""
+        self._buffer.clear()
+
+    def feed(self, data: bytes) -> List[Packet]:
+        """
+        追加数据并取出所有完整的包
+
+        Raises:
+            FrameDecodeError: 数据无法解码；此时缓冲已清空，下一帧重新开始解码
+        """
+        self._buffer += data
+        packets: List[Packet] = []
+        try:
+            consumed = self._split(self._buffer, packets, allow_compressed=True)
+        except FrameDecodeError:
+            self._buffer.clear()
+            raise
+        del self._buffer[:consumed]
+        self.packet_count += len(packets)
+        return packets
+
+    def decode(self, data: bytes) -> Tuple[List[Dict[str, Any]], List[Packet]]:
+        """
+        解码一个完整的 WebSocket 帧并解析通知包的 JSON，整个过程不涉及事件循环，可以放到工作线程执行
+
+        WebSocket 消息边界就是帧边界，帧末尾残留不完整的包说明帧已损坏，丢弃而不是拼到下一帧。
+
+        Returns:
+            (通知消息列表, 其余的包)；JSON 无效的通知包记录警告后跳过
+
+        Raises:
+            FrameDecodeError: 帧无法解码或末尾有不完整的包
+        """
+        packets = self.feed(data)
+        if self._buffer:
+            pending = len(self._buffer)
+            self._buffer.clear()
+            raise FrameDecodeError(f"帧末尾有 {pending} 字节不完整的包")
+
+        messages: List[Dict[str, Any]] = []
+        others: List[Packet] = []
+        for packet in packets:
+            if packet.op != OP_NOTIFICATION:
+                others.append(packet)
+                continue
+            try:
+                messages.append(json.loads(packet.body))
+            except ValueError as e:
+                self.invalid_json_count += 1
+                self.logger.warning(f"解析消息JSON失败: {e}, 原始数据: {packet.body[:200]!r}")
+        return messages, others
+
+    def _split(self, buf: bytes, out: List[Packet], allow_compressed: bool) -> int:
+        """把 buf 中完整的包追加到 out，返回消耗的字节数"""
+        offset = 0
+        total = len(buf)
+        while total - offset >= HEADER_LEN:
+            packet_len, header_len, ver, op, seq = HEADER.unpack_from(buf, offset)
+            if header_len < HEADER_LEN or packet_len < header_len or packet_len > self.max_packet_len:
+                raise FrameDecodeError(f"包头异常: packet_len={packet_len}, header_len={header_len}")
+            if total - offset < packet_len:
+                break
+
+            body = bytes(buf[offset + header_len : offset + packet_len])
+            offset += packet_len
+
+            if ver == PROTO_VER_ZLIB or ver == PROTO_VER_BROTLI:
+                if not allow_compressed:
+                    raise FrameDecodeError(f"压缩包内不应再有压缩包: ver={ver}")
+                payload = self._decompress(ver, body)
+                if self._split(payload, out, allow_compressed=False) != len(payload):
+                    raise FrameDecodeError("压缩包解压后的数据不是完整的包")
+            else:
+                out.append(Packet(ver=ver, op=op, seq=seq, body=body))
+        return offset
+
+    def _decompress(self, ver: int, body: bytes) -> bytes:
+        if ver == PROTO_VER_ZLIB:
+            decompressor = zlib.decompressobj()
+            try:
+                payload = decompressor.decompress(body, self.max_packet_len)
+            except zlib.error as e:
+                raise FrameDecodeError(f"zlib 解压失败: {e}") from e
+            if decompressor.unconsumed_tail:
+                raise FrameDecodeError(f"解压后超过长度上限 {self.max_packet_len}")
+            return payload
+
+        if brotli is None:
+            raise FrameDecodeError("收到 brotli 压缩包，但未安装 brotli（uv add brotli）")
+        if not _BROTLI_BOUNDED:
+            raise FrameDecodeError("brotli 版本过旧，无法限制解压长度（需要 brotli>=1.1）")
+        # 输出缓冲达到上限后停止增长，不会先把整个解压炸弹展开到内存里再检查长度
+        decompressor = brotli.Decompressor()
+        try:
+            payload = decompressor.process(body, output_buffer_limit=self.max_packet_len + 1)
+        except brotli.error as e:
+            raise FrameDecodeError(f"brotli 解压失败: {e}") from e
+        if len(payload) > self.max_packet_len:
+            raise FrameDecodeError(f"解压后超过长度上限 {self.max_packet_len}")
+        if not decompressor.is_finished():
+            raise FrameDecodeError("brotli 解压失败: 数据不完整")
+        return payload
+
+
+def encode_packet(body: bytes, op: int = OP_NOTIFICATION, ver: int = PROTO_VER_RAW, seq: int = 0) -> bytes:
+    """按协议格式打包（用于发送和构造测试数据）"""
+    return HEADER.pack(HEADER_LEN + len(body), HEADER_LEN, ver, op, seq) + body
+
+
+__all__ = [
+    "FrameDecodeError",
+    "FrameDecoder",
+    "MAX_PACKET_LEN",
+    "OP_AUTH",
+    "OP_AUTH_REPLY",
+    "OP_HEARTBEAT",
+    "OP_HEARTBEAT_REPLY",
+    "OP_NOTIFICATION",
+    "PROTO_VER_BROTLI",
+    "PROTO_VER_INT",
+    "PROTO_VER_RAW",
+    "PROTO_VER_ZLIB",
+    "Packet",
+    "encode_packet",
+]
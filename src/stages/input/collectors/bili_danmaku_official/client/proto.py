@@ -3,9 +3,15 @@
 import logging
 import struct
 
+from .frame_decoder import MAX_PACKET_LEN
+
 
 class Proto:
-    """Bilibili WebSocket 协议处理器"""
+    """
+    Bilibili WebSocket 协议处理器
+
+    unpack() 只处理单个未压缩的包；接收循环中的帧可能包含多个包或压缩包，由 FrameDecoder 解码。
+    """
 
     def __init__(self):
         self.packet_len = 0
@@ -14,7 +20,7 @@ class Proto:
         self.op = 0
         self.seq = 0
         self.body = ""
-        self.max_body = 2048
+        self.max_body = MAX_PACKET_LEN
         self.logger = logging.getLogger(__name__)
 
     def pack(self) -> bytes:
@@ -16,6 +16,7 @@ import websockets
 
 from src.modules.logging import get_logger
 
+from .frame_decoder import OP_AUTH_REPLY, OP_HEARTBEAT_REPLY, FrameDecodeError, FrameDecoder
 from .proto import Proto
 
 # 禁用HTTPS证书警告
@@ -25,6 +26,11 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 _WS_HEARTBEAT_INTERVAL_S = 30
 _APP_HEARTBEAT_INTERVAL_S = 20
 
+# 接收循环与解码循环之间的帧队列长度：解码跟不上时接收循环等待，由 websockets 的接收缓冲兜底
+_FRAME_QUEUE_SIZE = 256
+# 不小于该字节数的帧在工作线程中解码（解压 + JSON 解析），更小的帧直接解码，省去线程切换的开销
+_OFFLOAD_FRAME_BYTES = 2048
+
 
 class BiliWebSocketClient:
     """Bilibili官方WebSocket客户端"""
@@ -62,10 +68,14 @@ class BiliWebSocketClient:
                 return
 
             self.websocket = websocket
+            frame_queue: asyncio.Queue = asyncio.Queue(maxsize=_FRAME_QUEUE_SIZE)
 
             # 启动后台任务
             tasks = [
-                asyncio.create_task(self._recv_loop(message_handler, queue), name="WebSocket接收循环"),
+                asyncio.create_task(self._recv_loop(frame_queue), name="WebSocket接收循环"),
+                asyncio.create_task(
+                    self._decode_loop(frame_queue, FrameDecoder(), message_handler, queue), name="WebSocket帧解码"
+                ),
                 asyncio.create_task(self._heartbeat_loop(), name="WebSocket心跳"),
                 asyncio.create_task(self._app_heartbeat_loop(), name="应用心跳"),
             ]
@@ -231,13 +241,13 @@ class BiliWebSocketClient:
 
             # 等待认证响应
             response = await websocket.recv()
-            proto.unpack(response)
+            ops = [packet.op for packet in FrameDecoder().feed(self._as_bytes(response))]
 
-            if proto.op == 8:
+            if OP_AUTH_REPLY in ops:
                 self.logger.info("WebSocket认证成功")
                 return True
             else:
-                self.logger.error(f"WebSocket认证失败，op: {proto.op}")
+                self.logger.error(f"WebSocket认证失败，op: {ops}")
                 return False
 
         except Exception as e:
@@ -295,30 +305,12 @@ class BiliWebSocketClient:
                 self.logger.warning(f"应用心跳循环出错: {e}")
                 break
 
-    async def _recv_loop(self, message_handler: Callable, queue: asyncio.Queue = None):
-        """接收消息循环"""
+    async def _recv_loop(self, frame_queue: asyncio.Queue):
+        """接收消息循环：只负责读取帧，解码交给 _decode_loop，避免大帧的解压和解析拖慢读取"""
         while self.is_started and self.websocket:
             try:
                 data = await self.websocket.recv()
-                proto = Proto()
-                proto.unpack(data)
-
-                if proto.op == 5:  # 消息通知
-                    try:
-                        message_data = json.loads(proto.body)
-                        # 调用handler，传入queue（如果提供）
-                        if queue is not None:
-                            await message_handler(message_data, queue)
-                        else:
-                            await message_handler(message_data)
-                    except json.JSONDecodeError as e:
-                        self.logger.warning(f"解析消息JSON失败: {e}, 原始数据: {proto.body}")
-                    except Exception as e:
-                        self.logger.error(f"处理消息时出错: {e}", exc_info=True)
-                elif proto.op == 3:  # 心跳回复
-                    self.logger.debug("收到WebSocket心跳回复")
-                else:
-                    self.logger.debug(f"收到其他类型消息，op: {proto.op}")
+                await frame_queue.put(self._as_bytes(data))
 
             except websockets.exceptions.ConnectionClosed:
                 self.logger.warning("WebSocket连接已关闭")
@@ -327,6 +319,52 @@ class BiliWebSocketClient:
                 self.logger.error(f"接收消息时出错: {e}", exc_info=True)
                 break
 
+        # 结束信号：解码循环处理完已收到的帧后退出（被取消时两个循环一起取消，不需要信号）
+        await frame_queue.put(None)
+
+    async def _decode_loop(
+        self,
+        frame_queue: asyncio.Queue,
+        decoder: FrameDecoder,
+        message_handler: Callable,
+        queue: asyncio.Queue = None,
+    ):
+        """解码循环：按接收顺序解码帧（大帧在工作线程中解码），再逐条交给 handler"""
+        while True:
+            frame = await frame_queue.get()
+            if frame is None:
+                break
+
+            try:
+                if len(frame) >= _OFFLOAD_FRAME_BYTES:
+                    messages, others = await asyncio.to_thread(decoder.decode, frame)
+                else:
+                    messages, others = decoder.decode(frame)
+            except FrameDecodeError as e:
+                self.logger.warning(f"解码WebSocket帧失败: {e}, 帧长度: {len(frame)}")
+                continue
+
+            for packet in others:
+                if packet.op == OP_HEARTBEAT_REPLY:
+                    self.logger.debug("收到WebSocket心跳回复")
+                else:
+                    self.logger.debug(f"收到其他类型消息，op: {packet.op}")
+
+            for message_data in messages:
+                try:
+                    # 调用handler，传入queue（如果提供）
+                    if queue is not None:
+                        await message_handler(message_data, queue)
+                    else:
+                        await message_handler(message_data)
+                except Exception as e:
+                    self.logger.error(f"处理消息时出错: {e}", exc_info=True)
+
+    @staticmethod
+    def _as_bytes(data) -> bytes:
+        """websockets 对文本帧返回 str，协议数据统一按字节处理"""
+        return data.encode("utf-8") if isinstance(data, str) else data
+
     async def _cleanup(self):
         """清理资源"""
         if self.websocket:
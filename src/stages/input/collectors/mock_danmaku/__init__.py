@@ -1,5 +1,6 @@
 """Mock Danmaku Input Collector"""
 
+from .load_generator import LoadGenerator, LoadProfile, SyntheticMessage
 from .mock_danmaku_collector import MockDanmakuCollector
 
-__all__ = ["MockDanmakuCollector"]
+__all__ = ["LoadGenerator", "LoadProfile", "MockDanmakuCollector", "SyntheticMessage"]
@@ -0,0 +1,194 @@
+"""
+合成弹幕负载生成
+
+按到达过程生成 (发送时刻, 消息) 序列，用于压测 Input → Decision → Output 链路：
+- steady: 到达率恒为 rate 的泊松过程
+- burst: 平时按 rate 到达，每个周期末尾的峰值窗口内按 peak_rate 到达（弹幕刷屏）
+- gift_storm: 同 burst，峰值窗口内大部分消息是礼物（礼物连击、抽奖）
+- raid: 同 burst，峰值窗口内来自一批新观众，每人先进入直播间再发弹幕（其他主播带人突袭）
+
+到达率是分段常数，每段内按指数分布抽取间隔，越过分段终点时从下一段起点重新抽取（泊松过程无记忆），
+因此每段内的到达都是严格的泊松过程。相同 seed 产生完全相同的序列，方便对比不同版本的容量。
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Set, Tuple
+
+ARRIVAL_MODES = ("steady", "burst", "gift_storm", "raid")
+
+# 重复弹幕从热门短语中抽取（复读、刷屏），其余弹幕各不相同
+HOT_PHRASES = ("哈哈哈哈哈", "草", "来了来了", "主播晚上好", "？？？", "好耶", "awsl", "666", "8888", "前方高能")
+TEXT_TEMPLATES = (
+    "今天播什么呀",
+    "刚下班来看看",
+    "这个好有意思",
+    "主播几点下播",
+    "第一次来，已关注",
+    "这首歌叫什么名字",
+    "晚饭吃了吗",
+    "刚才那段再来一次",
+)
+GIFTS = (("辣条", 1), ("小心心", 1), ("牛哇牛哇", 1), ("打call", 5), ("告白气球", 1), ("flag", 10))
+
+
+@dataclass
+class LoadProfile:
+    """
+    负载参数
+
+    Attributes:
+        mode: 到达过程，见 ARRIVAL_MODES
+        rate: 平时的平均到达率（条/秒）
+        peak_rate: 峰值窗口内的平均到达率（条/秒），steady 模式不使用
+        peak_interval: 峰值窗口的周期（秒），每个周期的最后 peak_duration 秒为峰值窗口
+        peak_duration: 峰值窗口时长（秒）
+        users: 平时发言的观众数量（用户基数）
+        duplicate_ratio: 弹幕中重复短语的比例（0-1）
+        gift_ratio: 平时礼物消息的比例（0-1）
+        storm_gift_ratio: gift_storm 峰值窗口内礼物消息的比例（0-1）
+        raid_users: raid 每次突袭带来的新观众数量
+        seed: 随机种子，None 表示每次不同
+    """
+
+    mode: str = "steady"
+    rate: float = 5.0
+    peak_rate: float = 50.0
+    peak_interval: float = 30.0
+    peak_duration: float = 5.0
+    users: int = 200
+    duplicate_ratio: float = 0.3
+    gift_ratio: float = 0.02
+    storm_gift_ratio: float = 0.8
+    raid_users: int = 100
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        if self.mode not in ARRIVAL_MODES:
+            raise ValueError(f"未知的到达过程: {self.mode}，可选: {', '.join(ARRIVAL_MODES)}")
+        if self.rate <= 0 or self.peak_interval <= 0:
+            raise ValueError("rate 和 peak_interval 必须大于 0")
+        self.peak_duration = min(max(self.peak_duration, 0.0), self.peak_interval)
+
+
+@dataclass(frozen=True)
+class SyntheticMessage:
+    """一条合成消息，offset_s 为相对负载开始的发送时刻（秒）"""
+
+    offset_s: float
+    text: str
+    data_type: str
+    importance: float
+    user_id: str
+    user_nickname: str
+
+
+class LoadGenerator:
+    """
+    合成负载生成器
+
+    messages() 是纯计算的生成器，不涉及时钟：调用方按 offset_s 安排发送时刻。
+    """
+
+    def __init__(self, profile: LoadProfile):
+        self.profile = profile
+        self._rng = random.Random(profile.seed)
+        self._seq = 0
+        self._raid_index = -1
+        self._raid_entered: Set[int] = set()
+
+    def in_peak(self, t: float) -> bool:
+        """t 时刻是否处于峰值窗口"""
+        profile = self.profile
+        if profile.mode == "steady" or profile.peak_duration <= 0:
+            return False
+        return t % profile.peak_interval >= profile.peak_interval - profile.peak_duration
+
+    def rate_at(self, t: float) -> float:
+        """t 时刻的到达率（条/秒）"""
+        return self.profile.peak_rate if self.in_peak(t) else self.profile.rate
+
+    def arrivals(self, duration: Optional[float] = None) -> Iterator[float]:
+        """按分段常数到达率生成到达时刻（秒），duration 为 None 时不结束"""
+        for t, _ in self._arrivals(duration):
+            yield t
+
+    def messages(self, duration: Optional[float] = None) -> Iterator[SyntheticMessage]:
+        """生成合成消息序列"""
+        for t, peak in self._arrivals(duration):
+            yield self._build(t, peak)
+
+    def take(self, count: int) -> List[SyntheticMessage]:
+        """生成前 count 条消息（用于预先构造语料）"""
+        result = []
+        for message in self.messages():
+            result.append(message)
+            if len(result) >= count:
+                break
+        return result
+
+    def _segments(self) -> Iterator[Tuple[float, float, float, bool]]:
+        """依次产出 (起点, 终点, 到达率, 是否峰值窗口)，分段边界按周期序号计算，不累积浮点误差"""
+        profile = self.profile
+        if profile.mode == "steady" or profile.peak_duration <= 0:
+            yield 0.0, float("inf"), profile.rate, False
+            return
+        cycle = 0
+        while True:
+            cycle_start = cycle * profile.peak_interval
+            peak_start = cycle_start + profile.peak_interval - profile.peak_duration
+            yield cycle_start, peak_start, profile.rate, False
+            yield peak_start, cycle_start + profile.peak_interval, profile.peak_rate, True
+            cycle += 1
+
+    def _arrivals(self, duration: Optional[float]) -> Iterator[Tuple[float, bool]]:
+        for start, end, rate, peak in self._segments():
+            if duration is not None and start >= duration:
+                return
+            if rate <= 0:
+                continue
+            t = start
+            while True:
+                t += self._rng.expovariate(rate)
+                if t >= end:
+                    break
+                if duration is not None and t >= duration:
+                    return
+                yield t, peak
+
+    def _build(self, t: float, peak: bool) -> SyntheticMessage:
+        profile = self.profile
+        rng = self._rng
+        self._seq += 1
+
+        if profile.mode == "raid" and peak:
+            raid_index = int(t // profile.peak_interval)
+            if raid_index != self._raid_index:
+                self._raid_index = raid_index
+                self._raid_entered = set()
+            member = rng.randrange(profile.raid_users)
+            user_id = f"raid{raid_index}-{member}"
+            nickname = f"突袭观众{raid_index}-{member}"
+            if member not in self._raid_entered:
+                self._raid_entered.add(member)
+                return SyntheticMessage(t, f"{nickname} 进入了直播间", "enter", 0.1, user_id, nickname)
+            return SyntheticMessage(t, self._text(), "text", 0.5, user_id, nickname)
+
+        member = rng.randrange(profile.users)
+        user_id = f"user-{member}"
+        nickname = f"观众{member}"
+        gift_ratio = profile.storm_gift_ratio if profile.mode == "gift_storm" and peak else profile.gift_ratio
+        if rng.random() < gift_ratio:
+            gift_name, unit = rng.choice(GIFTS)
+            gift_count = unit * rng.choice((1, 1, 1, 2, 5, 10))
+            description = f"{nickname} 送出了 {gift_count} 个 {gift_name}"
+            return SyntheticMessage(t, description, "gift", min(0.3 + gift_count * 0.05, 1.0), user_id, nickname)
+        return SyntheticMessage(t, self._text(), "text", 0.5, user_id, nickname)
+
+    def _text(self) -> str:
+        if self._rng.random() < self.profile.duplicate_ratio:
+            return self._rng.choice(HOT_PHRASES)
+        return f"{self._rng.choice(TEXT_TEMPLATES)}（{self._seq}）"
+
+
+__all__ = ["ARRIVAL_MODES", "LoadGenerator", "LoadProfile", "SyntheticMessage"]
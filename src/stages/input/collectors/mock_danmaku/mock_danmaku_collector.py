@@ -1,7 +1,12 @@
 """
 MockDanmakuCollector - 模拟弹幕输入Collector
 
-从JSONL文件读取消息并按设定速率发送模拟弹幕。
+mode = "replay"（默认）：从JSONL文件读取消息并按设定速率发送模拟弹幕。
+- 普通 JSONL：每行 {"text", "user_name", "user_id"}，可选 data_type / importance
+- 行内带 timestamp_ms 时按记录的时间间隔回放（speed 倍速）
+- 事件日志（main.py --record-events 的输出，可为 .gz）：回放其中的 input.message.received 消息
+
+其余模式按到达过程合成负载，用于容量压测（见 load_generator.py 和 scripts/bench_capacity.py）。
 """
 
 from __future__ import annotations
@@ -9,15 +14,19 @@ from __future__ import annotations
 import asyncio
 import json
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, Literal
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Tuple
 
 from pydantic import Field
 
 from src.stages.input.registry import collector
 from src.modules.config.schemas.base import BaseConfig
+from src.modules.events import read_journal
 from src.modules.events.event_bus import EventBus
+from src.modules.events.names import CoreEvents
 from src.modules.logging import get_logger
+from src.modules.time_utils import now_ms
 from src.modules.types.base.normalized_message import NormalizedMessage
+from src.stages.input.collectors.mock_danmaku.load_generator import LoadGenerator, LoadProfile
 
 
 @collector("mock_danmaku")
@@ -25,18 +34,35 @@ class MockDanmakuCollector:
     """
     模拟弹幕输入Collector
 
-    从JSONL文件读取消息并按设定速率发送。
+    从JSONL文件读取消息并按设定速率发送，或按到达过程合成负载。
     """
 
     class ConfigSchema(BaseConfig):
         """模拟弹幕输入Collector配置"""
 
         type: Literal["mock_danmaku"] = "mock_danmaku"
+        mode: Literal["replay", "steady", "burst", "gift_storm", "raid"] = Field(
+            default="replay", description="发送模式：replay 回放文件，其余为合成负载的到达过程"
+        )
         log_file_path: str = Field(default="msg_default.jsonl", description="日志文件路径")
         send_interval: float = Field(default=1.0, description="发送间隔（秒）", ge=0.1)
+        speed: float = Field(default=1.0, description="按时间戳回放时的倍速，0 表示不等待", ge=0)
         loop_playback: bool = Field(default=True, description="循环播放")
         start_immediately: bool = Field(default=True, description="立即开始")
 
+        # 合成负载（mode 不为 replay 时生效）
+        duration: float = Field(default=0.0, description="合成负载持续时间（秒），0 表示不限", ge=0)
+        rate: float = Field(default=5.0, description="平时的平均到达率（条/秒）", gt=0)
+        peak_rate: float = Field(default=50.0, description="峰值窗口内的平均到达率（条/秒）", ge=0)
+        peak_interval: float = Field(default=30.0, description="峰值窗口的周期（秒）", gt=0)
+        peak_duration: float = Field(default=5.0, description="峰值窗口时长（秒）", ge=0)
+        users: int = Field(default=200, description="观众数量（用户基数）", ge=1)
+        duplicate_ratio: float = Field(default=0.3, description="重复弹幕比例", ge=0, le=1)
+        gift_ratio: float = Field(default=0.02, description="平时礼物消息比例", ge=0, le=1)
+        storm_gift_ratio: float = Field(default=0.8, description="礼物潮窗口内礼物消息比例", ge=0, le=1)
+        raid_users: int = Field(default=100, description="每次突袭带来的新观众数量", ge=1)
+        seed: Optional[int] = Field(default=None, description="随机种子（相同种子产生相同的消息序列）")
+
     def __init__(
         self,
         config: Dict[str, Any],
@@ -54,8 +80,10 @@ class MockDanmakuCollector:
         self.logger = get_logger(self.__class__.__name__)
 
         self.typed_config = self.ConfigSchema.from_dict(config)
+        self.mode = self.typed_config.mode
         self.log_filename = self.typed_config.log_file_path
         self.send_interval = max(0.1, self.typed_config.send_interval)
+        self.speed = self.typed_config.speed
         self.loop_playback = self.typed_config.loop_playback
         self.start_immediately = self.typed_config.start_immediately
 
@@ -67,13 +95,19 @@ class MockDanmakuCollector:
         except OSError as e:
             self.logger.error(f"创建数据目录失败: {self.data_dir}: {e}")
 
+        # 绝对路径（如录制的事件日志）直接使用
         self.log_file_path = self.data_dir / self.log_filename
 
-        self._message_lines: list = []
+        # (相对第一条消息的偏移秒数或 None, 消息字段)
+        self._messages: List[Tuple[Optional[float], Dict[str, Any]]] = []
         self._current_line_index: int = 0
         self._stop_event = asyncio.Event()
         self.is_started = False
 
+        # 负载统计：已发送条数、落后于计划发送时刻的最大值（下游反压或事件循环繁忙）
+        self.sent_count = 0
+        self.max_schedule_lag_ms = 0.0
+
     def stream(self) -> AsyncIterator[NormalizedMessage]:
         if not self.is_started:
             raise RuntimeError("Collector 未启动，请先调用 start()")
@@ -95,70 +129,90 @@ class MockDanmakuCollector:
 
     async def cleanup(self) -> None:
         self._stop_event.set()
-        self._message_lines = []
+        self._messages = []
         self._current_line_index = 0
         self.logger.info("MockDanmakuCollector 已清理")
 
+    def load_profile(self) -> LoadProfile:
+        """由配置构造合成负载参数"""
+        cfg = self.typed_config
+        return LoadProfile(
+            mode=cfg.mode,
+            rate=cfg.rate,
+            peak_rate=cfg.peak_rate,
+            peak_interval=cfg.peak_interval,
+            peak_duration=cfg.peak_duration,
+            users=cfg.users,
+            duplicate_ratio=cfg.duplicate_ratio,
+            gift_ratio=cfg.gift_ratio,
+            storm_gift_ratio=cfg.storm_gift_ratio,
+            raid_users=cfg.raid_users,
+            seed=cfg.seed,
+        )
+
     async def collect(self) -> AsyncIterator[NormalizedMessage]:
         """启动模拟弹幕发送循环"""
         self.is_started = True
 
         try:
-            await self._load_message_lines()
+            if self.mode != "replay":
+                async for message in self._collect_synthetic():
+                    yield message
+                return
 
-            if not self._message_lines:
+            await self._load_messages()
+
+            if not self._messages:
                 self.logger.warning(f"未从 '{self.log_file_path}' 加载任何消息。")
                 return
 
             self.logger.info(f"模拟弹幕发送循环开始 (源: {self.log_file_path.name})")
+            loop = asyncio.get_running_loop()
+            started = loop.time()
 
             while not self._stop_event.is_set():
-                if not self._message_lines:
+                if not self._messages:
                     self.logger.warning("消息列表为空，停止发送循环。")
                     break
 
-                if self._current_line_index >= len(self._message_lines):
+                if self._current_line_index >= len(self._messages):
                     if self.loop_playback:
                         self.logger.info("到达文件末尾，循环播放已启用，重置索引。")
                         self._current_line_index = 0
+                        started = loop.time()
                     else:
                         self.logger.info("到达文件末尾，循环播放已禁用，停止发送。")
                         break
 
-                if self._current_line_index >= len(self._message_lines):
-                    self.logger.warning("索引仍然超出范围，停止循环。")
-                    break
-
-                line = self._message_lines[self._current_line_index]
+                offset_s, data = self._messages[self._current_line_index]
                 self._current_line_index += 1
 
                 try:
-                    data = json.loads(line)
-
-                    text = data.get("text", "")
-                    user = data.get("user_name", "未知用户")
-                    user_id = data.get("user_id", "")
+                    # 带时间戳的记录按原始节奏回放，否则按固定间隔发送
+                    if offset_s is not None:
+                        await self._sleep_until(started + offset_s / self.speed if self.speed > 0 else None)
 
                     message = NormalizedMessage(
-                        text=text,
+                        text=data.get("text", ""),
                         source="mock_danmaku",
-                        data_type="text",
-                        importance=0.5,
-                        user_id=user_id or None,
-                        user_nickname=user or None,
+                        data_type=data.get("data_type", "text"),
+                        importance=data.get("importance", 0.5),
+                        timestamp_ms=now_ms(),
+                        user_id=data.get("user_id") or None,
+                        user_nickname=data.get("user_name") or None,
                         platform="mock",
                     )
 
                     self.logger.debug(f"发送模拟消息 (行 {self._current_line_index}): {str(data)[:50]}...")
+                    self.sent_count += 1
                     yield message
 
-                    await asyncio.sleep(self.send_interval)
+                    if offset_s is None:
+                        await asyncio.sleep(self.send_interval)
 
                 except asyncio.CancelledError:
                     self.logger.info("模拟弹幕发送循环被取消。")
                     break
-                except json.JSONDecodeError as e:
-                    self.logger.error(f"JSON 解析错误: {e}. 行内容: {line[:100]}...")
                 except Exception as e:
                     self.logger.error(f"发送模拟消息时发生错误: {e}", exc_info=True)
 
@@ -167,9 +221,47 @@ class MockDanmakuCollector:
         finally:
             self.is_started = False
 
-    async def _load_message_lines(self) -> None:
-        """从 JSONL 文件加载消息行。"""
-        self._message_lines = []
+    async def _collect_synthetic(self) -> AsyncIterator[NormalizedMessage]:
+        """按到达过程发送合成负载，发送时刻相对开始时间计算，下游变慢时不会降低计划的到达率"""
+        profile = self.load_profile()
+        duration = self.typed_config.duration or None
+        self.logger.info(
+            f"合成负载开始: mode={profile.mode}, rate={profile.rate}/s, peak_rate={profile.peak_rate}/s, "
+            f"users={profile.users}, duplicate_ratio={profile.duplicate_ratio}, duration={duration or '不限'}"
+        )
+
+        started = asyncio.get_running_loop().time()
+        for item in LoadGenerator(profile).messages(duration):
+            if self._stop_event.is_set():
+                break
+            await self._sleep_until(started + item.offset_s)
+            self.sent_count += 1
+            yield NormalizedMessage(
+                text=item.text,
+                source="mock_danmaku",
+                data_type=item.data_type,
+                importance=item.importance,
+                timestamp_ms=now_ms(),
+                user_id=item.user_id,
+                user_nickname=item.user_nickname,
+                platform="mock",
+            )
+
+        self.logger.info(f"合成负载结束，共发送 {self.sent_count} 条，最大发送延迟 {self.max_schedule_lag_ms:.1f}ms")
+
+    async def _sleep_until(self, deadline: Optional[float]) -> None:
+        """等待到事件循环时钟的 deadline；已经落后时也让出一次事件循环，避免饿死下游的分发协程"""
+        if deadline is None:
+            await asyncio.sleep(0)
+            return
+        delay = deadline - asyncio.get_running_loop().time()
+        if delay < 0:
+            self.max_schedule_lag_ms = max(self.max_schedule_lag_ms, -delay * 1000)
+        await asyncio.sleep(max(delay, 0))
+
+    async def _load_messages(self) -> None:
+        """从 JSONL 文件或事件日志加载消息。"""
+        self._messages = []
         self._current_line_index = 0
 
         if not self.log_file_path.exists() or not self.log_file_path.is_file():
@@ -177,9 +269,60 @@ class MockDanmakuCollector:
             return
 
         try:
-            with open(self.log_file_path, "r", encoding="utf-8") as f:
-                self._message_lines = [line.strip() for line in f if line.strip()]
-            self.logger.info(f"成功从 '{self.log_file_path.name}' 加载 {len(self._message_lines)} 行消息。")
+            if self._is_event_journal():
+                self._messages = self._load_journal_messages()
+            else:
+                self._messages = self._load_jsonl_messages()
+            self.logger.info(f"成功从 '{self.log_file_path.name}' 加载 {len(self._messages)} 条消息。")
         except Exception as e:
             self.logger.error(f"读取日志文件时出错: {self.log_file_path}: {e}", exc_info=True)
-            self._message_lines = []
+            self._messages = []
+
+    def _is_event_journal(self) -> bool:
+        if self.log_file_path.suffix == ".gz":
+            return True
+        with open(self.log_file_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    return line.lstrip().startswith('{"journal"')
+        return False
+
+    def _load_jsonl_messages(self) -> List[Tuple[Optional[float], Dict[str, Any]]]:
+        messages: List[Tuple[Optional[float], Dict[str, Any]]] = []
+        first_ms: Optional[float] = None
+        with open(self.log_file_path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError as e:
+                    self.logger.error(f"JSON 解析错误 (行 {line_no}): {e}. 行内容: {line[:100]}...")
+                    continue
+                offset_s = None
+                if data.get("timestamp_ms") is not None:
+                    if first_ms is None:
+                        first_ms = data["timestamp_ms"]
+                    offset_s = max(data["timestamp_ms"] - first_ms, 0) / 1000
+                messages.append((offset_s, data))
+        return messages
+
+    def _load_journal_messages(self) -> List[Tuple[Optional[float], Dict[str, Any]]]:
+        messages: List[Tuple[Optional[float], Dict[str, Any]]] = []
+        first_ms: Optional[float] = None
+        for record in read_journal(str(self.log_file_path)):
+            if record.event_name != CoreEvents.INPUT_MESSAGE_RECEIVED:
+                continue
+            message = record.payload.get("message") or {}
+            if first_ms is None:
+                first_ms = record.offset_ms
+            data = {
+                "text": message.get("text", ""),
+                "user_name": message.get("user_nickname"),
+                "user_id": message.get("user_id"),
+                "data_type": message.get("data_type", "text"),
+                "importance": message.get("importance", 0.5),
+            }
+            messages.append(((record.offset_ms - first_ms) / 1000, data))
+        return messages
@@ -0,0 +1,163 @@
+"""
+STT 音频环形缓冲区
+
+音频回调运行在 PortAudio 的实时线程中，每 32ms 一次。原来每次回调都要 astype/切片/tobytes 分配新的数组和
+bytes 再放入队列，分配和释放都可能在实时线程里触发 GC；这里改为启动时预分配一块 int16 帧槽，
+回调只把样本转换后原地写入当前槽位，不分配新的缓冲区。
+
+单生产者单消费者：
+- 生产者（音频回调）写入帧并推进写序号，未读帧达到 max_unread 时丢弃新帧并计入溢出，从不阻塞
+- 消费者（VAD 工作线程）按序号顺序取帧
+- 已读的帧在被覆盖之前仍保留在缓冲区中，话语开始时可以按序号取回检测到语音之前的几帧（预录），
+  补上 VAD 判定前被截掉的第一个音节
+
+序号单调递增，槽位为 序号 % capacity。写入先填满槽位再推进写序号（GIL 保证其他线程看到的顺序），
+读取历史帧时复制后再检查序号仍在保留范围内，期间被覆盖的帧计入 stale_read_count 并丢弃。
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import numpy as np
+
+
+@dataclass
+class AudioRingStats:
+    """
+    环形缓冲区统计
+
+    Attributes:
+        written_count: 写入的完整帧数
+        overrun_count: 消费者落后（未读帧达到上限）时丢弃的帧数
+        input_overflow_count: 音频设备报告输入溢出的次数（回调来不及处理，声卡丢了样本）
+        stale_read_count: 读取历史帧时已被覆盖的帧数（预录不完整）
+    """
+
+    written_count: int = 0
+    overrun_count: int = 0
+    input_overflow_count: int = 0
+    stale_read_count: int = 0
+
+
+class AudioRingBuffer:
+    """
+    预分配的 int16 单声道帧环形缓冲区
+
+    write() 只应在一个线程中调用（音频回调，或没有麦克风时的事件循环），
+    take() 只应在一个线程中调用（VAD 工作线程），read_range() 可以在任意线程调用。
+    """
+
+    def __init__(self, frame_samples: int, max_unread: int = 64, history_frames: int = 0):
+        """
+        Args:
+            frame_samples: 每帧采样点数（VAD 模型的帧长）
+            max_unread: 未读帧上限，超出时丢弃新帧
+            history_frames: 读取之后仍保证保留的帧数（预录长度加上事件循环处理结果的余量）
+        """
+        self.frame_samples = frame_samples
+        self.max_unread = max(1, max_unread)
+        self.capacity = self.max_unread + max(0, history_frames) + 1
+        self.stats = AudioRingStats()
+        self._frames = np.zeros((self.capacity, frame_samples), dtype=np.int16)
+        self._scratch = np.zeros(frame_samples, dtype=np.float32)
+        self._write_seq = 0
+        self._read_seq = 0
+        self._fill = 0
+        self._readable = threading.Event()
+
+    @property
+    def write_seq(self) -> int:
+        """下一帧的序号（即已写入的完整帧数）"""
+        return self._write_seq
+
+    @property
+    def unread(self) -> int:
+        """已写入但还没被 take() 取走的帧数"""
+        return self._write_seq - self._read_seq
+
+    def write(self, samples) -> bool:
+        """
+        写入音频（不分配缓冲区，可在实时音频回调中调用）
+
+        samples 可以是 int16 PCM bytes，或 sounddevice 交回的 int16/float32 数组（多声道取第一声道）。
+        长度不必等于帧长，不足一帧的部分留在当前槽位等待下次写入。
+
+        Returns:
+            False 表示有帧因消费者落后被丢弃
+        """
+        if isinstance(samples, (bytes, bytearray, memoryview)):
+            samples = np.frombuffer(samples, dtype=np.int16)
+        if samples.ndim > 1:
+            samples = samples[:, 0]
+
+        accepted = True
+        offset = 0
+        total = samples.shape[0]
+        while offset < total:
+            count = min(self.frame_samples - self._fill, total - offset)
+            slot = self._frames[self._write_seq % self.capacity]
+            self._copy_into(slot[self._fill : self._fill + count], samples[offset : offset + count])
+            offset += count
+            self._fill += count
+            if self._fill < self.frame_samples:
+                break
+            self._fill = 0
+            if self._write_seq - self._read_seq >= self.max_unread:
+                # 丢弃刚写满的这一帧，槽位留给下一帧重写
+                self.stats.overrun_count += 1
+                accepted = False
+                continue
+            self._write_seq += 1
+            self.stats.written_count += 1
+            self._readable.set()
+        return accepted
+
+    def _copy_into(self, dst: np.ndarray, src: np.ndarray) -> None:
+        if src.dtype == np.int16:
+            np.copyto(dst, src)
+            return
+        # float32 [-1, 1]：经预分配的临时数组缩放、限幅后写入
+        scratch = self._scratch[: src.shape[0]]
+        np.multiply(src, 32767.0, out=scratch, casting="unsafe")
+        np.minimum(scratch, 32767.0, out=scratch)
+        np.maximum(scratch, -32768.0, out=scratch)
+        np.copyto(dst, scratch, casting="unsafe")
+
+    def wait_readable(self, timeout: float) -> bool:
+        """等待有新帧写入，返回是否被唤醒"""
+        woke = self._readable.wait(timeout)
+        self._readable.clear()
+        return woke
+
+    def wake(self) -> None:
+        """唤醒等待中的消费者（停止时使用）"""
+        self._readable.set()
+
+    def take(self, max_frames: int) -> List[Tuple[int, bytes]]:
+        """按序取出最多 max_frames 个未读帧，返回 (序号, int16 PCM) 列表"""
+        end = min(self._write_seq, self._read_seq + max_frames)
+        frames = [(seq, self._frames[seq % self.capacity].tobytes()) for seq in range(self._read_seq, end)]
+        self._read_seq = end
+        return frames
+
+    def read_range(self, start: int, end: int) -> List[bytes]:
+        """
+        取回序号在 [start, end) 内、仍保留在缓冲区中的帧（用于预录）
+
+        已被覆盖或尚未写入的帧跳过，已被覆盖的计入 stale_read_count。
+        """
+        start = max(0, start)
+        end = min(end, self._write_seq)
+        frames = []
+        for seq in range(start, end):
+            data = self._frames[seq % self.capacity].tobytes()
+            # 复制之后再检查：写指针正在写的槽位属于 write_seq - capacity 这一帧
+            if seq > self._write_seq - self.capacity:
+                frames.append(data)
+            else:
+                self.stats.stale_read_count += 1
+        return frames
+
+
+__all__ = ["AudioRingBuffer", "AudioRingStats"]
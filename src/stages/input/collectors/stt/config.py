@@ -6,7 +6,7 @@ STTInput组件配置 Schema
 
 from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from src.modules.config.schemas.base import BaseConfig
 
@@ -28,12 +28,39 @@ class IflytekAsrConfig(BaseModel):
     dwa: str = Field(default="wpgs", description="动态修正")
 
 
+class LocalAsrConfig(BaseModel):
+    """本地识别引擎（sherpa-onnx 流式模型）配置"""
+
+    model_type: Literal["paraformer", "transducer"] = Field(default="paraformer", description="流式模型类型")
+    tokens: str = Field(..., description="tokens.txt 路径")
+    encoder: str = Field(..., description="encoder ONNX 模型路径")
+    decoder: str = Field(..., description="decoder ONNX 模型路径")
+    joiner: str = Field(default="", description="joiner ONNX 模型路径（仅 transducer）")
+    num_threads: int = Field(default=2, ge=1, description="推理线程数")
+    decoding_method: str = Field(default="greedy_search", description="解码方法")
+    provider: str = Field(default="cpu", description="ONNX Runtime 执行后端")
+
+
+class FakeAsrConfig(BaseModel):
+    """假识别引擎配置（测试、离线调试）"""
+
+    transcripts: List[str] = Field(default_factory=lambda: ["你好"], description="每次话语依次返回的文本（循环）")
+    frames_per_partial: int = Field(default=3, ge=1, description="每送入多少帧返回一次部分结果")
+    chars_per_partial: int = Field(default=2, ge=1, description="每次部分结果多出的字数")
+
+
 class VadConfig(BaseModel):
     """VAD (语音活动检测) 配置"""
 
     enable: bool = Field(default=True, description="是否启用 VAD")
     vad_threshold: float = Field(default=0.5, description="VAD 阈值 (0-1)")
     silence_seconds: float = Field(default=1.0, description="静音持续时间阈值 (秒)")
+    preroll_ms: int = Field(default=300, ge=0, description="话语开始前补送给引擎的音频长度 (毫秒)")
+    energy_gate: bool = Field(default=True, description="是否启用能量门限（明显静音的帧不调用 VAD 模型）")
+    energy_threshold_db: float = Field(default=-50.0, description="能量门限电平 (dBFS)，低于该电平视为静音")
+    zcr_threshold: float = Field(default=0.35, description="过零率门限，接近门限电平且过零率更高的帧视为底噪")
+    max_queue_frames: int = Field(default=64, ge=1, description="音频缓冲区中待 VAD 处理的帧数上限，超出时丢帧")
+    max_batch_frames: int = Field(default=16, ge=1, description="VAD 工作线程落后时每批最多处理的帧数")
 
 
 class AudioConfig(BaseModel):
@@ -69,8 +96,22 @@ class STTInputConfig(BaseConfig):
 
     type: Literal["stt"] = "stt"
 
+    engine: Literal["iflytek", "local", "fake"] = Field(default="iflytek", description="识别引擎")
+    partial_results: bool = Field(default=True, description="是否发布识别中间结果（input.speech.recognized 事件）")
+
     # 嵌套配置结构（与旧插件一致）
-    iflytek_asr: IflytekAsrConfig = Field(..., description="讯飞 ASR 配置")
+    iflytek_asr: Optional[IflytekAsrConfig] = Field(default=None, description="讯飞 ASR 配置（engine=iflytek 时必填）")
+    local_asr: Optional[LocalAsrConfig] = Field(default=None, description="本地识别配置（engine=local 时必填）")
+    fake_asr: FakeAsrConfig = Field(default_factory=FakeAsrConfig, description="假识别引擎配置")
     vad: VadConfig = Field(default_factory=VadConfig, description="VAD 配置")
     audio: AudioConfig = Field(default_factory=AudioConfig, description="音频配置")
     message_config: MessageConfig = Field(default_factory=MessageConfig, description="消息配置")
+
+    @model_validator(mode="after")
+    def _check_engine_config(self) -> "STTInputConfig":
+        """所选引擎的配置节必须存在"""
+        if self.engine == "iflytek" and self.iflytek_asr is None:
+            raise ValueError("engine=iflytek 需要 iflytek_asr 配置")
+        if self.engine == "local" and self.local_asr is None:
+            raise ValueError("engine=local 需要 local_asr 配置")
+        return self
@@ -0,0 +1,53 @@
+"""
+STT 识别引擎
+
+- iflytek: 讯飞流式语音听写（WebSocket，需要网络和 API 凭据）
+- local: sherpa-onnx 本地流式识别（需要 sherpa-onnx 和模型文件）
+- fake: 确定性的假引擎（测试、离线调试）
+
+按配置中的 engine 名称通过 create_engine() 创建。
+"""
+
+from typing import Any, Callable, Dict, Type
+
+from .base import SpeechHypothesis, STTEngineBase, STTEngineStats
+from .fake import FakeEngine
+from .iflytek import IflytekEngine, WpgsTranscript
+from .local import LocalEngine
+
+ENGINES: Dict[str, Type[STTEngineBase]] = {
+    IflytekEngine.name: IflytekEngine,
+    LocalEngine.name: LocalEngine,
+    FakeEngine.name: FakeEngine,
+}
+
+
+def create_engine(
+    name: str,
+    config: Dict[str, Any],
+    sample_rate: int,
+    on_hypothesis: Callable[[SpeechHypothesis], None],
+) -> STTEngineBase:
+    """
+    按名称创建识别引擎
+
+    Raises:
+        ValueError: 未知的引擎名称
+    """
+    engine_cls = ENGINES.get(name)
+    if engine_cls is None:
+        raise ValueError(f"未知的 STT 引擎: {name}（可选: {', '.join(ENGINES)}）")
+    return engine_cls(config, sample_rate, on_hypothesis)
+
+
+__all__ = [
+    "ENGINES",
+    "FakeEngine",
+    "IflytekEngine",
+    "LocalEngine",
+    "SpeechHypothesis",
+    "STTEngineBase",
+    "STTEngineStats",
+    "WpgsTranscript",
+    "create_engine",
+]
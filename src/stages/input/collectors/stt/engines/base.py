@@ -0,0 +1,205 @@
+"""
+STT 识别引擎接口
+
+STTCollector 负责采集音频和 VAD 断句，识别交给引擎。一次话语的调用顺序：
+start_utterance() → feed() × N → finish_utterance()（或中途 abort_utterance()）
+
+识别结果通过构造时传入的 on_hypothesis 回调交回（总是在事件循环线程中调用）：
+- 部分结果（is_final=False）：说话过程中的临时识别文本，后续可能被修正，文本不变时不重复交回
+- 最终结果（is_final=True）：每次 start_utterance() 成功的话语恰好一条，
+  识别失败或被 abort_utterance() 放弃时文本为空
+"""
+
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from src.modules.logging import get_logger
+
+
+@dataclass(frozen=True)
+class SpeechHypothesis:
+    """
+    一条识别结果
+
+    Attributes:
+        text: 识别文本
+        is_final: 是否为话语的最终结果
+        utterance_id: 话语序号（同一引擎内递增）
+        engine: 引擎名称
+        elapsed_ms: 距话语开始的时间（毫秒）
+    """
+
+    text: str
+    is_final: bool
+    utterance_id: int
+    engine: str
+    elapsed_ms: float
+
+
+@dataclass
+class STTEngineStats:
+    """
+    引擎统计
+
+    Attributes:
+        utterance_count: 开始的话语数
+        partial_count: 交回的部分结果数
+        final_count: 交回的非空最终结果数
+        failed_count: 失败或被放弃的话语数
+    """
+
+    utterance_count: int = 0
+    partial_count: int = 0
+    final_count: int = 0
+    failed_count: int = 0
+
+
+class STTEngineBase(ABC):
+    """
+    STT 识别引擎抽象基类
+
+    子类实现 _start/_feed/_finish/_abort，并通过 _emit_partial/_emit_final 交回结果；
+    基类负责话语编号、部分结果去重，以及保证每次话语恰好交回一条最终结果。
+    """
+
+    name: str = "base"
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        sample_rate: int,
+        on_hypothesis: Callable[[SpeechHypothesis], None],
+    ):
+        """
+        Args:
+            config: 引擎配置
+            sample_rate: 输入音频采样率（int16 单声道 PCM）
+            on_hypothesis: 识别结果回调（在事件循环线程中调用）
+        """
+        self.config = config
+        self.sample_rate = sample_rate
+        self.stats = STTEngineStats()
+        self.logger = get_logger(self.__class__.__name__)
+        self._on_hypothesis = on_hypothesis
+        self._utterance_id = 0
+        self._utterance_started: Optional[float] = None
+        self._last_partial = ""
+        self._final_emitted = True
+
+    @property
+    def utterance_id(self) -> int:
+        """当前（或最近一次）话语序号"""
+        return self._utterance_id
+
+    @property
+    def in_utterance(self) -> bool:
+        """是否有进行中的话语"""
+        return self._utterance_started is not None
+
+    async def setup(self) -> None:
+        """加载模型、检查依赖（失败时抛出异常）"""
+        return None
+
+    async def cleanup(self) -> None:
+        """释放连接和模型"""
+        await self.abort_utterance()
+
+    async def start_utterance(self) -> bool:
+        """开始一次话语，返回 False 表示引擎不可用（本次话语不会有任何结果）"""
+        if self.in_utterance:
+            await self.abort_utterance()
+        self._utterance_id += 1
+        self._utterance_started = time.monotonic()
+        self._last_partial = ""
+        self._final_emitted = False
+        self.stats.utterance_count += 1
+        try:
+            started = await self._start(self._utterance_id)
+        except Exception as e:
+            self.logger.opt(exception=e).error(f"开始识别失败: {e}")
+            started = False
+        if not started:
+            self.stats.failed_count += 1
+            self._utterance_started = None
+            self._final_emitted = True
+        return started
+
+    async def feed(self, audio: bytes) -> None:
+        """送入一帧 int16 PCM"""
+        if not self.in_utterance:
+            return
+        await self._feed(self._utterance_id, audio)
+
+    async def finish_utterance(self) -> None:
+        """话语结束，等待最终结果交回"""
+        if not self.in_utterance:
+            return
+        utterance_id = self._utterance_id
+        try:
+            await self._finish(utterance_id)
+        except Exception as e:
+            self.logger.opt(exception=e).error(f"结束识别失败: {e}")
+        self._emit_final(utterance_id, "")
+        self._utterance_started = None
+
+    async def abort_utterance(self) -> None:
+        """放弃当前话语（交回空的最终结果）"""
+        if not self.in_utterance:
+            return
+        utterance_id = self._utterance_id
+        try:
+            await self._abort(utterance_id)
+        except Exception as e:
+            self.logger.warning(f"放弃识别时出错: {e}")
+        self._emit_final(utterance_id, "")
+        self._utterance_started = None
+
+    @abstractmethod
+    async def _start(self, utterance_id: int) -> bool:
+        """建立连接或识别流"""
+
+    @abstractmethod
+    async def _feed(self, utterance_id: int, audio: bytes) -> None:
+        """送入音频，出错时自行记录日志（之后的 feed 可以直接忽略）"""
+
+    @abstractmethod
+    async def _finish(self, utterance_id: int) -> None:
+        """送完音频并等待最终结果（期间调用 _emit_final）"""
+
+    @abstractmethod
+    async def _abort(self, utterance_id: int) -> None:
+        """丢弃识别流，不再交回结果"""
+
+    def _emit_partial(self, utterance_id: int, text: str) -> None:
+        """交回部分结果（过期话语和未变化的文本会被忽略）"""
+        text = text.strip()
+        if utterance_id != self._utterance_id or self._final_emitted or not text or text == self._last_partial:
+            return
+        self._last_partial = text
+        self.stats.partial_count += 1
+        self._deliver(SpeechHypothesis(text, False, utterance_id, self.name, self._elapsed_ms()))
+
+    def _emit_final(self, utterance_id: int, text: str) -> None:
+        """交回最终结果（每次话语只交回第一条）"""
+        if utterance_id != self._utterance_id or self._final_emitted:
+            return
+        text = text.strip()
+        self._final_emitted = True
+        if text:
+            self.stats.final_count += 1
+        else:
+            self.stats.failed_count += 1
+        self._deliver(SpeechHypothesis(text, True, utterance_id, self.name, self._elapsed_ms()))
+
+    def _elapsed_ms(self) -> float:
+        if self._utterance_started is None:
+            return 0.0
+        return (time.monotonic() - self._utterance_started) * 1000
+
+    def _deliver(self, hypothesis: SpeechHypothesis) -> None:
+        try:
+            self._on_hypothesis(hypothesis)
+        except Exception as e:
+            self.logger.opt(exception=e).error(f"处理识别结果出错: {e}")
@@ -0,0 +1,55 @@
+"""
+确定性的假识别引擎
+
+不做任何识别：第 N 次话语对应 transcripts 中的第 N 条文本（循环使用），
+每送入 frames_per_partial 帧音频就多"识别"出 chars_per_partial 个字作为部分结果，
+结束时交回完整文本。结果只取决于配置和送入的帧数，用于测试和离线调试整条 STT 链路。
+"""
+
+from typing import Any, Callable, Dict, List
+
+from .base import SpeechHypothesis, STTEngineBase
+
+
+class FakeEngine(STTEngineBase):
+    """确定性的假识别引擎"""
+
+    name = "fake"
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        sample_rate: int,
+        on_hypothesis: Callable[[SpeechHypothesis], None],
+    ):
+        super().__init__(config, sample_rate, on_hypothesis)
+        self.transcripts: List[str] = list(config.get("transcripts") or [])
+        self.frames_per_partial = max(1, int(config.get("frames_per_partial", 3)))
+        self.chars_per_partial = max(1, int(config.get("chars_per_partial", 2)))
+        self.fail_utterances = set(config.get("fail_utterances") or [])
+        self.fed_frames = 0
+        self.fed_bytes = 0
+
+    def transcript_for(self, utterance_id: int) -> str:
+        """第 utterance_id 次话语的完整文本"""
+        if not self.transcripts:
+            return ""
+        return self.transcripts[(utterance_id - 1) % len(self.transcripts)]
+
+    async def _start(self, utterance_id: int) -> bool:
+        self.fed_frames = 0
+        self.fed_bytes = 0
+        return utterance_id not in self.fail_utterances
+
+    async def _feed(self, utterance_id: int, audio: bytes) -> None:
+        self.fed_frames += 1
+        self.fed_bytes += len(audio)
+        if self.fed_frames % self.frames_per_partial == 0:
+            revealed = self.fed_frames // self.frames_per_partial * self.chars_per_partial
+            self._emit_partial(utterance_id, self.transcript_for(utterance_id)[:revealed])
+
+    async def _finish(self, utterance_id: int) -> None:
+        self._emit_final(utterance_id, self.transcript_for(utterance_id))
+
+    async def _abort(self, utterance_id: int) -> None:
+        pass
@@ -0,0 +1,253 @@
+"""
+讯飞流式语音听写引擎
+
+每次话语建立一条 WebSocket 连接：第一帧带业务参数，之后逐帧发送音频，话语结束时发送结束帧并等待最终结果。
+开启动态修正（dwa=wpgs）后，讯飞在说话过程中持续返回识别结果，后一条结果可能替换前面几条（pgs=rpl），
+WpgsTranscript 负责按序号拼接，拼接后的文本作为部分结果交回。
+"""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import ssl
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from .base import SpeechHypothesis, STTEngineBase
+
+STATUS_FIRST_FRAME = 0
+STATUS_CONTINUE_FRAME = 1
+STATUS_LAST_FRAME = 2
+
+
+class WpgsTranscript:
+    """
+    讯飞识别结果拼接
+
+    每条结果带序号 sn；pgs="rpl" 时先删除 rg=[起, 止] 范围内的旧结果再写入，
+    pgs="apd" 或未开启动态修正时直接追加。
+    """
+
+    def __init__(self):
+        self._segments: Dict[int, str] = {}
+
+    def apply(self, result: Dict[str, Any]) -> str:
+        """合并一条 data.result，返回当前完整文本"""
+        # cw 是同一个词的候选列表，只取第一个候选
+        text = "".join(w["cw"][0].get("w", "") for w in result.get("ws", []) if w.get("cw"))
+        sn = result.get("sn", max(self._segments, default=0) + 1)
+        if result.get("pgs") == "rpl":
+            start, end = result.get("rg", [sn, sn])
+            for key in range(start, end + 1):
+                self._segments.pop(key, None)
+        self._segments[sn] = text
+        return self.text
+
+    @property
+    def text(self) -> str:
+        return "".join(self._segments[key] for key in sorted(self._segments))
+
+
+class IflytekEngine(STTEngineBase):
+    """讯飞流式语音听写（WebSocket）"""
+
+    name = "iflytek"
+
+    FINAL_TIMEOUT = 2.0
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        sample_rate: int,
+        on_hypothesis: Callable[[SpeechHypothesis], None],
+    ):
+        super().__init__(config, sample_rate, on_hypothesis)
+        self.aiohttp = None
+        self._session = None
+        self._ws = None
+        self._receiver_task: Optional[asyncio.Task] = None
+        self._frames_sent = 0
+        self._failed = False
+
+    async def setup(self) -> None:
+        try:
+            import aiohttp
+        except ImportError as e:
+            raise RuntimeError("讯飞识别引擎缺少依赖: aiohttp。请运行 'pip install aiohttp'") from e
+        self.aiohttp = aiohttp
+
+        if not all(self.config.get(key) for key in ("appid", "api_key", "api_secret")):
+            raise ValueError("讯飞配置缺少必要字段 (appid / api_key / api_secret)")
+
+    async def cleanup(self) -> None:
+        await super().cleanup()
+        if self._session and not self._session.closed:
+            await self._session.close()
+            self.logger.info("aiohttp session 已关闭")
+        self._session = None
+
+    async def _start(self, utterance_id: int) -> bool:
+        await self._close(send_last_frame=False)
+        self._frames_sent = 0
+        self._failed = False
+
+        if not self._session or self._session.closed:
+            self._session = self.aiohttp.ClientSession()
+            self.logger.info("已创建新的 aiohttp session")
+
+        try:
+            self.logger.debug("连接到讯飞 WebSocket...")
+            self._ws = await self._session.ws_connect(
+                self._build_auth_url(),
+                autoping=True,
+                heartbeat=30,
+                ssl=ssl.create_default_context(),
+            )
+        except Exception as e:
+            self.logger.opt(exception=e).error(f"建立讯飞连接失败: {e}")
+            self._ws = None
+            return False
+
+        self.logger.debug("成功连接到讯飞 WebSocket")
+        self._receiver_task = asyncio.create_task(self._receiver(self._ws, utterance_id))
+        return True
+
+    async def _feed(self, utterance_id: int, audio: bytes) -> None:
+        if self._failed or self._ws is None or self._ws.closed:
+            return
+        status = STATUS_FIRST_FRAME if self._frames_sent == 0 else STATUS_CONTINUE_FRAME
+        try:
+            await asyncio.wait_for(self._ws.send_bytes(self._build_frame(status, audio)), timeout=1.0)
+            self._frames_sent += 1
+        except Exception as e:
+            self.logger.opt(exception=e).error(f"发送音频帧失败: {e}")
+            self._failed = True
+            await self._close(send_last_frame=False)
+
+    async def _finish(self, utterance_id: int) -> None:
+        await self._close(send_last_frame=self._frames_sent > 0 and not self._failed)
+
+    async def _abort(self, utterance_id: int) -> None:
+        await self._close(send_last_frame=False)
+
+    async def _close(self, send_last_frame: bool) -> None:
+        """关闭连接；send_last_frame 时先发送结束帧并等待接收器收到最终结果"""
+        ws, receiver_task = self._ws, self._receiver_task
+        self._ws = None
+        self._receiver_task = None
+
+        try:
+            if ws is not None and not ws.closed and send_last_frame:
+                try:
+                    await asyncio.wait_for(ws.send_bytes(self._build_frame(STATUS_LAST_FRAME)), timeout=2.0)
+                    self.logger.debug("已发送结束帧")
+                except Exception as e:
+                    self.logger.warning(f"发送结束帧失败: {e}")
+                if receiver_task is not None and not receiver_task.done():
+                    try:
+                        await asyncio.wait_for(asyncio.shield(receiver_task), timeout=self.FINAL_TIMEOUT)
+                    except asyncio.TimeoutError:
+                        self.logger.warning(f"{self.FINAL_TIMEOUT}s 内未收到讯飞最终结果")
+            if ws is not None and not ws.closed:
+                await ws.close()
+        except Exception as e:
+            self.logger.opt(exception=e).error(f"关闭讯飞连接出错: {e}")
+        finally:
+            if receiver_task is not None and not receiver_task.done():
+                receiver_task.cancel()
+
+    async def _receiver(self, ws, utterance_id: int) -> None:
+        """接收讯飞 WebSocket 消息，交回部分结果和最终结果"""
+        transcript = WpgsTranscript()
+        try:
+            async for msg in ws:
+                if msg.type == self.aiohttp.WSMsgType.TEXT:
+                    resp = json.loads(msg.data)
+                    if resp.get("code", -1) != 0:
+                        self.logger.error(f"讯飞 API 错误: Code={resp.get('code')}, Message={resp.get('message', '')}")
+                        break
+
+                    data = resp.get("data", {})
+                    text = transcript.apply(data.get("result", {}))
+                    if data.get("status", -1) == STATUS_LAST_FRAME:
+                        self.logger.debug(f"讯飞识别结果: '{text}'")
+                        self._emit_final(utterance_id, text)
+                        break
+                    self._emit_partial(utterance_id, text)
+
+                elif msg.type == self.aiohttp.WSMsgType.ERROR:
+                    self.logger.error(f"讯飞 WebSocket 错误: {ws.exception() or 'unknown'}")
+                    break
+
+                elif msg.type == self.aiohttp.WSMsgType.CLOSED:
+                    self.logger.warning(f"讯飞连接已关闭: Code={ws.close_code}")
+                    break
+
+        except asyncio.CancelledError:
+            self.logger.debug("讯飞接收器任务被取消")
+        except json.JSONDecodeError:
+            self.logger.error("无法解码讯飞 JSON 响应")
+        except Exception as e:
+            self.logger.opt(exception=e).error(f"讯飞接收器任务异常: {e}")
+
+    def _build_auth_url(self) -> str:
+        """构建讯飞认证 URL"""
+        cfg = self.config
+
+        host = cfg.get("host", "iat-api.xfyun.com")
+        path = cfg.get("path", "/v2/iat")
+
+        if not all([host, path, cfg.get("api_secret"), cfg.get("api_key")]):
+            raise ValueError("讯飞配置缺少必要字段")
+
+        url = f"wss://{host}{path}"
+
+        date = datetime.utcnow().strftime("%a, %d %b %Y %H:%M:%S GMT")
+        signature_origin = f"host: {host}\ndate: {date}\nGET {path} HTTP/1.1"
+
+        signature_sha = hmac.new(
+            cfg["api_secret"].encode("utf-8"), signature_origin.encode("utf-8"), digestmod=hashlib.sha256
+        ).digest()
+        signature_sha_base64 = base64.b64encode(signature_sha).decode(encoding="utf-8")
+
+        authorization_origin = (
+            f'api_key="{cfg["api_key"]}", algorithm="hmac-sha256", '
+            f'headers="host date request-line", signature="{signature_sha_base64}"'
+        )
+        authorization = base64.b64encode(authorization_origin.encode("utf-8")).decode(encoding="utf-8")
+
+        self.logger.debug(f"讯飞认证 - host: {host}, path: {path}, date: {date}")
+
+        params = f"authorization={authorization}&date={date}&host={host}"
+        return url + "?" + params
+
+    def _build_frame(self, status: int, audio_chunk_bytes: bytes = b"") -> bytes:
+        """构建讯飞帧（语音听写流式版 API 格式）"""
+        data = {
+            "status": status,
+            "format": f"audio/L16;rate={self.sample_rate}",
+            "encoding": "raw",
+            "audio": base64.b64encode(audio_chunk_bytes).decode("utf-8") if audio_chunk_bytes else "",
+        }
+        if status != STATUS_FIRST_FRAME:
+            return json.dumps({"data": data}).encode("utf-8")
+
+        business = {
+            "language": self.config.get("language", "zh_cn"),
+            "阶段": self.config.get("阶段", "iat"),
+            "accent": self.config.get("accent", "mandarin"),
+            "vad_eos": self.config.get("vad_eos", 1000),
+        }
+        # 动态修正：说话过程中持续返回识别结果（部分结果）
+        if self.config.get("dwa"):
+            business["dwa"] = self.config["dwa"]
+
+        frame = {
+            "common": {"app_id": str(self.config["appid"])},
+            "business": business,
+            "data": data,
+        }
+        self.logger.debug(f"发送第一帧: common={frame['common']}, business={frame['business']}")
+        return json.dumps(frame).encode("utf-8")
@@ -0,0 +1,137 @@
+"""
+本地流式识别引擎（sherpa-onnx）
+
+模型在本机 CPU 上运行，不需要网络：每送入一帧音频就解码一次，文本变化时交回部分结果，
+话语结束时冲刷剩余音频得到最终结果，省去每次话语的网络往返。
+
+识别流只在一个专用线程中访问（单线程执行器按提交顺序执行），feed() 只提交任务不等待，
+解码再慢也不会阻塞事件循环或 VAD 状态机；finish_utterance() 等待之前提交的音频全部解码完。
+
+依赖: pip install sherpa-onnx，并下载流式模型（paraformer 或 zipformer transducer），
+例如 sherpa-onnx-streaming-paraformer-bilingual-zh-en。
+"""
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+from .base import SpeechHypothesis, STTEngineBase
+
+# sherpa-onnx 流式模型的特征采样率，输入音频由 accept_waveform 重采样
+MODEL_SAMPLE_RATE = 16000
+
+
+class LocalEngine(STTEngineBase):
+    """本地流式识别（sherpa-onnx OnlineRecognizer）"""
+
+    name = "local"
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        sample_rate: int,
+        on_hypothesis: Callable[[SpeechHypothesis], None],
+    ):
+        super().__init__(config, sample_rate, on_hypothesis)
+        self._recognizer = None
+        self._stream = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def setup(self) -> None:
+        try:
+            import sherpa_onnx
+        except ImportError as e:
+            raise RuntimeError("本地识别引擎缺少依赖: sherpa-onnx。请运行 'pip install sherpa-onnx'") from e
+
+        self._loop = asyncio.get_running_loop()
+        self.logger.info(f"加载本地识别模型 ({self.config.get('model_type', 'paraformer')})...")
+        self._recognizer = await asyncio.to_thread(self._create_recognizer, sherpa_onnx)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="STT-Local")
+        self.logger.info("本地识别模型加载完成")
+
+    async def cleanup(self) -> None:
+        await super().cleanup()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._recognizer = None
+
+    def _create_recognizer(self, sherpa_onnx):
+        cfg = self.config
+        common = {
+            "tokens": cfg["tokens"],
+            "num_threads": cfg.get("num_threads", 2),
+            "sample_rate": MODEL_SAMPLE_RATE,
+            "feature_dim": 80,
+            "decoding_method": cfg.get("decoding_method", "greedy_search"),
+            "provider": cfg.get("provider", "cpu"),
+        }
+        if cfg.get("model_type", "paraformer") == "transducer":
+            return sherpa_onnx.OnlineRecognizer.from_transducer(
+                encoder=cfg["encoder"], decoder=cfg["decoder"], joiner=cfg["joiner"], **common
+            )
+        return sherpa_onnx.OnlineRecognizer.from_paraformer(encoder=cfg["encoder"], decoder=cfg["decoder"], **common)
+
+    async def _start(self, utterance_id: int) -> bool:
+        if self._recognizer is None or self._executor is None:
+            self.logger.error("本地识别模型未加载")
+            return False
+        self._submit(self._open_stream)
+        return True
+
+    async def _feed(self, utterance_id: int, audio: bytes) -> None:
+        self._submit(self._decode, utterance_id, audio)
+
+    async def _finish(self, utterance_id: int) -> None:
+        text = await asyncio.wrap_future(self._submit(self._close_stream))
+        self._emit_final(utterance_id, text)
+
+    async def _abort(self, utterance_id: int) -> None:
+        if self._executor is not None:
+            self._submit(self._drop_stream)
+
+    def _submit(self, fn, *args) -> Future:
+        return self._executor.submit(fn, *args)
+
+    # ---- 以下方法只在识别线程中执行 ----
+
+    def _open_stream(self) -> None:
+        self._stream = self._recognizer.create_stream()
+
+    def _decode(self, utterance_id: int, audio: bytes) -> None:
+        if self._stream is None:
+            return
+        try:
+            samples = np.frombuffer(audio, dtype=np.int16).astype(np.float32) / 32768.0
+            self._stream.accept_waveform(self.sample_rate, samples)
+            text = self._decode_ready()
+        except Exception as e:
+            self.logger.opt(exception=e).error(f"本地识别解码出错: {e}")
+            self._stream = None
+            return
+        self._loop.call_soon_threadsafe(self._emit_partial, utterance_id, text)
+
+    def _close_stream(self) -> str:
+        if self._stream is None:
+            return ""
+        try:
+            self._stream.input_finished()
+            return self._decode_ready()
+        except Exception as e:
+            self.logger.opt(exception=e).error(f"本地识别解码出错: {e}")
+            return ""
+        finally:
+            self._stream = None
+
+    def _drop_stream(self) -> None:
+        self._stream = None
+
+    def _decode_ready(self) -> str:
+        while self._recognizer.is_ready(self._stream):
+            self._recognizer.decode_stream(self._stream)
+        result = self._recognizer.get_result(self._stream)
+        # 新版本返回 str，旧版本返回带 text 属性的对象
+        return result if isinstance(result, str) else result.text
@@ -1,34 +1,29 @@
 """
 STTCollector - 语音转文字输入Collector
 
-使用讯飞流式 ASR 和 Silero VAD 实现实时语音转文字。
+使用 Silero VAD 断句，识别交给可替换的 STT 引擎（讯飞流式 ASR / 本地 sherpa-onnx / 假引擎，见 engines/）。
 """
 
 from __future__ import annotations
 
 import asyncio
-import base64
-import hashlib
-import hmac
-import json
+import math
 import os
-import ssl
 import time
-from datetime import datetime
-from typing import Any, AsyncIterator, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional, Set
 
 import numpy as np
 
 from src.stages.input.registry import collector
 from src.modules.events.event_bus import EventBus
+from src.modules.events.names import CoreEvents
+from src.modules.events.payloads.input import SpeechRecognizedPayload
 from src.modules.logging import get_logger
 from src.modules.types.base.normalized_message import NormalizedMessage
 
 from .config import STTInputConfig
-
-STATUS_FIRST_FRAME = 0
-STATUS_CONTINUE_FRAME = 1
-STATUS_LAST_FRAME = 2
+from .engines import SpeechHypothesis, STTEngineBase, create_engine
+from .vad_worker import EnergyGate, VadResult, VadWorker
 
 
 @collector("stt")
@@ -37,13 +32,18 @@ class STTCollector:
     语音转文字输入Collector
 
     使用 sounddevice 捕获音频，通过 VAD 判断话语起止，
-    实时发送到讯飞 ASR，生成识别的文本 NormalizedMessage。
+    实时送入 STT 引擎，生成识别的文本 NormalizedMessage。
+    音频回调把样本写入预分配的环形缓冲区（见 audio_ring.py），VAD 推理在专用工作线程中进行（见 vad_worker.py），
+    不阻塞事件循环；话语开始时从缓冲区取回之前 preroll_ms 的音频先送入引擎，避免句首被截断。
+
+    说话过程中引擎交回的部分结果以 input.speech.recognized 事件发布（partial_results 配置），
+    下游可以在说话结束前开始准备回复；最终结果照常作为 NormalizedMessage 产出。
 
     支持特性:
     - 本地麦克风输入
     - 远程音频流 (RemoteStream)
-    - Silero VAD 语音活动检测
-    - 讯飞流式 ASR
+    - Silero VAD 语音活动检测（工作线程推理 + 能量门限跳过静音帧）
+    - 可替换的流式识别引擎：讯飞（iflytek）、本地 sherpa-onnx（local）、确定性假引擎（fake）
     - 自定义 torch 缓存目录（避免 Windows 中文用户名问题）
     """
 
@@ -74,7 +74,8 @@ class STTCollector:
             self.logger.error(f"配置验证失败: {e}")
             raise
 
-        self.iflytek_config = self.typed_config.iflytek_asr.model_dump()
+        self.engine_name = self.typed_config.engine
+        self.partial_results = self.typed_config.partial_results
         self.vad_config = self.typed_config.vad.model_dump()
         self.audio_config = self.typed_config.audio.model_dump()
         self.message_config = self.typed_config.message_config.model_dump()
@@ -103,6 +104,8 @@ class STTCollector:
             self.block_size_samples = 512
 
         self.block_size_ms = int(self.block_size_samples * 1000 / self.sample_rate)
+        frame_ms = self.block_size_samples * 1000 / self.sample_rate
+        self.preroll_frames = math.ceil(self.vad_config.get("preroll_ms", 300) / frame_ms)
 
         self.use_remote_stream = self.audio_config.get("use_remote_stream", False)
         self.remote_stream_service = None
@@ -110,28 +113,31 @@ class STTCollector:
 
         self._check_dependencies()
 
+        self._engine: STTEngineBase = create_engine(
+            self.engine_name, self._build_engine_config(), self.sample_rate, self._on_hypothesis
+        )
+
         self.vad_model = None
         self.vad_utils = None
 
         if self.vad_enabled:
             self._load_vad_model()
 
-        self._session = None
-        self._active_ws = None
-        self._active_receiver_task = None
-        self._internal_audio_queue = None
+        self._emit_tasks: Set[asyncio.Task] = set()
+        self._vad_worker: Optional[VadWorker] = None
+        self._vad_result_queue = None
         self._result_queue = None
+        self._speech_chunk_count = 0
+        self._last_fed_seq = -1
 
         self._is_speaking: bool = False
         self._silence_started_time: Optional[float] = None
-        self.full_text = ""
-        self._last_audio_chunk: Optional[bytes] = None
 
         self.is_started = False
 
         self.logger.info(
             f"STTCollector 初始化完成. "
-            f"VAD={self.vad_enabled}, Remote={self.use_remote_stream}, "
+            f"Engine={self.engine_name}, VAD={self.vad_enabled}, Remote={self.use_remote_stream}, "
             f"SampleRate={self.sample_rate}"
         )
 
@@ -153,17 +159,18 @@ class STTCollector:
             self.logger.error("缺少依赖: sounddevice。请运行 'pip install sounddevice'")
             self.sd = None
 
-        try:
-            import aiohttp
-
-            self.aiohttp = aiohttp
-        except ImportError:
-            self.logger.error("缺少依赖: aiohttp。请运行 'pip install aiohttp'")
-            self.aiohttp = None
-
-        if not all([self.torch, self.sd, self.aiohttp]):
+        if not all([self.torch, self.sd]):
             raise RuntimeError("STTCollector 缺少核心依赖，无法初始化")
 
+    def _build_engine_config(self) -> Dict[str, Any]:
+        """所选引擎的配置字典"""
+        if self.engine_name == "iflytek":
+            # 讯飞服务端也做端点检测，与本地 VAD 的静音阈值保持一致
+            return {**self.typed_config.iflytek_asr.model_dump(), "vad_eos": self.min_silence_duration_ms}
+        if self.engine_name == "local":
+            return self.typed_config.local_asr.model_dump()
+        return self.typed_config.fake_asr.model_dump()
+
     def _load_vad_model(self) -> None:
         """加载 Silero VAD 模型"""
         try:
@@ -236,15 +243,14 @@ class STTCollector:
     async def cleanup(self) -> None:
         self.logger.info("清理 STTCollector 资源...")
 
-        if self._session and not self._session.closed:
-            await self._session.close()
-            self.logger.info("aiohttp session 已关闭")
-            self._session = None
+        await self._engine.cleanup()
+        if self._emit_tasks:
+            await asyncio.gather(*self._emit_tasks, return_exceptions=True)
 
-        self._active_ws = None
-        self._active_receiver_task = None
         self._is_speaking = False
         self._silence_started_time = None
+        self._speech_chunk_count = 0
+        self._last_fed_seq = -1
 
         self.logger.info("STTCollector 清理完成")
 
@@ -254,37 +260,38 @@ class STTCollector:
             self.logger.error("VAD 未启用或模型未加载，无法运行")
             return
 
+        try:
+            await self._engine.setup()
+        except Exception as e:
+            self.logger.opt(exception=e).error(f"STT 引擎 {self.engine_name} 初始化失败: {e}")
+            return
+
         loop = asyncio.get_event_loop()
         stream = None
-        self._internal_audio_queue = asyncio.Queue()
+        self._vad_result_queue = asyncio.Queue()
         self._result_queue = asyncio.Queue()
+        self._speech_chunk_count = 0
+        # 新的环形缓冲区序号从 0 开始，已送出帧的序号不能沿用上一次采集的
+        self._last_fed_seq = -1
+
+        # VAD 推理在工作线程中进行，结果按批交回事件循环
+        self._vad_worker = self._create_vad_worker(
+            lambda results: loop.call_soon_threadsafe(self._vad_result_queue.put_nowait, results)
+        )
+        self._vad_worker.start()
 
         input_device_index = self._find_device_index(self.input_device_name, kind="input")
 
         def audio_callback(indata, frame_count, time_info, status):
-            """sounddevice 音频回调"""
+            """sounddevice 音频回调（在音频线程中把第一声道原地写入环形缓冲区，不分配缓冲区）"""
             if status:
+                if status.input_overflow:
+                    self._vad_worker.ring.stats.input_overflow_count += 1
                 self.logger.warning(f"音频输入状态: {status}")
 
             try:
-                if indata.dtype == np.float32:
-                    indata_int16 = (indata * 32767.0).astype(np.int16)
-                elif indata.dtype == np.int16:
-                    indata_int16 = indata
-                else:
-                    indata_int16 = indata.astype(np.int16)
-
-                if indata_int16.ndim > 1 and self.channels == 1:
-                    audio_bytes = indata_int16[:, 0].tobytes()
-                elif indata_int16.ndim == 1 and self.channels == 1:
-                    audio_bytes = indata_int16.tobytes()
-                else:
-                    audio_bytes = indata_int16[:, 0].tobytes() if indata_int16.ndim > 1 else indata_int16.tobytes()
-
-                loop.call_soon_threadsafe(self._internal_audio_queue.put_nowait, audio_bytes)
-
-            except asyncio.QueueFull:
-                pass
+                self._vad_worker.submit(indata)
+
             except Exception as e:
                 self.logger.error(f"音频回调出错: {e}", exc_info=True)
 
@@ -304,17 +311,15 @@ class STTCollector:
             else:
                 self.logger.info(f"使用远程音频流模式 (VAD 阈值: {self.vad_threshold})")
 
-            speech_chunk_count = 0
             timeout_duration = max(0.1, self.min_silence_duration_ms / 1000.0 * 0.8)
 
             while self.is_started:
                 try:
-                    audio_chunk_bytes = await asyncio.wait_for(
-                        self._internal_audio_queue.get(), timeout=timeout_duration
-                    )
-                    self._internal_audio_queue.task_done()
+                    vad_results = await asyncio.wait_for(self._vad_result_queue.get(), timeout=timeout_duration)
 
                 except asyncio.TimeoutError:
+                    # 没有音频帧（远程音频流中断等）：按静音处理
+                    vad_results = []
                     if self._is_speaking:
                         self._is_speaking = False
                         self._silence_started_time = time.monotonic()
@@ -322,100 +327,17 @@ class STTCollector:
                     if self._silence_started_time is not None and (
                         time.monotonic() - self._silence_started_time > self.min_silence_duration_ms / 1000.0
                     ):
-                        if self._active_ws:
+                        if self._engine.in_utterance:
                             self.logger.debug(f"静音超过阈值 ({self.min_silence_duration_ms}ms)，结束话语")
-                            if speech_chunk_count > 0:
-                                await self._close_iflytek_connection(send_last_frame=True)
-                            else:
-                                await self._close_iflytek_connection(send_last_frame=False)
-                            speech_chunk_count = 0
+                            await self._end_utterance()
                             self._is_speaking = False
                         self._silence_started_time = None
-                    continue
 
                 except asyncio.CancelledError:
                     break
 
-                try:
-                    audio_np = np.frombuffer(audio_chunk_bytes, dtype=np.int16)
-                    audio_float32 = audio_np.astype(np.float32) / 32768.0
-
-                    if audio_float32.ndim == 0 or audio_float32.size == 0:
-                        continue
-
-                    audio_tensor = self.torch.from_numpy(audio_float32)
-                    speech_prob = self.vad_model(audio_tensor, self.sample_rate).item()
-                    is_speech = speech_prob > self.vad_threshold
-
-                except Exception as e:
-                    self.logger.error(f"VAD 处理出错: {e}", exc_info=True)
-                    continue
-
-                now = time.monotonic()
-
-                if is_speech:
-                    if not self._is_speaking:
-                        self.logger.debug(f"VAD: 话语开始 (Prob: {speech_prob:.2f})")
-                        self._is_speaking = True
-                        self._silence_started_time = None
-                        speech_chunk_count = 0
-
-                        if not await self._ensure_iflytek_connection():
-                            self.logger.error("无法建立讯飞连接")
-                            self._is_speaking = False
-                            continue
-
-                        if self._active_ws:
-                            try:
-                                first_frame = self._build_iflytek_frame(STATUS_FIRST_FRAME, audio_chunk_bytes)
-                                await asyncio.wait_for(self._active_ws.send_bytes(first_frame), timeout=2.0)
-                                speech_chunk_count += 1
-                                self.logger.debug("已发送第一帧")
-                            except Exception as e:
-                                self.logger.error(f"发送第一帧失败: {e}", exc_info=True)
-                                await self._close_iflytek_connection(send_last_frame=False)
-                                self._is_speaking = False
-                                speech_chunk_count = 0
-                                continue
-
-                    elif speech_chunk_count > 0 and self._active_ws and not self._active_ws.closed:
-                        try:
-                            data_frame = self._build_iflytek_frame(STATUS_CONTINUE_FRAME, audio_chunk_bytes)
-                            await asyncio.wait_for(self._active_ws.send_bytes(data_frame), timeout=1.0)
-                            speech_chunk_count += 1
-                            self._last_audio_chunk = audio_chunk_bytes
-                        except Exception as e:
-                            self.logger.error(f"发送音频帧失败: {e}", exc_info=True)
-                            await self._close_iflytek_connection(send_last_frame=False)
-                            self._is_speaking = False
-                            speech_chunk_count = 0
-
-                else:
-                    if self._is_speaking:
-                        self.logger.debug("VAD: 话语结束 (静音检测)")
-                        self._is_speaking = False
-                        self._silence_started_time = now
-
-                        if self._active_ws and not self._active_ws.closed:
-                            try:
-                                data_frame = self._build_iflytek_frame(STATUS_CONTINUE_FRAME, audio_chunk_bytes)
-                                await asyncio.wait_for(self._active_ws.send_bytes(data_frame), timeout=1.0)
-                            except Exception as e:
-                                self.logger.error(f"发送静音帧失败: {e}", exc_info=True)
-                                await self._close_iflytek_connection(send_last_frame=False)
-                                self._silence_started_time = None
-                                speech_chunk_count = 0
-
-                    elif self._silence_started_time is not None:
-                        if now - self._silence_started_time > self.min_silence_duration_ms / 1000.0:
-                            if self._active_ws:
-                                self.logger.debug(f"静音阈值已达到 ({self.min_silence_duration_ms}ms)，结束话语")
-                                if speech_chunk_count > 0:
-                                    await self._close_iflytek_connection(send_last_frame=True)
-                                else:
-                                    await self._close_iflytek_connection(send_last_frame=False)
-                                speech_chunk_count = 0
-                            self._silence_started_time = None
+                for vad_result in vad_results:
+                    await self._handle_vad_result(vad_result)
 
                 try:
                     while not self._result_queue.empty():
@@ -439,261 +361,144 @@ class STTCollector:
                 except Exception as e:
                     self.logger.error(f"停止麦克流出错: {e}", exc_info=True)
 
-            await self._close_iflytek_connection(send_last_frame=False)
-
-    async def _ensure_iflytek_connection(self) -> bool:
-        """确保讯飞 WebSocket 连接存在"""
-        if self._active_ws and not self._active_ws.closed:
-            if self._active_receiver_task and not self._active_receiver_task.done():
-                return True
-            else:
-                self.logger.warning("WebSocket 存在但接收器任务未运行，重新连接")
-                await self._close_iflytek_connection(send_last_frame=False)
-
-        if not self._session or self._session.closed:
-            try:
-                self._session = self.aiohttp.ClientSession()
-                self.logger.info("已创建新的 aiohttp session")
-            except Exception as e:
-                self.logger.error(f"创建 aiohttp session 失败: {e}", exc_info=True)
-                return False
-
-        try:
-            auth_url = self._build_iflytek_auth_url()
-            self.logger.debug("连接到讯飞 WebSocket...")
-
-            ssl_context = ssl.create_default_context()
-            self._active_ws = await self._session.ws_connect(
-                auth_url,
-                autoping=True,
-                heartbeat=30,
-                ssl=ssl_context,
+            await asyncio.to_thread(self._vad_worker.stop)
+            stats = self._vad_worker.stats
+            ring_stats = self._vad_worker.ring.stats
+            self.logger.info(
+                f"VAD 统计: 帧={ring_stats.written_count}, 门限跳过={stats.gated_count}, 推理={stats.inferred_count}, "
+                f"最大批次={stats.max_batch}, 缓冲区溢出丢帧={ring_stats.overrun_count}, "
+                f"设备输入溢出={ring_stats.input_overflow_count}, 预录缺帧={ring_stats.stale_read_count}"
             )
-            self.logger.info("成功连接到讯飞 WebSocket")
-
-            if self._active_receiver_task and not self._active_receiver_task.done():
-                self._active_receiver_task.cancel()
-                try:
-                    await asyncio.wait_for(self._active_receiver_task, timeout=1.0)
-                except (asyncio.CancelledError, asyncio.TimeoutError):
-                    pass
-
-            self._active_receiver_task = asyncio.create_task(self._iflytek_receiver(self._active_ws))
-            self.logger.info("已启动讯飞接收器任务")
-            return True
 
-        except Exception as e:
-            self.logger.error(f"建立讯飞连接失败: {e}", exc_info=True)
-            if self._active_ws and not self._active_ws.closed:
-                await self._active_ws.close()
-            self._active_ws = None
-            if self._active_receiver_task and not self._active_receiver_task.done():
-                self._active_receiver_task.cancel()
-            self._active_receiver_task = None
-            return False
-
-    async def _close_iflytek_connection(
-        self, send_last_frame: bool = True, last_audio_chunk: Optional[bytes] = None
-    ) -> None:
-        """关闭讯飞 WebSocket 连接"""
-        ws_to_close = self._active_ws
-        receiver_task_to_await = self._active_receiver_task
-
-        self._active_ws = None
-        self._active_receiver_task = None
-        self._last_audio_chunk = None
-
-        if not ws_to_close:
-            if receiver_task_to_await and not receiver_task_to_await.done():
-                receiver_task_to_await.cancel()
-            return
-
-        if ws_to_close.closed:
-            if receiver_task_to_await and not receiver_task_to_await.done():
-                receiver_task_to_await.cancel()
-            return
+            await self._engine.abort_utterance()
+            engine_stats = self._engine.stats
+            self.logger.info(
+                f"STT 引擎 {self.engine_name} 统计: 话语={engine_stats.utterance_count}, "
+                f"部分结果={engine_stats.partial_count}, 识别成功={engine_stats.final_count}, "
+                f"失败={engine_stats.failed_count}"
+            )
 
-        self.logger.debug(f"关闭讯飞连接 (发送结束帧: {send_last_frame})...")
+    def _create_vad_worker(self, deliver) -> VadWorker:
+        """按 VAD 配置创建工作线程"""
+        gate = None
+        if self.vad_config.get("energy_gate", True):
+            gate = EnergyGate(
+                rms_threshold_db=self.vad_config.get("energy_threshold_db", -50.0),
+                zcr_threshold=self.vad_config.get("zcr_threshold", 0.35),
+            )
+        return VadWorker(
+            infer=self._infer_speech_prob,
+            deliver=deliver,
+            gate=gate,
+            max_queue=self.vad_config.get("max_queue_frames", 64),
+            max_batch=self.vad_config.get("max_batch_frames", 16),
+            frame_samples=self.block_size_samples,
+            # 预录之外再留约 1 秒，事件循环处理结果稍有延迟时预录帧仍未被覆盖
+            history_frames=self.preroll_frames + self.sample_rate // self.block_size_samples,
+        )
 
-        try:
-            if send_last_frame:
-                try:
-                    audio_for_end = last_audio_chunk or self._last_audio_chunk
-                    last_frame = self._build_iflytek_frame(STATUS_LAST_FRAME, audio_for_end or b"")
-                    await asyncio.wait_for(ws_to_close.send_bytes(last_frame), timeout=2.0)
-                    self.logger.debug("已发送结束帧")
-                except Exception as e:
-                    self.logger.warning(f"发送结束帧失败: {e}")
+    def _infer_speech_prob(self, samples: np.ndarray) -> float:
+        """Silero VAD 推理（在 VAD 工作线程中调用）"""
+        with self.torch.no_grad():
+            return self.vad_model(self.torch.from_numpy(samples), self.sample_rate).item()
+
+    async def _handle_vad_result(self, vad_result: VadResult) -> None:
+        """按一帧的 VAD 结果推进话语状态，并把音频送入 STT 引擎"""
+        audio_chunk_bytes = vad_result.audio
+        speech_prob = vad_result.probability
+        is_speech = speech_prob > self.vad_threshold
+        now = time.monotonic()
+
+        if is_speech:
+            if not self._is_speaking:
+                self.logger.debug(f"VAD: 话语开始 (Prob: {speech_prob:.2f})")
+                self._is_speaking = True
+                self._silence_started_time = None
+
+                if not self._engine.in_utterance:
+                    self._speech_chunk_count = 0
+                    if not await self._engine.start_utterance():
+                        self.logger.error(f"STT 引擎 {self.engine_name} 无法开始识别")
+                        self._is_speaking = False
+                        return
 
-            if receiver_task_to_await and not receiver_task_to_await.done():
-                try:
-                    await asyncio.wait_for(receiver_task_to_await, timeout=1.0)
-                except asyncio.TimeoutError:
-                    receiver_task_to_await.cancel()
-                except Exception as e:
-                    self.logger.error(f"等待接收器任务出错: {e}", exc_info=True)
+                await self._feed_preroll(vad_result.seq)
 
-            await ws_to_close.close()
-            self.logger.debug(f"讯飞连接已关闭 (代码: {ws_to_close.close_code})")
+            await self._engine.feed(audio_chunk_bytes)
+            self._speech_chunk_count += 1
+            self._last_fed_seq = vad_result.seq
 
-        except Exception as e:
-            self.logger.error(f"关闭连接出错: {e}", exc_info=True)
-        finally:
-            if receiver_task_to_await and not receiver_task_to_await.done():
-                receiver_task_to_await.cancel()
+        else:
+            if self._is_speaking:
+                self.logger.debug("VAD: 话语结束 (静音检测)")
+                self._is_speaking = False
+                self._silence_started_time = now
+                # 话语尾部的第一帧静音也送入引擎，避免截断最后一个字
+                await self._engine.feed(audio_chunk_bytes)
+                self._last_fed_seq = vad_result.seq
+
+            elif self._silence_started_time is not None:
+                if now - self._silence_started_time > self.min_silence_duration_ms / 1000.0:
+                    if self._engine.in_utterance:
+                        self.logger.debug(f"静音阈值已达到 ({self.min_silence_duration_ms}ms)，结束话语")
+                        await self._end_utterance()
+                    self._silence_started_time = None
+
+    async def _feed_preroll(self, seq: int) -> None:
+        """
+        把检测到语音之前的几帧（最多 preroll_frames，不重复已送入的帧）从环形缓冲区取回送入引擎
 
-    async def _iflytek_receiver(self, ws) -> None:
-        """接收讯飞 WebSocket 消息并处理识别结果"""
-        self.logger.debug("讯飞接收器任务启动")
-        self.full_text = ""
-        utterance_failed = False
+        VAD 要听到一小段语音才能判定开始，这些帧已经过去了；话语中途短暂停顿后恢复时，
+        同样补上停顿末尾的音频。
+        """
+        if seq < 0 or self.preroll_frames <= 0 or not self._engine.in_utterance:
+            return
+        start = max(seq - self.preroll_frames, self._last_fed_seq + 1)
+        for audio in self._vad_worker.ring.read_range(start, seq):
+            await self._engine.feed(audio)
+
+    async def _end_utterance(self) -> None:
+        """结束当前话语：送过语音帧则等待最终结果，否则直接放弃"""
+        if self._speech_chunk_count > 0:
+            await self._engine.finish_utterance()
+        else:
+            await self._engine.abort_utterance()
+        self._speech_chunk_count = 0
+
+    def _on_hypothesis(self, hypothesis: SpeechHypothesis) -> None:
+        """STT 引擎交回识别结果（事件循环线程）"""
+        if hypothesis.is_final and hypothesis.text:
+            self.logger.debug(f"识别结果: '{hypothesis.text}' ({hypothesis.elapsed_ms:.0f}ms)")
+            self._result_queue.put_nowait(
+                NormalizedMessage(
+                    text=hypothesis.text,
+                    source="stt",
+                    data_type="text",
+                    importance=0.5,
+                    user_id=self.message_config.get("user_id") or None,
+                    user_nickname=self.message_config.get("user_nickname") or None,
+                    platform="voice",
+                )
+            )
 
+        if self.partial_results:
+            task = asyncio.create_task(self._emit_recognized(hypothesis))
+            self._emit_tasks.add(task)
+            task.add_done_callback(self._emit_tasks.discard)
+
+    async def _emit_recognized(self, hypothesis: SpeechHypothesis) -> None:
+        """发布 input.speech.recognized 事件"""
+        payload = SpeechRecognizedPayload(
+            text=hypothesis.text,
+            is_final=hypothesis.is_final,
+            utterance_id=hypothesis.utterance_id,
+            source="stt",
+            engine=hypothesis.engine,
+            elapsed_ms=hypothesis.elapsed_ms,
+            user_id=self.message_config.get("user_id") or None,
+            user_nickname=self.message_config.get("user_nickname") or None,
+        )
         try:
-            async for msg in ws:
-                if not self.is_started:
-                    break
-
-                if msg.type == self.aiohttp.WSMsgType.TEXT:
-                    try:
-                        resp = json.loads(msg.data)
-                        self.logger.debug(f"讯飞原始响应: {json.dumps(resp, ensure_ascii=False)[:500]}")
-
-                        if resp.get("code", -1) != 0:
-                            msg_content = resp.get("message", "")
-                            err_msg = f"讯飞 API 错误: Code={resp.get('code')}, Message={msg_content}"
-                            self.logger.error(err_msg)
-                            utterance_failed = True
-                            break
-
-                        data = resp.get("data", {})
-                        result_data = data.get("result", {})
-                        status = data.get("status", -1)
-
-                        if "ws" in result_data:
-                            try:
-                                for w in result_data["ws"]:
-                                    for cw in w.get("cw", []):
-                                        self.full_text += cw.get("w", "")
-                            except Exception as e:
-                                self.logger.warning(f"解析识别结果文本失败: {e}")
-
-                        self.logger.debug(
-                            f"检查最后一帧: status={status}, STATUS_LAST_FRAME={STATUS_LAST_FRAME}, full_text='{self.full_text}'"
-                        )
-                        if status == STATUS_LAST_FRAME:
-                            full_text = self.full_text.strip()
-                            self.logger.debug(f"讯飞识别结果: '{full_text}'")
-
-                            if full_text and not utterance_failed:
-                                await self._result_queue.put(
-                                    NormalizedMessage(
-                                        text=full_text,
-                                        source="stt",
-                                        data_type="text",
-                                        importance=0.5,
-                                        user_id=self.message_config.get("user_id") or None,
-                                        user_nickname=self.message_config.get("user_nickname") or None,
-                                        platform="voice",
-                                    )
-                                )
-                                self.full_text = ""
-                                break
-
-                    except json.JSONDecodeError:
-                        self.logger.error(f"无法解码讯飞 JSON: {msg.data}")
-                        utterance_failed = True
-                        break
-                    except Exception as e:
-                        self.logger.error(f"处理讯飞消息出错: {e}", exc_info=True)
-                        utterance_failed = True
-                        break
-
-                elif msg.type == self.aiohttp.WSMsgType.ERROR:
-                    err = ws.exception() or RuntimeError("WebSocket 错误")
-                    self.logger.error(f"讯飞 WebSocket 错误: {err}")
-                    utterance_failed = True
-                    break
-
-                elif msg.type == self.aiohttp.WSMsgType.CLOSED:
-                    self.logger.warning(f"讯飞连接已关闭: Code={ws.close_code}")
-                    break
-
-        except asyncio.CancelledError:
-            self.logger.info("讯飞接收器任务被取消")
+            await self.event_bus.emit(CoreEvents.INPUT_SPEECH_RECOGNIZED, payload, source="STTCollector")
         except Exception as e:
-            self.logger.error(f"讯飞接收器任务异常: {e}", exc_info=True)
-        finally:
-            self.logger.debug("讯飞接收器任务结束")
-
-    def _build_iflytek_auth_url(self) -> str:
-        """构建讯飞认证 URL"""
-        cfg = self.iflytek_config
-
-        host = cfg.get("host", "iat-api.xfyun.com")
-        path = cfg.get("path", "/v2/iat")
-
-        if not all([host, path, cfg.get("api_secret"), cfg.get("api_key")]):
-            raise ValueError("讯飞配置缺少必要字段")
-
-        url = f"wss://{host}{path}"
-
-        date = datetime.utcnow().strftime("%a, %d %b %Y %H:%M:%S GMT")
-        signature_origin = f"host: {host}\ndate: {date}\nGET {path} HTTP/1.1"
-
-        self.logger.debug(f"signature_origin: {repr(signature_origin)}")
-
-        signature_sha = hmac.new(
-            cfg["api_secret"].encode("utf-8"), signature_origin.encode("utf-8"), digestmod=hashlib.sha256
-        ).digest()
-        signature_sha_base64 = base64.b64encode(signature_sha).decode(encoding="utf-8")
-
-        self.logger.debug(f"signature_sha_base64: {signature_sha_base64}")
-
-        authorization_origin = f'api_key="{cfg["api_key"]}", algorithm="hmac-sha256", headers="host date request-line", signature="{signature_sha_base64}"'
-
-        self.logger.debug(f"authorization_origin: {authorization_origin[:50]}...")
-
-        authorization = base64.b64encode(authorization_origin.encode("utf-8")).decode(encoding="utf-8")
-
-        self.logger.debug(f"讯飞认证 - host: {host}, path: {path}, date: {date}")
-
-        params = f"authorization={authorization}&date={date}&host={host}"
-        signed_url = url + "?" + params
-
-        self.logger.debug(f"讯飞认证 URL: {signed_url[:150]}...")
-        return signed_url
-
-    def _build_iflytek_frame(self, status: int, audio_chunk_bytes: bytes = b"") -> bytes:
-        """构建讯飞帧（语音听写流式版 API 格式）"""
-        is_first = status == STATUS_FIRST_FRAME
-
-        business = {}
-        if is_first:
-            business = {
-                "language": self.iflytek_config.get("language", "zh_cn"),
-                "阶段": self.iflytek_config.get("阶段", "iat"),
-                "accent": self.iflytek_config.get("accent", "mandarin"),
-                "vad_eos": self.min_silence_duration_ms,
-            }
-
-        format_str = f"audio/L16;rate={self.sample_rate}"
-        data = {
-            "status": status,
-            "format": format_str,
-            "encoding": "raw",
-            "audio": base64.b64encode(audio_chunk_bytes).decode("utf-8") if audio_chunk_bytes else "",
-        }
-
-        if is_first:
-            frame = {
-                "common": {"app_id": str(self.iflytek_config["appid"])},
-                "business": business,
-                "data": data,
-            }
-            self.logger.debug(
-                f"发送第一帧: common={frame['common']}, business={frame['business']}, data.status={data['status']}, format={format_str}"
-            )
-        else:
-            frame = {"data": data}
-
-        return json.dumps(frame).encode("utf-8")
+            self.logger.warning(f"发布语音识别结果事件失败: {e}")
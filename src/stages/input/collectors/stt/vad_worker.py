@@ -0,0 +1,207 @@
+"""
+STT 语音活动检测（VAD）工作线程
+
+Silero VAD 每 32ms 一帧调用一次 torch 推理，放在事件循环上会让整个进程（TTS 播放、WebSocket I/O）
+每帧都停顿一次。这里把推理放到专用线程：
+- 音频回调把样本原地写入预分配的环形缓冲区（见 audio_ring.py，不阻塞、不分配，消费者落后时丢帧并计数）
+- 能量门限（RMS + 过零率）判为静音的帧不调用模型，直播中大部分时间是静音
+- 工作线程每次取出队列中积压的所有帧（最多 max_batch）依次处理，结果整批交回事件循环，
+  落后时一次唤醒处理多帧，事件循环也只被唤醒一次
+- Silero 模型带有跨帧的 RNN 状态，同一路音频的帧不能拼成一个批次张量，只能按顺序逐帧推理
+"""
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from src.modules.logging import get_logger
+
+from .audio_ring import AudioRingBuffer
+
+
+@dataclass
+class EnergyGate:
+    """
+    RMS / 过零率能量门限
+
+    - 电平低于 rms_threshold_db（dBFS）：静音
+    - 电平只比门限高 noise_margin_db 以内且过零率高于 zcr_threshold：平稳的底噪（风扇、电流声），按静音处理
+    - 其余帧交给 VAD 模型判断
+
+    门限只用来跳过明显的静音，宁可放过也不误杀：说话声的电平通常比门限高 20dB 以上。
+    """
+
+    rms_threshold_db: float = -50.0
+    zcr_threshold: float = 0.35
+    noise_margin_db: float = 6.0
+
+    def is_silence(self, samples: np.ndarray) -> bool:
+        """samples 为 [-1, 1] 的 float32 单声道帧"""
+        if samples.size < 2:
+            return True
+        rms = float(np.sqrt(np.mean(np.square(samples, dtype=np.float32))))
+        level_db = 20 * math.log10(max(rms, 1e-10))
+        if level_db < self.rms_threshold_db:
+            return True
+        if level_db < self.rms_threshold_db + self.noise_margin_db:
+            signs = np.signbit(samples)
+            zero_crossing_rate = np.count_nonzero(signs[1:] != signs[:-1]) / (samples.size - 1)
+            return zero_crossing_rate > self.zcr_threshold
+        return False
+
+
+@dataclass(frozen=True)
+class VadResult:
+    """
+    一帧的 VAD 结果
+
+    Attributes:
+        audio: 原始 int16 PCM 帧（原样交给 ASR）
+        probability: 语音概率，被能量门限跳过的帧为 0
+        gated: 是否被能量门限判为静音（未调用模型）
+        seq: 帧在环形缓冲区中的序号（用于取回之前的预录帧），-1 表示不来自缓冲区
+    """
+
+    audio: bytes
+    probability: float
+    gated: bool = False
+    seq: int = -1
+
+
+@dataclass
+class VadWorkerStats:
+    """
+    VAD 工作线程统计
+
+    提交和丢帧（溢出）计数见 VadWorker.ring.stats。
+
+    Attributes:
+        gated_count: 被能量门限跳过的帧数
+        inferred_count: 调用模型的帧数
+        error_count: 模型推理出错的帧数
+        batch_count: 交回事件循环的批次数
+        max_batch: 最大批次帧数（大于 1 说明工作线程曾经落后）
+        infer_ms: 模型推理累计耗时（毫秒）
+    """
+
+    gated_count: int = 0
+    inferred_count: int = 0
+    error_count: int = 0
+    batch_count: int = 0
+    max_batch: int = 0
+    infer_ms: float = 0.0
+
+
+class VadWorker:
+    """
+    VAD 推理工作线程
+
+    submit() 只应在一个线程中调用（音频回调，或远程音频流时的事件循环），deliver 在工作线程中调用，
+    交回事件循环时应使用 loop.call_soon_threadsafe。
+    """
+
+    def __init__(
+        self,
+        infer: Callable[[np.ndarray], float],
+        deliver: Callable[[List[VadResult]], None],
+        gate: Optional[EnergyGate] = None,
+        max_queue: int = 64,
+        max_batch: int = 16,
+        name: str = "STT-VAD",
+        frame_samples: int = 512,
+        history_frames: int = 0,
+    ):
+        """
+        Args:
+            infer: VAD 模型推理函数，输入 [-1, 1] 的 float32 帧，返回语音概率
+            deliver: 接收一批按提交顺序排列的 VadResult
+            gate: 能量门限，None 表示每帧都调用模型
+            max_queue: 待处理帧上限（16kHz 下 64 帧约 2 秒）
+            max_batch: 每批最多处理的帧数
+            name: 线程名称
+            frame_samples: 每帧采样点数
+            history_frames: 处理之后在缓冲区中继续保留的帧数（预录）
+        """
+        self._infer = infer
+        self._deliver = deliver
+        self.gate = gate
+        self.max_batch = max(1, max_batch)
+        self.name = name
+        self.stats = VadWorkerStats()
+        self.logger = get_logger("VadWorker")
+        # 结果整批交回，批内第一帧到达事件循环时读序号已领先一整批，保留区多留一批
+        self.ring = AudioRingBuffer(frame_samples, max_unread=max_queue, history_frames=history_frames + self.max_batch)
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def backlog(self) -> int:
+        """等待处理的帧数"""
+        return self.ring.unread
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """停止工作线程（丢弃未处理的帧），会阻塞到线程结束，事件循环中应通过 asyncio.to_thread 调用"""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stopping = True
+        self.ring.wake()
+        thread.join(timeout)
+        if thread.is_alive():
+            self.logger.warning(f"VAD 工作线程 {self.name} 未在 {timeout}s 内结束")
+        self._thread = None
+
+    def submit(self, audio) -> bool:
+        """
+        提交音频（int16 PCM bytes 或 sounddevice 数组），待处理帧已满时丢弃并返回 False
+
+        不阻塞、不分配缓冲区，可在实时音频回调中调用。
+        """
+        return self.ring.write(audio)
+
+    def evaluate(self, audio: bytes, seq: int = -1) -> VadResult:
+        """对一帧执行门限判断和模型推理（在调用线程中执行）"""
+        samples = np.frombuffer(audio, dtype=np.int16).astype(np.float32) / 32768.0
+        if self.gate is not None and self.gate.is_silence(samples):
+            self.stats.gated_count += 1
+            return VadResult(audio, 0.0, gated=True, seq=seq)
+
+        started = time.perf_counter()
+        try:
+            probability = float(self._infer(samples))
+        except Exception as e:
+            self.stats.error_count += 1
+            self.logger.opt(exception=e).error(f"VAD 推理出错: {e}")
+            probability = 0.0
+        self.stats.infer_ms += (time.perf_counter() - started) * 1000
+        self.stats.inferred_count += 1
+        return VadResult(audio, probability, seq=seq)
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self.ring.wait_readable(0.5)
+            while not self._stopping:
+                batch = self.ring.take(self.max_batch)
+                if not batch:
+                    break
+                results = [self.evaluate(audio, seq) for seq, audio in batch]
+                self.stats.batch_count += 1
+                self.stats.max_batch = max(self.stats.max_batch, len(results))
+                try:
+                    self._deliver(results)
+                except Exception as e:
+                    self.logger.opt(exception=e).error(f"交付 VAD 结果出错: {e}")
+
+
+__all__ = ["EnergyGate", "VadResult", "VadWorker", "VadWorkerStats"]
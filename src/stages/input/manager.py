@@ -3,20 +3,33 @@ InputCollectorManager - 输入Collector管理器
 
 负责管理多个InputCollector的生命周期和错误隔离。
 
-使用 _COLLECTORS 字典直接构造 Collector。
+通过 get_collector() 获取 Collector 类并直接构造（只导入配置中启用的 Collector）。
+
+Collector 除了 collect()（逐条产出 NormalizedMessage）外，还可以实现可选的
+collect_batches()（产出 List[NormalizedMessage]）：突发到达的消息以整批的形式通过
+PipelineManager.process_batch()，每个 Pipeline 每批只调用一次。
+
+Collector 只负责把消息放入自己的有界队列，分发协程通过 InputScheduler 按
+优先级 + 加权公平的顺序取出整批消息，再经过 InputPipeline 发布到 EventBus：
+弹幕洪峰只会让弹幕自己的队列变长（并按溢出策略丢弃），不会拖慢主播的语音输入。
+调度配置位于 [collectors.scheduling]，见 src/stages/input/scheduler.py。
 """
 
 import asyncio
-from typing import Any, Dict, Optional
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional
 
 from src.modules.di import instantiate_with_di
 from src.modules.events.event_bus import EventBus
 from src.modules.events.names import CoreEvents
 from src.modules.events.payloads.input import MessageReadyPayload
+from src.modules.lifecycle import get_lifecycle_profiler, run_phases
 from src.modules.logging import get_logger
 from src.modules.pipeline import PipelineManager
+from src.modules.tracing import TraceStage, get_tracer
 from src.modules.types.base.normalized_message import NormalizedMessage
-from src.stages.input.registry import _COLLECTORS
+from src.stages.input.registry import get_collector
+from src.stages.input.scheduler import InputScheduler, QueuedMessage, SourcePolicy
 
 
 class InputCollectorManager:
@@ -33,6 +46,13 @@ class InputCollectorManager:
         self._collector_tasks: dict[str, asyncio.Task] = {}
         self._stop_event = asyncio.Event()
         self._is_started = False
+        self._tracer = get_tracer()
+
+        # 配置中的 Collector 名称（用于查找调度策略），键为 Collector 实例
+        self._input_names: dict[Any, str] = {}
+        self._scheduling_config: Dict[str, Any] = {}
+        self._scheduler: Optional[InputScheduler] = None
+        self._dispatcher_tasks: list[asyncio.Task] = []
 
     async def setup(
         self,
@@ -47,6 +67,7 @@ class InputCollectorManager:
 
         collectors = await self.load_from_config(config, config_service=config_service)
         self._collectors = collectors
+        self._scheduling_config = config.get("scheduling", {}) or {}
 
         self.logger.info(f"InputCollectorManager 设置完成，加载了 {len(collectors)} 个 Collector")
 
@@ -73,6 +94,7 @@ class InputCollectorManager:
 
         self._collectors.clear()
         self._collector_tasks.clear()
+        self._input_names.clear()
 
         self.logger.info("InputCollectorManager 清理完成")
 
@@ -83,16 +105,24 @@ class InputCollectorManager:
 
         self._collectors = collectors
         self._stop_event.clear()
+        self._scheduler = self._create_scheduler()
 
         self.logger.info(f"开始启动{len(collectors)}个Collector...")
 
         for collector in collectors:
             collector_name = self._get_collector_name(collector)
+            self._scheduler.register(collector_name, self._input_names.get(collector, collector_name))
             task = asyncio.create_task(
                 self._run_collector(collector, collector_name), name=f"InputCollector-{collector_name}"
             )
             self._collector_tasks[collector_name] = task
 
+        workers = int(self._scheduling_config.get("workers", 2))
+        self._dispatcher_tasks = [
+            asyncio.create_task(self._dispatch_loop(self._scheduler), name=f"InputDispatcher-{i}")
+            for i in range(max(workers, 1))
+        ]
+
         self.logger.info(f"所有{len(collectors)}个Collector已启动并在后台运行")
 
         self._is_started = True
@@ -106,12 +136,15 @@ class InputCollectorManager:
 
         self._stop_event.set()
 
-        for collector in self._collectors:
-            collector_name = self._get_collector_name(collector)
-            try:
-                await collector.stop()
-            except Exception as e:
-                self.logger.error(f"停止Collector {collector_name}时出错: {e}", exc_info=True)
+        # 并发停止所有 Collector
+        names = [self._get_collector_name(collector) for collector in self._collectors]
+        errors = await run_phases(
+            [(f"input.{name}.stop", collector.stop) for name, collector in zip(names, self._collectors, strict=True)],
+            timeout=10.0,
+        )
+        for collector_name, error in zip(names, errors, strict=True):
+            if error is not None:
+                self.logger.error(f"停止Collector {collector_name}时出错: {error!r}")
 
         if self._collector_tasks:
             try:
@@ -124,6 +157,8 @@ class InputCollectorManager:
                     if not task.done():
                         task.cancel()
 
+        await self._stop_dispatchers()
+
         self._is_started = False
         self.logger.info("所有Collector已停止")
 
@@ -150,8 +185,9 @@ class InputCollectorManager:
         用于 Dashboard 等外部组件查询，避免直接访问私有属性。
 
         Returns:
-            包含 name, is_started, config 的字典列表
+            包含 name, is_started, config, queue（调度队列统计，未启动时为 None）的字典列表
         """
+        queue_stats = self.get_scheduler_stats()
         result = []
         for collector in self._collectors:
             collector_name = self._get_collector_name(collector)
@@ -160,10 +196,22 @@ class InputCollectorManager:
                     "name": collector_name,
                     "is_started": getattr(collector, "is_started", False),
                     "config": getattr(collector, "config", None),
+                    "queue": queue_stats.get(collector_name),
                 }
             )
         return result
 
+    def get_scheduler_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        获取各 Collector 调度队列的统计（深度、丢弃数、排队延迟等）
+
+        Returns:
+            Collector 名称 -> SourceQueueStats 字典
+        """
+        if self._scheduler is None:
+            return {}
+        return {name: asdict(stats) for name, stats in self._scheduler.get_stats().items()}
+
     def get_component_summaries(self) -> list[dict[str, Any]]:
         """Dashboard 协议接口：返回 Input 阶段参与者状态摘要字典列表"""
         return [
@@ -181,27 +229,15 @@ class InputCollectorManager:
     async def _run_collector(self, collector, collector_name: str) -> None:
         try:
             self.logger.info(f"Collector {collector_name} 开始运行")
-            await collector.start()
-            async for message in collector.collect():
-                if self.pipeline_manager:
-                    message = await self.pipeline_manager.process(message)
-                    if message is None:
-                        self.logger.debug(f"Collector {collector_name} 消息被 Pipeline 过滤")
-                        continue
-
-                await self.event_bus.emit(
-                    CoreEvents.INPUT_MESSAGE_RECEIVED,
-                    MessageReadyPayload.from_normalized_message(message),
-                    source=collector_name,
-                )
+            with get_lifecycle_profiler().phase(f"input.{collector_name}.start"):
+                await collector.start()
+            if hasattr(collector, "collect_batches"):
+                async for messages in collector.collect_batches():
+                    await self._enqueue(collector_name, messages)
+                return
 
-                nick = message.user_nickname or message.user_id or "anonymous"
-                self.logger.info(f"[{collector_name}] {nick}({message.user_id}): {message.text}")
-                self.logger.debug(
-                    f"[{collector_name}] input.message.received: "
-                    f"text={message.text!r}, source={message.source!r}, "
-                    f"user_id={message.user_id!r}, user_nickname={message.user_nickname!r}"
-                )
+            async for message in collector.collect():
+                await self._enqueue(collector_name, [message])
         except asyncio.CancelledError:
             self.logger.info(f"Collector {collector_name} 被取消")
         except Exception as e:
@@ -212,6 +248,115 @@ class InputCollectorManager:
             except Exception as e:
                 self.logger.warning(f"Collector {collector_name} 停止时出错: {e}")
 
+    def _create_scheduler(self) -> InputScheduler:
+        """根据 [collectors.scheduling] 配置创建调度器"""
+        config = self._scheduling_config
+        default_policy = SourcePolicy.from_dict(config.get("default", {}))
+        policies = {
+            name: SourcePolicy.from_dict(source_config, base=default_policy)
+            for name, source_config in (config.get("sources", {}) or {}).items()
+        }
+        return InputScheduler(
+            policies=policies,
+            default_policy=default_policy,
+            max_batch=int(config.get("max_batch", 50)),
+            on_drop=self._on_message_dropped,
+        )
+
+    async def _enqueue(self, collector_name: str, messages: List[NormalizedMessage]) -> None:
+        """为消息开始追踪，并放入 Collector 的调度队列"""
+        if not messages or self._scheduler is None:
+            return
+        items = []
+        for message in messages:
+            trace_id = self._tracer.start_trace(collector_name, message.text)
+            self._tracer.start_span(trace_id, TraceStage.INPUT_QUEUE)
+            items.append(QueuedMessage(message=message, trace_id=trace_id))
+        await self._scheduler.put(collector_name, items)
+
+    def _on_message_dropped(self, collector_name: str, item: QueuedMessage) -> None:
+        self._tracer.discard(item.trace_id)
+        self.logger.debug(f"Collector {collector_name} 队列已满，丢弃消息: {item.message.text!r}")
+
+    async def _dispatch_loop(self, scheduler: InputScheduler) -> None:
+        """分发协程：按调度顺序取出整批消息，通过 InputPipeline 后发布"""
+        while True:
+            batch = await scheduler.get()
+            if batch is None:
+                return
+            collector_name, items = batch
+            try:
+                trace_ids = [item.trace_id for item in items]
+                for trace_id in trace_ids:
+                    self._tracer.end_span(trace_id, TraceStage.INPUT_QUEUE)
+                await self._handle_batch(collector_name, [item.message for item in items], trace_ids)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.opt(exception=e).error(f"处理 Collector {collector_name} 的消息时出错: {e}")
+            finally:
+                scheduler.done(collector_name)
+
+    async def _stop_dispatchers(self) -> None:
+        """关闭调度器（丢弃未处理的消息），等待正在处理的批次完成"""
+        if self._scheduler is not None:
+            self._scheduler.close()
+        if not self._dispatcher_tasks:
+            return
+        try:
+            await asyncio.wait_for(asyncio.gather(*self._dispatcher_tasks, return_exceptions=True), timeout=5.0)
+        except TimeoutError:
+            self.logger.warning("等待输入分发协程停止超时，强制取消任务")
+            for task in self._dispatcher_tasks:
+                if not task.done():
+                    task.cancel()
+        self._dispatcher_tasks = []
+
+    async def _handle_batch(
+        self,
+        collector_name: str,
+        messages: List[NormalizedMessage],
+        trace_ids: Optional[List[Optional[str]]] = None,
+    ) -> None:
+        """让一批消息整批通过 InputPipeline，然后逐条发布"""
+        if not messages:
+            return
+        if trace_ids is None:
+            trace_ids = [self._tracer.start_trace(collector_name, message.text) for message in messages]
+        results: List[Optional[NormalizedMessage]] = list(messages)
+        if self.pipeline_manager:
+            for trace_id in trace_ids:
+                self._tracer.start_span(trace_id, TraceStage.INPUT_PIPELINES)
+            try:
+                results = await self.pipeline_manager.process_batch(messages)
+            finally:
+                for trace_id in trace_ids:
+                    self._tracer.end_span(trace_id, TraceStage.INPUT_PIPELINES)
+
+        for message, trace_id in zip(results, trace_ids, strict=True):
+            if message is None:
+                self._tracer.discard(trace_id)
+                self.logger.debug(f"Collector {collector_name} 消息被 Pipeline 过滤")
+                continue
+            await self._emit_message(collector_name, message, trace_id)
+
+    async def _emit_message(self, collector_name: str, message: NormalizedMessage, trace_id: Optional[str]) -> None:
+        # decider_queue 阶段在 DeciderManager 收到事件时结束
+        self._tracer.start_span(trace_id, TraceStage.DECIDER_QUEUE)
+        await self.event_bus.emit(
+            CoreEvents.INPUT_MESSAGE_RECEIVED,
+            MessageReadyPayload.from_normalized_message(message, trace_id=trace_id),
+            source=collector_name,
+        )
+
+        nick = message.user_nickname or message.user_id or "anonymous"
+        self.logger.info(f"[{collector_name}] {nick}({message.user_id}): {message.text}")
+        self.logger.debug(
+            f"[{collector_name}] input.message.received: "
+            f"text={message.text!r}, source={message.source!r}, "
+            f"user_id={message.user_id!r}, user_nickname={message.user_nickname!r}"
+        )
+
     async def load_from_config(self, config: dict[str, Any], config_service=None) -> list:
         self.logger.info("开始从配置加载InputCollector...")
 
@@ -252,12 +397,8 @@ class InputCollectorManager:
 
                 collector_type = collector_config.get("type", input_name)
 
-                # 使用 _COLLECTORS 字典直接获取 Collector 类
-                if collector_type not in _COLLECTORS:
-                    available = list(_COLLECTORS.keys())
-                    raise KeyError(f"Collector '{collector_type}' 未找到。可用: {available}")
-
-                collector_cls = _COLLECTORS[collector_type]
+                # 按需导入并获取 Collector 类（未找到时抛出 KeyError）
+                collector_cls = get_collector(collector_type)
 
                 # 直接构造 Collector
                 collector = instantiate_with_di(
@@ -266,6 +407,7 @@ class InputCollectorManager:
                     services_by_type={EventBus: self.event_bus},
                 )
                 created_collectors.append(collector)
+                self._input_names[collector] = input_name
                 self.logger.info(f"成功创建InputCollector: {input_name} (type={collector_type})")
             except Exception as e:
                 self.logger.error(f"InputCollector创建异常: {input_name} - {e}", exc_info=True)
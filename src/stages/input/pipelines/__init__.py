@@ -1,10 +1,29 @@
-"""InputPipeline 导出"""
+"""InputPipeline 导出
+
+各 Pipeline 由 PipelineManager 按 component_manifest 清单只导入启用的部分；下列类名在首次访问时才导入。
+"""
+
+import importlib
+from typing import Any
 
-from src.stages.input.pipelines.rate_limit.pipeline import RateLimitInputPipeline
-from src.stages.input.pipelines.similar_filter.pipeline import SimilarFilterInputPipeline
 from src.modules.types.base.pipeline_types import PipelineErrorHandling, PipelineException
 
+_EXPORTS = {
+    "LoadShedInputPipeline": "src.stages.input.pipelines.load_shed.pipeline",
+    "RateLimitInputPipeline": "src.stages.input.pipelines.rate_limit.pipeline",
+    "SimilarFilterInputPipeline": "src.stages.input.pipelines.similar_filter.pipeline",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
+
+
 __all__ = [
+    "LoadShedInputPipeline",
     "RateLimitInputPipeline",
     "SimilarFilterInputPipeline",
     "PipelineErrorHandling",
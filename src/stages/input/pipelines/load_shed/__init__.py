@@ -0,0 +1,9 @@
+from .pipeline import LoadShedInputPipeline
+
+__all__ = ["LoadShedInputPipeline"]
+
+"""
+负载感知准入管道
+
+下游决策阶段过载时丢弃低重要性消息和过期消息，重要消息（SC、大航海、大额礼物）始终放行。
+"""
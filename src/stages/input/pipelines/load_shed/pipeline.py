@@ -0,0 +1,132 @@
+"""负载感知准入管道（Input 阶段）
+
+下游决策阶段跟不上时，按 NormalizedMessage.importance 丢弃低价值消息，并丢弃过期消息，
+使重要消息的响应延迟保持有界。
+"""
+
+from typing import Any, Dict, List, Optional
+
+from src.modules.pipeline import Pipeline, pipeline
+from src.modules.time_utils import now_ms
+from src.modules.tracing import DecisionLoadMonitor, get_load_monitor
+from src.modules.types.base.normalized_message import NormalizedMessage
+from src.modules.types.base.pipeline_types import PipelineConcurrency
+
+
+@pipeline("load_shed")
+class LoadShedInputPipeline(Pipeline[NormalizedMessage]):
+    """负载感知准入管道。
+
+    负载 = max(in_flight / max_in_flight, lag_ms / max_lag_ms)，来自 DecisionLoadMonitor。
+    负载低于 shed_start 时全部放行；超过后放行所需的最低重要性从 0 线性升至 shed_importance（负载 >= 1）。
+    受保护的消息（always_admit_sources 中的来源、always_admit_types 中的类型，或 importance >= always_admit_importance）
+    始终放行，也不做过期检查。主播自己的语音和控制台输入默认受保护，不会因为弹幕过多被丢弃。
+
+    只读取负载和消息字段，没有可变状态，因此可以并发处理。
+    """
+
+    priority = 50
+    concurrency = PipelineConcurrency.CONCURRENT
+
+    def __init__(self, config: Dict[str, Any], load_monitor: Optional[DecisionLoadMonitor] = None):
+        super().__init__(config)
+
+        self._max_in_flight = self.config.get("max_in_flight", 8)
+        self._max_lag_ms = self.config.get("max_lag_ms", 10000)
+        self._shed_start = self.config.get("shed_start", 0.5)
+        self._shed_importance = self.config.get("shed_importance", 0.7)
+        self._max_age_ms = self.config.get("max_age_seconds", 60.0) * 1000
+        self._always_admit_sources = set(self.config.get("always_admit_sources", ["stt", "console", "console_input"]))
+        self._always_admit_types = set(self.config.get("always_admit_types", ["super_chat", "guard"]))
+        self._always_admit_importance = self.config.get("always_admit_importance", 0.8)
+
+        self._load_monitor = load_monitor or get_load_monitor()
+        self._shed_count = 0
+        self._stale_count = 0
+
+        self.logger.info(
+            f"LoadShedInputPipeline 初始化: "
+            f"max_in_flight={self._max_in_flight}, max_lag_ms={self._max_lag_ms}, "
+            f"shed_importance={self._shed_importance}, max_age={self._max_age_ms / 1000:.0f}秒"
+        )
+
+    async def _process(self, item: NormalizedMessage) -> Optional[NormalizedMessage]:
+        return self._admit(item, self._required_importance(), now_ms())
+
+    async def _process_batch(self, items: List[NormalizedMessage]) -> List[Optional[NormalizedMessage]]:
+        # 整批共用一次负载读取
+        required = self._required_importance()
+        now = now_ms()
+        return [self._admit(item, required, now) for item in items]
+
+    def _admit(self, item: NormalizedMessage, required_importance: float, now: int) -> Optional[NormalizedMessage]:
+        if self._is_protected(item):
+            return item
+
+        if self._max_age_ms > 0 and item.timestamp_ms > 0 and now - item.timestamp_ms > self._max_age_ms:
+            self._stale_count += 1
+            self._stats.dropped_count += 1
+            self.logger.debug(f"丢弃过期消息: age={(now - item.timestamp_ms) / 1000:.1f}秒, text={item.text[:30]!r}")
+            return None
+
+        if item.importance < required_importance:
+            self._shed_count += 1
+            self._stats.dropped_count += 1
+            self.logger.debug(
+                f"负载降级丢弃: importance={item.importance:.2f} < {required_importance:.2f}, text={item.text[:30]!r}"
+            )
+            return None
+
+        return item
+
+    def _is_protected(self, item: NormalizedMessage) -> bool:
+        return (
+            item.source in self._always_admit_sources
+            or item.data_type in self._always_admit_types
+            or item.importance >= self._always_admit_importance
+        )
+
+    def _load(self) -> float:
+        monitor = self._load_monitor
+        load = 0.0
+        if self._max_in_flight > 0:
+            load = monitor.in_flight / self._max_in_flight
+        if self._max_lag_ms > 0:
+            load = max(load, monitor.lag_ms / self._max_lag_ms)
+        return load
+
+    def _required_importance(self) -> float:
+        """当前负载下放行所需的最低重要性（0 表示全部放行）"""
+        load = self._load()
+        if load < self._shed_start:
+            return 0.0
+        if load >= 1.0 or self._shed_start >= 1.0:
+            return self._shed_importance
+        return self._shed_importance * (load - self._shed_start) / (1.0 - self._shed_start)
+
+    def get_info(self) -> Dict[str, Any]:
+        info = super().get_info()
+        info.update(
+            {
+                "max_in_flight": self._max_in_flight,
+                "max_lag_ms": self._max_lag_ms,
+                "shed_start": self._shed_start,
+                "shed_importance": self._shed_importance,
+                "max_age_seconds": self._max_age_ms / 1000,
+                "always_admit_sources": sorted(self._always_admit_sources),
+                "always_admit_types": sorted(self._always_admit_types),
+                "always_admit_importance": self._always_admit_importance,
+                "load": round(self._load(), 3),
+                "required_importance": round(self._required_importance(), 3),
+                "downstream": self._load_monitor.snapshot(),
+                "shed_count": self._shed_count,
+                "stale_count": self._stale_count,
+            }
+        )
+        return info
+
+    async def reset(self) -> None:
+        self._shed_count = 0
+        self._stale_count = 0
+        self.reset_stats()
+        self.logger.debug("LoadShedInputPipeline 已重置状态")
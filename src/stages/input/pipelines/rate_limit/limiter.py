@@ -0,0 +1,89 @@
+"""GCRA 限流器
+
+RateLimitInputPipeline 的计数结构。GCRA（Generic Cell Rate Algorithm）等价于容量为 limit、
+每 window / limit 秒补充一个令牌的令牌桶，但每个键只需保存一个浮点数 TAT（理论到达时间）：
+
+- 放行一条消息时 TAT = max(TAT, now) + interval
+- 若放行后 TAT - now 超过 window，说明桶中已无令牌，拒绝该消息且不修改 TAT
+
+令牌的补充是惰性的（由 now 与 TAT 的差值隐式给出），不需要定时任务或遍历所有键。
+TAT <= now 的键等价于满桶，可以直接删除而不丢失任何状态；键按最近使用顺序保存在 OrderedDict 中，
+每次记录时从最久未使用的一端顺带清理这类空闲键，单条消息的均摊成本为 O(1)。
+"""
+
+import math
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+
+class GcraLimiter:
+    """按键限流：每个键最多连续放行 limit 条消息，之后每 window / limit 秒恢复一条。"""
+
+    def __init__(self, limit: int, window: float, max_keys: Optional[int] = None):
+        """
+        Args:
+            limit: 每个窗口内允许的消息数（<= 0 表示全部拒绝）
+            window: 窗口长度（秒）
+            max_keys: 最多跟踪的键数量，超出时淘汰最久未使用的键（None 表示只清理空闲键）
+
+        Raises:
+            ValueError: 参数不合法
+        """
+        if window <= 0:
+            raise ValueError(f"window 必须 > 0，收到: {window}")
+        if max_keys is not None and max_keys <= 0:
+            raise ValueError(f"max_keys 必须 > 0，收到: {max_keys}")
+        self.limit = limit
+        self.window = float(window)
+        self.max_keys = max_keys
+        self.interval = self.window / limit if limit > 0 else math.inf
+        self.evicted_count = 0  # 因超过 max_keys 被淘汰的非空闲键数量
+        self._tat: "OrderedDict[Hashable, float]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._tat)
+
+    def try_acquire(self, key: Hashable, now: float) -> Optional[float]:
+        """检查是否可以放行（不修改状态）。
+
+        Returns:
+            可以放行时返回新的 TAT（传给 commit）；否则返回 None
+        """
+        if self.limit <= 0:
+            return None
+        tat = max(self._tat.get(key, now), now) + self.interval
+        if tat - now > self.window:
+            return None
+        return tat
+
+    def commit(self, key: Hashable, tat: float, now: float) -> None:
+        """记录一次放行（tat 为 try_acquire 的返回值）。"""
+        self._tat[key] = tat
+        self._tat.move_to_end(key)
+        self._evict(now)
+
+    def usage(self, key: Hashable, now: float) -> int:
+        """当前窗口内已占用的令牌数。"""
+        tat = self._tat.get(key)
+        if tat is None or tat <= now:
+            return 0
+        # 减去一个很小的值，避免浮点误差使整数个 interval 被向上取整
+        return math.ceil((tat - now) / self.interval - 1e-9)
+
+    def clear(self) -> None:
+        self._tat.clear()
+
+    def _evict(self, now: float) -> None:
+        tat = self._tat
+        while tat:
+            key, oldest = next(iter(tat.items()))
+            if oldest <= now:
+                del tat[key]
+            elif self.max_keys is not None and len(tat) > self.max_keys:
+                del tat[key]
+                self.evicted_count += 1
+            else:
+                break
+
+
+__all__ = ["GcraLimiter"]
@@ -1,22 +1,30 @@
 """限流管道（Input 阶段）
 
-基于滑动时间窗口算法限制消息发送频率。
+基于 GCRA（令牌桶）算法限制消息发送频率，见 limiter.py。
 """
 
-import asyncio
 import time
-from collections import defaultdict, deque
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from src.modules.pipeline import Pipeline, pipeline
+from src.modules.types.base.pipeline_types import PipelineConcurrency
 from src.modules.types.base.normalized_message import NormalizedMessage
 
+from .limiter import GcraLimiter
+
+_GLOBAL_KEY = "__global__"
+
 
 @pipeline("rate_limit")
 class RateLimitInputPipeline(Pipeline[NormalizedMessage]):
-    """限流管道。"""
+    """限流管道。
+
+    检查与记录之间没有 await，在事件循环上天然是原子的，因此可以并发处理而不需要加锁。
+    单条消息的成本为 O(1)，与窗口内的用户数量无关。
+    """
 
     priority = 100
+    concurrency = PipelineConcurrency.CONCURRENT
 
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
@@ -24,10 +32,10 @@ class RateLimitInputPipeline(Pipeline[NormalizedMessage]):
         self._global_rate_limit = self.config.get("global_rate_limit", 100)
         self._user_rate_limit = self.config.get("user_rate_limit", 10)
         self._window_size = self.config.get("window_size", 60)
+        self._max_tracked_users = self.config.get("max_tracked_users", 100000)
 
-        self._global_timestamps: deque = deque()
-        self._user_timestamps: Dict[str, deque] = defaultdict(deque)
-        self._lock = asyncio.Lock()
+        self._global_limiter = GcraLimiter(self._global_rate_limit, self._window_size)
+        self._user_limiter = GcraLimiter(self._user_rate_limit, self._window_size, max_keys=self._max_tracked_users)
 
         self.logger.info(
             f"RateLimitInputPipeline 初始化: "
@@ -38,59 +46,54 @@ class RateLimitInputPipeline(Pipeline[NormalizedMessage]):
 
     async def _process(self, item: NormalizedMessage) -> Optional[NormalizedMessage]:
         user_id = item.user_id or "unknown_user"
-        current_time = time.time()
 
-        await self._clean_expired_timestamps(current_time)
-
-        if await self._is_throttled(user_id):
-            self._stats.dropped_count += 1
-            self.logger.info(
-                f"消息限流: user_id={user_id}, text_preview='{item.text[:50]}{'...' if len(item.text) > 50 else ''}'"
-            )
+        if not self._try_admit(user_id, time.monotonic()):
+            self._on_throttled(user_id, item)
             return None
 
-        await self._record_message(user_id, current_time)
         return item
 
-    async def _clean_expired_timestamps(self, current_time: float) -> None:
-        async with self._lock:
-            cutoff_time = current_time - self._window_size
-
-            while self._global_timestamps and self._global_timestamps[0] < cutoff_time:
-                self._global_timestamps.popleft()
-
-            for user_id, timestamps in list(self._user_timestamps.items()):
-                while timestamps and timestamps[0] < cutoff_time:
-                    timestamps.popleft()
-
-                if not timestamps:
-                    del self._user_timestamps[user_id]
-
-    async def _is_throttled(self, user_id: str) -> bool:
-        async with self._lock:
-            global_count = len(self._global_timestamps)
-            if global_count >= self._global_rate_limit:
-                self.logger.warning(
-                    f"全局消息限流触发: 当前速率 {global_count}/{self._window_size}秒 "
-                    f"超过限制 {self._global_rate_limit}/{self._window_size}秒"
-                )
-                return True
-
-            user_timestamps = self._user_timestamps.get(user_id)
-            if user_timestamps and len(user_timestamps) >= self._user_rate_limit:
-                self.logger.warning(
-                    f"用户 {user_id} 消息限流触发: "
-                    f"当前速率 {len(user_timestamps)}/{self._window_size}秒 "
-                    f"超过限制 {self._user_rate_limit}/{self._window_size}秒"
-                )
-                return True
+    async def _process_batch(self, items: List[NormalizedMessage]) -> List[Optional[NormalizedMessage]]:
+        # 整批只取一次时间
+        now = time.monotonic()
+        results: List[Optional[NormalizedMessage]] = []
+        for item in items:
+            user_id = item.user_id or "unknown_user"
+            if self._try_admit(user_id, now):
+                results.append(item)
+            else:
+                self._on_throttled(user_id, item)
+                results.append(None)
+        return results
+
+    def _on_throttled(self, user_id: str, item: NormalizedMessage) -> None:
+        self._stats.dropped_count += 1
+        self.logger.info(
+            f"消息限流: user_id={user_id}, text_preview='{item.text[:50]}{'...' if len(item.text) > 50 else ''}'"
+        )
 
+    def _try_admit(self, user_id: str, now: float) -> bool:
+        """检查全局与用户限制，两者都通过时才同时记录。"""
+        global_tat = self._global_limiter.try_acquire(_GLOBAL_KEY, now)
+        if global_tat is None:
+            self.logger.warning(
+                f"全局消息限流触发: 当前速率 {self._global_limiter.usage(_GLOBAL_KEY, now)}/{self._window_size}秒 "
+                f"超过限制 {self._global_rate_limit}/{self._window_size}秒"
+            )
+            return False
+
+        user_tat = self._user_limiter.try_acquire(user_id, now)
+        if user_tat is None:
+            self.logger.warning(
+                f"用户 {user_id} 消息限流触发: "
+                f"当前速率 {self._user_limiter.usage(user_id, now)}/{self._window_size}秒 "
+                f"超过限制 {self._user_rate_limit}/{self._window_size}秒"
+            )
             return False
 
-    async def _record_message(self, user_id: str, current_time: float) -> None:
-        async with self._lock:
-            self._global_timestamps.append(current_time)
-            self._user_timestamps[user_id].append(current_time)
+        self._global_limiter.commit(_GLOBAL_KEY, global_tat, now)
+        self._user_limiter.commit(user_id, user_tat, now)
+        return True
 
     def get_info(self) -> Dict[str, Any]:
         info = super().get_info()
@@ -99,15 +102,17 @@ class RateLimitInputPipeline(Pipeline[NormalizedMessage]):
                 "global_rate_limit": self._global_rate_limit,
                 "user_rate_limit": self._user_rate_limit,
                 "window_size": self._window_size,
-                "current_global_count": len(self._global_timestamps),
-                "active_users": len(self._user_timestamps),
+                "max_tracked_users": self._max_tracked_users,
+                "current_global_count": self._global_limiter.usage(_GLOBAL_KEY, time.monotonic()),
+                "active_users": len(self._user_limiter),
+                "evicted_users": self._user_limiter.evicted_count,
             }
         )
         return info
 
     async def reset(self) -> None:
-        async with self._lock:
-            self._global_timestamps.clear()
-            self._user_timestamps.clear()
+        self._global_limiter.clear()
+        self._user_limiter.clear()
+        self._user_limiter.evicted_count = 0
         self.reset_stats()
         self.logger.debug("RateLimitInputPipeline 已重置状态")
@@ -0,0 +1,161 @@
+"""相似文本近邻索引
+
+SimilarFilterInputPipeline 的候选检索结构，让每条消息只与少数可能相似的缓存文本做精确比较：
+
+1. 重复字符归一化：连续重复的字符折叠到固定长度（"6666666" -> "666"），刷屏变体落到同一文本
+2. 精确哈希层：归一化后完全相同的文本直接命中，不需要计算签名
+3. MinHash LSH 层：文本按字符 n-gram 切分，计算 MinHash 签名并分段（band）放入桶中；
+   只有至少一个 band 完全相同的缓存文本才会成为候选
+
+LSH 参数偏向召回：默认 32 个 band × 2 行，字符 bigram Jaccard 相似度 0.45 的文本对
+（大致对应 SequenceMatcher 相似度 0.85）成为候选的概率约 99.9%。候选仍由调用方用原有的相似度算法打分，
+因此 LSH 只影响"比较哪些文本"，不改变相似度的定义和阈值。
+"""
+
+import re
+import zlib
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterator, List, Tuple
+
+import numpy as np
+
+_SHIFT = np.uint64(32)
+
+
+def similarity_upper_bound(counts1: Dict[str, int], len1: int, counts2: Dict[str, int], len2: int) -> float:
+    """字符多重集交集给出的相似度上界（即 SequenceMatcher.quick_ratio()，不小于 ratio()）。"""
+    if len1 + len2 == 0:
+        return 1.0
+    if len(counts1) > len(counts2):
+        counts1, counts2 = counts2, counts1
+    matches = sum(min(n, counts2.get(ch, 0)) for ch, n in counts1.items())
+    return 2.0 * matches / (len1 + len2)
+
+
+def collapse_repeats(text: str, max_repeat: int) -> str:
+    """把连续重复超过 max_repeat 次的字符折叠为 max_repeat 个（max_repeat <= 0 时不处理）。"""
+    if max_repeat <= 0:
+        return text
+    return re.sub(rf"(.)\1{{{max_repeat},}}", lambda m: m.group(1) * max_repeat, text, flags=re.DOTALL)
+
+
+class MinHasher:
+    """字符 n-gram MinHash 签名与 LSH band key 计算。
+
+    哈希族为 multiply-shift：h(x) = (a * x + b) >> 32（uint64 运算，a 为奇数），
+    对 n-gram 的 CRC32 值计算，签名的每一维取所有 n-gram 的最小值。
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 32, shingle_size: int = 2, seed: int = 1):
+        """
+        Args:
+            num_perm: 签名维数，必须能被 bands 整除
+            bands: LSH band 数（每个 band 有 num_perm / bands 行）
+            shingle_size: 字符 n-gram 长度
+            seed: 哈希参数随机种子（固定种子保证结果可复现）
+
+        Raises:
+            ValueError: 参数不合法
+        """
+        if num_perm <= 0 or bands <= 0 or num_perm % bands != 0:
+            raise ValueError(f"num_perm ({num_perm}) 必须是 bands ({bands}) 的正整数倍")
+        if shingle_size <= 0:
+            raise ValueError(f"shingle_size 必须 > 0，收到: {shingle_size}")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(0, 2**64, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2**64, size=num_perm, dtype=np.uint64)
+
+    def shingles(self, text: str) -> List[str]:
+        """文本的字符 n-gram（去重；短于 n 的文本整体作为一个 n-gram）。"""
+        k = self.shingle_size
+        if len(text) <= k:
+            return [text]
+        return list({text[i : i + k] for i in range(len(text) - k + 1)})
+
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash 签名（长度为 num_perm 的 uint64 数组）。"""
+        shingles = self.shingles(text)
+        hashes = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles))
+        return ((hashes[:, None] * self._a + self._b) >> _SHIFT).min(axis=0)
+
+    def band_keys(self, text: str) -> Tuple[bytes, ...]:
+        """LSH band key：band 序号 + 该 band 的签名字节。"""
+        bands = self.signature(text).reshape(self.bands, self.rows)
+        return tuple(i.to_bytes(2, "little") + band.tobytes() for i, band in enumerate(bands))
+
+
+@dataclass(eq=False)
+class IndexEntry:
+    """索引中的一条缓存文本"""
+
+    timestamp: float
+    text: str  # 归一化后的文本
+    user_id: str
+    keys: Tuple[bytes, ...]
+    counts: Dict[str, int]  # 字符计数（用于相似度上界预筛）
+
+
+class NearDuplicateIndex:
+    """单个分组（消息来源）内、按时间窗口缓存的文本索引。
+
+    条目按时间顺序加入，因此每个精确桶和 LSH 桶内部也按时间排序：
+    过期时只需从各桶头部弹出，单条过期成本为 O(bands)。
+    """
+
+    def __init__(self) -> None:
+        self._entries: Deque[IndexEntry] = deque()
+        self._exact: Dict[str, Deque[IndexEntry]] = {}
+        self._buckets: Dict[bytes, Deque[IndexEntry]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, entry: IndexEntry) -> None:
+        """加入一条文本（timestamp 不得早于已有条目）。"""
+        self._entries.append(entry)
+        self._exact.setdefault(entry.text, deque()).append(entry)
+        for key in entry.keys:
+            self._buckets.setdefault(key, deque()).append(entry)
+
+    def expire(self, cutoff: float) -> None:
+        """删除 timestamp 早于 cutoff 的条目。"""
+        while self._entries and self._entries[0].timestamp < cutoff:
+            entry = self._entries.popleft()
+            self._pop_head(self._exact, entry.text, entry)
+            for key in entry.keys:
+                self._pop_head(self._buckets, key, entry)
+
+    def exact(self, text: str) -> Iterator[IndexEntry]:
+        """归一化文本完全相同的条目（从新到旧）。"""
+        return reversed(self._exact.get(text, ()))
+
+    def candidates(self, keys: Tuple[bytes, ...]) -> Iterator[IndexEntry]:
+        """与 keys 至少共享一个 band 的条目（去重，各桶内从新到旧）。"""
+        seen = set()
+        for key in keys:
+            bucket = self._buckets.get(key)
+            if not bucket:
+                continue
+            for entry in reversed(bucket):
+                if id(entry) not in seen:
+                    seen.add(id(entry))
+                    yield entry
+
+    @staticmethod
+    def _pop_head(table: Dict, key, entry: IndexEntry) -> None:
+        bucket = table[key]
+        # 条目按时间顺序加入时 entry 总在桶头部；否则退化为线性删除
+        if bucket[0] is entry:
+            bucket.popleft()
+        else:
+            bucket.remove(entry)
+        if not bucket:
+            del table[key]
+
+
+__all__ = ["IndexEntry", "MinHasher", "NearDuplicateIndex", "collapse_repeats", "similarity_upper_bound"]
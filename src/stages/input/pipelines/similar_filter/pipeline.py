@@ -1,22 +1,32 @@
 """相似文本过滤管道（Input 阶段）
 
 过滤短时间内内容高度相似的重复消息。
+
+候选检索使用 NearDuplicateIndex（重复字符归一化 + 精确哈希 + MinHash LSH，见 index.py），
+每条消息只与少数候选计算 difflib 相似度，而不是与时间窗口内的所有缓存文本逐一比较。
 """
 
 import difflib
 import time
-from collections import defaultdict, deque
-from typing import Any, Dict, Optional
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.modules.pipeline import Pipeline, pipeline
+from src.modules.types.base.pipeline_types import PipelineConcurrency
 from src.modules.types.base.normalized_message import NormalizedMessage
 
+from .index import IndexEntry, MinHasher, NearDuplicateIndex, collapse_repeats, similarity_upper_bound
+
 
 @pipeline("similar_filter")
 class SimilarFilterInputPipeline(Pipeline[NormalizedMessage]):
-    """相似文本过滤管道。"""
+    """相似文本过滤管道。
+
+    缓存按消息来源（source）分组，只有同一来源的消息需要串行比较。
+    """
 
     priority = 500
+    concurrency = PipelineConcurrency.KEYED
 
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
@@ -25,9 +35,16 @@ class SimilarFilterInputPipeline(Pipeline[NormalizedMessage]):
         self._time_window = self.config.get("time_window", 5.0)
         self._min_text_length = self.config.get("min_text_length", 3)
         self._cross_user_filter = self.config.get("cross_user_filter", True)
+        self._max_repeat = self.config.get("max_repeat", 3)
 
-        self._text_cache: Dict[str, deque] = defaultdict(deque)
-        self._last_cleanup_time = time.time()
+        self._hasher = MinHasher(
+            num_perm=self.config.get("minhash_permutations", 64),
+            bands=self.config.get("lsh_bands", 32),
+        )
+        self._text_cache: Dict[str, NearDuplicateIndex] = {}
+        self._last_cleanup_time = time.monotonic()
+        self._exact_hits = 0
+        self._fuzzy_comparisons = 0
 
         self.logger.info(
             f"SimilarFilterInputPipeline 初始化: "
@@ -36,18 +53,36 @@ class SimilarFilterInputPipeline(Pipeline[NormalizedMessage]):
             f"跨用户过滤={self._cross_user_filter}"
         )
 
+    def lock_key(self, item: NormalizedMessage) -> str:
+        return item.source or "default"
+
     async def _process(self, item: NormalizedMessage) -> Optional[NormalizedMessage]:
         self._clean_expired_texts()
+        return self._filter(item)
+
+    async def _process_batch(self, items: List[NormalizedMessage]) -> List[Optional[NormalizedMessage]]:
+        # 整批只清理一次缓存；批内消息按顺序比较，前面通过的消息会进入缓存
+        self._clean_expired_texts()
+        return [self._filter(item) for item in items]
 
+    def _filter(self, item: NormalizedMessage) -> Optional[NormalizedMessage]:
         if len(item.text) < self._min_text_length:
             self.logger.debug(f"文本长度 {len(item.text)} 小于最小要求 {self._min_text_length}，跳过过滤")
             return item
 
         user_id = item.user_id or "unknown"
         group_id = item.source or "default"
-        now = time.time()
+        now = time.monotonic()
+        text = collapse_repeats(item.text, self._max_repeat)
 
-        if self._has_similar_text(group_id, user_id, item.text):
+        index = self._text_cache.get(group_id)
+        if index is None:
+            index = self._text_cache[group_id] = NearDuplicateIndex()
+        index.expire(now - self._time_window)
+
+        counts = Counter(text)
+        similar, keys = self._find_similar_text(index, user_id, text, counts)
+        if similar:
             self._stats.dropped_count += 1
             self.logger.info(
                 f"相似文本过滤: text_preview='{item.text[:50]}{'...' if len(item.text) > 50 else ''}', "
@@ -55,12 +90,13 @@ class SimilarFilterInputPipeline(Pipeline[NormalizedMessage]):
             )
             return None
 
-        self._text_cache[group_id].append((now, item.text, user_id))
+        index.add(IndexEntry(now, text, user_id, keys, counts))
         self.logger.debug(f"文本通过过滤并添加到缓存: {item.text[:30]!r}")
         return item
 
     def _clean_expired_texts(self) -> None:
-        now = time.time()
+        """定期清理所有分组的过期文本并删除空分组（活跃分组在每次处理时已按需清理）"""
+        now = time.monotonic()
 
         if now - self._last_cleanup_time < self._time_window / 2:
             return
@@ -69,35 +105,42 @@ class SimilarFilterInputPipeline(Pipeline[NormalizedMessage]):
         cutoff_time = now - self._time_window
 
         for group_id in list(self._text_cache.keys()):
-            while self._text_cache[group_id] and self._text_cache[group_id][0][0] < cutoff_time:
-                self._text_cache[group_id].popleft()
-
+            self._text_cache[group_id].expire(cutoff_time)
             if not self._text_cache[group_id]:
                 del self._text_cache[group_id]
 
-    def _has_similar_text(self, group_id: str, user_id: str, text: str) -> bool:
-        if group_id not in self._text_cache:
-            return False
-
-        now = time.time()
-        cutoff_time = now - self._time_window
-
-        for cached_ts, cached_text, cached_user_id in self._text_cache[group_id]:
-            if cached_ts < cutoff_time:
+    def _find_similar_text(
+        self, index: NearDuplicateIndex, user_id: str, text: str, counts: Dict[str, int]
+    ) -> Tuple[bool, Tuple[bytes, ...]]:
+        """在索引中查找相似文本。
+
+        候选先用相似度上界（字符多重集交集，不小于 difflib ratio，且不小于包含关系的相似度）预筛，
+        上界低于阈值的候选不可能相似，不必计算 difflib 相似度。
+
+        Returns:
+            (是否找到相似文本, 文本的 LSH band key)；精确命中时不计算 band key
+        """
+        for entry in index.exact(text):
+            if self._cross_user_filter or entry.user_id == user_id:
+                self._exact_hits += 1
+                self.logger.debug(f"发现相同文本: '{text[:30]}...'")
+                return True, ()
+
+        keys = self._hasher.band_keys(text)
+        for entry in index.candidates(keys):
+            if not self._cross_user_filter and entry.user_id != user_id:
                 continue
-
-            if not self._cross_user_filter and cached_user_id != user_id:
+            if similarity_upper_bound(counts, len(text), entry.counts, len(entry.text)) < self._similarity_threshold:
                 continue
 
-            similarity = self._calculate_similarity(text, cached_text)
+            self._fuzzy_comparisons += 1
+            similarity = self._calculate_similarity(text, entry.text)
 
             if similarity >= self._similarity_threshold:
-                self.logger.debug(
-                    f"发现相似文本 (相似度={similarity:.2f}): '{text[:30]}...' vs '{cached_text[:30]}...'"
-                )
-                return True
+                self.logger.debug(f"发现相似文本 (相似度={similarity:.2f}): '{text[:30]}...' vs '{entry.text[:30]}...'")
+                return True, keys
 
-        return False
+        return False, keys
 
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         similarity = difflib.SequenceMatcher(None, text1, text2).ratio()
@@ -119,14 +162,19 @@ class SimilarFilterInputPipeline(Pipeline[NormalizedMessage]):
                 "time_window": self._time_window,
                 "min_text_length": self._min_text_length,
                 "cross_user_filter": self._cross_user_filter,
+                "max_repeat": self._max_repeat,
                 "cache_groups": len(self._text_cache),
-                "cached_texts": sum(len(q) for q in self._text_cache.values()),
+                "cached_texts": sum(len(index) for index in self._text_cache.values()),
+                "exact_hits": self._exact_hits,
+                "fuzzy_comparisons": self._fuzzy_comparisons,
             }
         )
         return info
 
     async def reset(self) -> None:
         self._text_cache.clear()
-        self._last_cleanup_time = time.time()
+        self._last_cleanup_time = time.monotonic()
+        self._exact_hits = 0
+        self._fuzzy_comparisons = 0
         self.reset_stats()
         self.logger.debug("SimilarFilterInputPipeline 已重置状态")
@@ -6,7 +6,8 @@
     class ConsoleInputCollector:
         ...
 
-导入此模块即可填充 _COLLECTORS 字典。
+导入组件模块即可填充 _COLLECTORS 字典；get_collector() 会按 component_manifest 清单按需导入尚未注册的组件，
+list_collectors() 列出清单中的全部组件而不导入实现。
 
 设计原则:
 - 极简设计：模块级字典 + 装饰器函数
@@ -16,6 +17,8 @@
 
 from typing import TypeVar, Type, Dict
 
+from src.modules.config.component_manifest import import_component, list_components
+
 T = TypeVar("T")
 
 # 模块级注册表
@@ -70,21 +73,24 @@ def get_collector(name: str) -> Type:
 
     Raises:
         KeyError: 如果 Collector 未找到
+        ImportError: 如果 Collector 的实现模块（或其依赖）导入失败
 
     Returns:
         Collector 类
     """
     if name not in _COLLECTORS:
-        available = list(_COLLECTORS.keys())
+        import_component("input", name)
+    if name not in _COLLECTORS:
+        available = list_collectors()
         raise KeyError(f"Collector '{name}' 未找到。可用: {available}")
     return _COLLECTORS[name]
 
 
 def list_collectors() -> list[str]:
     """
-    列出所有已注册的 Collector 名称
+    列出所有可用的 Collector 名称（清单中的组件 + 已注册的组件，不导入实现）
 
     Returns:
         Collector 名称列表
     """
-    return list(_COLLECTORS.keys())
+    return list(dict.fromkeys([*list_components("input"), *_COLLECTORS]))
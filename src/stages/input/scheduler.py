@@ -0,0 +1,312 @@
+"""
+InputScheduler - Collector 消息的加权公平调度
+
+每个 Collector（消息来源）有一个有界队列，Collector 只负责把消息放入自己的队列；
+InputCollectorManager 的分发协程从调度器取出整批消息，再交给 InputPipeline 和 EventBus。
+
+调度规则：
+1. 优先级：priority 数值越小越优先（与 Pipeline 的 priority 含义一致），
+   只要高优先级来源有待处理消息，就不会调度低优先级来源
+2. 同一优先级内按权重公平（start-time fair queueing）：每个来源维护虚拟时间，
+   取出 n 条消息后虚拟时间增加 n / weight，总是调度虚拟时间最小的来源；
+   空闲后重新变为活跃的来源从当前系统虚拟时间开始，不能用空闲期间"攒下"的份额插队
+3. 同一来源同时最多只有一批在处理中，保证单个来源内的消息按到达顺序发布
+
+队列满时的处理复用 EventBus 有界订阅的 OverflowPolicy（见 src.modules.events.mailbox）。
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from src.modules.events.mailbox import OverflowPolicy
+from src.modules.types.base.normalized_message import NormalizedMessage
+
+
+@dataclass
+class SourcePolicy:
+    """
+    单个消息来源的调度策略
+
+    Attributes:
+        weight: 同一优先级内的权重（份额与权重成正比）
+        priority: 优先级，数值越小越优先
+        max_queue: 队列最大长度
+        overflow: 队列满时的溢出策略
+    """
+
+    weight: float = 1.0
+    priority: int = 100
+    max_queue: int = 200
+    overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], base: Optional["SourcePolicy"] = None) -> "SourcePolicy":
+        """
+        从配置字典创建（未指定的字段取 base 的值）
+
+        Raises:
+            ValueError: 配置值不合法
+        """
+        base = base or cls()
+        policy = cls(
+            weight=float(data.get("weight", base.weight)),
+            priority=int(data.get("priority", base.priority)),
+            max_queue=int(data.get("max_queue", base.max_queue)),
+            overflow=OverflowPolicy(data.get("overflow", base.overflow)),
+        )
+        if policy.weight <= 0:
+            raise ValueError(f"weight 必须 > 0，收到: {policy.weight}")
+        if policy.max_queue < 1:
+            raise ValueError(f"max_queue 必须 >= 1，收到: {policy.max_queue}")
+        return policy
+
+
+# 未在配置中指定时的内置策略：主播自己的语音和控制台输入总是优先，且不丢弃
+DEFAULT_SOURCE_POLICIES: Dict[str, SourcePolicy] = {
+    "stt": SourcePolicy(weight=4.0, priority=0, max_queue=50, overflow=OverflowPolicy.BLOCK),
+    "console_input": SourcePolicy(weight=4.0, priority=0, max_queue=50, overflow=OverflowPolicy.BLOCK),
+}
+
+
+@dataclass
+class QueuedMessage:
+    """队列中的一条消息"""
+
+    message: NormalizedMessage
+    trace_id: Optional[str] = None
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class SourceQueueStats:
+    """
+    单个来源队列的统计信息
+
+    Attributes:
+        source: 来源名称
+        weight / priority / max_queue / policy: 生效的调度策略
+        depth: 当前队列深度
+        high_watermark: 历史最大队列深度
+        enqueued_count: 入队消息数
+        dispatched_count: 已取出交给 Pipeline 的消息数
+        dropped_count: 因溢出策略丢弃的消息数
+        blocked_count: Collector 因队列满被阻塞的次数
+        lag_ms: 排队延迟（入队 → 取出）的指数滑动平均
+        last_lag_ms: 最近一批中最早消息的排队延迟
+        max_lag_ms: 历史最大排队延迟
+    """
+
+    source: str
+    weight: float
+    priority: int
+    max_queue: int
+    policy: str
+    depth: int = 0
+    high_watermark: int = 0
+    enqueued_count: int = 0
+    dispatched_count: int = 0
+    dropped_count: int = 0
+    blocked_count: int = 0
+    lag_ms: float = 0.0
+    last_lag_ms: float = 0.0
+    max_lag_ms: float = 0.0
+
+
+class _SourceQueue:
+    def __init__(self, source: str, policy: SourcePolicy):
+        self.policy = policy
+        self.items: Deque[QueuedMessage] = deque()
+        self.vtime = 0.0
+        self.busy = False
+        self.space = asyncio.Event()
+        self.space.set()
+        self.stats = SourceQueueStats(
+            source=source,
+            weight=policy.weight,
+            priority=policy.priority,
+            max_queue=policy.max_queue,
+            policy=policy.overflow.value,
+        )
+
+
+class InputScheduler:
+    """多来源有界队列 + 加权公平调度"""
+
+    def __init__(
+        self,
+        policies: Optional[Dict[str, SourcePolicy]] = None,
+        default_policy: Optional[SourcePolicy] = None,
+        max_batch: int = 50,
+        on_drop: Optional[Callable[[str, QueuedMessage], None]] = None,
+        lag_alpha: float = 0.2,
+    ):
+        """
+        Args:
+            policies: 按来源名称指定的策略（未指定的来源使用 DEFAULT_SOURCE_POLICIES 或 default_policy）
+            default_policy: 默认策略
+            max_batch: 单次 get() 最多取出的消息数
+            on_drop: 消息被丢弃时的回调 (source, item)
+            lag_alpha: 排队延迟指数滑动平均的平滑系数
+        """
+        if max_batch < 1:
+            raise ValueError(f"max_batch 必须 >= 1，收到: {max_batch}")
+        self._policies = {**DEFAULT_SOURCE_POLICIES, **(policies or {})}
+        self._default_policy = default_policy or SourcePolicy()
+        self.max_batch = max_batch
+        self._on_drop = on_drop
+        self._lag_alpha = lag_alpha
+        self._queues: Dict[str, _SourceQueue] = {}
+        self._vtime = 0.0
+        self._ready = asyncio.Event()
+        self._closed = False
+
+    def register(self, source: str, policy_name: Optional[str] = None) -> SourcePolicy:
+        """
+        注册来源（重复注册无副作用），返回生效的策略
+
+        Args:
+            source: 来源名称（队列与统计的键）
+            policy_name: 查找策略时使用的名称（如配置中的 Collector 名称），默认与 source 相同
+        """
+        queue = self._queues.get(source)
+        if queue is None:
+            policy = self._policies.get(policy_name or source, self._default_policy)
+            queue = self._queues[source] = _SourceQueue(source, policy)
+        return queue.policy
+
+    async def put(self, source: str, items: List[QueuedMessage]) -> None:
+        """
+        把消息放入来源队列（按顺序）
+
+        BLOCK 策略下队列满时等待分发协程取出消息；其余策略从不阻塞。
+        """
+        self.register(source)
+        queue = self._queues[source]
+        policy = queue.policy.overflow
+        for item in items:
+            if self._closed:
+                self._drop(queue, item)
+                continue
+
+            if policy == OverflowPolicy.LATEST:
+                while queue.items:
+                    self._drop(queue, queue.items.popleft())
+            elif len(queue.items) >= queue.policy.max_queue:
+                if policy == OverflowPolicy.DROP_NEWEST:
+                    self._drop(queue, item)
+                    continue
+                if policy == OverflowPolicy.DROP_OLDEST:
+                    self._drop(queue, queue.items.popleft())
+                else:
+                    queue.stats.blocked_count += 1
+                    while len(queue.items) >= queue.policy.max_queue and not self._closed:
+                        queue.space.clear()
+                        await queue.space.wait()
+                    if self._closed:
+                        self._drop(queue, item)
+                        continue
+
+            if not queue.items and not queue.busy:
+                # 空闲后重新活跃：从当前系统虚拟时间开始
+                queue.vtime = max(queue.vtime, self._vtime)
+            queue.items.append(item)
+            queue.stats.enqueued_count += 1
+            self._update_depth(queue)
+            self._ready.set()
+
+    async def get(self) -> Optional[Tuple[str, List[QueuedMessage]]]:
+        """
+        取出下一批消息（来源被标记为处理中，处理完后必须调用 done(source)）
+
+        Returns:
+            (来源名称, 消息列表)；调度器关闭后返回 None
+        """
+        while not self._closed:
+            queue = self._select()
+            if queue is None:
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+
+            count = min(len(queue.items), self.max_batch)
+            batch = [queue.items.popleft() for _ in range(count)]
+            queue.busy = True
+            self._vtime = queue.vtime
+            queue.vtime += count / queue.policy.weight
+            queue.space.set()
+            self._update_depth(queue)
+            self._record_lag(queue, batch)
+            return queue.stats.source, batch
+        return None
+
+    def done(self, source: str) -> None:
+        """标记来源的当前批次已处理完成"""
+        queue = self._queues.get(source)
+        if queue is None:
+            return
+        queue.busy = False
+        if queue.items:
+            self._ready.set()
+
+    def close(self) -> None:
+        """关闭调度器：丢弃所有待处理消息，唤醒被阻塞的 Collector 和分发协程"""
+        self._closed = True
+        for queue in self._queues.values():
+            while queue.items:
+                self._drop(queue, queue.items.popleft())
+            self._update_depth(queue)
+            queue.space.set()
+        self._ready.set()
+
+    @property
+    def pending_count(self) -> int:
+        """所有来源待处理的消息总数"""
+        return sum(len(queue.items) for queue in self._queues.values())
+
+    def get_stats(self) -> Dict[str, SourceQueueStats]:
+        """各来源的队列统计"""
+        return {source: queue.stats for source, queue in self._queues.items()}
+
+    def _select(self) -> Optional[_SourceQueue]:
+        best: Optional[_SourceQueue] = None
+        for queue in self._queues.values():
+            if not queue.items or queue.busy:
+                continue
+            if best is None or (queue.policy.priority, queue.vtime) < (best.policy.priority, best.vtime):
+                best = queue
+        return best
+
+    def _drop(self, queue: _SourceQueue, item: QueuedMessage) -> None:
+        queue.stats.dropped_count += 1
+        if self._on_drop is not None:
+            self._on_drop(queue.stats.source, item)
+
+    @staticmethod
+    def _update_depth(queue: _SourceQueue) -> None:
+        depth = len(queue.items)
+        queue.stats.depth = depth
+        if depth > queue.stats.high_watermark:
+            queue.stats.high_watermark = depth
+
+    def _record_lag(self, queue: _SourceQueue, batch: List[QueuedMessage]) -> None:
+        stats = queue.stats
+        lag_ms = (time.monotonic() - batch[0].enqueued_at) * 1000
+        stats.dispatched_count += len(batch)
+        stats.last_lag_ms = lag_ms
+        stats.max_lag_ms = max(stats.max_lag_ms, lag_ms)
+        if stats.lag_ms == 0.0:
+            stats.lag_ms = lag_ms
+        else:
+            stats.lag_ms += self._lag_alpha * (lag_ms - stats.lag_ms)
+
+
+__all__ = [
+    "DEFAULT_SOURCE_POLICIES",
+    "InputScheduler",
+    "QueuedMessage",
+    "SourcePolicy",
+    "SourceQueueStats",
+]
@@ -13,34 +13,36 @@ Rendering Handlers - 渲染输出Handler实现
 - RemoteStreamHandler: 远程流输出Handler
 - DebugConsoleHandler: 调试控制台输出Handler
 
-注意：导入这些模块会触发自动注册到 _HANDLERS
+注意：导入 Handler 子模块会触发自动注册到 _HANDLERS。导入此包本身不会导入任何 Handler：
+OutputHandlerManager 通过 get_handler() 按 component_manifest 清单只导入启用的 Handler；
+下列类名在首次访问时才导入对应子模块。
 """
 
-# 导入所有 Handler 子模块以触发 @handler 装饰器注册
-from . import (
-    avatar,  # noqa: F401 (包含所有Avatar Handler，包括VTSHandler, WarudoHandler, VRChatHandler)
-    debug_console,  # noqa: F401
-    edge_tts,  # noqa: F401
-    gptsovits,  # noqa: F401
-    mock,  # noqa: F401
-    obs_control,  # noqa: F401
-    omni_tts,  # noqa: F401
-    remote_stream,  # noqa: F401
-    sticker,  # noqa: F401
-    subtitle,  # noqa: F401
-)
-from .avatar.vts import VTSHandler
-from .avatar.warudo import WarudoHandler
-from .avatar.vrchat import VRChatHandler
-from .debug_console import DebugConsoleHandler
-from .edge_tts import EdgeTTSHandler
-from .gptsovits import GPTSoVITSHandler
-from .mock import MockOutputHandler
-from .obs_control import ObsControlHandler
-from .omni_tts import OmniTTSHandler
-from .remote_stream import RemoteStreamHandler
-from .sticker import StickerHandler
-from .subtitle import SubtitleHandler
+import importlib
+from typing import Any
+
+_EXPORTS = {
+    "DebugConsoleHandler": ".debug_console",
+    "EdgeTTSHandler": ".edge_tts",
+    "GPTSoVITSHandler": ".gptsovits",
+    "MockOutputHandler": ".mock",
+    "ObsControlHandler": ".obs_control",
+    "OmniTTSHandler": ".omni_tts",
+    "RemoteStreamHandler": ".remote_stream",
+    "StickerHandler": ".sticker",
+    "SubtitleHandler": ".subtitle",
+    "VRChatHandler": ".avatar.vrchat",
+    "VTSHandler": ".avatar.vts",
+    "WarudoHandler": ".avatar.warudo",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
+
 
 __all__ = [
     "SubtitleHandler",
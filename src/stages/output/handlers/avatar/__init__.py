@@ -7,15 +7,9 @@
 - AvatarHandlerBase: 虚拟形象 Handler 抽象基类
 
 每个 Handler 继承 AvatarHandlerBase 并实现平台特定的适配逻辑。
+各平台 Handler 子模块由 get_handler() 按需导入（导入时触发 @handler 装饰器注册）。
 """
 
-# 导入子模块以触发 @handler 装饰器注册
-from . import (
-    vts,  # noqa: F401
-    warudo,  # noqa: F401
-    vrchat,  # noqa: F401
-)
-
 # 导出基类供外部使用
 from .base import AvatarHandlerBase
 
@@ -30,8 +30,14 @@ class AvatarHandlerBase(ABC):
 
     `_adapt_intent` 返回 `None` 表示跳过(参数校验失败 / 静默 skip),返回 dict
     表示继续渲染。
+
+    Intent 派发事件使用合并订阅:虚拟形象只需呈现最新的表情/动作,突发时每
+    `DISPATCH_COALESCE_MS` 毫秒最多渲染一次最新的 Intent,避免平台 API 排队积压。
+    子类设置为 `None` 可恢复逐条渲染。
     """
 
+    DISPATCH_COALESCE_MS: Optional[int] = 100
+
     def __init__(
         self,
         config: Dict[str, Any],
@@ -79,6 +85,7 @@ class AvatarHandlerBase(ABC):
                 CoreEvents.OUTPUT_INTENT_DISPATCHED,
                 self._handle_intent_dispatched,
                 IntentPayload,
+                coalesce_ms=self.DISPATCH_COALESCE_MS,
             )
             self._dispatch_subscribed = True
             self.logger.debug(f"{self.__class__.__name__} 已订阅 {CoreEvents.OUTPUT_INTENT_DISPATCHED}")
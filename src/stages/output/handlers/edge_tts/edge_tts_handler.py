@@ -21,6 +21,7 @@ from src.modules.events.names import CoreEvents
 from src.modules.events.payloads import IntentPayload
 from src.modules.logging import get_logger
 from src.modules.streaming.audio_stream_channel import AudioStreamChannel
+from src.modules.tracing import TraceStage, get_current_trace_id, get_tracer, use_trace
 from src.modules.tts import AudioDeviceManager
 
 if TYPE_CHECKING:
@@ -147,7 +148,9 @@ class EdgeTTSHandler:
             source: 事件源标识
         """
         intent = payload.to_intent()
-        await self.handle(intent)
+        # trace_id 沿调用链传递到 _speak 和 AudioDeviceManager.play_audio
+        with use_trace(payload.trace_id):
+            await self.handle(intent)
 
     async def handle(self, intent: "Intent"):
         """
@@ -171,17 +174,25 @@ class EdgeTTSHandler:
         Args:
             text: 要合成的文本
         """
+        trace_id = get_current_trace_id()
+        tracer = get_tracer()
+        tracer.start_span(trace_id, TraceStage.TTS_QUEUE)
         async with self.tts_lock:
+            tracer.end_span(trace_id, TraceStage.TTS_QUEUE)
+
             # 通知订阅者: 音频开始
             if self.audio_stream_channel:
                 from src.modules.streaming.audio_chunk import AudioMetadata
 
-                await self.audio_stream_channel.notify_start(AudioMetadata(text=text, sample_rate=48000, channels=1))
+                await self.audio_stream_channel.notify_start(
+                    AudioMetadata(text=text, sample_rate=48000, channels=1, trace_id=trace_id)
+                )
 
             tmp_filename = None
             try:
                 # 合成语音
-                audio_array, samplerate = await self._edge_tts_synthesize(text)
+                with tracer.span(trace_id, TraceStage.TTS_SYNTHESIS):
+                    audio_array, samplerate = await self._edge_tts_synthesize(text)
 
                 # 计算音频时长
                 duration_seconds = len(audio_array) / samplerate if samplerate > 0 else 3.0
@@ -200,6 +211,7 @@ class EdgeTTSHandler:
                             channels=1,
                             sequence=i // chunk_size,
                             timestamp=time.time(),
+                            trace_id=trace_id,
                         )
                         await self.audio_stream_channel.publish(chunk)
 
@@ -216,7 +228,9 @@ class EdgeTTSHandler:
                 if self.audio_stream_channel:
                     from src.modules.streaming.audio_chunk import AudioMetadata
 
-                    await self.audio_stream_channel.notify_end(AudioMetadata(text=text, sample_rate=48000, channels=1))
+                    await self.audio_stream_channel.notify_end(
+                        AudioMetadata(text=text, sample_rate=48000, channels=1, trace_id=trace_id)
+                    )
 
                 # 清理临时文件
                 if tmp_filename and tmp_filename.startswith(tempfile.gettempdir()):
@@ -26,6 +26,7 @@ from src.modules.events.names import CoreEvents
 from src.modules.events.payloads import IntentPayload
 from src.modules.logging import get_logger
 from src.modules.streaming.audio_stream_channel import AudioStreamChannel
+from src.modules.tracing import TraceStage, get_current_trace_id, get_tracer, use_trace
 from src.modules.tts import AudioDeviceManager, GPTSoVITSClient
 from src.modules.types import Intent
 
@@ -197,7 +198,9 @@ class GPTSoVITSHandler:
             source: 事件源标识
         """
         intent = payload.to_intent()
-        await self.handle(intent)
+        # trace_id 沿调用链传递到 handle 和 AudioDeviceManager.play_audio
+        with use_trace(payload.trace_id):
+            await self.handle(intent)
 
     async def cleanup(self):
         """清理资源"""
@@ -236,18 +239,28 @@ class GPTSoVITSHandler:
         self.logger.debug(f"准备TTS: '{original_text[:50]}...'")
 
         final_text = original_text
+        trace_id = get_current_trace_id()
+        tracer = get_tracer()
 
         try:
+            tracer.start_span(trace_id, TraceStage.TTS_QUEUE)
             async with self.tts_lock:
+                tracer.end_span(trace_id, TraceStage.TTS_QUEUE)
+
                 # 通知订阅者: 音频开始
                 audio_channel = self.audio_stream_channel
                 if audio_channel:
                     from src.modules.streaming.audio_chunk import AudioMetadata
 
                     await audio_channel.notify_start(
-                        AudioMetadata(text=final_text, sample_rate=self.sample_rate, channels=CHANNELS)
+                        AudioMetadata(
+                            text=final_text, sample_rate=self.sample_rate, channels=CHANNELS, trace_id=trace_id
+                        )
                     )
 
+                # tts_synthesis 阶段在第一块音频就绪时结束
+                tracer.start_span(trace_id, TraceStage.TTS_SYNTHESIS)
+
                 # 执行TTS（流式）
                 audio_stream = self.tts_client.tts_stream(
                     text=final_text,
@@ -271,6 +284,8 @@ class GPTSoVITSHandler:
                 chunk_index = 0
                 async for chunk in self._process_audio_stream(audio_stream):
                     if chunk is not None:
+                        tracer.end_span(trace_id, TraceStage.TTS_SYNTHESIS)
+
                         # 发布音频块
                         if audio_channel:
                             from src.modules.streaming.audio_chunk import AudioChunk
@@ -281,6 +296,7 @@ class GPTSoVITSHandler:
                                 channels=CHANNELS,
                                 sequence=chunk_index,
                                 timestamp=time.time(),
+                                trace_id=trace_id,
                             )
                             await audio_channel.publish(audio_chunk)
 
@@ -297,7 +313,9 @@ class GPTSoVITSHandler:
                     from src.modules.streaming.audio_chunk import AudioMetadata
 
                     await audio_channel.notify_end(
-                        AudioMetadata(text=final_text, sample_rate=self.sample_rate, channels=CHANNELS)
+                        AudioMetadata(
+                            text=final_text, sample_rate=self.sample_rate, channels=CHANNELS, trace_id=trace_id
+                        )
                     )
 
             self.logger.debug(f"TTS播放完成: '{final_text[:30]}...'")
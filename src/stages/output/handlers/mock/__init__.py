@@ -1,10 +1,16 @@
-"""Mock Output Handler - 用于测试"""
+"""Mock Output Handler - 用于测试和事件重放"""
 
-from typing import TYPE_CHECKING, Any, Dict, Literal
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, Literal, Optional
+
+from pydantic import Field
 
 from src.modules.config.schemas.base import BaseConfig
 from src.modules.events.event_bus import EventBus
+from src.modules.events.names import CoreEvents
+from src.modules.events.payloads.decision import IntentPayload
 from src.modules.logging import get_logger
+from src.modules.tracing import TraceStage, get_tracer
 from src.stages.output.registry import handler
 
 if TYPE_CHECKING:
@@ -14,21 +20,33 @@ if TYPE_CHECKING:
 @handler("mock")
 class MockOutputHandler:
     """
-    模拟输出 Handler（用于测试）
+    模拟输出 Handler（用于测试和事件重放）
+
+    与真实 Handler 一样订阅 OUTPUT_INTENT_DISPATCHED，记录收到的所有 Intent，不进行实际渲染。
+    事件重放时用它替代真实输出 Handler：收到 Intent 即视为"开始播放"，
+    在消息追踪中记录 playback_start，使端到端延迟只包含 Decider 和 Pipeline 的耗时。
 
-    记录收到的所有 Intent，不进行实际渲染。
+    容量压测时可设置 synthesis_delay 作为 TTS 替身：Intent 按顺序逐条"合成"（与真实 TTS 一样持锁串行），
+    等待和合成分别记录为 tts_queue / tts_synthesis 阶段，合成完成后才记录 playback_start。
     """
 
     class ConfigSchema(BaseConfig):
         """模拟输出 Handler 配置（用于测试）"""
 
         type: Literal["mock"] = "mock"
+        synthesis_delay: float = Field(default=0.0, description="模拟 TTS 合成耗时（秒），0 表示不模拟", ge=0)
 
     def __init__(self, config: Dict[str, Any], event_bus: EventBus):
         self.config = config
         self.event_bus = event_bus
         self.logger = get_logger("MockOutputHandler")
         self.received_intents: list = []
+        self._dispatch_subscribed = False
+
+        self.synthesis_delay = self.ConfigSchema.from_dict(config or {}).synthesis_delay
+        self._synthesis_lock = asyncio.Lock()
+        # 等待合成（含正在合成）的 Intent 数量
+        self.pending_count = 0
 
         self.logger.info("MockOutputHandler 初始化完成")
 
@@ -38,12 +56,38 @@ class MockOutputHandler:
         speech = intent.speech[:50] if intent.speech else ""
         self.logger.debug(f"收到 Intent: speech={speech}...")
 
+    async def _handle_intent_dispatched(self, event_name: str, payload: IntentPayload, source: str) -> None:
+        """处理 OUTPUT_INTENT_DISPATCHED 事件"""
+        if self.synthesis_delay > 0:
+            await self._synthesize(payload.trace_id)
+        get_tracer().mark(payload.trace_id, TraceStage.PLAYBACK_START)
+        await self.handle(payload.to_intent())
+
+    async def _synthesize(self, trace_id: Optional[str]) -> None:
+        """模拟 TTS：持锁串行等待 synthesis_delay"""
+        tracer = get_tracer()
+        self.pending_count += 1
+        try:
+            tracer.start_span(trace_id, TraceStage.TTS_QUEUE)
+            async with self._synthesis_lock:
+                tracer.end_span(trace_id, TraceStage.TTS_QUEUE)
+                with tracer.span(trace_id, TraceStage.TTS_SYNTHESIS):
+                    await asyncio.sleep(self.synthesis_delay)
+        finally:
+            self.pending_count -= 1
+
     async def init(self) -> None:
         """初始化 Handler"""
+        if self.event_bus and not self._dispatch_subscribed:
+            self.event_bus.on(CoreEvents.OUTPUT_INTENT_DISPATCHED, self._handle_intent_dispatched, IntentPayload)
+            self._dispatch_subscribed = True
         self.logger.info("MockOutputHandler 启动完成")
 
     async def cleanup(self) -> None:
         """清理 Handler"""
+        if self.event_bus and self._dispatch_subscribed:
+            self.event_bus.off(CoreEvents.OUTPUT_INTENT_DISPATCHED, self._handle_intent_dispatched)
+            self._dispatch_subscribed = False
         self.logger.info(f"MockOutputHandler 清理完成，共收到 {len(self.received_intents)} 条 Intent")
 
     def get_received_intents(self):
@@ -26,6 +26,7 @@ from src.modules.events.names import CoreEvents
 from src.modules.events.payloads import IntentPayload
 from src.modules.logging import get_logger
 from src.modules.streaming.audio_stream_channel import AudioStreamChannel
+from src.modules.tracing import TraceStage, get_current_trace_id, get_tracer, use_trace
 from src.modules.tts import AudioDeviceManager
 from src.modules.types import Intent
 
@@ -201,7 +202,9 @@ class OmniTTSHandler:
             source: 事件源标识
         """
         intent = payload.to_intent()
-        await self.handle(intent)
+        # trace_id 沿调用链传递到 _speak / _decode_and_buffer
+        with use_trace(payload.trace_id):
+            await self.handle(intent)
 
     async def handle(self, intent: Intent):
         """
@@ -227,20 +230,26 @@ class OmniTTSHandler:
 
     async def _speak(self, text: str):
         """执行TTS并播放"""
+        trace_id = get_current_trace_id()
+        tracer = get_tracer()
+        tracer.start_span(trace_id, TraceStage.TTS_QUEUE)
         async with self.tts_lock:
+            tracer.end_span(trace_id, TraceStage.TTS_QUEUE)
+
             # 通知订阅者: 音频开始
             if self.audio_stream_channel:
                 from src.modules.streaming.audio_chunk import AudioMetadata
 
                 await self.audio_stream_channel.notify_start(
-                    AudioMetadata(text=text, sample_rate=self.sample_rate, channels=self.channels)
+                    AudioMetadata(text=text, sample_rate=self.sample_rate, channels=self.channels, trace_id=trace_id)
                 )
 
             # 重置序列计数器
             self.sequence_count = 0
 
             try:
-                # 发起流式TTS请求
+                # 发起流式TTS请求（tts_synthesis 阶段在第一块音频发布时结束）
+                tracer.start_span(trace_id, TraceStage.TTS_SYNTHESIS)
                 audio_stream = self._tts_stream(text)
 
                 # 处理音频流
@@ -261,7 +270,9 @@ class OmniTTSHandler:
                     from src.modules.streaming.audio_chunk import AudioMetadata
 
                     await self.audio_stream_channel.notify_end(
-                        AudioMetadata(text=text, sample_rate=self.sample_rate, channels=self.channels)
+                        AudioMetadata(
+                            text=text, sample_rate=self.sample_rate, channels=self.channels, trace_id=trace_id
+                        )
                     )
 
     def _tts_stream(self, text: str):
@@ -326,6 +337,8 @@ class OmniTTSHandler:
                         raw_block += bytes([self.input_pcm_queue.popleft()])
 
                 # 发布音频块
+                trace_id = get_current_trace_id()
+                get_tracer().end_span(trace_id, TraceStage.TTS_SYNTHESIS)
                 if self.audio_stream_channel:
                     from src.modules.streaming.audio_chunk import AudioChunk
 
@@ -335,6 +348,7 @@ class OmniTTSHandler:
                         channels=self.channels,
                         sequence=self.sequence_count,
                         timestamp=time.time(),
+                        trace_id=trace_id,
                     )
                     await self.audio_stream_channel.publish(chunk)
                     self.sequence_count += 1
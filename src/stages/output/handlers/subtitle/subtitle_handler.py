@@ -215,8 +215,13 @@ class SubtitleHandler:
     字幕输出Handler
 
     使用CustomTkinter显示字幕窗口，支持描边和半透明背景。
+
+    GUI 线程每 100ms 取空一次文本队列并只显示最后一条，
+    因此 Intent 派发事件使用同样窗口的合并订阅，突发时只把最新文本放入队列。
     """
 
+    DISPATCH_COALESCE_MS = 100
+
     class ConfigSchema(BaseConfig):
         """字幕输出Handler配置"""
 
@@ -340,6 +345,7 @@ class SubtitleHandler:
                 CoreEvents.OUTPUT_INTENT_DISPATCHED,
                 self._handle_intent_dispatched,
                 model_class=IntentPayload,
+                coalesce_ms=self.DISPATCH_COALESCE_MS,
             )
             self._dispatch_subscribed = True
 
@@ -21,7 +21,6 @@ OutputHandlerManager - Output 阶段: 输出Handler管理器
 - 所有 OutputHandler 订阅 OUTPUT_INTENT_DISPATCHED 事件
 """
 
-import asyncio
 from typing import Any, Optional
 
 from pydantic import BaseModel
@@ -30,13 +29,15 @@ from src.modules.di import instantiate_with_di
 from src.modules.events.event_bus import EventBus
 from src.modules.events.names import CoreEvents
 from src.modules.events.payloads.decision import IntentPayload
+from src.modules.lifecycle import run_phases
 from src.modules.llm.manager import LLMManager
 from src.modules.logging import get_logger
 from src.modules.pipeline import PipelineManager
 from src.modules.prompts.manager import PromptManager
 from src.modules.streaming.audio_stream_channel import AudioStreamChannel
+from src.modules.tracing import TraceStage, get_tracer
 from src.modules.tts.audio_device_manager import AudioDeviceManager
-from src.stages.output.registry import _HANDLERS, SupportsCapabilities
+from src.stages.output.registry import SupportsCapabilities, get_handler
 from src.modules.types.capabilities import UnifiedActionEntry, UnifiedCapabilitiesView
 
 
@@ -65,6 +66,11 @@ class OutputHandlerManager:
     - Pipeline 集成
     """
 
+    # 单个 Handler init() 的超时秒数（VTS、OBS 等连接卡住时不拖住整个启动）
+    HANDLER_INIT_TIMEOUT = 30.0
+    # 单个 Handler cleanup() 的超时秒数
+    HANDLER_CLEANUP_TIMEOUT = 10.0
+
     def __init__(
         self,
         event_bus: EventBus,
@@ -191,13 +197,14 @@ class OutputHandlerManager:
 
         try:
             if self.pipeline_manager:
-                intent = await self.pipeline_manager.process(intent)
+                with get_tracer().span(payload.trace_id, TraceStage.OUTPUT_PIPELINES):
+                    intent = await self.pipeline_manager.process(intent)
                 if intent is None:
                     self.logger.debug("Intent 被 Pipeline 丢弃，取消本次输出")
                     return
                 self.logger.debug("OutputPipeline 处理完成")
 
-            output_payload = IntentPayload.from_intent(intent, payload.name)
+            output_payload = IntentPayload.from_intent(intent, payload.name, trace_id=payload.trace_id)
             await self.event_bus.emit(
                 CoreEvents.OUTPUT_INTENT_DISPATCHED,
                 output_payload,
@@ -215,29 +222,24 @@ class OutputHandlerManager:
         self.logger.info(f"Handler已注册: {handler_name}")
 
     async def _start_all_handlers(self) -> None:
-        """启动所有Handler"""
+        """启动所有Handler（concurrent_rendering 为 True 时并发执行 init()）"""
         self.logger.info(f"正在启动 {len(self.handlers)} 个Handler...")
 
-        if self.concurrent_rendering:
-            setup_tasks = []
-            for handler in self.handlers:
-                setup_tasks.append(handler.init())
-
-            results = await asyncio.gather(*setup_tasks, return_exceptions=True)
-            for handler, result in zip(self.handlers, results, strict=False):
-                if isinstance(result, Exception):
-                    self._handler_started[handler] = False
-                    self.logger.error(f"Handler启动异常: {self._handler_names.get(handler, 'unknown')} - {result}")
-                else:
-                    self._handler_started[handler] = True
-        else:
-            for handler in self.handlers:
-                try:
-                    await handler.init()
-                    self._handler_started[handler] = True
-                except Exception as e:
-                    self._handler_started[handler] = False
-                    self.logger.error(f"Handler启动失败: {self._handler_names.get(handler, 'unknown')} - {e}")
+        errors = await run_phases(
+            [(f"output.{self._handler_names.get(h, 'unknown')}.init", h.init) for h in self.handlers],
+            timeout=self.HANDLER_INIT_TIMEOUT,
+            concurrent=self.concurrent_rendering,
+        )
+        for handler, error in zip(self.handlers, errors, strict=True):
+            self._handler_started[handler] = error is None
+            if isinstance(error, TimeoutError):
+                self.logger.error(
+                    f"Handler启动超时（{self.HANDLER_INIT_TIMEOUT}s）: {self._handler_names.get(handler, 'unknown')}"
+                )
+            elif error is not None:
+                self.logger.opt(exception=error).error(
+                    f"Handler启动失败: {self._handler_names.get(handler, 'unknown')} - {error}"
+                )
 
         all_setup = all(self._handler_started.get(h, False) for h in self.handlers)
         if all_setup:
@@ -247,15 +249,23 @@ class OutputHandlerManager:
             self.logger.warning(f"部分Handler启动失败: {setup_count}/{len(self.handlers)}")
 
     async def _stop_all_handlers(self):
-        """停止所有Handler"""
+        """并发停止所有Handler，单个Handler的 cleanup() 超时不会拖住其他Handler"""
         self.logger.info(f"正在停止 {len(self.handlers)} 个Handler...")
 
-        for handler in self.handlers:
-            if self._handler_started.get(handler, False):
-                try:
-                    await handler.cleanup()
-                except Exception as e:
-                    self.logger.error(f"Handler停止失败: {self._handler_names.get(handler, 'unknown')} - {e}")
+        started = [h for h in self.handlers if self._handler_started.get(h, False)]
+        errors = await run_phases(
+            [(f"output.{self._handler_names.get(h, 'unknown')}.cleanup", h.cleanup) for h in started],
+            timeout=self.HANDLER_CLEANUP_TIMEOUT,
+        )
+        for handler, error in zip(started, errors, strict=True):
+            if isinstance(error, TimeoutError):
+                self.logger.error(
+                    f"Handler停止超时（{self.HANDLER_CLEANUP_TIMEOUT}s）: {self._handler_names.get(handler, 'unknown')}"
+                )
+            elif error is not None:
+                self.logger.opt(exception=error).error(
+                    f"Handler停止失败: {self._handler_names.get(handler, 'unknown')} - {error}"
+                )
 
         self.logger.info("所有Handler已停止")
 
@@ -423,14 +433,13 @@ class OutputHandlerManager:
 
         使用类型匹配 DI 自动注入 Handler 声明的依赖（AudioStreamChannel 等）。
         """
-        if handler_type not in _HANDLERS:
-            available = list(_HANDLERS.keys())
-            self.logger.error(f"未知的Handler类型: '{handler_type}'. 可用的Handler: {available or '无'}")
+        try:
+            handler_cls = get_handler(handler_type)
+        except KeyError as e:
+            self.logger.error(f"未知的Handler类型: '{handler_type}'. {e}")
             return None
 
         try:
-            handler_cls = _HANDLERS[handler_type]
-
             services_by_type: dict[type, Any] = {EventBus: self.event_bus}
             if self._audio_stream_channel is not None:
                 services_by_type[AudioStreamChannel] = self._audio_stream_channel
@@ -1,11 +1,26 @@
 """OutputPipeline - Output 阶段 Intent 后处理管道系统
 
 OutputPipeline 用于在 Intent 分发给 OutputHandler 前执行过滤/修改/丢弃。
+各 Pipeline 由 PipelineManager 按 component_manifest 清单只导入启用的部分；下列类名在首次访问时才导入。
 """
 
-from .profanity_filter import ProfanityFilterOutputPipeline
+import importlib
+from typing import Any
+
 from src.modules.types.base.pipeline_types import PipelineErrorHandling, PipelineException
 
+_EXPORTS = {
+    "ProfanityFilterOutputPipeline": ".profanity_filter",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
+
+
 __all__ = [
     "ProfanityFilterOutputPipeline",
     "PipelineErrorHandling",
@@ -1,5 +1,6 @@
 """敏感词过滤管道 - Output 阶段 Intent 后处理管道"""
 
 from .pipeline import ProfanityFilterOutputPipeline
+from .streaming import StreamingProfanityFilter
 
-__all__ = ["ProfanityFilterOutputPipeline"]
+__all__ = ["ProfanityFilterOutputPipeline", "StreamingProfanityFilter"]
@@ -0,0 +1,160 @@
+"""敏感词多模式匹配自动机
+
+ProfanityFilterOutputPipeline 的匹配结构。词表在加载或修改时编译为一个 Aho-Corasick 自动机，
+之后每段文本只需线性扫描一遍即可找到所有命中的敏感词，成本与词表大小无关。
+
+替换语义：在所有命中中选择"最左、最长"且互不重叠的匹配，逐一替换为替换文本。
+不区分大小写时文本和敏感词按字符转为小写后再匹配（只转换小写后仍为单个字符的字符，保证下标对齐），
+替换作用于原文本，因此未命中的部分保持原样。
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+def fold_case(text: str) -> str:
+    """逐字符转小写，结果与原文本等长（小写后变为多个字符的字符保持不变）。"""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(low if len(low := ch.lower()) == 1 else ch for ch in text)
+
+
+class WordAutomaton:
+    """Aho-Corasick 自动机。
+
+    状态 0 为根；每个状态保存 goto 转移、失败链接、深度（即当前匹配到的前缀长度）
+    以及在该状态结束的所有敏感词长度（已沿失败链接合并）。
+    """
+
+    def __init__(self, words: Iterable[str], case_sensitive: bool = False):
+        """
+        Args:
+            words: 敏感词（空字符串会被忽略）
+            case_sensitive: 是否区分大小写
+        """
+        self.case_sensitive = case_sensitive
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._depth: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+        self.word_count = 0
+
+        for word in {self.normalize(w) for w in words if w}:
+            self._insert(word)
+            self.word_count += 1
+        self._build_links()
+
+    def __len__(self) -> int:
+        return self.word_count
+
+    @property
+    def max_word_length(self) -> int:
+        return max(self._depth)
+
+    def normalize(self, text: str) -> str:
+        """按大小写规则归一化文本（与匹配时使用的规则相同）。"""
+        return text if self.case_sensitive else fold_case(text)
+
+    def _insert(self, word: str) -> None:
+        state = 0
+        for ch in word:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._depth.append(self._depth[state] + 1)
+                self._out.append(())
+                self._goto[state][ch] = next_state
+            state = next_state
+        self._out[state] = (len(word),)
+
+    def _build_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, child in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(ch, 0)
+                self._fail[child] = fail
+                # 父状态先于子状态出队，fail 的输出已经合并完毕
+                self._out[child] = self._out[child] + self._out[fail]
+                queue.append(child)
+
+    def step(self, state: int, ch: str) -> int:
+        """从 state 读入一个字符（ch 须已按大小写规则归一化）后的状态。"""
+        goto = self._goto
+        while state and ch not in goto[state]:
+            state = self._fail[state]
+        return goto[state].get(ch, 0)
+
+    def depth(self, state: int) -> int:
+        """状态对应的前缀长度：文本末尾最多有这么多字符可能是某个敏感词的开头部分。"""
+        return self._depth[state]
+
+    def outputs(self, state: int) -> Tuple[int, ...]:
+        """在该状态结束的敏感词长度。"""
+        return self._out[state]
+
+    def scan(self, text: str) -> Tuple[List[Tuple[int, int]], int]:
+        """
+        从根状态扫描文本。
+
+        Returns:
+            (所有命中（可能重叠），按结束位置排序的 (start, end) 列表, 扫描结束时的状态)
+        """
+        matches: List[Tuple[int, int]] = []
+        if not self.word_count:
+            return matches, 0
+        state = 0
+        for i, ch in enumerate(self.normalize(text)):
+            state = self.step(state, ch)
+            for length in self._out[state]:
+                matches.append((i + 1 - length, i + 1))
+        return matches, state
+
+    def find_all(self, text: str) -> List[Tuple[int, int]]:
+        """所有命中（可能重叠），按结束位置排序的 (start, end) 列表。"""
+        return self.scan(text)[0]
+
+    def find(self, text: str) -> List[Tuple[int, int]]:
+        """最左、最长且互不重叠的命中，按位置排序。"""
+        return select_leftmost_longest(self.find_all(text))
+
+    def replace(self, text: str, replacement: str) -> Tuple[str, Set[str]]:
+        """
+        替换所有命中的敏感词。
+
+        Returns:
+            (替换后的文本, 命中的敏感词集合)
+        """
+        matches = self.find(text)
+        if not matches:
+            return text, set()
+        parts = []
+        matched = set()
+        position = 0
+        for start, end in matches:
+            parts.append(text[position:start])
+            parts.append(replacement)
+            matched.add(self.normalize(text[start:end]))
+            position = end
+        parts.append(text[position:])
+        return "".join(parts), matched
+
+
+def select_leftmost_longest(matches: List[Tuple[int, int]], start_at: int = 0) -> List[Tuple[int, int]]:
+    """从 (start, end) 命中中选出最左、最长且互不重叠的一组（忽略 start < start_at 的命中）。"""
+    selected: List[Tuple[int, int]] = []
+    position = start_at
+    for start, end in sorted(matches, key=lambda m: (m[0], -m[1])):
+        if start >= position:
+            selected.append((start, end))
+            position = end
+    return selected
+
+
+__all__ = ["WordAutomaton", "fold_case", "select_leftmost_longest"]
@@ -1,13 +1,17 @@
 """脏话过滤管道（Output 阶段）
 
-过滤 Intent 中的敏感词。
+过滤 Intent 中的敏感词。词表编译为 Aho-Corasick 自动机（见 automaton.py），
+每段文本只扫描一遍，成本与词表大小无关。
 """
 
 import os
-import re
-from typing import TYPE_CHECKING, Any, Dict, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Tuple
 
 from src.modules.pipeline import Pipeline, pipeline
+from src.modules.types.base.pipeline_types import PipelineConcurrency
+
+from .automaton import WordAutomaton
+from .streaming import StreamingProfanityFilter
 
 if TYPE_CHECKING:
     from src.modules.types import Intent
@@ -18,6 +22,7 @@ class ProfanityFilterOutputPipeline(Pipeline["Intent"]):
     """敏感词过滤管道。"""
 
     priority = 100
+    concurrency = PipelineConcurrency.CONCURRENT
 
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
@@ -28,6 +33,7 @@ class ProfanityFilterOutputPipeline(Pipeline["Intent"]):
 
         self._profanity_words: Set[str] = set()
         self._load_profanity_words()
+        self._automaton = WordAutomaton(self._profanity_words, self._case_sensitive)
 
         self.logger.info(
             f"ProfanityFilterOutputPipeline 初始化: "
@@ -75,32 +81,14 @@ class ProfanityFilterOutputPipeline(Pipeline["Intent"]):
 
         return item
 
-    def _filter_text(self, text: str):
-        if not self._profanity_words:
+    def _filter_text(self, text: str) -> Tuple[str, bool]:
+        filtered_text, matched_words = self._automaton.replace(text, self._replacement)
+        if not matched_words:
             return text, False
 
-        filtered_text = text
-        has_match = False
-        matched_words = set()
-
-        for profanity_word in sorted(self._profanity_words, key=len, reverse=True):
-            search_text = filtered_text if self._case_sensitive else filtered_text.lower()
-            search_word = profanity_word if self._case_sensitive else profanity_word.lower()
-
-            if search_word in search_text:
-                has_match = True
-                matched_words.add(profanity_word)
-                if self._case_sensitive:
-                    filtered_text = filtered_text.replace(profanity_word, self._replacement)
-                else:
-                    pattern = re.compile(re.escape(profanity_word), re.IGNORECASE)
-                    filtered_text = pattern.sub(self._replacement, filtered_text)
-
-        if has_match:
-            self._stats.filtered_words_count = getattr(self._stats, "filtered_words_count", 0) + len(matched_words)
-            self.logger.debug(f"检测到敏感词: {matched_words}")
-
-        return filtered_text, has_match
+        self._stats.filtered_words_count = getattr(self._stats, "filtered_words_count", 0) + len(matched_words)
+        self.logger.debug(f"检测到敏感词: {matched_words}")
+        return filtered_text, True
 
     def get_info(self) -> Dict[str, Any]:
         info = super().get_info()
@@ -118,13 +106,23 @@ class ProfanityFilterOutputPipeline(Pipeline["Intent"]):
         if not self._case_sensitive:
             word = word.lower()
         self._profanity_words.add(word)
+        self._rebuild_automaton()
         self.logger.info(f"添加敏感词: '{word}'")
 
     def remove_profanity_word(self, word: str) -> None:
         if not self._case_sensitive:
             word = word.lower()
         self._profanity_words.discard(word)
+        self._rebuild_automaton()
         self.logger.info(f"移除敏感词: '{word}'")
 
     def get_profanity_words(self) -> Set[str]:
         return self._profanity_words.copy()
+
+    def create_stream(self) -> StreamingProfanityFilter:
+        """创建一条增量文本流的过滤器（用于 LLM 流式输出、逐句 TTS 等，见 streaming.py）"""
+        return StreamingProfanityFilter(self._automaton, self._replacement)
+
+    def _rebuild_automaton(self) -> None:
+        # 整体替换引用：并发中的 _filter_text 继续使用旧自动机，不会看到构建到一半的状态
+        self._automaton = WordAutomaton(self._profanity_words, self._case_sensitive)
@@ -0,0 +1,101 @@
+"""流式敏感词过滤
+
+对增量到达的文本（LLM 流式输出、逐句送入 TTS 的文本）做与 ProfanityFilterOutputPipeline 相同的过滤，
+不必等待完整回复。
+
+每次 feed() 只扣留可能与后续文本组成敏感词的最短后缀，其余文本立即释放：
+
+- 扫描结束时自动机的状态深度 d 表示文本末尾最长的、是某个敏感词前缀的后缀长度，
+  因此之后到达的文本产生的命中一定从 len(text) - d 或更靠后的位置开始
+- 在此之前开始的命中不会再被更左或更长的命中取代，可以直接替换并释放
+- 若某个已确定的命中跨过了该边界，释放到命中结束处（边界内被它覆盖的部分不会再产生新命中）
+
+扣留的后缀不超过最长敏感词的长度，每次 feed() 重新扫描的文本也不超过 扣留后缀 + 新文本，
+因此总成本与整段文本一次性过滤相同，且拼接所有输出与对完整文本调用 _filter_text() 的结果一致。
+"""
+
+from typing import AsyncIterable, AsyncIterator, Set
+
+from .automaton import WordAutomaton, select_leftmost_longest
+
+
+class StreamingProfanityFilter:
+    """单条流的增量过滤器（不可跨流复用，每条流调用一次 ProfanityFilterOutputPipeline.create_stream()）。
+
+    已释放的文本无法收回，因此 drop_on_match 在流式场景下不会生效；
+    调用方可以在结束后检查 has_match / matched_words 自行决定后续处理。
+    """
+
+    def __init__(self, automaton: WordAutomaton, replacement: str):
+        """
+        Args:
+            automaton: 已编译的敏感词自动机（创建时的快照，之后词表变化不影响本条流）
+            replacement: 替换文本
+        """
+        self._automaton = automaton
+        self._replacement = replacement
+        self._pending = ""
+        self.matched_words: Set[str] = set()
+
+    @property
+    def has_match(self) -> bool:
+        return bool(self.matched_words)
+
+    @property
+    def pending(self) -> str:
+        """当前扣留、尚未释放的文本"""
+        return self._pending
+
+    def feed(self, chunk: str) -> str:
+        """
+        输入一段增量文本
+
+        Returns:
+            可以立即释放的已过滤文本（可能为空字符串）
+        """
+        if not chunk:
+            return ""
+        text = self._pending + chunk
+        matches, state = self._automaton.scan(text)
+        boundary = len(text) - self._automaton.depth(state)
+
+        parts = []
+        position = 0
+        for start, end in select_leftmost_longest(matches):
+            if start >= boundary:
+                break
+            parts.append(text[position:start])
+            parts.append(self._replacement)
+            self.matched_words.add(self._automaton.normalize(text[start:end]))
+            position = end
+
+        release = max(position, boundary)
+        parts.append(text[position:release])
+        self._pending = text[release:]
+        return "".join(parts)
+
+    def flush(self) -> str:
+        """流结束：过滤并释放所有扣留的文本"""
+        text, self._pending = self._pending, ""
+        if not text:
+            return ""
+        filtered, matched = self._automaton.replace(text, self._replacement)
+        self.matched_words |= matched
+        return filtered
+
+    async def filter(self, chunks: AsyncIterable[str]) -> AsyncIterator[str]:
+        """
+        包装异步文本流（如 LLMManager.stream_chat() 的输出），逐段产出已过滤文本
+
+        空的中间结果不会产出；流结束时产出剩余文本。
+        """
+        async for chunk in chunks:
+            released = self.feed(chunk)
+            if released:
+                yield released
+        tail = self.flush()
+        if tail:
+            yield tail
+
+
+__all__ = ["StreamingProfanityFilter"]
@@ -6,7 +6,8 @@
     class TTSOutputHandler:
         ...
 
-导入此模块即可填充 _HANDLERS 字典。
+导入组件模块即可填充 _HANDLERS 字典；get_handler() 会按 component_manifest 清单按需导入尚未注册的组件，
+list_handlers() 列出清单中的全部组件而不导入实现。
 
 设计原则:
 - 极简设计：模块级字典 + 装饰器函数
@@ -16,6 +17,8 @@
 
 from typing import TYPE_CHECKING, Dict, Protocol, Type, TypeVar, runtime_checkable
 
+from src.modules.config.component_manifest import import_component, list_components
+
 if TYPE_CHECKING:
     from src.modules.types.capabilities import HandlerCapabilities
 
@@ -73,24 +76,27 @@ def get_handler(name: str) -> Type:
 
     Raises:
         KeyError: 如果 Handler 未找到
+        ImportError: 如果 Handler 的实现模块（或其依赖）导入失败
 
     Returns:
         Handler 类
     """
     if name not in _HANDLERS:
-        available = list(_HANDLERS.keys())
+        import_component("output", name)
+    if name not in _HANDLERS:
+        available = list_handlers()
         raise KeyError(f"Handler '{name}' 未找到。可用: {available}")
     return _HANDLERS[name]
 
 
 def list_handlers() -> list[str]:
     """
-    列出所有已注册的 Handler 名称
+    列出所有可用的 Handler 名称（清单中的组件 + 已注册的组件，不导入实现）
 
     Returns:
         Handler 名称列表
     """
-    return list(_HANDLERS.keys())
+    return list(dict.fromkeys([*list_components("output"), *_HANDLERS]))
 
 
 @runtime_checkable
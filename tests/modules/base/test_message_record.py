@@ -0,0 +1,158 @@
+"""
+MessageRecord 单元测试（阶段间轻量消息、原始消息延迟序列化、MessageReadyPayload 兼容性）
+
+运行: uv run pytest tests/modules/base/test_message_record.py -v
+"""
+
+import json
+
+import pytest
+
+from src.modules.events.event_bus import EventBus
+from src.modules.events.names import CoreEvents
+from src.modules.events.payloads.input import MessageReadyPayload
+from src.modules.types.base.message_record import MessageRecord
+from src.modules.types.base.normalized_message import NormalizedMessage
+from src.stages.input.shared.bili_messages import DanmakuMessage
+
+
+class CountingRaw(DanmakuMessage):
+    """记录 model_dump 调用次数的原始消息"""
+
+    def model_dump(self, **kwargs):
+        CountingRaw.dump_count += 1
+        return super().model_dump(**kwargs)
+
+
+def create_message(**kwargs) -> NormalizedMessage:
+    params = {
+        "text": "你好",
+        "source": "bili_danmaku_official",
+        "importance": 0.7,
+        "timestamp_ms": 1700000000000,
+        "user_id": "open-1",
+        "user_nickname": "观众A",
+        "platform": "bilibili",
+        "room_id": "123",
+    }
+    params.update(kwargs)
+    return NormalizedMessage(**params)
+
+
+def create_raw() -> CountingRaw:
+    CountingRaw.dump_count = 0
+    return CountingRaw(cmd="LIVE_OPEN_PLATFORM_DM", uname="观众A", msg="你好")
+
+
+def test_from_normalized_keeps_original_message():
+    message = create_message()
+
+    record = MessageRecord.from_normalized(message)
+
+    assert record.text == "你好"
+    assert record.user_nickname == "观众A"
+    assert record.to_normalized() is message
+
+
+def test_mapping_matches_model_dump():
+    """按字典读取的结果与原来 model_dump() 得到的字典一致"""
+    message = create_message(raw=create_raw())
+
+    record = MessageRecord.from_normalized(message)
+
+    assert dict(record) == message.model_dump(mode="python")
+    assert record.to_dict() == message.model_dump(mode="python")
+    assert record.get("metadata", {}) == {}
+    assert "text" in record and "metadata" not in record
+    with pytest.raises(KeyError):
+        record["metadata"]
+
+
+def test_raw_is_serialized_lazily_once():
+    raw = create_raw()
+    record = MessageRecord.from_normalized(create_message(raw=raw))
+
+    assert record.raw is raw
+    assert record.get("text") == "你好"
+    assert "raw" in record
+    assert CountingRaw.dump_count == 0
+
+    assert record["raw"]["msg"] == "你好"
+    assert record["raw"] is record.raw_dict
+    assert CountingRaw.dump_count == 1
+
+
+def test_to_normalized_without_original():
+    record = MessageRecord(text="测试", source="console", importance=0.9, raw={"k": "v"})
+
+    normalized = record.to_normalized()
+
+    assert isinstance(normalized, NormalizedMessage)
+    assert (normalized.text, normalized.importance, normalized.raw) == ("测试", 0.9, {"k": "v"})
+    assert record.to_normalized() is normalized
+    assert record["raw"] == {"k": "v"}
+
+
+def test_slots_only():
+    record = MessageRecord(text="测试", source="console")
+
+    with pytest.raises(AttributeError):
+        record.extra = 1
+
+
+# =============================================================================
+# MessageReadyPayload
+# =============================================================================
+
+
+def test_payload_carries_record_without_dumping_raw():
+    raw = create_raw()
+    message = create_message(raw=raw)
+
+    payload = MessageReadyPayload.from_normalized_message(message, trace_id="t1")
+
+    assert isinstance(payload.message, MessageRecord)
+    assert payload.message.to_normalized() is message
+    assert payload.metadata == {"user_id": "open-1", "username": "观众A"}
+    assert CountingRaw.dump_count == 0
+
+
+def test_payload_serializes_record_as_dict():
+    """Dashboard 广播和事件日志仍得到字典，日志可以按旧格式还原"""
+    payload = MessageReadyPayload.from_normalized_message(create_message(raw=create_raw()))
+
+    dumped = payload.model_dump()
+    assert dumped["message"]["text"] == "你好"
+    assert dumped["message"]["raw"]["uname"] == "观众A"
+
+    restored = MessageReadyPayload.model_validate(json.loads(payload.model_dump_json(by_alias=True)))
+    assert isinstance(restored.message, dict)
+    assert restored.message["text"] == "你好"
+
+
+def test_payload_still_accepts_dict():
+    payload = MessageReadyPayload(message={"text": "测试消息", "source": "test"}, source="test")
+
+    assert isinstance(payload.message, dict)
+    assert str(payload) == "测试消息"
+
+
+@pytest.mark.asyncio
+async def test_subscribers_share_the_record():
+    event_bus = EventBus(enable_stats=False)
+    received = []
+
+    async def handler(event_name: str, payload: MessageReadyPayload, source: str):
+        received.append(payload.message)
+
+    event_bus.on(CoreEvents.INPUT_MESSAGE_RECEIVED, handler, MessageReadyPayload)
+    event_bus.on(CoreEvents.INPUT_MESSAGE_RECEIVED, handler, MessageReadyPayload)
+    message = create_message()
+
+    await event_bus.emit(
+        CoreEvents.INPUT_MESSAGE_RECEIVED, MessageReadyPayload.from_normalized_message(message), "test", wait=True
+    )
+
+    assert len(received) == 2
+    assert received[0] is received[1]
+    assert received[0].to_normalized() is message
@@ -0,0 +1,111 @@
+"""
+组件清单（component_manifest）测试
+
+运行: uv run pytest tests/modules/config/test_component_manifest.py -v
+"""
+
+import importlib
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.modules.config.component_manifest import (
+    COMPONENT_MANIFEST,
+    PIPELINE_MANIFEST,
+    get_component_module,
+    import_component,
+    list_components,
+)
+from src.modules.pipeline.registry import PIPELINE_REGISTRY
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+STAGES_DIR = PROJECT_ROOT / "src" / "stages"
+
+_REGISTRIES = {
+    "input": ("src.stages.input.registry", "_COLLECTORS", "collector"),
+    "decision": ("src.stages.decision.registry", "_DECIDERS", "decider"),
+    "output": ("src.stages.output.registry", "_HANDLERS", "handler"),
+}
+
+
+def _decorated_names(decorator: str) -> dict:
+    """扫描源码中的 @<decorator>("name")，返回 {name: 模块路径}"""
+    pattern = re.compile(rf'^@{decorator}\("([^"]+)"\)', re.MULTILINE)
+    found = {}
+    for path in STAGES_DIR.rglob("*.py"):
+        for name in pattern.findall(path.read_text(encoding="utf-8")):
+            module = ".".join(path.relative_to(PROJECT_ROOT).with_suffix("").parts)
+            found[name] = module.removesuffix(".__init__")
+    return found
+
+
+@pytest.mark.parametrize("phase", list(_REGISTRIES))
+def test_manifest_lists_every_decorated_component(phase):
+    """清单与源码中的装饰器注册一致（新增组件忘记登记时失败）"""
+    _, _, decorator = _REGISTRIES[phase]
+    assert _decorated_names(decorator) == COMPONENT_MANIFEST[phase]
+
+
+def test_pipeline_manifest_lists_every_decorated_pipeline():
+    decorated = _decorated_names("pipeline")
+    manifest = {name: module for modules in PIPELINE_MANIFEST.values() for name, module in modules.items()}
+    assert decorated == manifest
+
+
+@pytest.mark.parametrize(
+    "phase,name", [(phase, name) for phase, modules in COMPONENT_MANIFEST.items() for name in modules]
+)
+def test_import_component_registers_class(phase, name):
+    """按清单导入组件后，组件已注册到对应 registry"""
+    registry_path, registry_attr, _ = _REGISTRIES[phase]
+    try:
+        assert import_component(phase, name) is True
+    except ImportError as e:
+        pytest.skip(f"组件 {name} 的可选依赖未安装: {e}")
+
+    registry = getattr(importlib.import_module(registry_path), registry_attr)
+    assert name in registry
+
+
+@pytest.mark.parametrize(
+    "stage,name", [(stage, name) for stage, modules in PIPELINE_MANIFEST.items() for name in modules]
+)
+def test_import_pipeline_registers_class(stage, name):
+    importlib.import_module(PIPELINE_MANIFEST[stage][name])
+    assert (stage, name) in PIPELINE_REGISTRY
+
+
+def test_unknown_component():
+    assert get_component_module("input", "nonexistent") is None
+    assert import_component("input", "nonexistent") is False
+
+
+def test_list_without_import():
+    """列举组件不需要导入实现"""
+    from src.stages.input.registry import list_collectors
+
+    assert list_components("input") == list(COMPONENT_MANIFEST["input"])
+    assert set(COMPONENT_MANIFEST["input"]) <= set(list_collectors())
+
+
+def test_importing_packages_does_not_import_components():
+    """导入阶段包、列举组件都不会导入任何组件实现"""
+    code = (
+        "import sys\n"
+        "import src.stages.input.collectors, src.stages.input.pipelines\n"
+        "import src.stages.decision.deciders, src.stages.output.handlers, src.stages.output.pipelines\n"
+        "from src.stages.input.registry import list_collectors\n"
+        "list_collectors()\n"
+        "print('\\n'.join(sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True, timeout=60
+    )
+    loaded = set(result.stdout.split())
+
+    component_modules = [module for modules in COMPONENT_MANIFEST.values() for module in modules.values()]
+    component_modules += [module for modules in PIPELINE_MANIFEST.values() for module in modules.values()]
+    assert not loaded & set(component_modules)
@@ -0,0 +1,69 @@
+"""
+类型匹配依赖注入（instantiate_with_di）单元测试
+
+运行: uv run pytest tests/modules/di/test_instantiation.py -v
+"""
+
+from typing import Any, Dict, Optional
+
+import pytest
+
+from src.modules.di import DependencyInjectionError, instantiate_with_di, instantiation
+from src.modules.lifecycle import get_lifecycle_profiler
+
+
+class Service:
+    pass
+
+
+class OtherService:
+    pass
+
+
+class Participant:
+    def __init__(self, config: Dict[str, Any], service: Service, other: Optional[OtherService] = None):
+        self.config = config
+        self.service = service
+        self.other = other
+
+
+def test_injects_by_type():
+    service = Service()
+
+    participant = instantiate_with_di(Participant, config={"a": 1}, services_by_type={Service: service})
+
+    assert participant.config == {"a": 1}
+    assert participant.service is service
+    assert participant.other is None
+
+
+def test_missing_required_service():
+    with pytest.raises(DependencyInjectionError, match="service"):
+        instantiate_with_di(Participant, config={}, services_by_type={OtherService: OtherService()})
+
+
+def test_init_spec_is_cached_per_class(monkeypatch):
+    """同一个类只解析一次签名和类型注解"""
+    calls = []
+    original = instantiation.get_type_hints
+
+    def counting_get_type_hints(obj):
+        calls.append(obj)
+        return original(obj)
+
+    monkeypatch.setattr(instantiation, "get_type_hints", counting_get_type_hints)
+    monkeypatch.setattr(instantiation, "_INIT_SPEC_CACHE", {})
+
+    for _ in range(3):
+        instantiate_with_di(Participant, config={}, services_by_type={Service: Service()})
+
+    assert calls == [Participant.__init__]
+
+
+def test_instantiation_is_profiled():
+    profiler = get_lifecycle_profiler()
+    profiler.reset()
+
+    instantiate_with_di(Participant, config={}, services_by_type={Service: Service()})
+
+    assert [r.name for r in profiler.records(prefix="di.")] == ["di.Participant"]
@@ -362,6 +362,57 @@ async def test_default_priority(event_bus: EventBus):
     assert execution_order == ["high", "default"]
 
 
+@pytest.mark.asyncio
+async def test_dispatch_table_compiled_once_and_invalidated(event_bus: EventBus):
+    """测试分发表只在订阅变化时重新编译"""
+    execution_order = []
+
+    async def handler_a(event_name, payload: SimpleTestEvent, source: str):
+        execution_order.append("a")
+
+    async def handler_b(event_name, payload: SimpleTestEvent, source: str):
+        execution_order.append("b")
+
+    event_bus.on("test.event", handler_a, SimpleTestEvent, priority=50)
+    await event_bus.emit("test.event", SimpleTestEvent(), source="test", wait=True)
+    table = event_bus._dispatch_tables["test.event"]
+
+    # 再次 emit 复用同一个分发表
+    await event_bus.emit("test.event", SimpleTestEvent(), source="test", wait=True)
+    assert event_bus._dispatch_tables["test.event"] is table
+
+    # 新订阅使分发表失效，并按优先级重新编译
+    event_bus.on("test.event", handler_b, SimpleTestEvent, priority=10)
+    assert "test.event" not in event_bus._dispatch_tables
+    execution_order.clear()
+    await event_bus.emit("test.event", SimpleTestEvent(), source="test", wait=True)
+    assert execution_order == ["b", "a"]
+
+    # 取消订阅同样使分发表失效
+    event_bus.off("test.event", handler_b)
+    execution_order.clear()
+    await event_bus.emit("test.event", SimpleTestEvent(), source="test", wait=True)
+    assert execution_order == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_single_handler_fast_path_runs_without_extra_task(event_bus: EventBus):
+    """测试单处理器事件在 wait=True 时直接在调用方任务中执行"""
+    caller_task = None
+    handler_task = None
+
+    async def handler(event_name, payload: SimpleTestEvent, source: str):
+        nonlocal handler_task
+        handler_task = asyncio.current_task()
+
+    event_bus.on("test.event", handler, SimpleTestEvent)
+
+    caller_task = asyncio.current_task()
+    await event_bus.emit("test.event", SimpleTestEvent(), source="test", wait=True)
+
+    assert handler_task is caller_task
+
+
 # =============================================================================
 # 错误隔离测试
 # =============================================================================
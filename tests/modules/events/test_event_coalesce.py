@@ -0,0 +1,149 @@
+"""
+合并订阅（CoalescingMailbox）单元测试
+
+测试 EventBus.on(coalesce_ms=..., coalesce_key=...) 的行为：
+- 同 key 的待处理事件只保留最新一条
+- 每个窗口最多交付一批，空闲后的第一个事件立即交付
+- key 数量上限、wait=True 语义与统计
+
+运行: uv run pytest tests/modules/events/test_event_coalesce.py -v
+"""
+
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from src.modules.events.event_bus import EventBus
+from src.modules.events.mailbox import CoalescingMailbox
+
+
+class StateEvent(BaseModel):
+    """带 key 的状态事件"""
+
+    name: str = "a"
+    seq: int = 0
+
+
+@pytest.fixture
+def event_bus():
+    return EventBus()
+
+
+def make_recorder(received: list):
+    async def handler(event_name: str, payload: StateEvent, source: str):
+        received.append((payload.name, payload.seq))
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_first_event_delivered_immediately_then_throttled(event_bus: EventBus):
+    """空闲后的第一个事件立即交付，窗口内的后续事件合并为最新一条"""
+    received = []
+    event_bus.on("test.coalesce", make_recorder(received), StateEvent, coalesce_ms=50)
+
+    await event_bus.emit("test.coalesce", StateEvent(seq=0), source="test")
+    await asyncio.sleep(0.01)
+    assert received == [("a", 0)]
+
+    for i in range(1, 20):
+        await event_bus.emit("test.coalesce", StateEvent(seq=i), source="test")
+    await asyncio.sleep(0.01)
+    assert received == [("a", 0)]  # 仍在窗口内
+
+    await asyncio.sleep(0.08)
+    assert received == [("a", 0), ("a", 19)]
+
+    stats = event_bus.get_queue_stats()["test.coalesce"][0]
+    assert stats.policy == "coalesce"
+    assert stats.coalesced_count == 18
+    assert stats.delivered_count == 2
+    assert stats.dropped_count == 0
+
+
+@pytest.mark.asyncio
+async def test_coalesce_key_keeps_latest_per_key(event_bus: EventBus):
+    """按 key 合并：每个 key 保留最新一条，交付顺序为 key 首次出现的顺序"""
+    received = []
+    gate = asyncio.Event()
+
+    async def handler(event_name: str, payload: StateEvent, source: str):
+        await gate.wait()
+        received.append((payload.name, payload.seq))
+
+    event_bus.on("test.coalesce", handler, StateEvent, coalesce_key=lambda p: p.name)
+
+    await event_bus.emit("test.coalesce", StateEvent(name="x", seq=0), source="test")
+    await asyncio.sleep(0)  # 工作协程取走第一批并阻塞在 gate 上
+    for i in range(1, 6):
+        await event_bus.emit("test.coalesce", StateEvent(name="b" if i % 2 else "c", seq=i), source="test")
+
+    gate.set()
+    await asyncio.sleep(0.01)
+    assert received == [("x", 0), ("b", 5), ("c", 4)]
+
+
+@pytest.mark.asyncio
+async def test_max_pending_limits_keys(event_bus: EventBus):
+    """不同 key 超过 max_pending 时丢弃最旧的 key"""
+    received = []
+    event_bus.on(
+        "test.coalesce",
+        make_recorder(received),
+        StateEvent,
+        max_pending=2,
+        coalesce_ms=1000,
+        coalesce_key=lambda p: p.name,
+    )
+
+    await event_bus.emit("test.coalesce", StateEvent(name="first"), source="test")
+    await asyncio.sleep(0.01)
+    for name in ("a", "b", "c"):
+        await event_bus.emit("test.coalesce", StateEvent(name=name), source="test")
+
+    stats = event_bus.get_queue_stats()["test.coalesce"][0]
+    assert stats.depth == 2
+    assert stats.dropped_count == 1
+    assert received == [("first", 0)]
+
+
+@pytest.mark.asyncio
+async def test_wait_true_resolves_with_merged_delivery(event_bus: EventBus):
+    """被合并事件的 emit(wait=True) 在合并后的事件交付时一起返回"""
+    received = []
+    event_bus.on("test.coalesce", make_recorder(received), StateEvent, coalesce_ms=30)
+
+    await event_bus.emit("test.coalesce", StateEvent(seq=0), source="test", wait=True)
+    results = await asyncio.gather(
+        *(event_bus.emit("test.coalesce", StateEvent(seq=i), source="test", wait=True) for i in range(1, 4))
+    )
+
+    assert results == [None, None, None]
+    assert received == [("a", 0), ("a", 3)]
+
+
+@pytest.mark.asyncio
+async def test_off_closes_coalescing_mailbox(event_bus: EventBus):
+    """取消订阅后丢弃待处理事件"""
+    received = []
+    handler = make_recorder(received)
+    event_bus.on("test.coalesce", handler, StateEvent, coalesce_ms=1000)
+
+    await event_bus.emit("test.coalesce", StateEvent(seq=0), source="test")
+    await asyncio.sleep(0.01)
+    await event_bus.emit("test.coalesce", StateEvent(seq=1), source="test")
+    event_bus.off("test.coalesce", handler)
+    await asyncio.sleep(0.01)
+
+    assert received == [("a", 0)]
+
+
+def test_invalid_window():
+    """window_ms 为负数时报错"""
+
+    async def consumer(event_name, payload, source):
+        pass
+
+    with pytest.raises(ValueError):
+        CoalescingMailbox("handler", 8, consumer, window_ms=-1)
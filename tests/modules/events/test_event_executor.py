@@ -0,0 +1,167 @@
+"""
+同步处理器执行器（SyncHandlerExecutor）单元测试
+
+测试内容：
+- 同步处理器运行在专用线程池中，不占用默认线程池
+- isolated=True 的处理器独占执行器
+- 排队深度、超时和卡住处理器的统计
+
+运行: uv run pytest tests/modules/events/test_event_executor.py -v
+"""
+
+import asyncio
+import threading
+
+import pytest
+from pydantic import BaseModel
+
+from src.modules.events.event_bus import EventBus
+from src.modules.events.executor import SyncHandlerExecutor
+
+
+class SyncEvent(BaseModel):
+    """测试事件"""
+
+    seq: int = 0
+
+
+@pytest.mark.asyncio
+async def test_sync_handler_runs_on_dedicated_executor():
+    """同步处理器运行在 EventBus 专用线程中"""
+    event_bus = EventBus()
+    thread_names = []
+
+    def handler(event_name: str, payload: SyncEvent, source: str):
+        thread_names.append(threading.current_thread().name)
+
+    event_bus.on("test.sync", handler, SyncEvent)
+    await event_bus.emit("test.sync", SyncEvent(), source="test", wait=True)
+
+    assert len(thread_names) == 1
+    assert thread_names[0].startswith("EventBus-sync")
+    stats = event_bus.get_executor_stats()
+    assert [s.name for s in stats] == ["EventBus-sync"]
+    assert stats[0].completed_count == 1
+    assert stats[0].pending == 0
+    await event_bus.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_blocked_handler_does_not_starve_default_executor():
+    """同步处理器占满专用线程池时，默认线程池仍然可用"""
+    event_bus = EventBus(sync_workers=1)
+    release = threading.Event()
+
+    def blocking_handler(event_name: str, payload: SyncEvent, source: str):
+        release.wait(timeout=5)
+
+    event_bus.on("test.sync", blocking_handler, SyncEvent)
+    for i in range(3):
+        await event_bus.emit("test.sync", SyncEvent(seq=i), source="test")
+    await asyncio.sleep(0.05)
+
+    result = await asyncio.wait_for(asyncio.to_thread(lambda: "default pool ok"), timeout=1)
+    assert result == "default pool ok"
+
+    stats = event_bus.get_executor_stats()[0]
+    assert stats.active == 1
+    assert stats.queued == 2
+    assert stats.high_watermark == 3
+
+    release.set()
+    await event_bus.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_isolated_handler_has_own_executor():
+    """isolated=True 的处理器阻塞时不影响共享执行器中的其他处理器"""
+    event_bus = EventBus(sync_workers=1)
+    release = threading.Event()
+    received = []
+
+    def slow_handler(event_name: str, payload: SyncEvent, source: str):
+        release.wait(timeout=5)
+
+    def fast_handler(event_name: str, payload: SyncEvent, source: str):
+        received.append(payload.seq)
+
+    event_bus.on("test.slow", slow_handler, SyncEvent, isolated=True)
+    event_bus.on("test.fast", fast_handler, SyncEvent)
+
+    await event_bus.emit("test.slow", SyncEvent(), source="test")
+    await asyncio.wait_for(event_bus.emit("test.fast", SyncEvent(seq=1), source="test", wait=True), timeout=1)
+    assert received == [1]
+
+    names = {s.name for s in event_bus.get_executor_stats()}
+    assert names == {"EventBus-sync", "EventBus-slow_handler"}
+
+    release.set()
+    await event_bus.cleanup()
+
+
+def test_isolated_rejects_async_handler():
+    """isolated 只适用于同步处理器"""
+    event_bus = EventBus()
+
+    async def handler(event_name: str, payload: SyncEvent, source: str):
+        pass
+
+    with pytest.raises(ValueError):
+        event_bus.on("test.sync", handler, SyncEvent, isolated=True)
+
+
+@pytest.mark.asyncio
+async def test_timeout_reports_stuck_handler():
+    """超时后 emit 不再等待，卡住的处理器出现在 stuck 列表中直到返回"""
+    event_bus = EventBus(sync_handler_timeout=0.05)
+    release = threading.Event()
+
+    def stuck_handler(event_name: str, payload: SyncEvent, source: str):
+        release.wait(timeout=5)
+
+    event_bus.on("test.sync", stuck_handler, SyncEvent)
+    await asyncio.wait_for(event_bus.emit("test.sync", SyncEvent(), source="test", wait=True), timeout=1)
+
+    stats = event_bus.get_executor_stats()[0]
+    assert stats.timeout_count == 1
+    assert [name for name, _ in stats.stuck] == ["stuck_handler"]
+    assert stats.stuck[0][1] >= 0.05
+    assert event_bus.get_stats("test.sync").error_count == 1
+
+    release.set()
+    await asyncio.sleep(0.05)
+    assert event_bus.get_executor_stats()[0].stuck == []
+    await event_bus.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_queued_call_is_cancelled_on_timeout():
+    """排队中超时的调用被取消，不会再运行"""
+    executor = SyncHandlerExecutor("test", 1, timeout=0.05)
+    release = threading.Event()
+    calls = []
+
+    def work(tag: str):
+        calls.append(tag)
+        release.wait(timeout=5)
+
+    first = asyncio.create_task(executor.run("first", work, "first"))
+    await asyncio.sleep(0.01)
+    with pytest.raises(asyncio.TimeoutError):
+        await executor.run("second", work, "second")
+    with pytest.raises(asyncio.TimeoutError):
+        await first
+
+    release.set()
+    await asyncio.sleep(0.05)
+    assert calls == ["first"]
+    assert executor.stats.timeout_count == 2
+    executor.shutdown()
+
+
+def test_invalid_executor_config():
+    """线程数和超时必须为正数"""
+    with pytest.raises(ValueError):
+        SyncHandlerExecutor("test", 0)
+    with pytest.raises(ValueError):
+        SyncHandlerExecutor("test", 1, timeout=0)
@@ -0,0 +1,156 @@
+"""
+事件日志录制与重放单元测试
+
+测试内容：
+- EventJournal 通过 EventBus tap 录制所有事件（含 gzip 压缩格式）
+- read_journal 读取多次追加录制的片段
+- JournalReplayer 的倍速/最大速度重放、事件过滤与 trace_id 分配
+
+运行: uv run pytest tests/modules/events/test_event_journal.py -v
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.modules.events.event_bus import EventBus
+from src.modules.events.journal import EventJournal, JournalRecord, read_journal
+from src.modules.events.names import CoreEvents
+from src.modules.events.payloads.decision import IntentPayload
+from src.modules.events.payloads.input import MessageReadyPayload
+from src.modules.events.replay import JournalReplayer
+from src.modules.tracing import get_tracer
+from src.modules.types.base.normalized_message import NormalizedMessage
+from src.modules.types.intent import Intent, IntentMetadata
+
+
+def _message_payload(text: str) -> MessageReadyPayload:
+    message = NormalizedMessage(text=text, source="console", user_id="u1", user_nickname="观众")
+    return MessageReadyPayload.from_normalized_message(message, trace_id="recorded-trace")
+
+
+def _intent_payload(speech: str) -> IntentPayload:
+    intent = Intent(speech=speech, metadata=IntentMetadata(source_id="test", decision_time_ms=0))
+    return IntentPayload.from_intent(intent, name="test")
+
+
+def _record(offset_ms: float, text: str) -> JournalRecord:
+    payload = _message_payload(text).model_dump(mode="json", by_alias=True)
+    return JournalRecord(offset_ms, CoreEvents.INPUT_MESSAGE_RECEIVED, "console", payload)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("filename", ["events.jsonl", "events.jsonl.gz"])
+async def test_journal_records_all_events(tmp_path, filename):
+    """录制所有 emit（包括没有订阅者的事件），读取后可按 EventRegistry 类型还原"""
+    path = str(tmp_path / filename)
+    event_bus = EventBus()
+    journal = EventJournal(path)
+    journal.attach(event_bus)
+
+    await event_bus.emit(CoreEvents.INPUT_MESSAGE_RECEIVED, _message_payload("你好"), source="console")
+    await event_bus.emit(CoreEvents.DECISION_INTENT_GENERATED, _intent_payload("欢迎"), source="echo")
+    await journal.close()
+    await event_bus.emit(CoreEvents.INPUT_MESSAGE_RECEIVED, _message_payload("录制结束后"), source="console")
+
+    records = list(read_journal(path))
+    assert [r.event_name for r in records] == [CoreEvents.INPUT_MESSAGE_RECEIVED, CoreEvents.DECISION_INTENT_GENERATED]
+    assert [r.source for r in records] == ["console", "echo"]
+    assert records[0].offset_ms <= records[1].offset_ms
+    restored = MessageReadyPayload.model_validate(records[0].payload)
+    assert restored.message["text"] == "你好"
+    assert journal.recorded_count == 2
+
+
+@pytest.mark.asyncio
+async def test_journal_include_prefixes_and_append(tmp_path):
+    """include 只录制匹配前缀的事件；追加录制的片段偏移保持单调"""
+    path = str(tmp_path / "events.jsonl")
+    for text in ("第一段", "第二段"):
+        event_bus = EventBus()
+        journal = EventJournal(path, include=["input."])
+        journal.attach(event_bus)
+        await event_bus.emit(CoreEvents.DECISION_INTENT_GENERATED, _intent_payload("忽略"), source="echo")
+        await event_bus.emit(CoreEvents.INPUT_MESSAGE_RECEIVED, _message_payload(text), source="console")
+        await journal.close()
+
+    records = list(read_journal(path))
+    assert [r.payload["message"]["text"] for r in records] == ["第一段", "第二段"]
+    assert records[1].offset_ms >= records[0].offset_ms
+
+
+@pytest.mark.asyncio
+async def test_replay_max_speed_assigns_new_traces():
+    """最大速度重放：按顺序发布，分配新的 trace_id，跳过未注册事件"""
+    event_bus = EventBus()
+    received = []
+
+    async def handler(event_name: str, payload: MessageReadyPayload, source: str):
+        received.append((payload.message["text"], payload.trace_id))
+
+    event_bus.on(CoreEvents.INPUT_MESSAGE_RECEIVED, handler, MessageReadyPayload)
+    records = [
+        _record(0, "a"),
+        JournalRecord(10, "input.unknown.event", "console", {}),
+        _record(5000, "b"),
+    ]
+
+    report = await JournalReplayer(event_bus, speed=None, include=["input."], wait=True).replay(records)
+
+    assert [text for text, _ in received] == ["a", "b"]
+    assert all(trace_id not in (None, "recorded-trace") for _, trace_id in received)
+    assert report.trace_ids == [trace_id for _, trace_id in received]
+    assert get_tracer().get_trace(report.trace_ids[0]) is not None
+    assert report.emitted_count == 2
+    assert report.skipped_count == 1
+    assert report.wall_time_ms < 1000
+
+
+@pytest.mark.asyncio
+async def test_replay_speed_scales_intervals():
+    """倍速重放：事件间隔按 speed 缩短，调度延迟计入 lag"""
+    event_bus = EventBus()
+    times = []
+
+    async def handler(event_name: str, payload: MessageReadyPayload, source: str):
+        times.append(time.perf_counter())
+
+    event_bus.on(CoreEvents.INPUT_MESSAGE_RECEIVED, handler, MessageReadyPayload)
+    records = [_record(1000, "a"), _record(1200, "b"), _record(1400, "c")]
+
+    report = await JournalReplayer(event_bus, speed=4.0).replay(records)
+    await asyncio.sleep(0.01)
+
+    assert len(times) == 3
+    assert times[2] - times[0] == pytest.approx(0.1, abs=0.04)
+    assert report.journal_span_ms == pytest.approx(400)
+    assert report.lag.count == 3
+
+
+@pytest.mark.asyncio
+async def test_replay_input_pipeline_can_filter():
+    """提供 InputPipeline 时消息重新经过 Pipeline，被过滤的消息不发布"""
+
+    class DropShortPipeline:
+        async def process(self, message: NormalizedMessage):
+            return message if len(message.text) > 1 else None
+
+    event_bus = EventBus()
+    received = []
+
+    async def handler(event_name: str, payload: MessageReadyPayload, source: str):
+        received.append(payload.message["text"])
+
+    event_bus.on(CoreEvents.INPUT_MESSAGE_RECEIVED, handler, MessageReadyPayload)
+    replayer = JournalReplayer(event_bus, speed=None, input_pipeline_manager=DropShortPipeline(), wait=True)
+    report = await replayer.replay([_record(0, "x"), _record(1, "保留")])
+
+    assert received == ["保留"]
+    assert report.filtered_count == 1
+
+
+def test_invalid_speed():
+    """speed 不能为负数"""
+    with pytest.raises(ValueError):
+        JournalReplayer(EventBus(), speed=-1)
@@ -0,0 +1,217 @@
+"""
+有界订阅（SubscriberMailbox）单元测试
+
+测试 EventBus.on(max_pending=..., overflow=...) 的行为：
+- 溢出策略：BLOCK / DROP_OLDEST / DROP_NEWEST / LATEST
+- 队列深度与丢弃计数统计
+- wait=True 语义与取消订阅/清理
+
+运行: uv run pytest tests/modules/events/test_event_mailbox.py -v
+"""
+
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from src.modules.events.event_bus import EventBus
+from src.modules.events.mailbox import OverflowPolicy, SubscriberMailbox
+
+
+class SeqEvent(BaseModel):
+    """带序号的测试事件"""
+
+    seq: int = 0
+
+
+@pytest.fixture
+def event_bus():
+    return EventBus()
+
+
+def make_gated_handler(received: list, gate: asyncio.Event):
+    """创建一个在 gate 打开前阻塞的慢处理器"""
+
+    async def handler(event_name: str, payload: SeqEvent, source: str):
+        await gate.wait()
+        received.append(payload.seq)
+
+    return handler
+
+
+async def emit_many(event_bus: EventBus, count: int):
+    for i in range(count):
+        await event_bus.emit("test.mailbox", SeqEvent(seq=i), source="test")
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_keeps_most_recent(event_bus: EventBus):
+    """DROP_OLDEST：队列满时丢弃最旧事件"""
+    received = []
+    gate = asyncio.Event()
+    handler = make_gated_handler(received, gate)
+    event_bus.on("test.mailbox", handler, SeqEvent, max_pending=3, overflow=OverflowPolicy.DROP_OLDEST)
+
+    await event_bus.emit("test.mailbox", SeqEvent(seq=0), source="test")
+    await asyncio.sleep(0)  # 工作协程取走第 0 个事件并阻塞在 gate 上
+    for i in range(1, 10):
+        await event_bus.emit("test.mailbox", SeqEvent(seq=i), source="test")
+
+    stats = event_bus.get_queue_stats()["test.mailbox"][0]
+    assert stats.depth == 3
+    assert stats.dropped_count == 6
+
+    gate.set()
+    await asyncio.sleep(0.05)
+    assert received == [0, 7, 8, 9]
+
+
+@pytest.mark.asyncio
+async def test_drop_newest_keeps_queued(event_bus: EventBus):
+    """DROP_NEWEST：队列满时丢弃新事件"""
+    received = []
+    gate = asyncio.Event()
+    event_bus.on(
+        "test.mailbox",
+        make_gated_handler(received, gate),
+        SeqEvent,
+        max_pending=2,
+        overflow=OverflowPolicy.DROP_NEWEST,
+    )
+
+    await event_bus.emit("test.mailbox", SeqEvent(seq=0), source="test")
+    await asyncio.sleep(0)
+    for i in range(1, 6):
+        await event_bus.emit("test.mailbox", SeqEvent(seq=i), source="test")
+
+    gate.set()
+    await asyncio.sleep(0.05)
+    assert received == [0, 1, 2]
+    assert event_bus.get_queue_stats()["test.mailbox"][0].dropped_count == 3
+
+
+@pytest.mark.asyncio
+async def test_latest_coalesces_pending(event_bus: EventBus):
+    """LATEST：新事件替换所有待处理事件"""
+    received = []
+    gate = asyncio.Event()
+    event_bus.on(
+        "test.mailbox", make_gated_handler(received, gate), SeqEvent, max_pending=8, overflow=OverflowPolicy.LATEST
+    )
+
+    await emit_many(event_bus, 6)
+    await asyncio.sleep(0)
+    gate.set()
+    await asyncio.sleep(0.05)
+
+    assert received[-1] == 5
+    assert len(received) <= 2
+
+
+@pytest.mark.asyncio
+async def test_block_policy_blocks_emitter(event_bus: EventBus):
+    """BLOCK：队列满时 emit 等待空位，不丢弃事件"""
+    received = []
+    gate = asyncio.Event()
+    event_bus.on(
+        "test.mailbox", make_gated_handler(received, gate), SeqEvent, max_pending=2, overflow=OverflowPolicy.BLOCK
+    )
+
+    producer = asyncio.create_task(emit_many(event_bus, 6))
+    await asyncio.sleep(0.05)
+
+    # 1 个正在处理 + 2 个排队，生产者被阻塞
+    assert not producer.done()
+    assert event_bus.get_queue_stats()["test.mailbox"][0].blocked_count >= 1
+
+    gate.set()
+    await asyncio.wait_for(producer, timeout=1.0)
+    await asyncio.sleep(0.05)
+
+    assert received == [0, 1, 2, 3, 4, 5]
+    assert event_bus.get_queue_stats()["test.mailbox"][0].dropped_count == 0
+
+
+@pytest.mark.asyncio
+async def test_wait_true_waits_for_queued_handler(event_bus: EventBus):
+    """wait=True 等待有界订阅者处理完成"""
+    received = []
+
+    async def handler(event_name: str, payload: SeqEvent, source: str):
+        await asyncio.sleep(0.01)
+        received.append(payload.seq)
+
+    event_bus.on("test.mailbox", handler, SeqEvent, max_pending=4)
+    await event_bus.emit("test.mailbox", SeqEvent(seq=42), source="test", wait=True)
+
+    assert received == [42]
+
+
+@pytest.mark.asyncio
+async def test_bounded_and_direct_subscribers_coexist(event_bus: EventBus):
+    """有界订阅者与直接订阅者可以订阅同一事件"""
+    direct = []
+    queued = []
+
+    async def direct_handler(event_name: str, payload: SeqEvent, source: str):
+        direct.append(payload.seq)
+
+    async def queued_handler(event_name: str, payload: SeqEvent, source: str):
+        queued.append(payload.seq)
+
+    event_bus.on("test.mailbox", direct_handler, SeqEvent)
+    event_bus.on("test.mailbox", queued_handler, SeqEvent, max_pending=4)
+    assert event_bus.get_listeners_count("test.mailbox") == 2
+
+    await event_bus.emit("test.mailbox", SeqEvent(seq=1), source="test", wait=True)
+
+    assert direct == [1]
+    assert queued == [1]
+    assert "test.mailbox" in event_bus.get_queue_stats()
+
+
+@pytest.mark.asyncio
+async def test_off_closes_mailbox(event_bus: EventBus):
+    """取消订阅时丢弃待处理事件并停止工作协程"""
+    received = []
+    gate = asyncio.Event()
+    handler = make_gated_handler(received, gate)
+    event_bus.on("test.mailbox", handler, SeqEvent, max_pending=4)
+
+    await emit_many(event_bus, 3)
+    await asyncio.sleep(0)
+    mailbox = event_bus._handlers["test.mailbox"][0].mailbox
+
+    event_bus.off("test.mailbox", handler)
+    gate.set()
+    await asyncio.sleep(0.05)
+
+    assert mailbox.stats.dropped_count == 2
+    assert received == []
+    assert event_bus.get_queue_stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_cleanup_drains_queues(event_bus: EventBus):
+    """cleanup 等待有界订阅者队列处理完毕"""
+    received = []
+
+    async def handler(event_name: str, payload: SeqEvent, source: str):
+        await asyncio.sleep(0.001)
+        received.append(payload.seq)
+
+    event_bus.on("test.mailbox", handler, SeqEvent, max_pending=16)
+    await emit_many(event_bus, 5)
+    await event_bus.cleanup()
+
+    assert received == [0, 1, 2, 3, 4]
+
+
+def test_invalid_max_pending():
+    """max_pending 必须 >= 1"""
+
+    async def consumer(event_name, payload, source):
+        pass
+
+    with pytest.raises(ValueError):
+        SubscriberMailbox("handler", 0, OverflowPolicy.BLOCK, consumer)
@@ -0,0 +1,145 @@
+"""
+EventBus 统计单元测试
+
+测试内容：
+- LatencyHistogram 分位数估算
+- 事件级和处理器级延迟统计
+- reset_stats 同时重置处理器级直方图
+
+运行: uv run pytest tests/modules/events/test_event_stats.py -v
+"""
+
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from src.modules.events.event_bus import EventBus
+from src.modules.events.stats import LATENCY_BUCKETS_MS, LatencyHistogram
+
+
+class PingEvent(BaseModel):
+    """测试事件"""
+
+    value: int = 0
+
+
+@pytest.fixture
+def event_bus():
+    return EventBus(enable_stats=True)
+
+
+def test_histogram_empty():
+    """没有样本时所有分位数为 0"""
+    histogram = LatencyHistogram()
+    summary = histogram.summary()
+
+    assert summary["count"] == 0
+    assert summary["p99_ms"] == 0.0
+    assert summary["avg_ms"] == 0.0
+
+
+def test_histogram_percentiles():
+    """分位数落在正确的桶内且不超过最大值"""
+    histogram = LatencyHistogram()
+    for _ in range(90):
+        histogram.record(0.3)  # (0.25, 0.5] 桶
+    for _ in range(10):
+        histogram.record(40.0)  # (25, 50] 桶
+
+    assert 0.25 <= histogram.percentile(0.5) <= 0.5
+    assert 25.0 <= histogram.percentile(0.99) <= 40.0
+    assert histogram.max_ms == 40.0
+    assert histogram.summary()["avg_ms"] == pytest.approx((90 * 0.3 + 10 * 40.0) / 100)
+
+
+def test_histogram_overflow_bucket():
+    """超出最大桶的样本使用实际最大值"""
+    histogram = LatencyHistogram()
+    histogram.record(LATENCY_BUCKETS_MS[-1] * 3)
+
+    assert histogram.percentile(0.99) == LATENCY_BUCKETS_MS[-1] * 3
+
+
+@pytest.mark.asyncio
+async def test_handler_latency_recorded(event_bus: EventBus):
+    """处理器执行耗时记录到事件级和处理器级直方图"""
+
+    async def slow_handler(event_name: str, payload: PingEvent, source: str):
+        await asyncio.sleep(0.01)
+
+    async def fast_handler(event_name: str, payload: PingEvent, source: str):
+        pass
+
+    event_bus.on("test.stats", slow_handler, PingEvent)
+    event_bus.on("test.stats", fast_handler, PingEvent)
+
+    for i in range(3):
+        await event_bus.emit("test.stats", PingEvent(value=i), source="test", wait=True)
+
+    stats = event_bus.get_stats("test.stats")
+    assert stats.emit_count == 3
+    assert stats.handler_latency.count == 6
+    assert stats.emit_latency.count == 3
+    assert stats.emit_latency.percentile(0.5) >= 5.0
+
+    handler_stats = {item.handler_name: item for item in event_bus.get_handler_stats()["test.stats"]}
+    assert handler_stats["slow_handler"].call_count == 3
+    assert handler_stats["slow_handler"].latency.percentile(0.5) > handler_stats["fast_handler"].latency.percentile(0.5)
+    assert handler_stats["fast_handler"].delivery_latency.count == 3
+
+
+@pytest.mark.asyncio
+async def test_handler_errors_counted(event_bus: EventBus):
+    """处理器异常计入错误统计，同时仍记录延迟"""
+
+    async def failing_handler(event_name: str, payload: PingEvent, source: str):
+        raise RuntimeError("boom")
+
+    event_bus.on("test.stats", failing_handler, PingEvent)
+    await event_bus.emit("test.stats", PingEvent(), source="test", wait=True)
+
+    assert event_bus.get_stats("test.stats").error_count == 1
+    item = event_bus.get_handler_stats()["test.stats"][0]
+    assert item.error_count == 1
+    assert item.last_error == "boom"
+    assert item.latency.count == 1
+
+
+@pytest.mark.asyncio
+async def test_reset_stats_resets_handler_histograms(event_bus: EventBus):
+    """reset_stats 同时重置处理器级统计"""
+
+    async def handler(event_name: str, payload: PingEvent, source: str):
+        pass
+
+    event_bus.on("test.stats", handler, PingEvent)
+    await event_bus.emit("test.stats", PingEvent(), source="test", wait=True)
+    event_bus.reset_stats()
+
+    item = event_bus.get_handler_stats()["test.stats"][0]
+    assert item.call_count == 0
+    assert item.latency.count == 0
+    assert event_bus.get_stats("test.stats") is None
+
+
+@pytest.mark.asyncio
+async def test_stats_snapshot_is_copy(event_bus: EventBus):
+    """返回的统计是副本，外部修改不影响内部数据"""
+
+    async def handler(event_name: str, payload: PingEvent, source: str):
+        pass
+
+    event_bus.on("test.stats", handler, PingEvent)
+    await event_bus.emit("test.stats", PingEvent(), source="test", wait=True)
+
+    snapshot = event_bus.get_handler_stats()["test.stats"][0]
+    snapshot.latency.record(1000.0)
+
+    assert event_bus.get_handler_stats()["test.stats"][0].latency.count == 1
+
+
+def test_stats_disabled():
+    """禁用统计时不返回处理器统计"""
+    event_bus = EventBus(enable_stats=False)
+    assert event_bus.get_handler_stats() == {}
@@ -10,12 +10,12 @@
 import asyncio
 
 import pytest
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
 from src.modules.events.event_bus import EventBus
 from src.modules.events.names import CoreEvents
 from src.modules.events.payloads.decision import IntentPayload
-from src.modules.events.payloads.input import MessageReadyPayload
+from src.modules.events.payloads.input import MessageReadyPayload, SpeechRecognizedPayload
 from src.modules.time_utils import now_ms
 
 
@@ -223,3 +223,123 @@ class TestTypedEventHandler:
         assert len(received_regular) == 1
         assert received_typed[0] == "test_value"
         assert received_regular[0] == "test_value"
+
+
+class TestZeroCopyDispatch:
+    """测试零拷贝分发：每次 emit 只验证一次，类型匹配的订阅者共享同一实例"""
+
+    class SharedPayload(BaseModel):
+        value: str
+        count: int = 0
+
+    class OtherPayload(BaseModel):
+        value: str
+
+    @pytest.mark.asyncio
+    async def test_matching_subscribers_share_emitted_instance(self):
+        """类型匹配的订阅者收到的就是 emit 传入的实例本身"""
+        event_bus = EventBus(enable_stats=False)
+        received = []
+
+        def make_handler():
+            async def handler(event_name: str, data: BaseModel, source: str):
+                received.append(data)
+
+            return handler
+
+        for _ in range(5):
+            event_bus.on("test.zero_copy", make_handler(), self.SharedPayload)
+
+        payload = self.SharedPayload(value="hello", count=1)
+        await event_bus.emit("test.zero_copy", payload, source="test", wait=True)
+
+        assert len(received) == 5
+        assert all(item is payload for item in received)
+
+    @pytest.mark.asyncio
+    async def test_no_serialization_when_types_match(self, monkeypatch):
+        """所有订阅者类型匹配时不调用 model_dump / model_validate"""
+        event_bus = EventBus(enable_stats=False)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("不应发生序列化或重新验证")
+
+        async def handler(event_name: str, data: BaseModel, source: str):
+            pass
+
+        for _ in range(3):
+            event_bus.on("test.zero_copy", handler, self.SharedPayload)
+
+        payload = self.SharedPayload(value="hello")
+        monkeypatch.setattr(self.SharedPayload, "model_dump", fail)
+        monkeypatch.setattr(self.SharedPayload, "model_validate", classmethod(fail))
+
+        await event_bus.emit("test.zero_copy", payload, source="test", wait=True)
+
+    @pytest.mark.asyncio
+    async def test_mismatched_type_converted_once_per_emit(self):
+        """类型不匹配的订阅者按类型转换一次，同类型订阅者共享转换结果"""
+        event_bus = EventBus(enable_stats=False)
+        shared = []
+        converted = []
+
+        async def shared_handler(event_name: str, data: BaseModel, source: str):
+            shared.append(data)
+
+        async def other_handler(event_name: str, data: BaseModel, source: str):
+            converted.append(data)
+
+        event_bus.on("test.zero_copy", shared_handler, self.SharedPayload)
+        event_bus.on("test.zero_copy", other_handler, self.OtherPayload)
+        event_bus.on("test.zero_copy", other_handler, self.OtherPayload)
+
+        payload = self.SharedPayload(value="hello", count=3)
+        await event_bus.emit("test.zero_copy", payload, source="test", wait=True)
+
+        assert shared == [payload]
+        assert len(converted) == 2
+        assert isinstance(converted[0], self.OtherPayload)
+        assert converted[0].value == "hello"
+        assert converted[0] is converted[1]
+
+    @pytest.mark.asyncio
+    async def test_untyped_handler_receives_dict(self):
+        """model_class=None 的旧式处理器接收 dict"""
+        event_bus = EventBus(enable_stats=False)
+        received = []
+
+        async def legacy_handler(event_name: str, data: dict, source: str):
+            received.append(data)
+
+        event_bus.on("test.zero_copy", legacy_handler, None)
+        await event_bus.emit("test.zero_copy", self.SharedPayload(value="hi"), source="test", wait=True)
+
+        assert received == [{"value": "hi", "count": 0}]
+
+    @pytest.mark.asyncio
+    async def test_shared_payload_is_immutable(self):
+        """共享的 Payload 实例不可修改，订阅者和 tap 看到的都是 emit 时的内容"""
+        event_bus = EventBus(enable_stats=False)
+        tapped = []
+        seen = []
+        errors = []
+
+        async def mutating_handler(event_name: str, data: SpeechRecognizedPayload, source: str):
+            try:
+                data.text = "被改写"
+            except ValidationError as e:
+                errors.append(e)
+
+        async def reader(event_name: str, data: SpeechRecognizedPayload, source: str):
+            seen.append(data.text)
+
+        event_bus.add_tap(lambda event_name, data, source: tapped.append(data))
+        event_bus.on("test.zero_copy", mutating_handler, SpeechRecognizedPayload, priority=1)
+        event_bus.on("test.zero_copy", reader, SpeechRecognizedPayload, priority=2)
+
+        payload = SpeechRecognizedPayload(text="你好", is_final=True, utterance_id=1, engine="fake")
+        await event_bus.emit("test.zero_copy", payload, source="test", wait=True)
+
+        assert len(errors) == 1
+        assert seen == ["你好"]
+        assert tapped == [payload] and tapped[0].text == "你好"
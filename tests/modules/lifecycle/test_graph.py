@@ -0,0 +1,159 @@
+"""
+LifecycleGraph / run_phases 单元测试
+
+运行: uv run pytest tests/modules/lifecycle/test_graph.py -v
+"""
+
+import asyncio
+import time
+from typing import List
+
+import pytest
+
+from src.modules.lifecycle import LifecycleGraph, LifecycleProfiler, run_phases
+
+
+def create_step(events: List[str], name: str, delay: float = 0.0):
+    async def action():
+        events.append(f"{name}:start")
+        await asyncio.sleep(delay)
+        events.append(f"{name}:end")
+
+    return action
+
+
+async def fail():
+    raise RuntimeError("启动失败")
+
+
+@pytest.mark.asyncio
+async def test_independent_steps_run_concurrently():
+    """互不依赖的步骤并发执行，依赖的步骤在依赖结束后才开始"""
+    events = []
+    profiler = LifecycleProfiler()
+    graph = LifecycleGraph("startup", profiler=profiler)
+    graph.add("decision", create_step(events, "decision"), depends_on=["llm", "context"])
+    graph.add("llm", create_step(events, "llm", 0.1))
+    graph.add("context", create_step(events, "context", 0.1))
+
+    started = time.perf_counter()
+    results = await graph.run()
+    elapsed = time.perf_counter() - started
+
+    assert results == {"llm": None, "context": None, "decision": None}
+    assert elapsed < 0.18
+    assert events.index("decision:start") > max(events.index("llm:end"), events.index("context:end"))
+    assert {r.name for r in profiler.records()} == {"startup.llm", "startup.context", "startup.decision"}
+
+
+@pytest.mark.asyncio
+async def test_fail_fast_cancels_remaining_steps():
+    events = []
+    graph = LifecycleGraph("startup", profiler=LifecycleProfiler())
+    graph.add("llm", fail)
+    graph.add("slow", create_step(events, "slow", 10))
+    graph.add("decision", create_step(events, "decision"), depends_on=["llm"])
+
+    with pytest.raises(RuntimeError, match="启动失败"):
+        await asyncio.wait_for(graph.run(), timeout=1.0)
+
+    assert "decision:start" not in events
+    assert "slow:end" not in events
+
+
+@pytest.mark.asyncio
+async def test_shutdown_continues_after_failure_and_timeout():
+    """fail_fast=False 时失败/超时的步骤不影响依赖它的步骤"""
+    events = []
+    graph = LifecycleGraph("shutdown", fail_fast=False, default_timeout=0.05, profiler=LifecycleProfiler())
+    graph.add("input", create_step(events, "input", 10))
+    graph.add("output", fail, depends_on=["input"])
+    graph.add("event_bus", create_step(events, "event_bus"), depends_on=["input", "output"])
+
+    results = await asyncio.wait_for(graph.run(), timeout=1.0)
+
+    assert isinstance(results["input"], TimeoutError)
+    assert isinstance(results["output"], RuntimeError)
+    assert results["event_bus"] is None
+    assert "event_bus:end" in events
+
+
+@pytest.mark.asyncio
+async def test_shutdown_step_error_message_with_braces():
+    """异常消息中含花括号时，记录失败日志不能再抛出异常中断关闭流程"""
+    events = []
+
+    async def missing_key():
+        raise ValueError("缺少配置项 {name}: {}")
+
+    graph = LifecycleGraph("shutdown", fail_fast=False, profiler=LifecycleProfiler())
+    graph.add("output", missing_key)
+    graph.add("event_bus", create_step(events, "event_bus"), depends_on=["output"])
+
+    results = await graph.run()
+
+    assert isinstance(results["output"], ValueError)
+    assert results["event_bus"] is None
+    assert "event_bus:end" in events
+
+
+@pytest.mark.asyncio
+async def test_step_timeout_overrides_default():
+    graph = LifecycleGraph("shutdown", fail_fast=False, default_timeout=0.01, profiler=LifecycleProfiler())
+    graph.add("dashboard", create_step([], "dashboard", 0.05), timeout=1.0)
+
+    assert await graph.run() == {"dashboard": None}
+
+
+@pytest.mark.asyncio
+async def test_invalid_graph():
+    graph = LifecycleGraph("startup")
+    graph.add("a", create_step([], "a"), depends_on=["missing"])
+    with pytest.raises(ValueError, match="不存在"):
+        await graph.run()
+
+    graph = LifecycleGraph("startup")
+    graph.add("a", create_step([], "a"), depends_on=["b"])
+    graph.add("b", create_step([], "b"), depends_on=["a"])
+    with pytest.raises(ValueError, match="循环依赖"):
+        await graph.run()
+
+    with pytest.raises(ValueError, match="已存在"):
+        graph.add("a", create_step([], "a"))
+
+
+@pytest.mark.asyncio
+async def test_run_phases_collects_errors():
+    events = []
+    profiler = LifecycleProfiler()
+
+    errors = await run_phases(
+        [
+            ("output.tts.init", create_step(events, "tts", 0.05)),
+            ("output.subtitle.init", fail),
+            ("output.vts.init", create_step(events, "vts", 10)),
+        ],
+        timeout=0.2,
+        profiler=profiler,
+    )
+
+    assert errors[0] is None
+    assert isinstance(errors[1], RuntimeError)
+    assert isinstance(errors[2], TimeoutError)
+    assert {r.name: r.ok for r in profiler.records()} == {
+        "output.tts.init": True,
+        "output.subtitle.init": False,
+        "output.vts.init": False,
+    }
+
+
+@pytest.mark.asyncio
+async def test_run_phases_sequential():
+    events = []
+    await run_phases(
+        [("a", create_step(events, "a", 0.01)), ("b", create_step(events, "b"))],
+        concurrent=False,
+        profiler=LifecycleProfiler(),
+    )
+
+    assert events == ["a:start", "a:end", "b:start", "b:end"]
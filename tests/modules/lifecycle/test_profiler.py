@@ -0,0 +1,84 @@
+"""
+生命周期耗时分析单元测试
+
+运行: uv run pytest tests/modules/lifecycle/test_profiler.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from src.modules.lifecycle import LifecycleProfiler, get_lifecycle_profiler
+
+
+def test_phase_records_duration():
+    profiler = LifecycleProfiler()
+
+    with profiler.phase("config.load"):
+        pass
+    with profiler.phase("import.input.stt"):
+        pass
+
+    records = profiler.records()
+    assert [r.name for r in records] == ["config.load", "import.input.stt"]
+    assert all(r.ok and r.duration_ms >= 0 for r in records)
+    assert records[0].start_ms <= records[1].start_ms
+
+
+def test_failed_phase_is_recorded_and_reraised():
+    profiler = LifecycleProfiler()
+
+    with pytest.raises(RuntimeError):
+        with profiler.phase("decision.llm.setup"):
+            raise RuntimeError("连接失败")
+
+    (record,) = profiler.records()
+    assert not record.ok
+    assert record.error == "RuntimeError: 连接失败"
+    assert "[失败: RuntimeError: 连接失败]" in profiler.report()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_phases_overlap():
+    """并发执行的阶段各自记录，按开始时间排序"""
+    profiler = LifecycleProfiler()
+
+    async def step(name: str):
+        with profiler.phase(name):
+            await asyncio.sleep(0.05)
+
+    await asyncio.gather(step("output.tts.init"), step("output.subtitle.init"))
+
+    records = profiler.records(prefix="output.")
+    assert len(records) == 2
+    assert records[1].start_ms < records[0].end_ms
+
+
+def test_prefix_filter_and_report():
+    profiler = LifecycleProfiler()
+    for name in ["startup.llm", "startup.output", "shutdown.output"]:
+        with profiler.phase(name):
+            pass
+
+    assert [r.name for r in profiler.records(prefix="startup.")] == ["startup.llm", "startup.output"]
+    assert [s["name"] for s in profiler.snapshot(prefix="shutdown.")] == ["shutdown.output"]
+
+    report = profiler.report(prefix="startup.", title="启动耗时")
+    assert report.startswith("启动耗时: 共 2 个阶段")
+    assert "shutdown.output" not in report
+
+
+def test_reset_and_max_records():
+    profiler = LifecycleProfiler(max_records=2)
+    for i in range(3):
+        with profiler.phase(f"p{i}"):
+            pass
+    assert [r.name for r in profiler.records()] == ["p1", "p2"]
+
+    profiler.reset()
+    assert profiler.records() == []
+    assert profiler.report() == "生命周期耗时: 无记录"
+
+
+def test_global_profiler():
+    assert get_lifecycle_profiler() is get_lifecycle_profiler()
@@ -267,6 +267,25 @@ async def test_chat_records_token_usage(setup_llm_manager):
     )
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("record_history", [True, False])
+async def test_chat_request_history_can_be_disabled(setup_llm_manager, record_history: bool):
+    """测试 record_history=False 时不写请求历史"""
+    llm_manager, _, _ = setup_llm_manager
+    llm_manager._record_history = record_history
+
+    with patch("src.modules.llm.request_history_manager.get_global_request_history_manager") as get_history:
+        await llm_manager.chat("Hello")
+
+    assert get_history.return_value.record_request.called is record_history
+
+
+def test_record_history_enabled_by_default():
+    """测试默认记录请求历史，构造参数可关闭"""
+    assert LLMManager()._record_history is True
+    assert LLMManager(record_history=False)._record_history is False
+
+
 # =============================================================================
 # 流式聊天测试
 # =============================================================================
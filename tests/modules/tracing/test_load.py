@@ -0,0 +1,75 @@
+"""
+决策负载监视单元测试
+
+运行: uv run pytest tests/modules/tracing/test_load.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from src.modules.events.event_bus import EventBus
+from src.modules.events.names import CoreEvents
+from src.modules.events.payloads.input import MessageReadyPayload
+from src.modules.time_utils import now_ms
+from src.modules.tracing import DecisionLoadMonitor, get_load_monitor
+from src.modules.types.base.normalized_message import NormalizedMessage
+from src.stages.decision.manager import DeciderManager
+
+
+def test_in_flight_and_lag():
+    """begin/end 维护决策中消息数，排队延迟只在有消息决策时有效"""
+    monitor = DecisionLoadMonitor()
+
+    first = monitor.begin(now_ms() - 2000)
+    second = monitor.begin(0)  # 时间戳为 0 不计入排队延迟
+    assert monitor.in_flight == 2
+    assert 1900 <= monitor.lag_ms <= 2500
+
+    monitor.end(first)
+    monitor.end(second)
+    monitor.end(None)
+    assert monitor.in_flight == 0
+    assert monitor.completed == 2
+    assert monitor.lag_ms == 0.0
+    assert monitor.snapshot()["in_flight"] == 0
+
+
+def test_reset():
+    monitor = DecisionLoadMonitor()
+    monitor.begin(now_ms() - 1000)
+    monitor.reset()
+    assert monitor.snapshot() == {"in_flight": 0, "lag_ms": 0.0, "decision_ms": 0.0, "completed": 0}
+
+
+@pytest.mark.asyncio
+async def test_decider_manager_reports_load():
+    """DeciderManager 在决策期间计入 in_flight，结束（包括异常）后释放"""
+    monitor = get_load_monitor()
+    monitor.reset()
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    class _SlowDecider:
+        async def decide(self, message):
+            started.set()
+            await release.wait()
+            raise RuntimeError("boom")
+
+    event_bus = EventBus()
+    manager = DeciderManager(event_bus)
+    decider = _SlowDecider()
+    manager._deciders = {"slow": decider}
+    manager._current_decider = decider
+    manager._decider_name = "slow"
+
+    payload = MessageReadyPayload.from_normalized_message(NormalizedMessage(text="你好", source="console"))
+    task = asyncio.create_task(manager._on_data_message(CoreEvents.INPUT_MESSAGE_RECEIVED, payload, "console"))
+    await started.wait()
+    assert monitor.in_flight == 1
+
+    release.set()
+    await task
+    assert monitor.in_flight == 0
+    assert monitor.completed == 1
+    monitor.reset()
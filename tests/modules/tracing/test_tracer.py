@@ -0,0 +1,196 @@
+"""
+消息追踪单元测试
+
+测试内容：
+- MessageTracer 的 span / 标记 / 延迟分解
+- trace_id 通过 contextvars 和 Payload 在 Decision → Output 之间传递
+
+运行: uv run pytest tests/modules/tracing/test_tracer.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from src.modules.events.event_bus import EventBus
+from src.modules.events.names import CoreEvents
+from src.modules.events.payloads.decision import IntentPayload
+from src.modules.events.payloads.input import MessageReadyPayload
+from src.modules.tracing import MessageTracer, TraceStage, get_current_trace_id, get_tracer, use_trace
+from src.modules.types.base.normalized_message import NormalizedMessage
+from src.modules.types.intent import Intent, IntentMetadata
+from src.stages.decision.manager import DeciderManager
+
+
+def _make_intent(speech: str = "你好") -> Intent:
+    return Intent(speech=speech, metadata=IntentMetadata(source_id="test", decision_time_ms=0))
+
+
+@pytest.fixture
+def tracer():
+    tracer = get_tracer()
+    tracer.clear()
+    yield tracer
+    tracer.clear()
+
+
+# =============================================================================
+# MessageTracer
+# =============================================================================
+
+
+def test_span_and_breakdown():
+    """span 记录阶段耗时，标记点记录相对 trace 开始的偏移"""
+    tracer = MessageTracer()
+    trace_id = tracer.start_trace("console", "hello")
+
+    with tracer.span(trace_id, TraceStage.INPUT_PIPELINES):
+        pass
+    tracer.start_span(trace_id, TraceStage.DECISION)
+    tracer.end_span(trace_id, TraceStage.DECISION)
+    tracer.mark(trace_id, TraceStage.PLAYBACK_START)
+    tracer.mark(trace_id, TraceStage.PLAYBACK_START)  # 只记录第一次
+
+    trace = tracer.get_trace(trace_id)
+    breakdown = trace.breakdown()
+    assert set(breakdown) == {TraceStage.INPUT_PIPELINES, TraceStage.DECISION, TraceStage.PLAYBACK_START}
+    assert len(trace.spans) == 3
+    assert trace.total_ms == breakdown[TraceStage.PLAYBACK_START]
+    assert trace.total_ms >= breakdown[TraceStage.DECISION]
+
+
+def test_repeated_spans_are_summed():
+    """同名 span 多次出现（如 LLM 重试）时累加耗时，未结束的 span 不计入"""
+    tracer = MessageTracer()
+    trace_id = tracer.start_trace("console")
+    for _ in range(2):
+        with tracer.span(trace_id, TraceStage.LLM):
+            pass
+    tracer.start_span(trace_id, TraceStage.TTS_SYNTHESIS)
+
+    trace = tracer.get_trace(trace_id)
+    durations = [span.duration_ms for span in trace.spans if span.name == TraceStage.LLM]
+    assert trace.breakdown()[TraceStage.LLM] == pytest.approx(sum(durations))
+    assert TraceStage.TTS_SYNTHESIS not in trace.breakdown()
+    assert trace.total_ms is None
+
+
+def test_unknown_or_missing_trace_is_ignored():
+    """trace_id 为 None 或已淘汰时所有操作都是空操作"""
+    tracer = MessageTracer()
+    tracer.start_span(None, TraceStage.DECISION)
+    tracer.end_span("missing", TraceStage.DECISION)
+    tracer.mark(None, TraceStage.PLAYBACK_START)
+    with tracer.span("missing", TraceStage.LLM):
+        pass
+
+    assert tracer.get_recent() == []
+
+
+def test_max_traces_evicts_oldest():
+    """超过 max_traces 时淘汰最旧的 trace"""
+    tracer = MessageTracer(max_traces=3)
+    trace_ids = [tracer.start_trace("console", str(i)) for i in range(5)]
+
+    assert tracer.get_trace(trace_ids[0]) is None
+    assert [trace.trace_id for trace in tracer.get_recent()] == trace_ids[:1:-1]
+
+
+def test_disabled_tracer():
+    """禁用时不创建 trace"""
+    tracer = MessageTracer(enabled=False)
+    assert tracer.start_trace("console") is None
+
+
+def test_discard():
+    """被过滤的消息可以丢弃 trace"""
+    tracer = MessageTracer()
+    trace_id = tracer.start_trace("console")
+    tracer.discard(trace_id)
+    assert tracer.get_trace(trace_id) is None
+
+
+# =============================================================================
+# trace_id 传递
+# =============================================================================
+
+
+def test_use_trace_sets_and_restores_context():
+    """use_trace 在 with 块内设置 trace_id，退出后恢复"""
+    assert get_current_trace_id() is None
+    with use_trace("abc"):
+        assert get_current_trace_id() == "abc"
+        with use_trace(None):
+            assert get_current_trace_id() == "abc"
+    assert get_current_trace_id() is None
+
+
+def test_intent_payload_picks_up_current_trace():
+    """IntentPayload.from_intent 未指定 trace_id 时使用当前调用链的 trace_id"""
+    with use_trace("trace-1"):
+        payload = IntentPayload.from_intent(_make_intent(), name="test")
+    assert payload.trace_id == "trace-1"
+
+    explicit = IntentPayload.from_intent(_make_intent(), name="test", trace_id="trace-2")
+    assert explicit.trace_id == "trace-2"
+    assert IntentPayload.from_intent(_make_intent(), name="test").trace_id is None
+
+
+class _EchoDecider:
+    """在 decide() 调用链内直接发布 Intent 的测试 Decider"""
+
+    def __init__(self, event_bus: EventBus):
+        self.event_bus = event_bus
+
+    async def decide(self, message: NormalizedMessage) -> None:
+        await asyncio.sleep(0.001)
+        await self.event_bus.emit(
+            CoreEvents.DECISION_INTENT_GENERATED,
+            IntentPayload.from_intent(_make_intent(message.text), name="echo"),
+            source="echo",
+        )
+
+
+@pytest.mark.asyncio
+async def test_trace_flows_from_input_to_output(tracer):
+    """trace_id 从 MessageReadyPayload 经 Decider、OutputHandlerManager 传递到 Output Handler"""
+    # OutputHandlerManager 依赖音频设备模块，在需要时才导入
+    from src.stages.output.manager import OutputHandlerManager
+
+    event_bus = EventBus()
+    decider_manager = DeciderManager(event_bus)
+    decider = _EchoDecider(event_bus)
+    decider_manager._deciders = {"echo": decider}
+    decider_manager._current_decider = decider
+    decider_manager._decider_name = "echo"
+    decider_manager._subscribe_data_message_event()
+
+    output_manager = OutputHandlerManager(event_bus, pipeline_manager=None)
+    event_bus.on(CoreEvents.DECISION_INTENT_GENERATED, output_manager._on_decision_intent, model_class=IntentPayload)
+
+    received = []
+
+    async def output_handler(event_name: str, payload: IntentPayload, source: str):
+        received.append(payload.trace_id)
+        with use_trace(payload.trace_id):
+            tracer.mark(get_current_trace_id(), TraceStage.PLAYBACK_START)
+
+    event_bus.on(CoreEvents.OUTPUT_INTENT_DISPATCHED, output_handler, model_class=IntentPayload)
+
+    trace_id = tracer.start_trace("console", "你好")
+    tracer.start_span(trace_id, TraceStage.DECIDER_QUEUE)
+    message = NormalizedMessage(text="你好", source="console")
+    await event_bus.emit(
+        CoreEvents.INPUT_MESSAGE_RECEIVED,
+        MessageReadyPayload.from_normalized_message(message, trace_id=trace_id),
+        source="console",
+        wait=True,
+    )
+    # Decider 和 OutputHandlerManager 的 emit 默认不等待处理器完成
+    await asyncio.sleep(0.05)
+
+    assert received == [trace_id]
+    breakdown = tracer.get_trace(trace_id).breakdown()
+    assert TraceStage.DECIDER_QUEUE in breakdown
+    assert breakdown[TraceStage.DECISION] >= 1.0
+    assert breakdown[TraceStage.PLAYBACK_START] >= breakdown[TraceStage.DECISION]
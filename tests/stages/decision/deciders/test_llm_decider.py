@@ -0,0 +1,183 @@
+"""
+LLMDecider 推测请求测试
+
+覆盖：
+- 部分结果稳定后提前发起请求，最终文本相同（忽略标点）时复用结果、不再请求
+- 最终文本不同时作废推测请求并重新请求
+- 部分结果变化时作废旧请求；空的最终结果作废推测请求
+- 防抖期间收到最终文本不复用；未开启时 prepare() 不做任何事
+- DeciderManager 把 input.speech.recognized 转发给 prepare()
+
+运行: uv run pytest tests/stages/decision/deciders/test_llm_decider.py -v
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.modules.events.names import CoreEvents
+from src.modules.events.payloads.input import SpeechRecognizedPayload
+from src.modules.types.base.normalized_message import NormalizedMessage
+from src.stages.decision.deciders.llm.llm_decider import LLMDecider
+from src.stages.decision.manager import DeciderManager
+
+# ==================== 辅助 ====================
+
+
+def make_decider(speculate: bool = True, speculate_after_ms: int = 10, llm_delay: float = 0.0) -> LLMDecider:
+    event_bus = MagicMock()
+    event_bus.emit = AsyncMock()
+
+    async def chat(prompt, client_type):
+        await asyncio.sleep(llm_delay)
+        return SimpleNamespace(success=True, content=json.dumps({"text": f"回复:{prompt}"}), error="")
+
+    llm_service = MagicMock()
+    llm_service.chat = AsyncMock(side_effect=chat)
+
+    prompt_service = MagicMock()
+    prompt_service.render_safe = MagicMock(side_effect=lambda template, text, **kwargs: text)
+
+    return LLMDecider(
+        config={"speculate_on_partial": speculate, "speculate_after_ms": speculate_after_ms},
+        event_bus=event_bus,
+        llm_service=llm_service,
+        prompt_service=prompt_service,
+    )
+
+
+def partial(text: str, utterance_id: int = 1, is_final: bool = False) -> SpeechRecognizedPayload:
+    return SpeechRecognizedPayload(text=text, is_final=is_final, utterance_id=utterance_id, engine="fake")
+
+
+def final_message(text: str, source: str = "stt") -> NormalizedMessage:
+    return NormalizedMessage(text=text, source=source, platform="voice")
+
+
+def published_speech(decider: LLMDecider) -> list:
+    return [call.args[1].intent_data["speech"] for call in decider._event_bus.emit.await_args_list]
+
+
+async def settle(seconds: float = 0.05) -> None:
+    await asyncio.sleep(seconds)
+
+
+# ==================== 推测请求 ====================
+
+
+@pytest.mark.asyncio
+async def test_matching_final_reuses_speculative_response():
+    decider = make_decider()
+
+    await decider.prepare(partial("今天天气怎么样"))
+    await settle()
+    await decider.prepare(partial("今天天气怎么样？", is_final=True))
+    await decider.decide(final_message("今天天气怎么样？"))
+
+    assert decider._llm_service.chat.await_count == 1
+    assert published_speech(decider) == ["回复:今天天气怎么样"]
+    assert decider.get_statistics()["speculation_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_different_final_discards_speculation():
+    decider = make_decider(llm_delay=1.0)
+
+    await decider.prepare(partial("今天天气"))
+    await settle()
+    speculative_task = decider._speculation.task
+    decider._llm_service.chat.side_effect = None
+    decider._llm_service.chat.return_value = SimpleNamespace(success=True, content='{"text": "晴天"}', error="")
+    await decider.decide(final_message("今天天气怎么样"))
+    await settle(0)
+
+    assert speculative_task.cancelled()
+    assert decider._llm_service.chat.await_count == 2
+    assert published_speech(decider) == ["晴天"]
+    assert decider.get_statistics()["speculation_misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_changing_partial_restarts_speculation():
+    decider = make_decider(speculate_after_ms=30)
+
+    await decider.prepare(partial("今天"))
+    await settle(0.01)
+    first = decider._speculation.task
+    await decider.prepare(partial("今天天气"))
+    await settle()
+
+    assert first.cancelled()
+    # 第一条还在防抖等待中就被作废，只发出了一次请求
+    assert decider._llm_service.chat.await_count == 1
+    assert decider._speculation.key == "今天天气"
+
+
+@pytest.mark.asyncio
+async def test_empty_final_cancels_speculation():
+    decider = make_decider(llm_delay=1.0)
+
+    await decider.prepare(partial("嗯"))
+    await settle()
+    task = decider._speculation.task
+    await decider.prepare(partial("", is_final=True))
+    await settle(0)
+
+    assert decider._speculation is None
+    assert task.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_final_during_debounce_is_not_reused():
+    decider = make_decider(speculate_after_ms=1000)
+
+    await decider.prepare(partial("你好"))
+    await decider.decide(final_message("你好"))
+
+    assert decider._llm_service.chat.await_count == 1
+    assert published_speech(decider) == ["回复:你好"]
+    assert decider.get_statistics()["speculation_hits"] == 0
+
+
+@pytest.mark.asyncio
+async def test_other_source_does_not_touch_speculation():
+    decider = make_decider(llm_delay=0.05)
+
+    await decider.prepare(partial("你好"))
+    await settle(0.02)
+    await decider.decide(final_message("弹幕", source="bili_danmaku"))
+
+    assert decider._speculation is not None and not decider._speculation.task.cancelled()
+    await decider.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_prepare_disabled_by_default():
+    decider = make_decider(speculate=False)
+
+    await decider.prepare(partial("你好"))
+    await settle()
+
+    assert decider._speculation is None
+    assert decider._llm_service.chat.await_count == 0
+
+
+# ==================== DeciderManager 转发 ====================
+
+
+@pytest.mark.asyncio
+async def test_manager_forwards_speech_recognized_to_prepare():
+    manager = DeciderManager(event_bus=MagicMock())
+    with_prepare = SimpleNamespace(prepare=AsyncMock(side_effect=RuntimeError("boom {text}")))
+    another = SimpleNamespace(prepare=AsyncMock())
+    without_prepare = SimpleNamespace()
+    manager._deciders = {"a": with_prepare, "b": another, "c": without_prepare}
+
+    payload = partial("你好")
+    await manager._on_speech_recognized(CoreEvents.INPUT_SPEECH_RECOGNIZED, payload, "STTCollector")
+
+    with_prepare.prepare.assert_awaited_once_with(payload)
+    another.prepare.assert_awaited_once_with(payload)
@@ -0,0 +1,234 @@
+"""
+BiliDanmakuCollector 测试（自适应轮询、去重、本地模拟 gethistory 接口）
+
+运行: uv run pytest tests/stages/input/collectors/test_bili_danmaku_collector.py -v
+"""
+
+import asyncio
+import random
+import statistics
+import time
+from typing import List
+
+import pytest
+
+from src.modules.events.event_bus import EventBus
+from src.stages.input.collectors.bili_danmaku.polling import AdaptivePollScheduler, DanmakuDedup
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def create_poller(clock: FakeClock, **kwargs) -> AdaptivePollScheduler:
+    params = {"base_interval": 3.0, "min_interval": 1.0, "max_interval": 10.0, "clock": clock}
+    params.update(kwargs)
+    return AdaptivePollScheduler(**params)
+
+
+def simulate(poller: AdaptivePollScheduler, clock: FakeClock, arrivals: List[float], duration: float):
+    """按 poller 给出的间隔轮询模拟的弹幕流，返回 (请求数, 延迟中位数)"""
+    latencies = []
+    requests = 0
+    last = 0.0
+    while clock.now < duration:
+        new = [t for t in arrivals if last < t <= clock.now]
+        latencies.extend(clock.now - t for t in new)
+        poller.record(len(new))
+        requests += 1
+        last = clock.now
+        clock.now += poller.next_delay()
+    return requests, statistics.median(latencies)
+
+
+def bursty_arrivals(duration: float, seed: int = 1) -> List[float]:
+    """安静 120 秒（0.02 条/秒）与热闹 40 秒（1.5 条/秒）交替"""
+    rng = random.Random(seed)
+    arrivals = []
+    t = 0.0
+    while t < duration:
+        rate = 0.02 if t % 160 < 120 else 1.5
+        t += rng.expovariate(rate)
+        arrivals.append(t)
+    return arrivals
+
+
+# =============================================================================
+# AdaptivePollScheduler
+# =============================================================================
+
+
+def test_speeds_up_with_chat_velocity():
+    clock = FakeClock()
+    poller = create_poller(clock)
+
+    for _ in range(5):
+        clock.now += 2.0
+        poller.record(4)
+
+    assert poller.interval == pytest.approx(1.0)
+
+
+def test_backs_off_when_idle():
+    clock = FakeClock()
+    poller = create_poller(clock)
+
+    for _ in range(10):
+        clock.now += poller.interval
+        poller.record(0)
+
+    assert poller.interval == 10.0
+
+
+def test_full_page_polls_at_min_interval():
+    clock = FakeClock()
+    poller = create_poller(clock)
+    clock.now += 3.0
+
+    poller.record(10, page_full=True)
+
+    assert poller.interval == 1.0
+
+
+def test_error_doubles_interval():
+    poller = create_poller(FakeClock())
+
+    poller.record_error()
+
+    assert poller.interval == 6.0
+
+
+def test_request_budget_is_enforced():
+    """持续热闹时请求速率不超过 base_interval 对应的速率（加上桶容量）"""
+    clock = FakeClock()
+    poller = create_poller(clock, burst=5.0)
+
+    requests = 0
+    while clock.now < 300:
+        poller.record(5)
+        requests += 1
+        clock.now += poller.next_delay()
+
+    assert requests <= 300 / 3.0 + 5 + 1
+
+
+def test_quiet_room_polls_at_base_interval_once_bucket_is_full():
+    """令牌桶装满后不再继续放慢，安静直播间的延迟不差于固定间隔轮询"""
+    clock = FakeClock()
+    poller = create_poller(clock, burst=5.0)
+
+    delays = []
+    for _ in range(50):
+        poller.record(0)
+        delay = poller.next_delay()
+        delays.append(delay)
+        clock.now += delay
+
+    assert delays[-1] == pytest.approx(3.0)
+
+
+def test_adaptive_polling_lowers_latency_without_more_requests():
+    duration = 3600.0
+    arrivals = bursty_arrivals(duration)
+
+    fixed_clock = FakeClock()
+    fixed = create_poller(fixed_clock, min_interval=3.0, max_interval=3.0)
+    fixed_requests, fixed_latency = simulate(fixed, fixed_clock, arrivals, duration)
+
+    adaptive_clock = FakeClock()
+    adaptive = create_poller(adaptive_clock)
+    adaptive_requests, adaptive_latency = simulate(adaptive, adaptive_clock, arrivals, duration)
+
+    assert adaptive_requests <= fixed_requests
+    assert adaptive_latency < fixed_latency * 0.75
+
+
+def test_invalid_intervals():
+    with pytest.raises(ValueError):
+        AdaptivePollScheduler(base_interval=3.0, min_interval=5.0, max_interval=1.0)
+    with pytest.raises(ValueError):
+        AdaptivePollScheduler(base_interval=0, min_interval=1.0, max_interval=2.0)
+
+
+# =============================================================================
+# DanmakuDedup
+# =============================================================================
+
+
+def test_dedup_is_bounded():
+    dedup = DanmakuDedup(capacity=2)
+
+    assert dedup.add(("1", "a", 100))
+    assert not dedup.add(("1", "a", 100))
+    assert dedup.add(("2", "a", 100))
+    assert dedup.add(("3", "b", 100))
+
+    assert len(dedup) == 2
+    assert ("1", "a", 100) not in dedup
+    assert ("3", "b", 100) in dedup
+
+
+# =============================================================================
+# BiliDanmakuCollector + 本地模拟接口
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_collector_against_fake_history_endpoint():
+    """同一秒内的不同弹幕都被采集，重复返回的弹幕只采集一次，启动前的历史弹幕被忽略"""
+    pytest.importorskip("aiohttp")
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    from src.stages.input.collectors.bili_danmaku.bili_danmaku_collector import BiliDanmakuCollector
+
+    room: list = []
+    request_count = 0
+
+    async def gethistory(request):
+        nonlocal request_count
+        request_count += 1
+        assert request.query["roomid"] == "123"
+        return web.json_response({"code": 0, "data": {"room": list(room)}})
+
+    app = web.Application()
+    app.router.add_get("/xlive/web-room/v1/dM/gethistory", gethistory)
+    server = TestServer(app)
+    await server.start_server()
+
+    try:
+        collector = BiliDanmakuCollector(
+            {
+                "room_id": 123,
+                "poll_interval": 1,
+                "min_poll_interval": 0.05,
+                "api_base_url": str(server.make_url("")),
+            },
+            EventBus(),
+        )
+        now = int(time.time())
+        room.append({"uid": 1, "nickname": "旧观众", "text": "启动前", "check_info": {"ts": now - 60}})
+        room.append({"uid": 2, "nickname": "A", "text": "第一条", "check_info": {"ts": now}})
+        room.append({"uid": 3, "nickname": "B", "text": "同一秒", "check_info": {"ts": now}})
+
+        received = []
+
+        async def consume():
+            async for message in collector.collect():
+                received.append(message.text)
+                if len(received) == 2:
+                    # 第二轮：重复返回已有弹幕，并追加一条同一秒的新弹幕
+                    room.append({"uid": 2, "nickname": "A", "text": "再一条", "check_info": {"ts": now}})
+                if len(received) == 3:
+                    await collector.stop()
+
+        await asyncio.wait_for(consume(), timeout=5.0)
+    finally:
+        await server.close()
+
+    assert received == ["第一条", "同一秒", "再一条"]
+    assert request_count >= 2
@@ -0,0 +1,216 @@
+"""
+Bilibili 官方弹幕 WebSocket 帧解码测试（多包拼接、zlib/brotli 压缩、大包体、工作线程解码）
+
+运行: uv run pytest tests/stages/input/collectors/test_bili_frame_decoder.py -v
+"""
+
+import asyncio
+import json
+import struct
+import tracemalloc
+import zlib
+
+import pytest
+
+from src.stages.input.collectors.bili_danmaku_official.client.frame_decoder import (
+    HEADER_LEN,
+    OP_AUTH_REPLY,
+    OP_HEARTBEAT_REPLY,
+    OP_NOTIFICATION,
+    PROTO_VER_BROTLI,
+    PROTO_VER_INT,
+    PROTO_VER_ZLIB,
+    FrameDecodeError,
+    FrameDecoder,
+    encode_packet,
+)
+
+
+def notification(text: str) -> bytes:
+    data = {"cmd": "LIVE_OPEN_PLATFORM_DM", "data": {"uname": "测试用户", "msg": text}}
+    return encode_packet(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+
+
+def texts(messages) -> list:
+    return [m["data"]["msg"] for m in messages]
+
+
+# =============================================================================
+# FrameDecoder
+# =============================================================================
+
+
+def test_single_raw_packet():
+    messages, others = FrameDecoder().decode(notification("你好"))
+
+    assert texts(messages) == ["你好"]
+    assert others == []
+
+
+def test_concatenated_packets_in_one_frame():
+    frame = notification("一") + encode_packet(struct.pack(">I", 42), OP_HEARTBEAT_REPLY, PROTO_VER_INT)
+    frame += notification("二")
+
+    messages, others = FrameDecoder().decode(frame)
+
+    assert texts(messages) == ["一", "二"]
+    assert [(p.op, p.body) for p in others] == [(OP_HEARTBEAT_REPLY, struct.pack(">I", 42))]
+
+
+def test_zlib_compressed_batch():
+    payload = b"".join(notification(str(i)) for i in range(50))
+    frame = encode_packet(zlib.compress(payload), ver=PROTO_VER_ZLIB)
+
+    messages, _ = FrameDecoder().decode(frame)
+
+    assert texts(messages) == [str(i) for i in range(50)]
+
+
+def test_brotli_compressed_batch():
+    brotli = pytest.importorskip("brotli")
+    payload = b"".join(notification(str(i)) for i in range(50))
+    frame = encode_packet(brotli.compress(payload), ver=PROTO_VER_BROTLI)
+
+    messages, _ = FrameDecoder().decode(frame)
+
+    assert texts(messages) == [str(i) for i in range(50)]
+
+
+def test_large_body_is_not_rejected():
+    """旧实现丢弃超过 2048 字节的包，醒目留言等大消息会丢失"""
+    text = "醒目留言" * 2000
+
+    messages, _ = FrameDecoder().decode(notification(text))
+
+    assert texts(messages) == [text]
+
+
+def test_partial_packet_is_buffered_until_complete():
+    data = notification("一") + notification("二")
+    decoder = FrameDecoder()
+
+    first = decoder.feed(data[: HEADER_LEN + 5])
+    assert first == []
+    assert decoder.pending_bytes == HEADER_LEN + 5
+
+    packets = decoder.feed(data[HEADER_LEN + 5 :])
+    assert [p.op for p in packets] == [OP_NOTIFICATION, OP_NOTIFICATION]
+    assert decoder.pending_bytes == 0
+
+
+def test_corrupt_header_raises_and_resets():
+    decoder = FrameDecoder()
+    corrupt = struct.pack(">IHHII", 4, HEADER_LEN, 0, OP_NOTIFICATION, 0)
+
+    with pytest.raises(FrameDecodeError):
+        decoder.feed(corrupt)
+
+    assert decoder.pending_bytes == 0
+    assert texts(decoder.decode(notification("恢复"))[0]) == ["恢复"]
+
+
+def test_decompressed_size_is_capped():
+    payload = b"".join(notification("x" * 100) for _ in range(100))
+    frame = encode_packet(zlib.compress(payload), ver=PROTO_VER_ZLIB)
+
+    with pytest.raises(FrameDecodeError, match="长度上限"):
+        FrameDecoder(max_packet_len=len(payload) // 2).decode(frame)
+
+
+def test_brotli_bomb_is_not_fully_decompressed():
+    """brotli 解压边解压边限制长度，不会先把整个解压炸弹展开到内存里"""
+    brotli = pytest.importorskip("brotli")
+    frame = encode_packet(brotli.compress(b"\0" * (64 * 1024 * 1024), quality=1), ver=PROTO_VER_BROTLI)
+
+    tracemalloc.start()
+    with pytest.raises(FrameDecodeError, match="长度上限"):
+        FrameDecoder(max_packet_len=1024 * 1024).decode(frame)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert peak < 8 * 1024 * 1024
+
+
+def test_truncated_brotli_payload_raises():
+    brotli = pytest.importorskip("brotli")
+    payload = b"".join(notification(str(i)) for i in range(50))
+    frame = encode_packet(brotli.compress(payload)[:-4], ver=PROTO_VER_BROTLI)
+
+    with pytest.raises(FrameDecodeError, match="brotli"):
+        FrameDecoder().decode(frame)
+
+
+def test_invalid_json_is_skipped():
+    decoder = FrameDecoder()
+    frame = encode_packet(b"{not json") + notification("正常")
+
+    messages, _ = decoder.decode(frame)
+
+    assert texts(messages) == ["正常"]
+    assert decoder.invalid_json_count == 1
+
+
+# =============================================================================
+# BiliWebSocketClient 接收 / 解码循环
+# =============================================================================
+
+
+class FakeWebSocket:
+    def __init__(self, frames):
+        self.frames = list(frames)
+
+    async def recv(self):
+        import websockets.exceptions
+
+        if not self.frames:
+            raise websockets.exceptions.ConnectionClosed(None, None)
+        return self.frames.pop(0)
+
+    async def send(self, data):
+        self.sent = data
+
+
+def create_client():
+    pytest.importorskip("websockets")
+    from src.stages.input.collectors.bili_danmaku_official.client.websocket_client import BiliWebSocketClient
+
+    return BiliWebSocketClient("code", 1, "key", "secret", "http://127.0.0.1")
+
+
+@pytest.mark.asyncio
+async def test_client_dispatches_every_message_in_order():
+    """大帧在工作线程中解码，小帧直接解码，handler 收到的顺序与帧顺序一致"""
+    client = create_client()
+    big_batch = b"".join(notification(f"b{i}") for i in range(200))
+    frames = [
+        notification("a"),
+        encode_packet(zlib.compress(big_batch), ver=PROTO_VER_ZLIB),
+        b"\x00\x00\x00\x04broken",
+        notification("c") + notification("d"),
+    ]
+    client.websocket = FakeWebSocket(frames)
+    client.is_started = True
+
+    received = []
+
+    async def handler(message_data, queue):
+        received.append(message_data["data"]["msg"])
+
+    frame_queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+    await asyncio.wait_for(
+        asyncio.gather(
+            client._recv_loop(frame_queue),
+            client._decode_loop(frame_queue, FrameDecoder(), handler, asyncio.Queue()),
+        ),
+        timeout=5.0,
+    )
+
+    assert received == ["a"] + [f"b{i}" for i in range(200)] + ["c", "d"]
+
+
+@pytest.mark.asyncio
+async def test_auth_accepts_reply_in_batched_frame():
+    client = create_client()
+    websocket = FakeWebSocket([encode_packet(b'{"code":0}', OP_AUTH_REPLY) + notification("欢迎")])
+
+    assert await client._auth(websocket, '{"key":"x"}')
@@ -0,0 +1,179 @@
+"""
+MockDanmakuCollector 负载生成测试（到达过程、用户基数与重复比例、按时间戳回放会话）
+
+运行: uv run pytest tests/stages/input/collectors/test_mock_danmaku_collector.py -v
+"""
+
+import json
+from collections import Counter
+
+import pytest
+
+from src.modules.events.journal import EventJournal
+from src.modules.events.event_bus import EventBus
+from src.modules.events.names import CoreEvents
+from src.modules.events.payloads.input import MessageReadyPayload
+from src.modules.types.base.normalized_message import NormalizedMessage
+from src.stages.input.collectors.mock_danmaku import LoadGenerator, LoadProfile, MockDanmakuCollector
+from src.stages.input.collectors.mock_danmaku.load_generator import HOT_PHRASES
+
+# =============================================================================
+# LoadGenerator
+# =============================================================================
+
+
+def test_steady_rate_matches_profile():
+    messages = list(LoadGenerator(LoadProfile(mode="steady", rate=20, seed=1)).messages(duration=500))
+
+    assert len(messages) == pytest.approx(20 * 500, rel=0.05)
+    offsets = [m.offset_s for m in messages]
+    assert offsets == sorted(offsets) and offsets[-1] < 500
+
+
+def test_burst_rate_inside_peak_windows():
+    profile = LoadProfile(mode="burst", rate=5, peak_rate=100, peak_interval=10, peak_duration=2, seed=2)
+    generator = LoadGenerator(profile)
+
+    messages = list(generator.messages(duration=1000))
+
+    in_peak = sum(1 for m in messages if generator.in_peak(m.offset_s))
+    assert in_peak == pytest.approx(100 * 2 * 100, rel=0.05)
+    assert len(messages) - in_peak == pytest.approx(5 * 8 * 100, rel=0.05)
+
+
+def test_same_seed_same_sequence():
+    profile = LoadProfile(mode="raid", seed=7)
+
+    assert LoadGenerator(profile).take(500) == LoadGenerator(profile).take(500)
+
+
+def test_user_cardinality_and_duplicate_ratio():
+    profile = LoadProfile(mode="steady", rate=50, users=30, duplicate_ratio=0.4, gift_ratio=0, seed=3)
+
+    messages = list(LoadGenerator(profile).messages(duration=200))
+
+    assert len({m.user_id for m in messages}) == 30
+    duplicates = sum(1 for m in messages if m.text in HOT_PHRASES)
+    assert duplicates / len(messages) == pytest.approx(0.4, abs=0.03)
+    unique_texts = [m.text for m in messages if m.text not in HOT_PHRASES]
+    assert len(set(unique_texts)) == len(unique_texts)
+
+
+def test_gift_storm_is_mostly_gifts_in_peak():
+    profile = LoadProfile(mode="gift_storm", rate=5, peak_rate=50, gift_ratio=0, storm_gift_ratio=0.8, seed=4)
+    generator = LoadGenerator(profile)
+
+    messages = list(generator.messages(duration=300))
+
+    assert all(m.data_type == "text" for m in messages if not generator.in_peak(m.offset_s))
+    peak_types = Counter(m.data_type for m in messages if generator.in_peak(m.offset_s))
+    assert peak_types["gift"] / sum(peak_types.values()) == pytest.approx(0.8, abs=0.05)
+
+
+def test_raid_users_enter_before_talking():
+    profile = LoadProfile(mode="raid", rate=1, peak_rate=100, raid_users=20, gift_ratio=0, seed=5)
+
+    messages = list(LoadGenerator(profile).messages(duration=60))
+
+    seen = set()
+    for message in messages:
+        if not message.user_id.startswith("raid"):
+            continue
+        if message.user_id not in seen:
+            assert message.data_type == "enter"
+            seen.add(message.user_id)
+        else:
+            assert message.data_type == "text"
+    # 两个周期的峰值窗口各来一批新观众
+    assert {uid.split("-")[0] for uid in seen} == {"raid0", "raid1"}
+
+
+def test_invalid_mode_rejected():
+    with pytest.raises(ValueError):
+        LoadProfile(mode="unknown")
+
+
+# =============================================================================
+# MockDanmakuCollector
+# =============================================================================
+
+
+async def collect_all(collector: MockDanmakuCollector) -> list:
+    await collector.start()
+    return [message async for message in collector.collect()]
+
+
+@pytest.mark.asyncio
+async def test_collector_generates_synthetic_load():
+    collector = MockDanmakuCollector(
+        {"mode": "burst", "rate": 50, "peak_rate": 500, "peak_interval": 0.2, "peak_duration": 0.1, "duration": 0.4},
+        EventBus(enable_stats=False),
+    )
+
+    messages = await collect_all(collector)
+
+    assert len(messages) == collector.sent_count > 0
+    assert all(isinstance(m, NormalizedMessage) and m.source == "mock_danmaku" for m in messages)
+    assert all(m.timestamp_ms > 0 for m in messages)
+
+
+@pytest.mark.asyncio
+async def test_replay_plain_jsonl_keeps_fields(tmp_path):
+    path = tmp_path / "session.jsonl"
+    lines = [
+        {"text": "你好", "user_name": "观众A", "user_id": "1"},
+        "not json",
+        {"text": "送出了 1 个 辣条", "user_name": "观众B", "user_id": "2", "data_type": "gift", "importance": 0.35},
+    ]
+    path.write_text("\n".join(x if isinstance(x, str) else json.dumps(x) for x in lines), encoding="utf-8")
+    collector = MockDanmakuCollector(
+        {"log_file_path": str(path), "send_interval": 0.1, "loop_playback": False}, EventBus(enable_stats=False)
+    )
+
+    messages = await collect_all(collector)
+
+    assert [(m.text, m.user_nickname, m.data_type) for m in messages] == [
+        ("你好", "观众A", "text"),
+        ("送出了 1 个 辣条", "观众B", "gift"),
+    ]
+    assert messages[1].importance == 0.35
+
+
+@pytest.mark.asyncio
+async def test_replay_follows_recorded_timestamps(tmp_path, monkeypatch):
+    path = tmp_path / "session.jsonl"
+    rows = [{"text": str(i), "timestamp_ms": 1_700_000_000_000 + i * 2000} for i in range(3)]
+    path.write_text("\n".join(json.dumps(r) for r in rows), encoding="utf-8")
+    collector = MockDanmakuCollector(
+        {"log_file_path": str(path), "speed": 4, "loop_playback": False}, EventBus(enable_stats=False)
+    )
+    deadlines = []
+
+    async def fake_sleep_until(deadline):
+        deadlines.append(deadline)
+
+    monkeypatch.setattr(collector, "_sleep_until", fake_sleep_until)
+
+    messages = await collect_all(collector)
+
+    assert [m.text for m in messages] == ["0", "1", "2"]
+    # 2 秒间隔按 4 倍速回放为 0.5 秒
+    assert [round(d - deadlines[0], 6) for d in deadlines] == [0.0, 0.5, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_replay_event_journal(tmp_path):
+    path = str(tmp_path / "events.jsonl.gz")
+    event_bus = EventBus(enable_stats=False)
+    journal = EventJournal(path)
+    journal.attach(event_bus)
+    for text in ("一", "二"):
+        message = NormalizedMessage(text=text, source="bili_danmaku_official", user_nickname="观众", user_id="u1")
+        payload = MessageReadyPayload.from_normalized_message(message)
+        await event_bus.emit(CoreEvents.INPUT_MESSAGE_RECEIVED, payload, "test", wait=True)
+    await journal.close()
+
+    collector = MockDanmakuCollector({"log_file_path": path, "speed": 0, "loop_playback": False}, event_bus)
+    messages = await collect_all(collector)
+
+    assert [(m.text, m.user_nickname, m.user_id) for m in messages] == [("一", "观众", "u1"), ("二", "观众", "u1")]
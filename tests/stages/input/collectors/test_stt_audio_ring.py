@@ -0,0 +1,179 @@
+"""
+STT 音频环形缓冲区测试（原地写入与格式转换、任意块长、溢出计数、历史帧取回、话语预录）
+
+运行: uv run pytest tests/stages/input/collectors/test_stt_audio_ring.py -v
+"""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from src.modules.logging import get_logger
+from src.stages.input.collectors.stt.audio_ring import AudioRingBuffer
+from src.stages.input.collectors.stt.engines import FakeEngine
+from src.stages.input.collectors.stt.stt_collector import STTCollector
+from src.stages.input.collectors.stt.vad_worker import VadResult, VadWorker
+
+FRAME_SAMPLES = 512
+
+
+def frame(value: int) -> np.ndarray:
+    return np.full(FRAME_SAMPLES, value, dtype=np.int16)
+
+
+def pcm(value: int) -> bytes:
+    return frame(value).tobytes()
+
+
+# =============================================================================
+# AudioRingBuffer
+# =============================================================================
+
+
+def test_write_converts_sounddevice_blocks_in_place():
+    ring = AudioRingBuffer(FRAME_SAMPLES, max_unread=8)
+    stereo_int16 = np.stack([frame(100), frame(-7)], axis=1)
+    mono_float = np.full((FRAME_SAMPLES, 1), 2.0, dtype=np.float32)
+
+    ring.write(stereo_int16)
+    ring.write(mono_float)
+    ring.write(pcm(5))
+
+    assert ring.take(8) == [(0, pcm(100)), (1, pcm(32767)), (2, pcm(5))]
+
+
+def test_write_reassembles_blocks_of_any_length():
+    ring = AudioRingBuffer(FRAME_SAMPLES, max_unread=8)
+    samples = np.arange(3 * FRAME_SAMPLES, dtype=np.int16)
+
+    for start in range(0, samples.size, 300):
+        ring.write(samples[start : start + 300])
+
+    assert [seq for seq, _ in ring.take(8)] == [0, 1, 2]
+    assert ring.read_range(0, 3) == [samples[i * FRAME_SAMPLES : (i + 1) * FRAME_SAMPLES].tobytes() for i in range(3)]
+
+
+def test_write_does_not_allocate_audio_buffers():
+    ring = AudioRingBuffer(FRAME_SAMPLES, max_unread=256)
+    block = np.full((FRAME_SAMPLES, 1), 0.25, dtype=np.float32)
+    ring.write(block)
+
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    for _ in range(200):
+        ring.write(block)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # 旧实现每块至少分配 float32 临时数组、int16 数组和 bytes（约 4KB）；这里只有切片视图等小对象
+    assert peak - baseline < FRAME_SAMPLES * 2
+
+
+def test_overrun_drops_newest_frames_and_counts():
+    ring = AudioRingBuffer(FRAME_SAMPLES, max_unread=3)
+
+    accepted = [ring.write(pcm(i)) for i in range(5)]
+
+    assert accepted == [True, True, True, False, False]
+    assert ring.stats.written_count == 3 and ring.stats.overrun_count == 2
+    assert ring.take(10) == [(0, pcm(0)), (1, pcm(1)), (2, pcm(2))]
+    ring.write(pcm(9))
+    assert ring.take(10) == [(3, pcm(9))]
+
+
+def test_read_range_returns_history_and_counts_overwritten_frames():
+    ring = AudioRingBuffer(FRAME_SAMPLES, max_unread=2, history_frames=3)
+    for i in range(10):
+        ring.write(pcm(i))
+        ring.take(1)
+
+    # capacity = 2 + 3 + 1，序号 4 之前的帧已被覆盖
+    assert ring.read_range(2, 10) == [pcm(i) for i in range(5, 10)]
+    assert ring.stats.stale_read_count == 3
+    assert ring.read_range(8, 20) == [pcm(8), pcm(9)]
+
+
+# =============================================================================
+# 话语预录
+# =============================================================================
+
+
+class RecordingEngine(FakeEngine):
+    def __init__(self):
+        super().__init__({"transcripts": ["你好"]}, 16000, lambda hypothesis: None)
+        self.fed = []
+
+    async def _feed(self, utterance_id, audio):
+        self.fed.append(np.frombuffer(audio, dtype=np.int16)[0])
+        await super()._feed(utterance_id, audio)
+
+
+def make_collector(preroll_frames: int) -> STTCollector:
+    collector = STTCollector.__new__(STTCollector)
+    collector.logger = get_logger("STTCollector")
+    collector.engine_name = "fake"
+    collector.vad_threshold = 0.5
+    collector.min_silence_duration_ms = 1000
+    collector.preroll_frames = preroll_frames
+    collector._engine = RecordingEngine()
+    collector._vad_worker = VadWorker(lambda samples: 0.0, lambda results: None, history_frames=preroll_frames)
+    collector._speech_chunk_count = 0
+    collector._last_fed_seq = -1
+    collector._is_speaking = False
+    collector._silence_started_time = None
+    return collector
+
+
+async def run_frames(collector: STTCollector, pattern: str) -> None:
+    """pattern 中每个字符一帧：s 为语音，其余为静音；帧的样本值即序号"""
+    ring = collector._vad_worker.ring
+    for value, kind in enumerate(pattern):
+        ring.write(pcm(value))
+        for seq, audio in ring.take(1):
+            await collector._handle_vad_result(VadResult(audio, 0.9 if kind == "s" else 0.1, seq=seq))
+
+
+@pytest.mark.asyncio
+async def test_preroll_prepended_to_detected_utterance():
+    collector = make_collector(preroll_frames=3)
+
+    await run_frames(collector, "......ssss..")
+
+    # 第 6 帧判定为语音，之前 3 帧先送入；话语结束后的第一帧静音也送入
+    assert collector._engine.fed == [3, 4, 5, 6, 7, 8, 9, 10]
+
+
+@pytest.mark.asyncio
+async def test_preroll_does_not_resend_frames_within_utterance():
+    collector = make_collector(preroll_frames=3)
+
+    await run_frames(collector, "..ss.....ss")
+
+    # 短暂停顿后恢复说话：只补停顿末尾还没送过的帧
+    assert collector._engine.fed == [0, 1, 2, 3, 4, 6, 7, 8, 9, 10]
+    assert collector._engine.utterance_id == 1
+
+
+@pytest.mark.asyncio
+async def test_preroll_disabled():
+    collector = make_collector(preroll_frames=0)
+
+    await run_frames(collector, "....ss")
+
+    assert collector._engine.fed == [4, 5]
+
+
+@pytest.mark.asyncio
+async def test_preroll_after_restart_with_new_ring():
+    collector = make_collector(preroll_frames=3)
+    collector._emit_tasks = set()
+    await run_frames(collector, "........ss..")
+
+    # 重新采集时环形缓冲区重建，序号从 0 开始
+    await collector.cleanup()
+    collector._engine.fed.clear()
+    collector._vad_worker = VadWorker(lambda samples: 0.0, lambda results: None, history_frames=3)
+    await run_frames(collector, "....ss")
+
+    assert collector._engine.fed == [1, 2, 3, 4, 5]
@@ -0,0 +1,306 @@
+"""
+STT 识别引擎测试（假引擎、讯飞动态修正拼接与接收、本地引擎的线程化解码、引擎配置校验）
+
+运行: uv run pytest tests/stages/input/collectors/test_stt_engines.py -v
+"""
+
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import aiohttp
+import pytest
+from pydantic import ValidationError
+
+from src.stages.input.collectors.stt.config import STTInputConfig
+from src.stages.input.collectors.stt.engines import (
+    FakeEngine,
+    IflytekEngine,
+    LocalEngine,
+    WpgsTranscript,
+    create_engine,
+)
+
+FRAME = b"\x00\x01" * 512
+
+
+def make_engine(cls, config=None):
+    results = []
+    engine = cls(config or {}, 16000, results.append)
+    return engine, results
+
+
+def texts(results):
+    return [(r.text, r.is_final) for r in results]
+
+
+# =============================================================================
+# FakeEngine
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_fake_engine_reveals_transcript_then_final():
+    engine, results = make_engine(FakeEngine, {"transcripts": ["今天天气怎么样"], "frames_per_partial": 2})
+
+    assert await engine.start_utterance()
+    for _ in range(7):
+        await engine.feed(FRAME)
+    await engine.finish_utterance()
+
+    assert texts(results) == [("今天", False), ("今天天气", False), ("今天天气怎么", False), ("今天天气怎么样", True)]
+    assert {r.utterance_id for r in results} == {1}
+    assert engine.fed_bytes == 7 * len(FRAME)
+    assert not engine.in_utterance
+
+
+@pytest.mark.asyncio
+async def test_fake_engine_cycles_transcripts_and_skips_unchanged_partials():
+    engine, results = make_engine(
+        FakeEngine, {"transcripts": ["好", "再见"], "frames_per_partial": 1, "chars_per_partial": 1}
+    )
+
+    for _ in range(3):
+        await engine.start_utterance()
+        for _ in range(3):
+            await engine.feed(FRAME)
+        await engine.finish_utterance()
+
+    # "好" 只有一个字，后两帧的部分结果不变，不重复交回
+    assert texts(results) == [
+        ("好", False),
+        ("好", True),
+        ("再", False),
+        ("再见", False),
+        ("再见", True),
+        ("好", False),
+        ("好", True),
+    ]
+    assert [r.utterance_id for r in results if r.is_final] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_abort_delivers_single_empty_final():
+    engine, results = make_engine(
+        FakeEngine, {"transcripts": ["你好"], "frames_per_partial": 1, "chars_per_partial": 1}
+    )
+
+    await engine.start_utterance()
+    await engine.feed(FRAME)
+    await engine.abort_utterance()
+    await engine.finish_utterance()
+    await engine.feed(FRAME)
+
+    assert texts(results) == [("你", False), ("", True)]
+    assert engine.stats.failed_count == 1
+
+
+@pytest.mark.asyncio
+async def test_callback_error_does_not_break_utterance():
+    delivered = []
+
+    def on_hypothesis(hypothesis):
+        delivered.append(hypothesis)
+        # 消息中的花括号不能让日志调用本身抛出异常
+        raise KeyError("{utterance_id}")
+
+    engine = FakeEngine({"transcripts": ["你好"], "frames_per_partial": 1}, 16000, on_hypothesis)
+
+    assert await engine.start_utterance()
+    await engine.feed(FRAME)
+    await engine.finish_utterance()
+
+    assert texts(delivered) == [("你好", False), ("你好", True)]
+    assert not engine.in_utterance
+
+
+@pytest.mark.asyncio
+async def test_failed_start_delivers_nothing():
+    engine, results = make_engine(FakeEngine, {"transcripts": ["你好"], "fail_utterances": [1]})
+
+    assert not await engine.start_utterance()
+    await engine.feed(FRAME)
+    await engine.finish_utterance()
+
+    assert results == []
+    assert await engine.start_utterance()
+    assert engine.utterance_id == 2
+
+
+def test_create_engine_rejects_unknown_name():
+    with pytest.raises(ValueError):
+        create_engine("whisper", {}, 16000, lambda h: None)
+
+
+def test_config_requires_selected_engine_section():
+    assert STTInputConfig.from_dict({"engine": "fake"}).iflytek_asr is None
+    with pytest.raises(ValidationError):
+        STTInputConfig.from_dict({"engine": "iflytek"})
+    with pytest.raises(ValidationError):
+        STTInputConfig.from_dict({"engine": "local"})
+
+
+# =============================================================================
+# 讯飞
+# =============================================================================
+
+
+def wpgs(sn, text, pgs="apd", rg=None):
+    result = {"sn": sn, "pgs": pgs, "ws": [{"cw": [{"w": ch}, {"w": "候选"}]} for ch in text]}
+    if rg is not None:
+        result["rg"] = rg
+    return result
+
+
+def test_wpgs_transcript_appends_and_replaces():
+    transcript = WpgsTranscript()
+
+    assert transcript.apply(wpgs(1, "今天")) == "今天"
+    assert transcript.apply(wpgs(2, "天汽")) == "今天天汽"
+    assert transcript.apply(wpgs(3, "天气怎么样", pgs="rpl", rg=[2, 2])) == "今天天气怎么样"
+    assert transcript.apply(wpgs(4, "今天天气怎么样？", pgs="rpl", rg=[1, 3])) == "今天天气怎么样？"
+
+
+def test_wpgs_transcript_without_dynamic_correction():
+    transcript = WpgsTranscript()
+
+    transcript.apply({"ws": [{"cw": [{"w": "你好"}]}]})
+
+    assert transcript.apply({"ws": [{"cw": [{"w": "。"}]}]}) == "你好。"
+
+
+class FakeWebSocket:
+    def __init__(self, responses):
+        self._messages = [
+            SimpleNamespace(type=aiohttp.WSMsgType.TEXT, data=json.dumps(r, ensure_ascii=False)) for r in responses
+        ]
+        self.closed = False
+        self.close_code = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._messages:
+            raise StopAsyncIteration
+        await asyncio.sleep(0)
+        return self._messages.pop(0)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_iflytek_receiver_emits_partials_and_final():
+    engine, results = make_engine(IflytekEngine, {"appid": "a", "api_key": "k", "api_secret": "s", "dwa": "wpgs"})
+    await engine.setup()
+    responses = [
+        {"code": 0, "data": {"status": 1, "result": wpgs(1, "今天")}},
+        {"code": 0, "data": {"status": 1, "result": wpgs(2, "天汽")}},
+        {"code": 0, "data": {"status": 1, "result": wpgs(3, "天气", pgs="rpl", rg=[2, 2])}},
+        {"code": 0, "data": {"status": 2, "result": wpgs(4, "。")}},
+    ]
+
+    engine._utterance_id = 1
+    engine._final_emitted = False
+    engine._utterance_started = 0.0
+    await engine._receiver(FakeWebSocket(responses), 1)
+
+    assert texts(results) == [("今天", False), ("今天天汽", False), ("今天天气", False), ("今天天气。", True)]
+
+
+@pytest.mark.asyncio
+async def test_iflytek_api_error_ends_utterance_with_empty_final():
+    engine, results = make_engine(IflytekEngine, {"appid": "a", "api_key": "k", "api_secret": "s"})
+    await engine.setup()
+    ws = FakeWebSocket([{"code": 10105, "message": "illegal access"}])
+
+    async def fake_start(utterance_id):
+        engine._ws = ws
+        engine._receiver_task = asyncio.create_task(engine._receiver(ws, utterance_id))
+        return True
+
+    engine._start = fake_start
+    assert await engine.start_utterance()
+    await engine._receiver_task
+    await engine.finish_utterance()
+
+    assert texts(results) == [("", True)]
+    assert ws.closed
+
+
+def test_iflytek_first_frame_carries_business_params():
+    engine, _ = make_engine(IflytekEngine, {"appid": "123", "dwa": "wpgs", "vad_eos": 800})
+
+    first = json.loads(engine._build_frame(0, b"\x01\x02"))
+    middle = json.loads(engine._build_frame(1, b"\x01\x02"))
+
+    assert first["common"] == {"app_id": "123"}
+    assert first["business"]["dwa"] == "wpgs" and first["business"]["vad_eos"] == 800
+    assert first["data"]["format"] == "audio/L16;rate=16000"
+    assert set(middle) == {"data"}
+
+
+# =============================================================================
+# 本地引擎
+# =============================================================================
+
+
+class FakeRecognizer:
+    """模拟 sherpa-onnx OnlineRecognizer：每收到一帧识别出一个字"""
+
+    def __init__(self, text):
+        self.text = text
+        self.threads = set()
+
+    def create_stream(self):
+        return SimpleNamespace(frames=0, pending=0, finished=False, accept_waveform=None, input_finished=None)
+
+    def is_ready(self, stream):
+        self.threads.add(threading.get_ident())
+        return stream.pending > 0
+
+    def decode_stream(self, stream):
+        stream.pending -= 1
+        stream.frames += 1
+
+    def get_result(self, stream):
+        return self.text[: stream.frames] + ("。" if stream.finished else "")
+
+
+@pytest.mark.asyncio
+async def test_local_engine_decodes_off_loop_in_order():
+    engine, results = make_engine(LocalEngine)
+    recognizer = FakeRecognizer("你好世界")
+    engine._recognizer = recognizer
+    engine._executor = ThreadPoolExecutor(max_workers=1)
+    engine._loop = asyncio.get_running_loop()
+
+    original_open = engine._open_stream
+
+    def open_stream():
+        original_open()
+        stream = engine._stream
+        stream.accept_waveform = lambda sample_rate, samples: setattr(stream, "pending", stream.pending + 1)
+        stream.input_finished = lambda: setattr(stream, "finished", True)
+
+    engine._open_stream = open_stream
+
+    await engine.start_utterance()
+    for _ in range(3):
+        await engine.feed(FRAME)
+    await engine.finish_utterance()
+    await engine.cleanup()
+
+    assert texts(results) == [("你", False), ("你好", False), ("你好世", False), ("你好世。", True)]
+    assert recognizer.threads and threading.get_ident() not in recognizer.threads
+
+
+@pytest.mark.asyncio
+async def test_local_engine_without_model_cannot_start():
+    engine, results = make_engine(LocalEngine)
+
+    assert not await engine.start_utterance()
+    assert results == []
@@ -0,0 +1,243 @@
+"""
+STT VAD 工作线程测试（能量门限、按序交付、落后时批量处理、缓冲区满丢帧、事件循环不被推理阻塞）
+
+运行: uv run pytest tests/stages/input/collectors/test_stt_vad_worker.py -v
+"""
+
+import asyncio
+import threading
+import time
+import wave
+
+import numpy as np
+import pytest
+
+from src.stages.input.collectors.stt.vad_worker import EnergyGate, VadResult, VadWorker
+
+SAMPLE_RATE = 16000
+FRAME_SAMPLES = 512
+
+
+def tone(db: float, freq: float = 220.0) -> np.ndarray:
+    t = np.arange(FRAME_SAMPLES) / SAMPLE_RATE
+    return (10 ** (db / 20) * np.sqrt(2) * np.sin(2 * np.pi * freq * t)).astype(np.float32)
+
+
+def to_pcm(samples: np.ndarray) -> bytes:
+    return (np.clip(samples, -1, 1) * 32767).astype(np.int16).tobytes()
+
+
+def write_fixture(path, pattern):
+    """按 pattern（"speech"/"silence" 列表）合成 16kHz 单声道 WAV，每项一帧"""
+    rng = np.random.default_rng(0)
+    frames = []
+    for kind in pattern:
+        if kind == "speech":
+            frames.append(tone(-20, freq=180) + tone(-26, freq=360))
+        else:
+            frames.append(rng.normal(0, 10 ** (-70 / 20), FRAME_SAMPLES).astype(np.float32))
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes(b"".join(to_pcm(x) for x in frames))
+
+
+def read_fixture(path) -> list:
+    with wave.open(str(path), "rb") as f:
+        pcm = f.readframes(f.getnframes())
+    size = FRAME_SAMPLES * 2
+    return [pcm[i : i + size] for i in range(0, len(pcm), size)]
+
+
+class Collector:
+    """线程安全地收集 deliver 交回的批次"""
+
+    def __init__(self):
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def __call__(self, results):
+        with self.lock:
+            self.batches.append(results)
+
+    @property
+    def results(self):
+        with self.lock:
+            return [r for batch in self.batches for r in batch]
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("等待超时")
+        time.sleep(0.005)
+
+
+# =============================================================================
+# EnergyGate
+# =============================================================================
+
+
+def test_gate_digital_silence():
+    assert EnergyGate().is_silence(np.zeros(FRAME_SAMPLES, dtype=np.float32))
+
+
+def test_gate_passes_speech_level_tone():
+    assert not EnergyGate().is_silence(tone(-20))
+
+
+def test_gate_treats_low_level_hiss_as_silence():
+    rng = np.random.default_rng(1)
+    hiss = rng.normal(0, 10 ** (-47 / 20), FRAME_SAMPLES).astype(np.float32)
+    low_tone = tone(-47)
+
+    # 门限附近：高过零率的白噪声算静音，同电平的低频浊音交给模型
+    assert EnergyGate().is_silence(hiss)
+    assert not EnergyGate().is_silence(low_tone)
+
+
+# =============================================================================
+# VadWorker
+# =============================================================================
+
+
+def test_results_delivered_in_submit_order():
+    collector = Collector()
+    worker = VadWorker(lambda samples: float(samples[0]), collector)
+    frames = [to_pcm(np.full(FRAME_SAMPLES, i / 100, dtype=np.float32)) for i in range(20)]
+
+    worker.start()
+    for frame in frames:
+        assert worker.submit(frame)
+    wait_for(lambda: len(collector.results) == 20)
+    worker.stop()
+
+    assert [r.audio for r in collector.results] == frames
+    assert [r.seq for r in collector.results] == list(range(20))
+    assert worker.stats.inferred_count == 20
+
+
+def test_gate_skips_model_on_silence_frames_from_wav_fixture(tmp_path):
+    path = tmp_path / "mic.wav"
+    pattern = ["silence"] * 10 + ["speech"] * 6 + ["silence"] * 8
+    write_fixture(path, pattern)
+    calls = []
+    collector = Collector()
+    worker = VadWorker(lambda samples: calls.append(1) or 0.9, collector, gate=EnergyGate())
+
+    worker.start()
+    for frame in read_fixture(path):
+        worker.submit(frame)
+    wait_for(lambda: len(collector.results) == len(pattern))
+    worker.stop()
+
+    assert [r.gated for r in collector.results] == [kind == "silence" for kind in pattern]
+    assert len(calls) == worker.stats.inferred_count == 6
+    assert worker.stats.gated_count == 18
+    assert all(r.probability == 0.0 for r in collector.results if r.gated)
+
+
+def test_frames_batched_when_worker_falls_behind():
+    release = threading.Event()
+    collector = Collector()
+
+    def slow_infer(samples):
+        release.wait(1.0)
+        return 0.5
+
+    worker = VadWorker(slow_infer, collector, max_batch=8)
+    worker.start()
+    worker.submit(to_pcm(tone(-20)))
+    wait_for(lambda: worker.backlog == 0)
+    # 第一帧卡在推理中，期间积压的帧在下一次唤醒时整批处理
+    for _ in range(10):
+        worker.submit(to_pcm(tone(-20)))
+    release.set()
+    wait_for(lambda: len(collector.results) == 11)
+    worker.stop()
+
+    assert [len(b) for b in collector.batches] == [1, 8, 2]
+    assert worker.stats.max_batch == 8
+
+
+def test_full_buffer_drops_without_blocking():
+    release = threading.Event()
+    worker = VadWorker(lambda samples: release.wait(1.0) and 0.5, Collector(), max_queue=4)
+    worker.start()
+    worker.submit(to_pcm(tone(-20)))
+    wait_for(lambda: worker.backlog == 0)
+
+    started = time.perf_counter()
+    accepted = [worker.submit(to_pcm(tone(-20))) for _ in range(10)]
+    elapsed = time.perf_counter() - started
+    release.set()
+    worker.stop()
+
+    assert accepted == [True] * 4 + [False] * 6
+    assert worker.ring.stats.overrun_count == 6
+    assert elapsed < 0.05
+
+
+def test_infer_error_counted_and_frame_still_delivered():
+    collector = Collector()
+
+    def broken(samples):
+        # 消息中的花括号不能让日志调用本身抛出异常
+        raise RuntimeError("boom {shape}")
+
+    worker = VadWorker(broken, collector)
+    worker.start()
+    worker.submit(to_pcm(tone(-20)))
+    wait_for(lambda: len(collector.results) == 1)
+    worker.stop()
+
+    assert collector.results == [VadResult(to_pcm(tone(-20)), 0.0, seq=0)]
+    assert worker.stats.error_count == 1
+
+
+def test_deliver_error_does_not_stop_worker():
+    delivered = []
+
+    def deliver(results):
+        delivered.extend(results)
+        if len(delivered) == 1:
+            raise KeyError("{seq}")
+
+    worker = VadWorker(lambda samples: 0.5, deliver)
+    worker.start()
+    worker.submit(to_pcm(tone(-20)))
+    wait_for(lambda: len(delivered) == 1)
+    worker.submit(to_pcm(tone(-20)))
+    wait_for(lambda: len(delivered) == 2)
+    worker.stop()
+
+    assert [r.seq for r in delivered] == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_slow_inference_does_not_block_event_loop():
+    loop = asyncio.get_running_loop()
+    results: asyncio.Queue = asyncio.Queue()
+    # 模拟一次 50ms 的 torch 推理（time.sleep 与 torch 一样释放 GIL）
+    worker = VadWorker(
+        lambda samples: time.sleep(0.05) or 0.9, lambda b: loop.call_soon_threadsafe(results.put_nowait, b)
+    )
+    worker.start()
+    for _ in range(5):
+        worker.submit(to_pcm(tone(-20)))
+
+    max_lag = 0.0
+    received = 0
+    deadline = loop.time() + 2.0
+    while received < 5 and loop.time() < deadline:
+        started = time.perf_counter()
+        await asyncio.sleep(0.005)
+        max_lag = max(max_lag, time.perf_counter() - started - 0.005)
+        while not results.empty():
+            received += len(results.get_nowait())
+    await asyncio.to_thread(worker.stop)
+
+    assert received == 5
+    assert max_lag < 0.04
@@ -0,0 +1,142 @@
+"""
+测试 LoadShedInputPipeline (负载感知准入管道)
+
+运行: uv run pytest tests/stages/input/pipelines/test_load_shed_pipeline.py -v
+"""
+
+import pytest
+
+from src.modules.time_utils import now_ms
+from src.modules.tracing import DecisionLoadMonitor
+from src.modules.types.base.normalized_message import NormalizedMessage
+from src.stages.input.pipelines.load_shed.pipeline import LoadShedInputPipeline
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def monitor():
+    return DecisionLoadMonitor()
+
+
+@pytest.fixture
+def load_shed_pipeline(monitor):
+    config = {"max_in_flight": 4, "max_lag_ms": 10000, "shed_start": 0.5, "shed_importance": 0.7}
+    return LoadShedInputPipeline(config, load_monitor=monitor)
+
+
+def create_message(
+    text: str = "弹幕", importance: float = 0.5, data_type: str = "text", age_ms: int = 0, source: str = "test"
+) -> NormalizedMessage:
+    return NormalizedMessage(
+        text=text, source=source, data_type=data_type, importance=importance, timestamp_ms=now_ms() - age_ms
+    )
+
+
+def _occupy(monitor: DecisionLoadMonitor, count: int) -> None:
+    for _ in range(count):
+        monitor.begin()
+
+
+# =============================================================================
+# 准入测试
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_idle_admits_everything(load_shed_pipeline):
+    """下游空闲时全部放行"""
+    assert await load_shed_pipeline._process(create_message(importance=0.1)) is not None
+    assert load_shed_pipeline.get_info()["required_importance"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_overload_sheds_low_importance(load_shed_pipeline, monitor):
+    """满载时低于 shed_importance 的消息被丢弃"""
+    _occupy(monitor, 4)
+
+    assert await load_shed_pipeline._process(create_message(importance=0.5)) is None
+    assert await load_shed_pipeline._process(create_message(importance=0.75)) is not None
+    assert load_shed_pipeline.get_info()["shed_count"] == 1
+    assert load_shed_pipeline.get_stats().dropped_count == 1
+
+
+@pytest.mark.asyncio
+async def test_partial_load_scales_threshold(load_shed_pipeline, monitor):
+    """负载介于 shed_start 与 1 之间时最低重要性线性增长"""
+    _occupy(monitor, 3)  # load = 0.75
+
+    assert load_shed_pipeline.get_info()["required_importance"] == pytest.approx(0.35)
+    assert await load_shed_pipeline._process(create_message(importance=0.3)) is None
+    assert await load_shed_pipeline._process(create_message(importance=0.4)) is not None
+
+
+@pytest.mark.asyncio
+async def test_lag_counts_as_load(load_shed_pipeline, monitor):
+    """排队延迟超过 max_lag_ms 时同样视为满载"""
+    monitor.begin(now_ms() - 20000)
+
+    assert load_shed_pipeline.get_info()["load"] >= 1.0
+    assert await load_shed_pipeline._process(create_message(importance=0.5)) is None
+
+
+@pytest.mark.asyncio
+async def test_protected_messages_always_admitted(load_shed_pipeline, monitor):
+    """SC、大航海和高重要性消息在满载和过期时仍放行"""
+    _occupy(monitor, 100)
+
+    assert await load_shed_pipeline._process(create_message(importance=0.5, data_type="super_chat")) is not None
+    assert await load_shed_pipeline._process(create_message(importance=0.1, data_type="guard")) is not None
+    assert await load_shed_pipeline._process(create_message(importance=0.9, data_type="gift", age_ms=600000)) is not None
+
+
+@pytest.mark.asyncio
+async def test_streamer_sources_always_admitted(load_shed_pipeline, monitor):
+    """主播自己的语音和控制台输入在满载时仍放行，可通过 always_admit_sources 配置"""
+    _occupy(monitor, 100)
+
+    assert await load_shed_pipeline._process(create_message(source="stt")) is not None
+    assert await load_shed_pipeline._process(create_message(source="console")) is not None
+    assert await load_shed_pipeline._process(create_message(source="bili_danmaku")) is None
+
+    custom = LoadShedInputPipeline({"max_in_flight": 4, "always_admit_sources": []}, load_monitor=monitor)
+    assert await custom._process(create_message(source="stt")) is None
+
+
+@pytest.mark.asyncio
+async def test_stale_messages_dropped(load_shed_pipeline):
+    """超过 max_age_seconds 的消息被丢弃，时间戳为 0 的消息不检查"""
+    assert await load_shed_pipeline._process(create_message(age_ms=120000)) is None
+    assert await load_shed_pipeline._process(NormalizedMessage(text="旧", source="test")) is not None
+    assert load_shed_pipeline.get_info()["stale_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_process_batch(load_shed_pipeline, monitor):
+    """批量处理与逐条处理一致"""
+    _occupy(monitor, 4)
+    messages = [
+        create_message(importance=0.2),
+        create_message(importance=0.5, data_type="super_chat"),
+        create_message(importance=0.75, age_ms=120000),
+        create_message(importance=0.75),
+    ]
+
+    results = await load_shed_pipeline.process_batch(messages)
+
+    assert [r is not None for r in results] == [False, True, False, True]
+    assert load_shed_pipeline.get_stats().dropped_count == 2
+
+
+@pytest.mark.asyncio
+async def test_reset(load_shed_pipeline):
+    await load_shed_pipeline._process(create_message(age_ms=120000))
+    await load_shed_pipeline.reset()
+    info = load_shed_pipeline.get_info()
+    assert info["stale_count"] == 0 and info["shed_count"] == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -8,6 +8,7 @@ import asyncio
 
 import pytest
 
+from src.stages.input.pipelines.rate_limit.limiter import GcraLimiter
 from src.stages.input.pipelines.rate_limit.pipeline import RateLimitInputPipeline
 from src.modules.types.base.normalized_message import NormalizedMessage
 
@@ -156,16 +157,16 @@ async def test_window_cleanup(rate_limit_pipeline):
     for i in range(3):
         await rate_limit_pipeline.process(create_message(f"消息{i}", "user1"))
 
-    # 记录当前时间戳数量
-    count_before = len(rate_limit_pipeline._global_timestamps)
+    # 记录当前计数
+    count_before = rate_limit_pipeline.get_info()["current_global_count"]
     assert count_before == 3  # 只有3条通过
 
     # 重置管道（清空所有记录）
     await rate_limit_pipeline.reset()
 
     # 验证所有记录都被清空
-    assert len(rate_limit_pipeline._global_timestamps) == 0
-    assert len(rate_limit_pipeline._user_timestamps) == 0
+    assert rate_limit_pipeline.get_info()["current_global_count"] == 0
+    assert rate_limit_pipeline.get_info()["active_users"] == 0
 
 
 @pytest.mark.asyncio
@@ -179,8 +180,8 @@ async def test_window_reset(rate_limit_pipeline):
     await rate_limit_pipeline.reset()
 
     # 验证状态已清空
-    assert len(rate_limit_pipeline._global_timestamps) == 0
-    assert len(rate_limit_pipeline._user_timestamps) == 0
+    assert rate_limit_pipeline.get_info()["current_global_count"] == 0
+    assert rate_limit_pipeline.get_info()["active_users"] == 0
     assert rate_limit_pipeline._stats.processed_count == 0
 
 
@@ -266,5 +267,91 @@ async def test_concurrent_access(rate_limit_pipeline):
     assert passed < 10  # 不是全部通过（有限流）
 
 
+@pytest.mark.asyncio
+async def test_process_batch_matches_sequential(rate_limit_pipeline):
+    """批量处理与逐条处理结果一致：批内前面的消息计入后面消息的限流"""
+    messages = [create_message(f"消息{i}", "user1") for i in range(5)] + [create_message("其他", "user2")]
+
+    results = await rate_limit_pipeline.process_batch(messages)
+
+    assert [r is not None for r in results] == [True, True, True, False, False, True]
+    assert rate_limit_pipeline.get_stats().processed_count == 6
+    assert rate_limit_pipeline.get_stats().dropped_count == 2
+    assert rate_limit_pipeline.get_info()["current_global_count"] == 4
+
+
+# =============================================================================
+# GCRA 限流器测试
+# =============================================================================
+
+
+def test_limiter_burst_then_refill():
+    """突发 limit 条后被拒绝，每经过 window / limit 秒恢复一条"""
+    limiter = GcraLimiter(limit=3, window=60)
+
+    for _ in range(3):
+        limiter.commit("u1", limiter.try_acquire("u1", 0.0), 0.0)
+    assert limiter.try_acquire("u1", 0.0) is None
+    assert limiter.usage("u1", 0.0) == 3
+
+    assert limiter.try_acquire("u1", 19.0) is None
+    tat = limiter.try_acquire("u1", 20.0)
+    assert tat is not None
+    limiter.commit("u1", tat, 20.0)
+    assert limiter.try_acquire("u1", 20.0) is None
+
+    assert limiter.usage("u1", 80.0) == 0
+
+
+def test_limiter_evicts_idle_keys():
+    """令牌已补满的空闲键在后续记录时被顺带清理"""
+    limiter = GcraLimiter(limit=10, window=60)
+    for i in range(1000):
+        limiter.commit(f"u{i}", limiter.try_acquire(f"u{i}", 0.0), 0.0)
+    assert len(limiter) == 1000
+
+    # 每个键只用了一个令牌，6 秒后全部补满
+    limiter.commit("late", limiter.try_acquire("late", 6.0), 6.0)
+    assert len(limiter) == 1
+    assert limiter.evicted_count == 0
+
+
+def test_limiter_max_keys():
+    """超过 max_keys 时淘汰最久未使用的键"""
+    limiter = GcraLimiter(limit=1, window=60, max_keys=2)
+    for i, key in enumerate(["a", "b", "a", "c"]):
+        tat = limiter.try_acquire(key, float(i) / 1000)
+        if tat is not None:
+            limiter.commit(key, tat, float(i) / 1000)
+
+    assert len(limiter) == 2
+    assert limiter.evicted_count == 1
+    # "a" 第二次被拒绝时不会刷新使用顺序，因此最先被淘汰
+    assert limiter.usage("a", 0.01) == 0
+    assert limiter.usage("b", 0.01) == 1 and limiter.usage("c", 0.01) == 1
+
+
+def test_limiter_zero_limit():
+    """limit <= 0 时拒绝所有消息"""
+    limiter = GcraLimiter(limit=0, window=60)
+    assert limiter.try_acquire("u1", 0.0) is None
+    with pytest.raises(ValueError):
+        GcraLimiter(limit=1, window=0)
+
+
+@pytest.mark.asyncio
+async def test_many_unique_users_bounded():
+    """大量不同用户时跟踪的用户数受 max_tracked_users 限制"""
+    pipeline = RateLimitInputPipeline(
+        {"global_rate_limit": 100000, "user_rate_limit": 5, "window_size": 60, "max_tracked_users": 100}
+    )
+    results = await pipeline.process_batch([create_message("弹幕", f"user{i}") for i in range(5000)])
+
+    assert all(r is not None for r in results)
+    info = pipeline.get_info()
+    assert info["active_users"] == 100
+    assert info["evicted_users"] == 4900
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
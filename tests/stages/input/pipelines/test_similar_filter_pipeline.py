@@ -4,8 +4,17 @@
 运行: uv run pytest tests/stages/input/pipelines/test_similar_filter_pipeline.py -v
 """
 
+import difflib
+import random
+
 import pytest
 
+from src.stages.input.pipelines.similar_filter.index import (
+    IndexEntry,
+    MinHasher,
+    NearDuplicateIndex,
+    collapse_repeats,
+)
 from src.stages.input.pipelines.similar_filter.pipeline import SimilarFilterInputPipeline
 from src.modules.types.base.normalized_message import NormalizedMessage
 
@@ -338,5 +347,106 @@ async def test_very_long_text(similar_filter_pipeline):
     assert result2 is None
 
 
+@pytest.mark.asyncio
+async def test_process_batch_filters_within_batch(similar_filter_pipeline):
+    """批量处理时批内的重复消息也会被过滤"""
+    messages = [
+        create_message("今天天气真好啊"),
+        create_message("今天天气真好啊", user_id="user2"),
+        create_message("主播晚上好"),
+    ]
+
+    results = await similar_filter_pipeline.process_batch(messages)
+
+    assert results == [messages[0], None, messages[2]]
+    assert await similar_filter_pipeline.process_batch([create_message("主播晚上好")]) == [None]
+
+
+# =============================================================================
+# 近邻索引测试
+# =============================================================================
+
+
+def test_collapse_repeats():
+    """连续重复字符折叠到 max_repeat 个"""
+    assert collapse_repeats("6666666", 3) == "666"
+    assert collapse_repeats("哈哈哈哈哈好", 2) == "哈哈好"
+    assert collapse_repeats("abc", 1) == "abc"
+    assert collapse_repeats("6666666", 0) == "6666666"
+
+
+@pytest.mark.asyncio
+async def test_repeated_character_variants_filtered(similar_filter_pipeline):
+    """重复字符数量不同的刷屏变体归一化后精确命中"""
+    assert await similar_filter_pipeline._process(create_message("666666")) is not None
+    assert await similar_filter_pipeline._process(create_message("666666666666")) is None
+    assert similar_filter_pipeline.get_info()["exact_hits"] == 1
+
+
+def test_index_expire_removes_buckets():
+    """过期条目从精确桶和 LSH 桶中删除"""
+    hasher = MinHasher()
+    index = NearDuplicateIndex()
+    for timestamp, text in enumerate(["主播晚上好", "今天天气真好", "主播晚上好"]):
+        index.add(IndexEntry(float(timestamp), text, "u1", hasher.band_keys(text), {}))
+
+    index.expire(cutoff=1.0)
+
+    assert len(index) == 2
+    assert [e.timestamp for e in index.exact("主播晚上好")] == [2.0]
+    assert all(e.timestamp >= 1.0 for e in index.candidates(hasher.band_keys("主播晚上好")))
+
+    index.expire(cutoff=10.0)
+    assert len(index) == 0
+    assert index._buckets == {} and index._exact == {}
+
+
+def test_invalid_minhash_config():
+    """签名维数必须能被 band 数整除"""
+    with pytest.raises(ValueError):
+        MinHasher(num_perm=64, bands=30)
+
+
+@pytest.mark.asyncio
+async def test_matches_linear_scan_decisions():
+    """关闭重复字符归一化时，与逐一比较所有缓存文本的旧算法判定一致"""
+    rng = random.Random(7)
+    phrases = ["主播晚上好", "今天吃什么呢", "这个操作太秀了", "下次一定", "前方高能预警"]
+    chars = "的一是在不了有和人这中大为上个我以要他时来用们生到作地"
+    texts = []
+    for _ in range(400):
+        if rng.random() < 0.6:
+            text = rng.choice(phrases)
+            i = rng.randrange(len(text))
+            text = text[:i] + rng.choice(chars + "!~") + text[i + 1 :] if rng.random() < 0.5 else text + "!"
+        else:
+            text = "".join(rng.choice(chars) for _ in range(rng.randint(4, 12)))
+        texts.append(text)
+
+    pipeline = SimilarFilterInputPipeline({"similarity_threshold": 0.85, "time_window": 3600.0, "max_repeat": 0})
+    indexed = [r is not None for r in await pipeline.process_batch([create_message(t) for t in texts])]
+
+    cache = []
+    linear = []
+    for text in texts:
+        similar = any(
+            max(
+                difflib.SequenceMatcher(None, text, cached).ratio(),
+                min(len(text), len(cached)) / max(len(text), len(cached))
+                if (text in cached or cached in text)
+                and min(len(text), len(cached)) >= max(len(text), len(cached)) * 0.5
+                else 0.0,
+            )
+            >= 0.85
+            for cached in cache
+        )
+        linear.append(not similar)
+        if not similar:
+            cache.append(text)
+
+    assert indexed == linear
+    assert pipeline.get_info()["fuzzy_comparisons"] < len(texts) * len(cache) / 20
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -17,7 +17,8 @@ import pytest
 
 from src.modules.pipeline import Pipeline, PipelineManager
 from src.modules.types.base.normalized_message import NormalizedMessage
-from src.modules.types.base.pipeline_types import PipelineErrorHandling, PipelineException
+from src.modules.pipeline.locks import KeyedLock
+from src.modules.types.base.pipeline_types import PipelineConcurrency, PipelineErrorHandling, PipelineException
 from src.modules.types.base.pipeline_stats import PipelineStats
 from src.modules.types.base.normalized_message import NormalizedMessage
 from src.modules.types.base.pipeline_stats import PipelineStats
@@ -536,6 +537,195 @@ async def test_concurrent_processing(pipeline_manager: PipelineManager[Normalize
     assert all(r is not None for r in results)
 
 
+class OverlapTrackingPipeline(Pipeline[NormalizedMessage]):
+    """记录同时处理中的 item 数量峰值"""
+
+    def __init__(self, config: Dict[str, Any], concurrency: PipelineConcurrency):
+        super().__init__(config)
+        self.concurrency = concurrency
+        self.active = 0
+        self.max_active = 0
+
+    def lock_key(self, item: NormalizedMessage) -> str:
+        return item.user_id or ""
+
+    async def _process(self, message: NormalizedMessage) -> Optional[NormalizedMessage]:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.02)
+        self.active -= 1
+        return message
+
+
+@pytest.mark.asyncio
+async def test_concurrent_pipeline_runs_in_parallel(pipeline_manager: PipelineManager[NormalizedMessage]):
+    """CONCURRENT Pipeline 不加锁，多条消息同时处理"""
+    pipeline = OverlapTrackingPipeline({}, PipelineConcurrency.CONCURRENT)
+    pipeline_manager.register_pipeline(pipeline)
+
+    start = asyncio.get_running_loop().time()
+    await asyncio.gather(*(pipeline_manager.process(create_message(f"text_{i}")) for i in range(10)))
+    elapsed = asyncio.get_running_loop().time() - start
+
+    assert pipeline.max_active == 10
+    assert elapsed < 0.15
+
+
+@pytest.mark.asyncio
+async def test_serial_pipelines_do_not_block_each_other(pipeline_manager: PipelineManager[NormalizedMessage]):
+    """SERIAL 只锁单个 Pipeline：链路中相邻的两个 SERIAL Pipeline 可以同时处理不同消息"""
+    first = OverlapTrackingPipeline({"priority": 100}, PipelineConcurrency.SERIAL)
+    second = OverlapTrackingPipeline({"priority": 200}, PipelineConcurrency.SERIAL)
+    pipeline_manager.register_pipeline(first)
+    pipeline_manager.register_pipeline(second)
+
+    start = asyncio.get_running_loop().time()
+    await asyncio.gather(*(pipeline_manager.process(create_message(f"text_{i}")) for i in range(4)))
+    elapsed = asyncio.get_running_loop().time() - start
+
+    assert first.max_active == 1
+    assert second.max_active == 1
+    # 全局锁下需要 4 * 2 * 20ms；流水线执行约 (4 + 1) * 20ms
+    assert elapsed < 0.14
+
+
+@pytest.mark.asyncio
+async def test_keyed_pipeline_serializes_per_key(pipeline_manager: PipelineManager[NormalizedMessage]):
+    """KEYED Pipeline 同一 key 串行，不同 key 并发"""
+    pipeline = OverlapTrackingPipeline({}, PipelineConcurrency.KEYED)
+    pipeline_manager.register_pipeline(pipeline)
+    user_messages = [create_message("same").model_copy(update={"user_id": "u1"}) for _ in range(3)]
+    await asyncio.gather(*(pipeline_manager.process(m) for m in user_messages))
+    assert pipeline.max_active == 1
+
+    other_messages = [create_message("other").model_copy(update={"user_id": f"u{i}"}) for i in range(3)]
+    await asyncio.gather(*(pipeline_manager.process(m) for m in other_messages))
+    assert pipeline.max_active == 3
+
+
+@pytest.mark.asyncio
+async def test_keyed_lock_releases_idle_keys():
+    """KeyedLock 在没有持有者和等待者时删除 key"""
+    lock = KeyedLock()
+    order = []
+
+    async def worker(key: str, tag: int):
+        async with lock.acquire(key):
+            order.append(tag)
+            await asyncio.sleep(0.01)
+
+    tasks = [asyncio.create_task(worker("a", i)) for i in range(3)]
+    await asyncio.sleep(0)
+    assert len(lock) == 1
+    await asyncio.gather(*tasks)
+    assert order == [0, 1, 2]
+    assert len(lock) == 0
+
+
+def test_pipeline_info_includes_concurrency():
+    """get_info 包含并发模式，默认 SERIAL"""
+    assert MockInputPipeline({}).get_info()["concurrency"] == "serial"
+
+
+# =============================================================================
+# 批量处理测试
+# =============================================================================
+
+
+class BatchRecordingPipeline(Pipeline[NormalizedMessage]):
+    """记录 _process_batch 调用，丢弃文本以 drop 开头的消息"""
+
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.batches = []
+
+    def lock_key(self, item: NormalizedMessage) -> str:
+        return item.user_id or ""
+
+    async def _process(self, message: NormalizedMessage) -> Optional[NormalizedMessage]:
+        return None if message.text.startswith("drop") else message
+
+    async def _process_batch(self, items):
+        self.batches.append([item.text for item in items])
+        return [await self._process(item) for item in items]
+
+
+@pytest.mark.asyncio
+async def test_process_batch_calls_each_pipeline_once(pipeline_manager: PipelineManager[NormalizedMessage]):
+    """每个 Pipeline 每批只调用一次，被丢弃的消息不进入后续 Pipeline，结果与输入一一对应"""
+    first = BatchRecordingPipeline({"priority": 100})
+    second = MockInputPipeline({"priority": 200})
+    pipeline_manager.register_pipeline(first)
+    pipeline_manager.register_pipeline(second)
+    messages = [create_message("a"), create_message("drop_b"), create_message("c")]
+
+    results = await pipeline_manager.process_batch(messages)
+
+    assert results == [messages[0], None, messages[2]]
+    assert first.batches == [["a", "drop_b", "c"]]
+    assert [m.text for m in second.processed_messages] == ["a", "c"]
+    assert first.get_stats().processed_count == 3
+    assert first.get_stats().dropped_count == 1
+
+
+@pytest.mark.asyncio
+async def test_process_batch_empty_and_no_pipelines(pipeline_manager: PipelineManager[NormalizedMessage]):
+    """空批次和没有 Pipeline 时原样返回"""
+    assert await pipeline_manager.process_batch([]) == []
+    message = create_message("hello")
+    assert await pipeline_manager.process_batch([message]) == [message]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("error_handling", "expected_alive"),
+    [(PipelineErrorHandling.CONTINUE, True), (PipelineErrorHandling.DROP, False)],
+)
+async def test_process_batch_error_handling_applies_to_whole_batch(
+    pipeline_manager: PipelineManager[NormalizedMessage], error_handling, expected_alive
+):
+    """Pipeline 出错时错误处理策略作用于整批"""
+    failing = MockInputPipeline({"priority": 100})
+    failing.should_fail = True
+    failing.error_handling = error_handling
+    pipeline_manager.register_pipeline(failing)
+    messages = [create_message("a"), create_message("b")]
+
+    results = await pipeline_manager.process_batch(messages)
+
+    assert results == (messages if expected_alive else [None, None])
+
+
+@pytest.mark.asyncio
+async def test_process_batch_stop_raises(pipeline_manager: PipelineManager[NormalizedMessage]):
+    """STOP 策略抛出 PipelineException"""
+    failing = MockInputPipeline({"priority": 100})
+    failing.should_fail = True
+    failing.error_handling = PipelineErrorHandling.STOP
+    pipeline_manager.register_pipeline(failing)
+
+    with pytest.raises(PipelineException):
+        await pipeline_manager.process_batch([create_message("a")])
+
+
+@pytest.mark.asyncio
+async def test_process_batch_keyed_groups_by_key(pipeline_manager: PipelineManager[NormalizedMessage]):
+    """KEYED Pipeline 的批次按 key 分组，每组调用一次，结果仍按输入顺序返回"""
+    pipeline = BatchRecordingPipeline({})
+    pipeline.concurrency = PipelineConcurrency.KEYED
+    pipeline_manager.register_pipeline(pipeline)
+    messages = [
+        create_message("a").model_copy(update={"user_id": "u1"}),
+        create_message("b").model_copy(update={"user_id": "u2"}),
+        create_message("c").model_copy(update={"user_id": "u1"}),
+    ]
+
+    results = await pipeline_manager.process_batch(messages)
+
+    assert results == messages
+    assert sorted(pipeline.batches) == [["a", "c"], ["b"]]
+
+
 # =============================================================================
 # 边界情况测试
 # =============================================================================
@@ -0,0 +1,287 @@
+"""
+测试 InputScheduler（Collector 消息的加权公平调度）及其在 InputCollectorManager 中的使用
+
+运行: uv run pytest tests/stages/input/test_input_scheduler.py -v
+"""
+
+import asyncio
+from typing import AsyncIterator, List
+
+import pytest
+
+from src.modules.events.event_bus import EventBus
+from src.modules.events.mailbox import OverflowPolicy
+from src.modules.events.names import CoreEvents
+from src.modules.events.payloads.input import MessageReadyPayload
+from src.modules.types.base.normalized_message import NormalizedMessage
+from src.stages.input.manager import InputCollectorManager
+from src.stages.input.scheduler import InputScheduler, QueuedMessage, SourcePolicy
+
+
+def create_items(prefix: str, count: int) -> List[QueuedMessage]:
+    return [QueuedMessage(message=NormalizedMessage(text=f"{prefix}{i}", source=prefix)) for i in range(count)]
+
+
+async def drain(scheduler: InputScheduler, rounds: int) -> List[str]:
+    texts = []
+    for _ in range(rounds):
+        source, batch = await scheduler.get()
+        texts.extend(item.message.text for item in batch)
+        scheduler.done(source)
+    return texts
+
+
+# =============================================================================
+# SourcePolicy
+# =============================================================================
+
+
+def test_policy_from_dict_inherits_base():
+    """未指定的字段取 base 的值"""
+    base = SourcePolicy(weight=2.0, priority=10, max_queue=30, overflow=OverflowPolicy.DROP_NEWEST)
+    policy = SourcePolicy.from_dict({"weight": 5, "overflow": "block"}, base=base)
+
+    assert policy == SourcePolicy(weight=5.0, priority=10, max_queue=30, overflow=OverflowPolicy.BLOCK)
+
+
+@pytest.mark.parametrize("data", [{"weight": 0}, {"max_queue": 0}, {"overflow": "unknown"}])
+def test_policy_from_dict_rejects_invalid(data):
+    with pytest.raises(ValueError):
+        SourcePolicy.from_dict(data)
+
+
+def test_stt_is_prioritized_by_default():
+    """未配置时 stt 使用内置的高优先级、阻塞策略"""
+    scheduler = InputScheduler()
+
+    policy = scheduler.register("STT", policy_name="stt")
+    assert policy.priority == 0
+    assert policy.overflow == OverflowPolicy.BLOCK
+    assert scheduler.register("BiliDanmaku").priority == 100
+
+
+# =============================================================================
+# 调度顺序
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_weighted_fair_share():
+    """同一优先级内按权重分配份额，同一来源内保持顺序"""
+    scheduler = InputScheduler(policies={"a": SourcePolicy(weight=3.0), "b": SourcePolicy(weight=1.0)}, max_batch=1)
+    await scheduler.put("a", create_items("a", 30))
+    await scheduler.put("b", create_items("b", 30))
+
+    texts = await drain(scheduler, 20)
+
+    a_texts = [t for t in texts if t.startswith("a")]
+    b_texts = [t for t in texts if t.startswith("b")]
+    assert len(a_texts) == 15
+    assert len(b_texts) == 5
+    assert a_texts == [f"a{i}" for i in range(15)]
+    assert b_texts == [f"b{i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_priority_source_goes_first():
+    """高优先级来源有消息时总是先被调度，即使低优先级来源积压"""
+    scheduler = InputScheduler(max_batch=10)
+    scheduler.register("STT", policy_name="stt")
+    await scheduler.put("danmaku", create_items("d", 100))
+    await scheduler.put("STT", create_items("voice", 1))
+
+    source, batch = await scheduler.get()
+
+    assert source == "STT"
+    assert [item.message.text for item in batch] == ["voice0"]
+
+
+@pytest.mark.asyncio
+async def test_idle_source_does_not_bank_credit():
+    """空闲的来源重新活跃后不能用空闲期间的份额长时间独占"""
+    scheduler = InputScheduler(max_batch=1)
+    await scheduler.put("a", create_items("a", 50))
+    await drain(scheduler, 40)
+
+    await scheduler.put("b", create_items("b", 10))
+    texts = await drain(scheduler, 6)
+
+    assert 2 <= sum(t.startswith("b") for t in texts) <= 4
+
+
+@pytest.mark.asyncio
+async def test_busy_source_is_not_dispatched_twice():
+    """同一来源的上一批未完成前，不会取出该来源的下一批"""
+    scheduler = InputScheduler(max_batch=2)
+    await scheduler.put("a", create_items("a", 4))
+    await scheduler.put("b", create_items("b", 2))
+
+    first, _ = await scheduler.get()
+    second, _ = await scheduler.get()
+    assert {first, second} == {"a", "b"}
+
+    pending = asyncio.create_task(scheduler.get())
+    await asyncio.sleep(0.01)
+    assert not pending.done()
+
+    scheduler.done("a")
+    source, batch = await asyncio.wait_for(pending, timeout=1.0)
+    assert source == "a"
+    assert [item.message.text for item in batch] == ["a2", "a3"]
+
+
+# =============================================================================
+# 溢出策略
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_keeps_latest_messages():
+    dropped = []
+    scheduler = InputScheduler(
+        policies={"a": SourcePolicy(max_queue=3)}, on_drop=lambda source, item: dropped.append(item.message.text)
+    )
+    await scheduler.put("a", create_items("a", 5))
+
+    _, batch = await scheduler.get()
+
+    assert [item.message.text for item in batch] == ["a2", "a3", "a4"]
+    assert dropped == ["a0", "a1"]
+    stats = scheduler.get_stats()["a"]
+    assert stats.dropped_count == 2
+    assert stats.high_watermark == 3
+
+
+@pytest.mark.asyncio
+async def test_drop_newest_keeps_oldest_messages():
+    scheduler = InputScheduler(policies={"a": SourcePolicy(max_queue=3, overflow=OverflowPolicy.DROP_NEWEST)})
+    await scheduler.put("a", create_items("a", 5))
+
+    _, batch = await scheduler.get()
+
+    assert [item.message.text for item in batch] == ["a0", "a1", "a2"]
+
+
+@pytest.mark.asyncio
+async def test_block_waits_for_dispatch():
+    """BLOCK 策略下 Collector 等待分发而不是丢弃消息"""
+    scheduler = InputScheduler(policies={"a": SourcePolicy(max_queue=2, overflow=OverflowPolicy.BLOCK)})
+    producer = asyncio.create_task(scheduler.put("a", create_items("a", 4)))
+    await asyncio.sleep(0.01)
+    assert not producer.done()
+
+    texts = await drain(scheduler, 2)
+    await asyncio.wait_for(producer, timeout=1.0)
+
+    assert texts == ["a0", "a1", "a2", "a3"]
+    assert scheduler.get_stats()["a"].dropped_count == 0
+    assert scheduler.get_stats()["a"].blocked_count >= 1
+
+
+@pytest.mark.asyncio
+async def test_close_releases_waiters():
+    scheduler = InputScheduler(policies={"a": SourcePolicy(max_queue=1, overflow=OverflowPolicy.BLOCK)})
+    producer = asyncio.create_task(scheduler.put("a", create_items("a", 3)))
+    await asyncio.sleep(0.01)
+
+    scheduler.close()
+    await asyncio.wait_for(producer, timeout=1.0)
+
+    assert await scheduler.get() is None
+    assert scheduler.pending_count == 0
+    assert scheduler.get_stats()["a"].dropped_count == 3
+
+
+# =============================================================================
+# InputCollectorManager
+# =============================================================================
+
+
+class BurstCollector:
+    """一次性产出大量消息的 Collector"""
+
+    def __init__(self, count: int):
+        self.count = count
+        self.is_started = False
+
+    async def start(self) -> None:
+        self.is_started = True
+
+    async def stop(self) -> None:
+        self.is_started = False
+
+    async def collect(self) -> AsyncIterator[NormalizedMessage]:
+        for i in range(self.count):
+            yield NormalizedMessage(text=f"burst{i}", source="burst")
+        while self.is_started:
+            await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_manager_dispatches_through_scheduler():
+    """Collector 的消息经由调度队列发布，并可查询队列统计"""
+    event_bus = EventBus()
+    received = []
+
+    async def on_message(event_name, payload, source):
+        received.append(payload.message["text"])
+
+    event_bus.on(CoreEvents.INPUT_MESSAGE_RECEIVED, on_message, MessageReadyPayload)
+    manager = InputCollectorManager(event_bus)
+
+    await manager.start_all_collectors([BurstCollector(20)])
+    for _ in range(100):
+        if len(received) >= 20:
+            break
+        await asyncio.sleep(0.01)
+    stats = manager.get_scheduler_stats()
+    await manager.stop_all_collectors()
+
+    assert received == [f"burst{i}" for i in range(20)]
+    assert stats["Burst"]["enqueued_count"] == 20
+    assert stats["Burst"]["dispatched_count"] == 20
+    assert manager.get_collector_status()[0]["queue"]["dropped_count"] == 0
+
+
+class PacedCollector(BurstCollector):
+    """每条消息之间间隔一段时间，保证每条消息单独成批"""
+
+    async def collect(self) -> AsyncIterator[NormalizedMessage]:
+        for i in range(self.count):
+            yield NormalizedMessage(text=f"paced{i}", source="paced")
+            await asyncio.sleep(0.02)
+        while self.is_started:
+            await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_survives_batch_error():
+    """某一批处理出错（错误消息含花括号）时，分发协程继续处理后续消息"""
+    event_bus = EventBus()
+    received = []
+
+    async def on_message(event_name, payload, source):
+        received.append(payload.message["text"])
+
+    event_bus.on(CoreEvents.INPUT_MESSAGE_RECEIVED, on_message, MessageReadyPayload)
+    manager = InputCollectorManager(event_bus)
+    # 只有一个分发协程，它退出后就没有其他协程接手
+    manager._scheduling_config = {"workers": 1}
+    handle_batch = manager._handle_batch
+    calls = []
+
+    async def flaky_handle_batch(collector_name, messages, trace_ids):
+        calls.append(collector_name)
+        if len(calls) == 1:
+            raise ValueError("缺少字段 {text}")
+        await handle_batch(collector_name, messages, trace_ids)
+
+    manager._handle_batch = flaky_handle_batch
+    await manager.start_all_collectors([PacedCollector(3)])
+    for _ in range(100):
+        if len(received) >= 2:
+            break
+        await asyncio.sleep(0.01)
+    await manager.stop_all_collectors()
+
+    assert received == ["paced1", "paced2"]
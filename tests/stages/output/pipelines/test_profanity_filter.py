@@ -2,10 +2,13 @@
 ProfanityFilterPipeline 测试
 """
 
+import random
+
 import pytest
 
 from src.modules.time_utils import now_ms
 from src.modules.types import Intent, IntentMetadata
+from src.stages.output.pipelines.profanity_filter.automaton import WordAutomaton
 from src.stages.output.pipelines.profanity_filter.pipeline import ProfanityFilterOutputPipeline
 
 
@@ -167,3 +170,112 @@ async def test_profanity_filter_no_match():
 
     assert result is not None
     assert result.speech == original_text
+
+
+def test_automaton_leftmost_longest():
+    """重叠命中时选择最左、最长且互不重叠的匹配"""
+    automaton = WordAutomaton(["ab", "bcd", "cd", "abc"], case_sensitive=True)
+    assert automaton.find("abcd") == [(0, 3)]
+    assert automaton.find("xabxcd") == [(1, 3), (4, 6)]
+    assert automaton.replace("she sells", "*") == ("she sells", set())
+
+
+def test_automaton_ignores_empty_words():
+    """空字符串敏感词被忽略，不会在每个位置插入替换文本"""
+    automaton = WordAutomaton(["", "bad"])
+    assert len(automaton) == 1
+    assert automaton.replace("not bad", "*") == ("not *", {"bad"})
+
+
+def test_automaton_case_insensitive_keeps_original_text():
+    """不区分大小写时只替换命中部分，其余文本保持原样"""
+    automaton = WordAutomaton(["BadWord"], case_sensitive=False)
+    assert automaton.replace("A BADWORD and a badword, Nice", "***") == ("A *** and a ***, Nice", {"badword"})
+
+
+@pytest.mark.asyncio
+async def test_profanity_filter_add_remove_word_rebuilds():
+    """增删敏感词后自动机重新编译"""
+    pipeline = ProfanityFilterOutputPipeline({"words": ["foo"], "replacement": "***"})
+
+    pipeline.add_profanity_word("Bar")
+    assert pipeline._filter_text("foo bar") == ("*** ***", True)
+
+    pipeline.remove_profanity_word("foo")
+    assert pipeline._filter_text("foo bar") == ("foo ***", True)
+
+
+@pytest.mark.asyncio
+async def test_profanity_filter_large_wordlist():
+    """大词表下匹配结果与逐词查找一致"""
+    words = [f"词{i:04d}" for i in range(5000)]
+    pipeline = ProfanityFilterOutputPipeline({"words": words, "replacement": "*"})
+
+    filtered, has_match = pipeline._filter_text("前缀词0042中间词4999后缀词9999")
+
+    assert has_match
+    assert filtered == "前缀*中间*后缀词9999"
+
+
+# =============================================================================
+# 流式过滤
+# =============================================================================
+
+
+def test_streaming_holds_only_partial_match():
+    """只扣留可能组成敏感词的后缀，干净文本立即释放"""
+    pipeline = ProfanityFilterOutputPipeline({"words": ["badword"], "replacement": "***"})
+    stream = pipeline.create_stream()
+
+    assert stream.feed("hello ba") == "hello "
+    assert stream.pending == "ba"
+    assert stream.feed("dwo") == ""
+    assert stream.feed("rd and bar") == "*** and bar"
+    assert stream.flush() == ""
+    assert stream.has_match and stream.matched_words == {"badword"}
+
+
+def test_streaming_flush_releases_unfinished_prefix():
+    """流结束时扣留的前缀原样释放"""
+    stream = ProfanityFilterOutputPipeline({"words": ["敏感词"], "replacement": "*"}).create_stream()
+
+    assert stream.feed("这是敏感") == "这是"
+    assert stream.flush() == "敏感"
+    assert not stream.has_match
+
+
+def test_streaming_matches_whole_text_filter():
+    """任意切分方式下，拼接流式输出与整段过滤结果一致"""
+    rng = random.Random(11)
+    words = ["脏话", "脏话连篇", "ab", "abc", "bcd", "Bad"]
+    pipeline = ProfanityFilterOutputPipeline({"words": words, "replacement": "*"})
+
+    for _ in range(300):
+        text = "".join(rng.choice("脏话连篇abcdBAD ") for _ in range(rng.randint(0, 40)))
+        expected, _ = pipeline._filter_text(text)
+
+        stream = pipeline.create_stream()
+        output = []
+        position = 0
+        while position < len(text):
+            size = rng.randint(1, 5)
+            output.append(stream.feed(text[position : position + size]))
+            assert len(stream.pending) <= 4
+            position += size
+        output.append(stream.flush())
+
+        assert "".join(output) == expected
+
+
+@pytest.mark.asyncio
+async def test_streaming_filter_async_iterable():
+    """包装异步文本流，逐段产出已过滤文本"""
+
+    async def chunks():
+        for chunk in ["我说", "脏", "话了", "。"]:
+            yield chunk
+
+    stream = ProfanityFilterOutputPipeline({"words": ["脏话"], "replacement": "*"}).create_stream()
+    released = [chunk async for chunk in stream.filter(chunks())]
+
+    assert released == ["我说", "*了", "。"]
@@ -9,14 +9,14 @@ Multi-Decider 支持测试
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 from typing import Any, Dict, List
 
 # 导入 providers 模块以触发 @decider 装饰器注册
 from src.stages.decision import deciders  # noqa: F401
 from src.stages.decision.manager import DeciderManager, SPEECH_DECIDERS
 from src.modules.events.names import CoreEvents
-from src.modules.events.payloads.input import MessageReadyPayload
+from src.modules.events.payloads.input import MessageReadyPayload, SpeechRecognizedPayload
 from src.modules.types.base.normalized_message import NormalizedMessage
 
 
@@ -405,7 +405,7 @@ class TestEventSubscription:
 
     @pytest.mark.asyncio
     async def test_subscribe_input_message_ready_once(self, mock_services):
-        """测试只订阅 INPUT_MESSAGE_RECEIVED 一次"""
+        """测试只订阅 INPUT_MESSAGE_RECEIVED（和 INPUT_SPEECH_RECOGNIZED）一次"""
         mock_event_bus = MagicMock()
         manager = _make_manager(mock_event_bus, mock_services)
 
@@ -414,12 +414,13 @@ class TestEventSubscription:
         await manager.setup(decision_config=decision_config)
         await manager.start()
 
-        # 验证 event_bus.on 只被调用一次
-        mock_event_bus.on.assert_called_once_with(
-            CoreEvents.INPUT_MESSAGE_RECEIVED,
-            manager._on_data_message,
-            model_class=MessageReadyPayload,
-        )
+        # 验证多个 Decider 时每个事件也只订阅一次
+        assert mock_event_bus.on.call_args_list == [
+            call(CoreEvents.INPUT_MESSAGE_RECEIVED, manager._on_data_message, model_class=MessageReadyPayload),
+            call(
+                CoreEvents.INPUT_SPEECH_RECOGNIZED, manager._on_speech_recognized, model_class=SpeechRecognizedPayload
+            ),
+        ]
 
     @pytest.mark.asyncio
     async def test_unsubscribe_on_stop(self, mock_services):
@@ -437,10 +438,10 @@ class TestEventSubscription:
         await manager.stop()
 
         # 验证 event_bus.off 被调用
-        mock_event_bus.off.assert_called_once_with(
-            CoreEvents.INPUT_MESSAGE_RECEIVED,
-            manager._on_data_message,
-        )
+        assert mock_event_bus.off.call_args_list == [
+            call(CoreEvents.INPUT_MESSAGE_RECEIVED, manager._on_data_message),
+            call(CoreEvents.INPUT_SPEECH_RECOGNIZED, manager._on_speech_recognized),
+        ]
 
 
 class TestEdgeCases: